@@ -14,7 +14,6 @@ from typing import Tuple
 import os
 
 from renforge_logger import get_logger
-import renforge_ai as ai
 from interfaces.di_container import DIContainer, Lifetime
 from interfaces.i_controller import (
     IAppController, IFileController, ITranslationController,
@@ -29,6 +28,8 @@ from controllers.translation_controller import TranslationController
 from controllers.batch_controller import BatchController
 from controllers.project_controller import ProjectController
 
+from utils.startup_timing import get_startup_timer
+
 logger = get_logger("bootstrap")
 
 
@@ -48,10 +49,13 @@ def bootstrap() -> Tuple[AppController, 'RenForgeGUI']:
     container = DIContainer.instance()
     container.clear()  # Start fresh
     
+    startup_timer = get_startup_timer()
+    
     # Stage 7: Initialize Plugin System
-    from core.plugin_manager import PluginManager
-    plugin_manager = PluginManager()
-    plugin_manager.initialize()
+    with startup_timer.phase("plugins"):
+        from core.plugin_manager import PluginManager
+        plugin_manager = PluginManager()
+        plugin_manager.initialize()
     logger.info("Plugin System Initialized")
     
     # =========================================================================
@@ -113,26 +117,27 @@ def bootstrap() -> Tuple[AppController, 'RenForgeGUI']:
     # Usage (Windows PowerShell):  $env:RENFORGE_FORCE_FLUENT = "1"; python main.py
     FORCE_FLUENT_UI = os.getenv("RENFORGE_FORCE_FLUENT", "0") == "1"
     
-    if USE_FLUENT_UI:
-        logger.debug("Creating view (MainFluentWindow - Fluent UI)...")
-        try:
-            from gui.windows.main_fluent_window import MainFluentWindow
-            view = MainFluentWindow()
-            logger.debug("  - Created MainFluentWindow as IMainView")
-        except Exception as e:
-            logger.exception(f"Failed to create FluentWindow: {e}")
-            if FORCE_FLUENT_UI:
-                # Fail fast so the root cause is fixed instead of silently hiding it.
-                raise
-            logger.warning("Falling back to legacy RenForgeGUI...")
+    with startup_timer.phase("view"):
+        if USE_FLUENT_UI:
+            logger.debug("Creating view (MainFluentWindow - Fluent UI)...")
+            try:
+                from gui.windows.main_fluent_window import MainFluentWindow
+                view = MainFluentWindow()
+                logger.debug("  - Created MainFluentWindow as IMainView")
+            except Exception as e:
+                logger.exception(f"Failed to create FluentWindow: {e}")
+                if FORCE_FLUENT_UI:
+                    # Fail fast so the root cause is fixed instead of silently hiding it.
+                    raise
+                logger.warning("Falling back to legacy RenForgeGUI...")
+                from gui.renforge_gui import RenForgeGUI
+                view = RenForgeGUI()
+                logger.debug("  - Created RenForgeGUI as IMainView (fallback)")
+        else:
+            logger.debug("Creating view (RenForgeGUI - Legacy UI)...")
             from gui.renforge_gui import RenForgeGUI
             view = RenForgeGUI()
-            logger.debug("  - Created RenForgeGUI as IMainView (fallback)")
-    else:
-        logger.debug("Creating view (RenForgeGUI - Legacy UI)...")
-        from gui.renforge_gui import RenForgeGUI
-        view = RenForgeGUI()
-        logger.debug("  - Created and registered RenForgeGUI as IMainView")
+            logger.debug("  - Created and registered RenForgeGUI as IMainView")
     
     container.register_instance(IMainView, view)
     
@@ -187,6 +192,13 @@ def bootstrap() -> Tuple[AppController, 'RenForgeGUI']:
             )
             logger.debug("  - Wired mini_batch_bar detail_clicked/log_clicked -> inspector")
     
+    # Wire project batch progress/cancel to the Files page open-files list
+    if hasattr(view, 'files_page') and view.files_page:
+        batch_controller.batch_running_changed.connect(view.files_page.set_batch_running)
+        batch_controller.file_progress_changed.connect(view.files_page.set_file_batch_progress)
+        view.files_page.cancel_file_requested.connect(batch_controller.cancel_file)
+        logger.debug("  - Wired project batch progress/cancel <-> files_page")
+    
     # =========================================================================
     # WIRE SIGNALS (View -> Controller, Controller -> View)
     # =========================================================================
@@ -345,6 +357,13 @@ def _wire_view_to_controller_signals(view: 'RenForgeGUI', controller: AppControl
     )
     logger.debug("    - batch_ai_requested -> _handle_batch_ai")
     
+    # Project batch AI - every open file in one deduplicated run
+    if hasattr(view, 'project_batch_ai_requested'):
+        view.project_batch_ai_requested.connect(
+            lambda: _handle_project_batch_ai(view)
+        )
+        logger.debug("    - project_batch_ai_requested -> _handle_project_batch_ai")
+    
     # Settings changes - sync to settings model
     view.target_language_changed.connect(
         lambda code: _on_target_language_changed(controller, view, code)
@@ -483,7 +502,8 @@ def _on_model_changed(controller: AppController, view: 'RenForgeGUI', model: str
     logger.debug(f"Model changed: {model}")
     view.selected_model = model if model != "None" else None
     
-    # Sync with AI module
+    # Sync with AI module (deferred import keeps the AI SDK off the startup path)
+    import renforge_ai as ai
     if view.selected_model:
         success = ai.configure_gemini(view.selected_model)
         if not success:
@@ -681,4 +701,14 @@ def _handle_batch_ai(view: 'RenForgeGUI'):
     action_handler.batch_translate_ai(view)
 
 
+def _handle_project_batch_ai(view: 'RenForgeGUI'):
+    """
+    Handle Project Batch AI request (Files page) from view signal.
+    Delegates to gui_action_handler.
+    """
+    import gui.gui_action_handler as action_handler
+    logger.debug("_handle_project_batch_ai called via signal")
+    action_handler.batch_translate_project_ai(view)
+
+
 
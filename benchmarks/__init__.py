@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Benchmarks
+
+Standalone performance scripts. Run from the repository root, e.g.:
+    python -m benchmarks.bench_parser
+    python -m benchmarks.bench_pipeline --output results.json
+
+bench_pipeline is the end-to-end suite (synthetic project, fake engine from
+benchmarks.fake_engine, JSON report for regression tracking).
+"""
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Glossary Benchmark
+
+Writes a CSV of N generated terms (one to three words) spread over a few
+language pairs, imports it into a temporary glossary store, builds the
+active pair's matcher and applies it to generated dialogue lines. Reports
+import throughput, matcher build time and per-line apply latency.
+
+Usage:
+    python -m benchmarks.bench_glossary [--terms N] [--lines L] [--pairs P]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import renforge_config as config
+from benchmarks.bench_tm_fuzzy import WORDS, generate_sentence, percentile
+from core.glossary_csv import import_to_glossary_store
+from core.glossary_manager import GlossaryManager
+from core.glossary_store import GlossaryStore
+
+TARGET_LANGS = ("tr", "de", "fr", "es", "ru")
+
+
+def write_terms_csv(path: Path, count: int, pairs: int, rng: random.Random) -> None:
+    """Generated terms: random 1-3 word phrases with a numbered suffix to keep them unique."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("term_src", "term_dst", "source_lang", "target_lang", "whole_word"))
+        for n in range(count):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(0, 2))]
+            term = " ".join(words + [f"{rng.choice(WORDS)}{n}"]) if n % 10 else rng.choice(WORDS)
+            writer.writerow((term, term.upper(), "en", TARGET_LANGS[n % pairs], int(n % 3 == 0)))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="RenForge glossary benchmark")
+    ap.add_argument('--terms', type=int, default=50_000)
+    ap.add_argument('--lines', type=int, default=2000)
+    ap.add_argument('--pairs', type=int, default=2, choices=range(1, len(TARGET_LANGS) + 1))
+    ap.add_argument('--seed', type=int, default=1)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    saved_db_dir = config.DB_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        config.DB_DIR = Path(tmp)
+        GlossaryStore.reset_instance()
+        try:
+            csv_path = Path(tmp) / "terms.csv"
+            write_terms_csv(csv_path, args.terms, args.pairs, rng)
+
+            start = time.perf_counter()
+            result = import_to_glossary_store(csv_path)
+            seconds = time.perf_counter() - start
+            print(f"Import: {result['total']} rows, {result['added']} added, {result['skipped']} skipped "
+                  f"in {seconds:.2f}s ({result['total'] / seconds:.0f} rows/s)")
+
+            store = GlossaryStore.instance()
+            start = time.perf_counter()
+            matcher = store.matcher("en", "tr")
+            print(f"Matcher (en->tr): {matcher.size} terms in {time.perf_counter() - start:.2f}s")
+
+            manager = GlossaryManager("en", "tr")
+            lines = [generate_sentence(rng) for _ in range(args.lines)]
+            latencies: List[float] = []
+            changed = 0
+            for line in lines:
+                start = time.perf_counter()
+                if manager.apply_to_text(line) != line:
+                    changed += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+            print(f"Apply: {args.lines} lines, {changed} changed, p50 {percentile(latencies, 0.5):.3f} ms, "
+                  f"p95 {percentile(latencies, 0.95):.3f} ms, max {max(latencies):.2f} ms")
+        finally:
+            GlossaryStore.reset_instance()
+            config.DB_DIR = saved_db_dir
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
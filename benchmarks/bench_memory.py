@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Project Memory Benchmark
+
+Parses a generated project with ~100k editable items and reports the memory
+held by the resulting `ParsedFile` models (lines + items) and, when the GUI
+package can be imported, by the table `RowData` mirrors built from them.
+
+Usage:
+    python -m benchmarks.bench_memory [--items N] [--tabs T]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.bench_parser import generate_direct_lines, generate_translate_lines
+from models.parsed_file import ParsedFile
+from parser.engine import parse_lines
+
+
+def _traced(build):
+    """Return (result, bytes allocated by build() and still alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def build_project(item_count: int):
+    """Parse half translate, half direct files until item_count is reached."""
+    # Item yield per generated line: ~0.17 (translate), 0.4 (direct)
+    translate = generate_translate_lines(int(item_count / 2 / 0.17) + 10)
+    direct = generate_direct_lines(int(item_count / 2 / 0.4) + 10)
+
+    files = []
+    for name, lines in (('tl.rpy', translate), ('script.rpy', direct)):
+        result = parse_lines(lines)
+        files.append(ParsedFile(name, result.mode, lines, result.items))
+    return files
+
+
+def build_rows(files):
+    """Build table rows the same way the editor does."""
+    from gui.views.file_table_view import parsed_items_to_table_rows
+    return [parsed_items_to_table_rows(f.items, f.mode.value) for f in files]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="RenForge project memory benchmark")
+    ap.add_argument('--items', type=int, default=100_000)
+    ap.add_argument('--tabs', type=int, default=20,
+                    help="Number of open tabs to project the totals for")
+    args = ap.parse_args(argv)
+
+    files, project_bytes = _traced(lambda: build_project(args.items))
+    items = sum(len(f.items) for f in files)
+    mb = project_bytes / (1024 * 1024)
+    print(f"project: {items} items, {mb:.1f} MB ({project_bytes / items:.0f} B/item incl. lines)")
+
+    try:
+        _, row_bytes = _traced(lambda: build_rows(files))
+    except ImportError as e:
+        print(f"rows: skipped ({e})")
+        row_bytes = 0
+    else:
+        print(f"rows: {row_bytes / (1024 * 1024):.1f} MB ({row_bytes / items:.0f} B/row)")
+
+    total = (project_bytes + row_bytes) * args.tabs / (1024 * 1024)
+    print(f"{args.tabs} tabs of this size: ~{total:.0f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+End-to-End Pipeline Benchmark
+
+Generates a synthetic Ren'Py translation project (configurable size, token
+and duplicate density), then measures every step of a project translation
+against the in-process fake engine (benchmarks.fake_engine):
+
+    parse -> TM lookup -> batch translate (headless pipeline: TM pre-check,
+    Gemini batch path, QC, save) -> apply -> preflight
+
+Per-stage timings of the translate step come from core.telemetry. Results
+are printed and, with --output, written as JSON for regression tracking:
+
+    {"benchmark": "pipeline", "timestamp", "environment", "params",
+     "results": {"parse", "tm_lookup", "translate", "apply", "preflight"},
+     "engine": {...}, "telemetry": {...}}
+
+Usage:
+    python -m benchmarks.bench_pipeline [--files F] [--lines-per-file N]
+        [--latency-ms MS] [--rate-429 R] [--malformed-rate R] [--drop-token-rate R]
+        [--keys K] [--quota-after N] [--jobs J] [--output results.json]
+
+With --keys > 1 the batches go through the engine pool (one fake model per
+key); --quota-after exhausts the first key after N requests.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import renforge_config as config
+from benchmarks.bench_tm_fuzzy import WORDS
+from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model, installed_fake_pool, merged_stats
+
+SOURCE_LANG = "en"
+TARGET_LANG = "tr"
+TOKENS = ("[player]", "[mc]", "{i}", "{/i}", "{w}", "[points]")
+SPEAKERS = ("e", "mc", "s", "n")
+
+
+# =============================================================================
+# PROJECT GENERATION
+# =============================================================================
+
+def _sentence(rng: random.Random, token_rate: float) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(4, 16))]
+    if rng.random() < token_rate:
+        words.insert(rng.randrange(len(words)), rng.choice(TOKENS))
+    return " ".join(words).capitalize() + rng.choice((".", "!", "?", "..."))
+
+
+def generate_project(root: Path, files: int, lines_per_file: int, rng: random.Random,
+                     token_rate: float = 0.3, duplicate_rate: float = 0.1) -> List[str]:
+    """
+    Write `files` untranslated translate-mode files under root/game/tl.
+
+    Roughly `lines_per_file` dialogue and string entries per file; a share of
+    the sentences repeats earlier ones (dedup/TM traffic).
+
+    Returns:
+        All source texts in file order
+    """
+    tl_dir = root / "game" / "tl" / "turkish"
+    tl_dir.mkdir(parents=True, exist_ok=True)
+    sources: List[str] = []
+    for file_no in range(files):
+        out = []
+        for n in range(lines_per_file):
+            if sources and rng.random() < duplicate_rate:
+                text = rng.choice(sources)
+            else:
+                text = _sentence(rng, token_rate)
+            sources.append(text)
+            escaped = text.replace('"', '\\"')
+            if n % 10 == 9:
+                out.extend(['translate turkish strings:', '', f'    old "{escaped}"', '    new ""', ''])
+            else:
+                out.extend([
+                    f'# game/chapter{file_no}.rpy:{n + 1}',
+                    f'translate turkish chapter{file_no}_{n:08x}:',
+                    '',
+                    f'    # {rng.choice(SPEAKERS)} "{escaped}"',
+                    f'    {rng.choice(SPEAKERS)} ""',
+                    '',
+                ])
+        (tl_dir / f"chapter{file_no}.rpy").write_text("\n".join(out) + "\n", encoding="utf-8")
+    return sources
+
+
+def fill_tm(store, sources: List[str], hit_rate: float, rng: random.Random) -> int:
+    """Pre-translate a share of the unique sources in the TM."""
+    unique = list(dict.fromkeys(sources))
+    chosen = [text for text in unique if rng.random() < hit_rate]
+    for text in chosen:
+        store.insert(text, f"TR {text}", SOURCE_LANG, TARGET_LANG, origin="bench")
+    return len(chosen)
+
+
+# =============================================================================
+# STEPS
+# =============================================================================
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def bench_parse(paths: List[Path]) -> Dict:
+    import renforge_core as core
+
+    size_mb = sum(p.stat().st_size for p in paths) / (1024 * 1024)
+    parsed, seconds = _timed(lambda: [core.load_parsed_file(p) for p in paths])
+    items = sum(f.item_count for f in parsed)
+    return {
+        "seconds": round(seconds, 4),
+        "files": len(paths),
+        "items": items,
+        "size_mb": round(size_mb, 2),
+        "mb_per_s": round(size_mb / seconds, 2) if seconds else 0.0,
+    }
+
+
+def bench_tm_lookup(store, sources: List[str]) -> Dict:
+    hits, seconds = _timed(lambda: store.lookup_batch(sources, SOURCE_LANG, TARGET_LANG, touch=False))
+    return {
+        "seconds": round(seconds, 4),
+        "lookups": len(sources),
+        "hits": len(hits),
+        "us_per_lookup": round(seconds / len(sources) * 1e6, 1) if sources else 0.0,
+    }
+
+
+def bench_translate(project: Path, out_dir: Path, jobs: int) -> Dict:
+    import renforge_ai as ai
+    from core.headless_pipeline import HeadlessPipeline, JsonLinesReporter
+
+    def translate_batch(texts: List[str]) -> dict:
+        return ai.translate_text_batch_gemini_strict(texts, SOURCE_LANG, TARGET_LANG)
+
+    pipeline = HeadlessPipeline(
+        translate_batch,
+        source_lang=SOURCE_LANG,
+        target_lang=TARGET_LANG,
+        reporter=JsonLinesReporter(io.StringIO()),
+        jobs=jobs,
+        output_dir=out_dir,
+        origin="bench",
+    )
+    summary, seconds = _timed(lambda: pipeline.run(project))
+    rows = summary['translated'] + summary['tm_hits']
+    return {
+        "seconds": round(seconds, 3),
+        "rows": summary['rows'],
+        "tm_hits": summary['tm_hits'],
+        "translated": summary['translated'],
+        "failed": summary['failed'],
+        "api_calls": summary['api_calls'],
+        "deduplicated": summary['deduplicated'],
+        "qc_errors": summary['qc_errors'],
+        "qc_warnings": summary['qc_warnings'],
+        "saved_files": summary['saved_files'],
+        "rows_per_s": round(rows / seconds, 1) if seconds else 0.0,
+        "telemetry": summary['telemetry'],
+    }
+
+
+def bench_apply(paths: List[Path]) -> Dict:
+    """Apply a translation to every row of freshly loaded files."""
+    import renforge_core as core
+
+    files = [core.load_parsed_file(p) for p in paths]
+
+    def apply_all():
+        count = 0
+        for parsed_file in files:
+            for index, item in enumerate(parsed_file.items):
+                parsed_file.update_item_text(index, f"TR {item.original_text}")
+                count += 1
+        return count
+
+    rows, seconds = _timed(apply_all)
+    return {"seconds": round(seconds, 4), "rows": rows,
+            "us_per_row": round(seconds / rows * 1e6, 2) if rows else 0.0}
+
+
+def bench_preflight(out_dir: Path) -> Dict:
+    from core.preflight_engine import PreflightEngine
+
+    saved_app_dir = config.APP_DIR
+    config.APP_DIR = out_dir
+    try:
+        issues, seconds = _timed(PreflightEngine().run_scan)
+    finally:
+        config.APP_DIR = saved_app_dir
+    return {
+        "seconds": round(seconds, 4),
+        "issues": len(issues),
+        "errors": sum(1 for issue in issues if issue.severity == "error"),
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(args) -> Dict:
+    from core.glossary_store import GlossaryStore
+    from core.tm_store import TMStore
+
+    rng = random.Random(args.seed)
+    engine_config = FakeEngineConfig(
+        latency_ms=args.latency_ms, per_item_ms=args.per_item_ms,
+        rate_429=args.rate_429, malformed_rate=args.malformed_rate,
+        drop_token_rate=args.drop_token_rate, seed=args.seed,
+    )
+    saved_db_dir = config.DB_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        config.DB_DIR = root / "db"
+        config.DB_DIR.mkdir()
+        TMStore.reset_instance()
+        GlossaryStore.reset_instance()
+        try:
+            project = root / "project"
+            out_dir = root / "out"
+            sources = generate_project(project, args.files, args.lines_per_file, rng,
+                                       token_rate=args.token_rate, duplicate_rate=args.duplicate_rate)
+            paths = sorted(project.rglob("*.rpy"))
+            store = TMStore.instance()
+            fill_tm(store, sources, args.tm_hit_rate, rng)
+
+            results = {
+                "parse": bench_parse(paths),
+                "tm_lookup": bench_tm_lookup(store, sources),
+            }
+            if args.keys > 1:
+                configs = [replace(engine_config, seed=args.seed + n,
+                                   quota_after=args.quota_after if n == 0 else 0)
+                           for n in range(args.keys)]
+                with installed_fake_pool(configs) as (pool, models):
+                    results["translate"] = bench_translate(project, out_dir, args.jobs)
+                results["translate"]["backends"] = pool.snapshot()
+            else:
+                with installed_fake_model(replace(engine_config, quota_after=args.quota_after)) as model:
+                    results["translate"] = bench_translate(project, out_dir, args.jobs)
+                models = [model]
+            results["apply"] = bench_apply(paths)
+            results["preflight"] = bench_preflight(out_dir)
+        finally:
+            TMStore.reset_instance()
+            GlossaryStore.reset_instance()
+            config.DB_DIR = saved_db_dir
+
+    return {
+        "benchmark": "pipeline",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "engine": dict(engine_config.to_dict(), **merged_stats(models)),
+        "results": results,
+        "telemetry": results["translate"].pop("telemetry"),
+    }
+
+
+def print_report(report: Dict):
+    results = report["results"]
+    parse, tm, tr, apply, pf = (results[k] for k in ("parse", "tm_lookup", "translate", "apply", "preflight"))
+    print(f"parse:     {parse['files']} files, {parse['items']} items, {parse['size_mb']} MB "
+          f"in {parse['seconds']}s ({parse['mb_per_s']} MB/s)")
+    print(f"tm lookup: {tm['lookups']} lookups, {tm['hits']} hits in {tm['seconds']}s "
+          f"({tm['us_per_lookup']} us/lookup)")
+    print(f"translate: {tr['rows']} rows in {tr['seconds']}s ({tr['rows_per_s']} rows/s), "
+          f"{tr['api_calls']} api calls, {tr['tm_hits']} TM hits, {tr['failed']} failed, "
+          f"{tr['qc_errors']} QC errors")
+    print(f"apply:     {apply['rows']} rows in {apply['seconds']}s ({apply['us_per_row']} us/row)")
+    print(f"preflight: {pf['issues']} issues in {pf['seconds']}s")
+    engine = report["engine"]
+    print(f"engine:    {engine['requests']} requests, {engine['rate_limited']} rate limited, "
+          f"{engine['malformed']} malformed, {engine['dropped_tokens']} items lost tokens, "
+          f"{engine['repair_requests']} repair requests, {engine['quota_exceeded']} over quota")
+    for backend in tr.get("backends", ()):
+        print(f"  {backend['name']:>12}: {backend['requests']} chunks, {backend['failures']} failures, "
+              f"cooldown {backend['cooldown']:.0f}s")
+
+    from core import telemetry
+    counters = report["telemetry"].get("counters") or {}
+    if counters:
+        print("counters:  " + ", ".join(f"{name} {value}" for name, value in sorted(counters.items())))
+    for row in telemetry.breakdown(report["telemetry"]):
+        print(f"  {row['stage']:>12}: {row['count']:>6} x, {row['total_ms'] / 1000:8.2f}s "
+              f"({row['share']:6.1%}), p50 {row['p50_ms']:.0f} ms, p95 {row['p95_ms']:.0f} ms")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="RenForge end-to-end pipeline benchmark")
+    ap.add_argument('--files', type=int, default=20)
+    ap.add_argument('--lines-per-file', type=int, default=500)
+    ap.add_argument('--token-rate', type=float, default=0.3, help="Share of lines with a Ren'Py token")
+    ap.add_argument('--duplicate-rate', type=float, default=0.1, help="Share of repeated lines")
+    ap.add_argument('--tm-hit-rate', type=float, default=0.2, help="Share of lines already in the TM")
+    ap.add_argument('--latency-ms', type=float, default=150.0)
+    ap.add_argument('--per-item-ms', type=float, default=2.0)
+    ap.add_argument('--rate-429', type=float, default=0.0)
+    ap.add_argument('--malformed-rate', type=float, default=0.0)
+    ap.add_argument('--drop-token-rate', type=float, default=0.0,
+                    help="Share of items returned without their placeholders (exercises repair)")
+    ap.add_argument('--keys', type=int, default=1, help="Fake API keys balanced by the engine pool")
+    ap.add_argument('--quota-after', type=int, default=0,
+                    help="Requests before the first key is exhausted (0 = never)")
+    ap.add_argument('--jobs', type=int, default=3)
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--output', help="Write the JSON report to this file ('-' for stdout only)")
+    args = ap.parse_args(argv)
+
+    report = run(args)
+    if args.output == '-':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Fuzzy TM Benchmark
+
+Fills a temporary TM with N generated dialogue lines, builds the fuzzy
+(MinHash/LSH) index and runs lookups for edited copies of random entries
+(one word replaced, punctuation changed or a token renamed). Reports index
+build time, database size, recall (the edited entry's original is returned
+at or above the threshold) and lookup latency percentiles.
+
+Usage:
+    python -m benchmarks.bench_tm_fuzzy [--entries N] [--queries Q] [--threshold T]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import renforge_config as config
+from core.tm_store import TMStore, compute_hash
+
+WORDS = (
+    "the old house forest night door key light dark window letter friend "
+    "mother father school city river road station train morning evening "
+    "quiet strange tired happy afraid ready late early always never maybe "
+    "remember forget open close find lose wait leave stay come back again "
+    "tomorrow tonight yesterday really still just only very much little"
+).split()
+TOKENS = ("[name]", "[player]", "{i}", "{w}", "[mc]")
+EDITS = ("word", "punctuation", "token")
+
+
+def generate_sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 14))]
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words)), rng.choice(TOKENS))
+    return " ".join(words).capitalize() + rng.choice((".", "!", "?", "..."))
+
+
+def edit_sentence(text: str, rng: random.Random, kind: str) -> str:
+    words = text.split(" ")
+    if kind == "word":
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    elif kind == "punctuation":
+        return text.rstrip(".!?") + rng.choice((",", "!?", "."))
+    else:
+        words.insert(rng.randrange(len(words)), rng.choice(TOKENS))
+    return " ".join(words)
+
+
+def fill_store(store: TMStore, count: int, rng: random.Random) -> List[Tuple[int, str]]:
+    """Bulk insert `count` unique entries; return (id, source) pairs."""
+    now = datetime.now().isoformat()
+    seen = set()
+    rows = []
+    while len(rows) < count:
+        source = generate_sentence(rng)
+        source_hash = compute_hash(source, "en", "tr")
+        if source_hash in seen:
+            continue
+        seen.add(source_hash)
+        rows.append((source_hash, source, f"TR {source}", "en", "tr", now, now, 0, "bench"))
+    conn = store._get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO tm_entries (source_hash, source_text, target_text, source_lang, target_lang, "
+            "created_at, updated_at, use_count, origin) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+    return conn.execute("SELECT id, source_text FROM tm_entries").fetchall()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="RenForge fuzzy TM benchmark")
+    ap.add_argument('--entries', type=int, default=100_000)
+    ap.add_argument('--queries', type=int, default=1000)
+    ap.add_argument('--threshold', type=float, default=config.TM_FUZZY_MIN_SCORE)
+    ap.add_argument('--seed', type=int, default=1)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        config.DB_DIR = type(config.DB_DIR)(tmp)
+        TMStore.reset_instance()
+        store = TMStore.instance()
+
+        start = time.perf_counter()
+        entries = fill_store(store, args.entries, rng)
+        print(f"TM: {len(entries)} entries inserted in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        store.fuzzy_index.sync()
+        build = time.perf_counter() - start
+        size_mb = os.path.getsize(store.db_path) / (1024 * 1024)
+        print(f"Index: built in {build:.1f}s ({len(entries) / build:.0f} entries/s), "
+              f"database {size_mb:.1f} MB")
+
+        latencies: List[float] = []
+        found = {kind: [0, 0] for kind in EDITS}
+        for _ in range(args.queries):
+            entry_id, source = rng.choice(entries)
+            kind = rng.choice(EDITS)
+            query = edit_sentence(source, rng, kind)
+            start = time.perf_counter()
+            matches = store.lookup_fuzzy(query, "en", "tr", threshold=args.threshold)
+            latencies.append((time.perf_counter() - start) * 1000)
+            found[kind][1] += 1
+            if any(m.entry.id == entry_id for m in matches):
+                found[kind][0] += 1
+
+        hits = sum(h for h, _ in found.values())
+        print(f"Recall @ {args.threshold}: {hits / args.queries:.1%} "
+              + ", ".join(f"{kind} {h / n:.1%}" for kind, (h, n) in found.items() if n))
+        print(f"Latency: p50 {percentile(latencies, 0.5):.2f} ms, p95 {percentile(latencies, 0.95):.2f} ms, "
+              f"max {max(latencies):.2f} ms")
+        TMStore.reset_instance()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+unrpyc AST Loading Benchmark
+
+Writes large synthetic .rpyc files (RENPY RPC2 archive, zlib-compressed
+protocol 2 pickle of fake ren'py AST nodes, like Ren'Py 8 produces) and
+measures `unrpyc.read_ast_from_file` with the C unpickler fast path
+(`magic.FAST_UNPICKLING`) against the pure-Python `pickle._Unpickler` path
+the decompiler used before. Both paths must produce the same AST.
+
+It then compares getting translatable text by full decompile (AST -> .rpy
+text -> re-read -> DirectParser) with `utils.rpyc_extractor.extract_rpyc`,
+which walks the AST directly.
+
+Usage:
+    python -m benchmarks.bench_unrpyc [--statements N] [--files F] [--repeat R]
+"""
+
+import argparse
+import copyreg
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+UNRPYC_DIR = ROOT / "utils" / "unrpyc_lib"
+sys.path.insert(0, str(UNRPYC_DIR))
+sys.path.insert(0, str(ROOT))
+
+import decompiler  # noqa: E402
+import unrpyc  # noqa: E402  (vendored script; imports `decompiler` from its own dir)
+from decompiler import magic  # noqa: E402
+from parser.core import parse_file  # noqa: E402
+from utils.rpyc_extractor import extract_rpyc  # noqa: E402
+from decompiler.renpycompat import CLASS_FACTORY  # noqa: E402
+
+
+def _py_code(source: str, location: tuple):
+    """A renpy.ast.PyCode that pickles its (version, source, location, mode) state tuple."""
+    cls = CLASS_FACTORY("PyCode", "renpy.ast")
+    code = cls.__new__(cls)
+    state = (1, source, location, "exec")
+    code.__reduce_ex__ = lambda protocol: (copyreg.__newobj__, (cls,), state)
+    return code
+
+
+def _node(kind: str, **attributes):
+    """A fake renpy.ast node with slot-style state, as unpickled by unrpyc."""
+    cls = CLASS_FACTORY(kind, "renpy.ast")
+    node = cls.__new__(cls)
+    node.__dict__.update(attributes)
+    return node
+
+
+def generate_statements(count: int) -> List:
+    """Labels holding dialogue, menus and python blocks (~count nodes)."""
+    stmts = []
+    made = 0
+    block = 0
+    while made < count:
+        block += 1
+        loc = {"filename": "game/script.rpy", "linenumber": block * 10}
+        body = []
+        for n in range(8):
+            body.append(_node("Say", who="e", what=f"Line {n} of scene {block}, [player].",
+                              with_=None, interact=True, attributes=None, arguments=None,
+                              temporary_attributes=None, identifier=None, **loc))
+        items = [(f"Choice {c} of {block}", None,
+                  [_node("Jump", target=f"scene_{block + 1}", expression=False, **loc)])
+                 for c in range(3)]
+        body.append(_node("Menu", items=items, set=None, with_=None, has_caption=False,
+                          arguments=None, item_arguments=[None] * 3, statement_start=None, **loc))
+        code = _py_code(f"points += {block}", ("game/script.rpy", block))
+        body.append(_node("Python", hide=False, store="store", code=code, **loc))
+        stmts.append(_node("Label", name=f"scene_{block}", block=body, parameters=None,
+                           hide=False, **loc))
+        made += len(body) + 4
+    return stmts
+
+
+def write_rpyc(path: Path, stmts: List) -> int:
+    """RENPY RPC2 file with the pickled (data, stmts) in slot 1; returns the pickle size."""
+    blob = magic.safe_dumps(({"version": 5003000, "key": "bench"}, stmts), protocol=2)
+    compressed = zlib.compress(blob, 3)
+    header = b"RENPY RPC2" + struct.pack("III", 1, 10 + 24, len(compressed)) + struct.pack("III", 0, 0, 0)
+    path.write_bytes(header + compressed)
+    return len(blob)
+
+
+def load_all(paths: List[Path]) -> list:
+    results = []
+    for path in paths:
+        with path.open("rb") as f:
+            results.append(unrpyc.read_ast_from_file(f, unrpyc.Context()))
+    return results
+
+
+def measure(paths: List[Path], fast: bool, repeat: int):
+    magic.FAST_UNPICKLING = fast
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = load_all(paths)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def decompile_and_parse(paths: List[Path]) -> int:
+    """The prepare_project_files route: decompile to .rpy, read it back, parse it."""
+    items = 0
+    for path in paths:
+        with path.open("rb") as f:
+            stmts = unrpyc.read_ast_from_file(f, unrpyc.Context())
+        out = path.with_suffix(".rpy")
+        with out.open("w", encoding="utf-8") as f:
+            decompiler.pprint(f, stmts, decompiler.Options(log=[]))
+        lines = out.read_text(encoding="utf-8").splitlines()
+        items += len(parse_file(lines, "direct")[0])
+    return items
+
+
+def extract(paths: List[Path]) -> int:
+    return sum(len(extract_rpyc(path).entries) for path in paths)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def same_ast(a, b) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(same_ast(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same_ast(a[k], b[k]) for k in a)
+    if hasattr(a, "__dict__"):
+        return same_ast(a.__dict__, b.__dict__)
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statements", type=int, default=100_000, help="AST nodes per file")
+    parser.add_argument("--files", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="renforge_bench_rpyc_") as tmp:
+        paths = []
+        pickled = 0
+        for n in range(args.files):
+            path = Path(tmp) / f"script_{n}.rpyc"
+            pickled += write_rpyc(path, generate_statements(args.statements))
+            paths.append(path)
+        on_disk = sum(os.path.getsize(p) for p in paths)
+        print(f"Fixtures: {args.files} x ~{args.statements} nodes, "
+              f"{pickled / 1e6:.1f} MB pickled, {on_disk / 1e6:.1f} MB on disk")
+
+        try:
+            slow, slow_result = measure(paths, fast=False, repeat=args.repeat)
+            fast, fast_result = measure(paths, fast=True, repeat=args.repeat)
+        finally:
+            magic.FAST_UNPICKLING = True
+
+        decompile_seconds, parsed_items = timed(decompile_and_parse, paths)
+        extract_seconds, extracted_items = timed(extract, paths)
+
+    print(f"{'Path':<26}{'Seconds':>10}{'MB/s':>10}")
+    for name, seconds in (("pickle._Unpickler (py)", slow), ("pickle.Unpickler (C)", fast)):
+        print(f"{name:<26}{seconds:>10.3f}{pickled / 1e6 / seconds:>10.1f}")
+    print(f"Speedup: {slow / fast:.1f}x   identical AST: {same_ast(slow_result, fast_result)}")
+    print()
+    print(f"{'Text extraction':<26}{'Seconds':>10}{'Items':>10}")
+    print(f"{'decompile + DirectParser':<26}{decompile_seconds:>10.3f}{parsed_items:>10}")
+    print(f"{'extract_rpyc':<26}{extract_seconds:>10.3f}{extracted_items:>10}")
+    print(f"Speedup: {decompile_seconds / extract_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
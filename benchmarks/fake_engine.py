@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Fake Translation Engine
+
+In-process stand-in for the Gemini model used by the benchmarks. It is
+installed as `renforge_ai.gemini_model`, so the real batch path (masking,
+prompt build, backoff, strict JSON parsing, repair prompts) runs unchanged
+while the "network" is simulated:
+
+- latency: a base delay per request plus a per-item delay, with jitter
+- rate limits: a fraction of requests fail with a 429 error
+- malformed output: a fraction of batch responses are truncated JSON
+- lost tokens: a fraction of batch items come back without their
+  placeholders, so the batched repair request runs
+- streaming: with stream=True the answer is yielded in small pieces; the
+  first one arrives after the base latency, the rest over the per-item time
+- quota: after `quota_after` requests every request fails with a 429, like
+  an exhausted API key (installed_fake_pool balances several fake keys)
+
+Translations are deterministic ("TR " + source, placeholders kept), so runs
+with the same seed are reproducible.
+
+    from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+
+    with installed_fake_model(FakeEngineConfig(latency_ms=200, rate_429=0.02)):
+        renforge_ai.translate_text_batch_gemini_strict(texts, "en", "tr")
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+SOURCE_MARKER = "SOURCE TEXTS:\n"
+REPAIR_MARKER = "ITEMS TO FIX:\n"
+TOKEN_PATTERN = re.compile(r"⟦T\d+⟧")
+STREAM_PIECE_CHARS = 64      # Text per streamed response chunk
+
+
+@dataclass
+class FakeEngineConfig:
+    """Simulated engine behaviour."""
+    latency_ms: float = 150.0         # Per request
+    per_item_ms: float = 2.0          # Added per translated item
+    jitter: float = 0.2               # +/- fraction of the delay
+    rate_429: float = 0.0             # Fraction of requests failing with 429
+    malformed_rate: float = 0.0       # Fraction of batch responses cut short
+    drop_token_rate: float = 0.0      # Fraction of batch items returned without placeholders
+    quota_after: int = 0              # Requests before the "key" is exhausted (0 = never)
+    seed: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = [text] if text else []
+
+
+class FakeGeminiModel:
+    """Duck-typed `GenerativeModel` answering the prompts of renforge_ai."""
+
+    model_name = "models/fake-bench"
+
+    def __init__(self, engine_config: Optional[FakeEngineConfig] = None):
+        self.config = engine_config or FakeEngineConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "rate_limited": 0, "malformed": 0, "items": 0,
+                      "dropped_tokens": 0, "repair_requests": 0, "quota_exceeded": 0}
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def generate_content(self, prompt: str, safety_settings=None, generation_config=None, stream=False):
+        self._count("requests")
+        items = _prompt_items(prompt, SOURCE_MARKER)
+        repair = items is None
+        if repair:
+            items = _prompt_items(prompt, REPAIR_MARKER)
+        scale = 1.0 + self.config.jitter * (2.0 * self._roll() - 1.0)
+        base_ms = self.config.latency_ms * scale
+        items_ms = self.config.per_item_ms * len(items or ()) * scale
+        # Streaming: the first piece arrives after the base latency, the rest while items are generated
+        time.sleep(max(0.0, base_ms if stream else base_ms + items_ms) / 1000.0)
+
+        if self.config.quota_after and self.stats["requests"] > self.config.quota_after:
+            self._count("quota_exceeded")
+            raise RuntimeError("429 Quota exceeded for this API key (fake engine)")
+        if self._roll() < self.config.rate_429:
+            self._count("rate_limited")
+            raise RuntimeError("429 Resource exhausted (fake engine)")
+
+        text = self._answer(items, repair)
+        if not stream:
+            return _FakeResponse(text)
+        return self._stream(text, items_ms)
+
+    def _answer(self, items, repair: bool) -> str:
+        if items is None:
+            return ""
+        if repair:
+            self._count("repair_requests")
+        else:
+            self._count("items", len(items))
+
+        translations = []
+        for item in items:
+            text = f"TR {item['s']}"
+            if not repair and "⟦" in text and self._roll() < self.config.drop_token_rate:
+                self._count("dropped_tokens")
+                text = TOKEN_PATTERN.sub("", text)
+            translations.append({"i": item["i"], "t": text})
+        text = json.dumps({"translations": translations}, ensure_ascii=False)
+        if self._roll() < self.config.malformed_rate:
+            self._count("malformed")
+            text = text[:max(1, int(len(text) * self._roll()))]
+        return text
+
+    @staticmethod
+    def _stream(text: str, total_ms: float):
+        pieces = [text[n:n + STREAM_PIECE_CHARS] for n in range(0, len(text), STREAM_PIECE_CHARS)]
+        for piece in pieces:
+            time.sleep(max(0.0, total_ms) / len(pieces) / 1000.0)
+            yield _FakeResponse(piece)
+
+
+def _prompt_items(prompt: str, marker: str):
+    """The [{"i", "s", ...}] list after `marker`, or None if the prompt has none."""
+    start = prompt.rfind(marker)
+    if start < 0:
+        return None
+    line = prompt[start + len(marker):].split("\n", 1)[0]
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def merged_stats(models) -> Dict[str, int]:
+    """Stats of several fake models added up."""
+    total: Dict[str, int] = {}
+    for model in models:
+        for key, value in model.stats.items():
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+@contextmanager
+def installed_fake_model(engine_config: Optional[FakeEngineConfig] = None):
+    """Route renforge_ai's Gemini calls to a FakeGeminiModel (response cache off)."""
+    import renforge_ai as ai
+    import renforge_config as config
+
+    saved = (ai.gemini_model, ai.no_ai, config.RESPONSE_CACHE_ENABLED)
+    model = FakeGeminiModel(engine_config)
+    ai.gemini_model, ai.no_ai = model, False
+    config.RESPONSE_CACHE_ENABLED = False
+    try:
+        yield model
+    finally:
+        ai.gemini_model, ai.no_ai, config.RESPONSE_CACHE_ENABLED = saved
+
+
+@contextmanager
+def installed_fake_pool(engine_configs, **pool_kwargs):
+    """
+    Route renforge_ai's Gemini batches through an EnginePool with one fake
+    model ("key") per config; yields (pool, models).
+    """
+    import renforge_ai as ai
+    import renforge_config as config
+    from core.engine_pool import Backend, EnginePool
+
+    saved = (ai.gemini_model, ai.no_ai, ai.engine_pool, ai._engine_pool_owner, config.RESPONSE_CACHE_ENABLED)
+    models = [FakeGeminiModel(c) for c in engine_configs]
+    pool = EnginePool([Backend(f"fake-key-{n}", model) for n, model in enumerate(models)], **pool_kwargs)
+    ai.gemini_model, ai.no_ai = models[0], False
+    ai.engine_pool, ai._engine_pool_owner = pool, models[0]
+    config.RESPONSE_CACHE_ENABLED = False
+    try:
+        yield pool, models
+    finally:
+        (ai.gemini_model, ai.no_ai, ai.engine_pool, ai._engine_pool_owner,
+         config.RESPONSE_CACHE_ENABLED) = saved
@@ -16,6 +16,7 @@ import gui.gui_table_manager as table_manager
 from gui.views import batch_status_view, file_table_view
 from models.batch_undo import get_undo_manager
 from core.error_explainer import ErrorExplainer # New import
+from core import telemetry
 
 class BatchController(QObject):
     """
@@ -33,6 +34,9 @@ class BatchController(QObject):
     # Emits True when batch starts, False when batch finishes/cancels
     batch_running_changed = Signal(bool)
     
+    # Per-file progress of a project batch (file_path, done, total) for the Files page
+    file_progress_changed = Signal(str, int, int)
+    
     def __init__(self, main_window):
         """
         Initialize BatchController with reference to the main window.
@@ -57,6 +61,8 @@ class BatchController(QObject):
         self._last_run_context = {}
         self._last_error_summary = None # Stores smart error analysis result
         self._batch_start_time = None  # For duration measurement (Stage 8)
+        self._telemetry = None  # RunTelemetry of the running batch (owned by this controller)
+        self._telemetry_snapshot = {}  # Snapshot of the last finished run
     
     # =========================================================================
     # CENTRALIZED STATE MANAGEMENT
@@ -93,6 +99,10 @@ class BatchController(QObject):
         old_state = self._is_running
         self._is_running = is_running
         
+        # Every stop path (finish, cancel, start failure) ends this controller's run
+        if not is_running:
+            self._finish_telemetry()
+        
         # Emit dedicated signal for UI button enable/disable
         # This is THE authority for UI state
         self.batch_running_changed.emit(is_running)
@@ -102,6 +112,11 @@ class BatchController(QObject):
         
         logger.info(f"[BATCH] running: {old_state} -> {is_running} (reason={reason})")
     
+    def _finish_telemetry(self):
+        """Stop collecting for this controller's run and keep its snapshot for the RunRecord."""
+        run, self._telemetry = self._telemetry, None
+        self._telemetry_snapshot = telemetry.finish_run(run) if run else {}
+    
     def cancel(self):
         """
         Cancel the current batch operation.
@@ -338,6 +353,11 @@ class BatchController(QObject):
         
         self._total_items = total_items
         
+        # Per-stage timings/counters for this run (stored with the RunRecord)
+        if self._telemetry is not None:
+            telemetry.finish_run(self._telemetry)
+        self._telemetry = telemetry.start_run()
+        
         # Capture start time for duration measurement (Stage 8)
         import time
         self._batch_start_time = time.perf_counter()
@@ -348,6 +368,57 @@ class BatchController(QObject):
         # Emit initial status with "starting" stage
         self._emit_status(stage="starting")
 
+    def start_project_batch(self, files: list, context: dict = None):
+        """
+        Translate rows from several files in one deduplicated AI run.
+
+        Args:
+            files: List of (ParsedFile, indices) pairs
+            context: Optional run settings (source_lang, target_lang, ...)
+        """
+        if self._is_running:
+            logger.warning("[BatchController] Cannot start project batch: batch already running")
+            return None
+
+        ctx = dict(context or {})
+        ctx.setdefault('engine', 'ai')
+        ctx['scope'] = 'project'
+        ctx['file_count'] = len(files)
+
+        total = sum(len(indices) for _, indices in files)
+        self.start_batch(total, context=ctx)
+        if not self._is_running:
+            return None
+
+        tc = self.main.gui_handlers.translation_controller
+        worker, signals = tc.start_project_batch_translation(
+            files, ctx.get('source_lang'), ctx.get('target_lang')
+        )
+        self.set_active_worker(worker)
+        signals.progress.connect(self.handle_progress)
+        signals.file_progress.connect(self.file_progress_changed)
+        signals.item_updated.connect(self.handle_item_updated)
+        signals.finished.connect(self.handle_finished)
+        return worker
+
+    def handle_progress(self, current: int, total: int):
+        """Overall progress of the running batch (rows done / total)."""
+        self._total_processed = current
+        self._total_items = total
+        self._emit_status()
+
+    def cancel_file(self, file_path: str):
+        """
+        Drop one file's remaining rows from the running project batch.
+
+        Strings shared with other files are still translated for those
+        files; the run itself continues.
+        """
+        if not self._is_running or not hasattr(self._active_worker, 'cancel_file'):
+            return
+        logger.info(f"[BatchController] Cancelling project batch rows of {file_path}")
+        self._active_worker.cancel_file(file_path)
+
     def retry_failed_last_run(self):
         """
         Retry only the items that failed in the last run.
@@ -399,8 +470,9 @@ class BatchController(QObject):
             model = ctx.get('model')
             source = ctx.get('source_lang')
             target = ctx.get('target_lang')
+            # Failed rows must be asked again, not replayed from the response cache
             worker, _ = tc.start_batch_ai_translation(
-                current_file_data, indices_to_retry, model, source, target
+                current_file_data, indices_to_retry, model, source, target, use_cache=False
             )
         else:
             logger.error(f"[BatchController] Unknown engine in context: {engine}")
@@ -494,7 +566,7 @@ class BatchController(QObject):
         elif engine == 'ai':
             model = ctx.get('model')
             worker, _ = tc.start_batch_ai_translation(
-                current_file_data, indices, model, source, target
+                current_file_data, indices, model, source, target, use_cache=False
             )
             
         if worker:
@@ -751,16 +823,18 @@ class BatchController(QObject):
         
         if item_index == -1 and batch_items:
             # BATCH MODE: Process entire chunk at once
-            self._process_batch_chunk(
-                batch_items, current_file_data, current_items, 
-                current_lines, current_mode, table_widget
-            )
+            with telemetry.stage(telemetry.GUI_APPLY):
+                self._process_batch_chunk(
+                    batch_items, current_file_data, current_items, 
+                    current_lines, current_mode, table_widget
+                )
         elif item_index >= 0:
             # SINGLE ITEM MODE (legacy/Google translate)
-            self._process_single_item(
-                item_index, translated_text, current_file_data,
-                current_items, current_lines, current_mode, table_widget
-            )
+            with telemetry.stage(telemetry.GUI_APPLY):
+                self._process_single_item(
+                    item_index, translated_text, current_file_data,
+                    current_items, current_lines, current_mode, table_widget
+                )
     
     def _process_batch_chunk(self, batch_items, current_file_data, current_items, 
                               current_lines, current_mode, table_widget):
@@ -772,6 +846,7 @@ class BatchController(QObject):
         table_widget.setUpdatesEnabled(False)
         
         try:
+            applied = []
             for batch_item in batch_items:
                 idx = batch_item.get('index')
                 text = batch_item.get('text')
@@ -793,12 +868,14 @@ class BatchController(QObject):
                     # Fallback for non-ParsedItem objects
                     item_data.current_text = text
                     item_data.is_modified_session = True
+                applied.append(idx)
                 
                 # QC Check (Stage 6)
                 qc_patch = {}
                 try:
                     import core.qc_engine as qc_engine
-                    qc_issues = qc_engine.check_quality(item_data.original_text, text)
+                    with telemetry.stage(telemetry.QC):
+                        qc_issues = qc_engine.check_quality(item_data.original_text, text)
                     
                     has_issues = len(qc_issues) > 0
                     codes = [i.code for i in qc_issues]
@@ -866,6 +943,10 @@ class BatchController(QObject):
             # Mark file as modified once
             current_file_data.is_modified = True
             
+            # Re-check only these rows on the next QA read
+            from core.qa_engine import mark_dirty
+            mark_dirty(current_file_data, applied)
+            
             # Emit status update after processing chunk
             self._emit_status()
             
@@ -890,6 +971,9 @@ class BatchController(QObject):
         original_item_data.is_modified_session = True
         current_file_data.is_modified = True
         
+        from core.qa_engine import mark_dirty
+        mark_dirty(current_file_data, [item_index])
+        
         # Clear error on success
         current_file_data.clear_item_error(item_index)
         
@@ -902,7 +986,8 @@ class BatchController(QObject):
         qc_patch = {}
         try:
             import core.qc_engine as qc_engine
-            qc_issues = qc_engine.check_quality(original_item_data.original_text, translated_text)
+            with telemetry.stage(telemetry.QC):
+                qc_issues = qc_engine.check_quality(original_item_data.original_text, translated_text)
             
             has_issues = len(qc_issues) > 0
             codes = [i.code for i in qc_issues]
@@ -1124,6 +1209,8 @@ class BatchController(QObject):
             current_file_data.is_modified = True
         
         # SYNC TO MODEL: Set ERROR status on failed rows (AFTER table sync!)
+        # Project runs tag their errors with file_path; only the shown file's rows are synced
+        shown_path = current_file_data.file_path if current_file_data else None
         if self._structured_errors:
             try:
                 # Get current table model
@@ -1135,23 +1222,25 @@ class BatchController(QObject):
                         if hasattr(proxy_model, 'sourceModel'):
                             model = proxy_model.sourceModel()
                         
-                        if hasattr(model, '_rows'):
+                        if hasattr(model, 'update_single_row'):
                             from gui.models.row_data import RowStatus
                             
                             synced_count = 0
+                            row_count = model.rowCount()
                             for err in self._structured_errors:
+                                if err.get('file_path') not in (None, shown_path):
+                                    continue
                                 row_id = err.get('row_id')
-                                logger.debug(f"[BatchController] Error sync: row_id={row_id}, total_rows={len(model._rows)}")
-                                if row_id is not None and 0 <= row_id < len(model._rows):
-                                    row = model._rows[row_id]
-                                    row.status = RowStatus.ERROR
-                                    row.error_message = err.get('message', 'Error')
+                                logger.debug(f"[BatchController] Error sync: row_id={row_id}, total_rows={row_count}")
+                                if row_id is not None and 0 <= row_id < row_count:
+                                    # Through the model so counters and the problem-row index follow
+                                    model.update_single_row(row_id, {
+                                        "status": RowStatus.ERROR,
+                                        "error_message": err.get('message', 'Error'),
+                                    })
                                     synced_count += 1
                                     logger.info(f"[BatchController] Set row {row_id} to ERROR status")
                             
-                            # Notify view of changes
-                            model.layoutChanged.emit()
-                            
                             # CRITICAL: Invalidate filter proxy so it re-evaluates rows
                             if hasattr(proxy_model, 'invalidateFilter'):
                                 proxy_model.invalidateFilter()
@@ -1481,7 +1570,8 @@ class BatchController(QObject):
                 error_category_counts=error_category_counts,
                 qc_code_counts=qc_code_counts,
                 tm_hits=tm_hits,          # Stage 21
-                tm_applied=tm_applied     # Stage 21
+                tm_applied=tm_applied,    # Stage 21
+                telemetry=self._telemetry_snapshot
             )
             
             # Save to store
@@ -3,15 +3,15 @@
 RenForge File Controller
 
 Handles file-related business logic:
-- Opening and parsing files
+- Opening and parsing files (large files time-sliced on the event loop)
 - Saving files
 - File mode detection
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Set, Dict, Iterable, Iterator
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer, QCoreApplication
 
 from renforge_logger import get_logger
 from locales import tr
@@ -19,12 +19,20 @@ from models.parsed_file import ParsedFile, ParsedItem
 from models.project_model import ProjectModel
 from models.settings_model import SettingsModel
 from renforge_enums import FileMode
-import parser.core as parser
+from parser.engine import ParseStream, detect_mode
 import renforge_core as core
+from core import telemetry
 
 logger = get_logger("controllers.file")
 
 
+def _collect_lines(source: Iterable[str], sink: List[str]) -> Iterator[str]:
+    """Pass lines through while keeping them for the ParsedFile (needed to save)."""
+    for line in source:
+        sink.append(line)
+        yield line
+
+
 class FileController(QObject):
     """
     Controller for file operations.
@@ -37,6 +45,8 @@ class FileController(QObject):
     
     Signals:
         file_opened(ParsedFile): Emitted when a file is successfully opened
+            (large files may still be streaming in; see file_loaded)
+        file_loaded(str): Emitted with file path once all items are parsed
         file_saved(str): Emitted with file path when saved
         file_closed(str): Emitted with file path when closed
         file_error(str): Emitted with error message
@@ -44,11 +54,18 @@ class FileController(QObject):
     """
     
     file_opened = Signal(object)  # ParsedFile
+    file_loaded = Signal(str)  # path
     file_saved = Signal(str)  # path
     file_closed = Signal(str)  # path
     file_error = Signal(str)  # message
     mode_detection_needed = Signal(str, str)  # path, detected_mode
     
+    # Items parsed before file_opened is emitted (first screen of rows)
+    FIRST_SCREEN_ITEMS = 200
+    # Items parsed per event-loop slice while the rest streams in; each slice
+    # runs on the GUI thread, so this bounds how long one slice blocks input
+    STREAM_CHUNK_ITEMS = 2000
+    
     def __init__(
         self, 
         project_model: Optional[ProjectModel] = None,
@@ -65,6 +82,9 @@ class FileController(QObject):
         self._project = project_model or ProjectModel()
         self._settings = settings or SettingsModel.instance()
         
+        # file_path -> ParseStream for files still loading
+        self._streams: Dict[str, ParseStream] = {}
+        
         logger.debug("FileController initialized")
     
     # =========================================================================
@@ -80,6 +100,11 @@ class FileController(QObject):
         """
         Open and parse a Ren'Py file.
         
+        Large files are loaded time-sliced, not in a background thread: the
+        first screen of items is parsed before file_opened, the rest is
+        parsed and appended STREAM_CHUNK_ITEMS at a time on the GUI thread
+        between event-loop turns, and file_loaded is emitted at the end.
+        
         Args:
             file_path: Path to the file
             mode: 'direct' or 'translate', or None for auto-detect
@@ -104,26 +129,19 @@ class FileController(QObject):
             return self._project.get_file(file_path)
         
         try:
-            # Read file content
-            lines, breakpoints = self._read_and_process_file(file_path)
-            if lines is None:
-                self.file_error.emit(tr("error_reading_file", path=file_path))
-                return None
-            
-            # Detect mode if not specified
-            file_mode = self._determine_mode(lines, mode)
+            # Stream the file: parse just enough for the first screen of rows,
+            # emit file_opened, then append the rest in event-loop slices.
+            lines: List[str] = []
+            breakpoints: Set[int] = set()
+            source = _collect_lines(core.iter_source_lines(file_path, breakpoints), lines)
+            stream = ParseStream(source, self._requested_mode(mode))
             
-            # Parse file
-            items, detected_lang = self._parse_file(lines, file_mode)
-            
-            if items is None:
-                self.file_error.emit(tr("error_parsing_file", path=file_path))
-                return None
+            items = stream.take(self.FIRST_SCREEN_ITEMS)
+            file_mode = stream.mode
             
             # Create ParsedFile
             # Set language/model to None so UI preserves user's current selection
             # Only store detected_lang if use_detected_target_lang setting is enabled
-            use_detected = self._settings.use_detected_target_lang
             parsed_file = ParsedFile(
                 file_path=file_path,
                 mode=file_mode,
@@ -131,7 +149,7 @@ class FileController(QObject):
                 items=items,
                 breakpoints=breakpoints,
                 output_path=output_path or file_path,
-                target_language=detected_lang if use_detected and detected_lang else None,
+                target_language=self._detected_target_language(stream),
                 source_language=None,  # Use UI's current selection
                 selected_model=None    # Use UI's current selection
             )
@@ -139,16 +157,101 @@ class FileController(QObject):
             # Add to project
             self._project.add_file(parsed_file)
             
+            if stream.exhausted:
+                self._log_opened(parsed_file)
+                self.file_opened.emit(parsed_file)
+                return parsed_file
+            
+            parsed_file.begin_loading()
+            self._streams[file_path] = stream
             self.file_opened.emit(parsed_file)
-            logger.info(f"Opened file: {path.name} ({file_mode.value}, {len(items)} items)")
+            
+            if QCoreApplication.instance() is None:
+                # No event loop to schedule slices on (scripts, tests)
+                self.finish_loading(file_path)
+            else:
+                QTimer.singleShot(0, lambda: self._continue_loading(file_path))
             
             return parsed_file
             
         except Exception as e:
             logger.error(f"Error opening file {file_path}: {e}")
+            self._streams.pop(file_path, None)
             self.file_error.emit(str(e))
             return None
 
+    def _continue_loading(self, file_path: str):
+        """Parse and append the next slice (GUI thread), then yield to the event loop."""
+        stream = self._streams.get(file_path)
+        if stream is None:
+            return
+        
+        parsed_file = self._project.get_file(file_path)
+        if parsed_file is None:
+            # Closed while loading
+            self._streams.pop(file_path, None)
+            stream.close()
+            return
+        
+        try:
+            parsed_file.append_items(stream.take(self.STREAM_CHUNK_ITEMS))
+        except Exception as e:
+            logger.error(f"Error streaming file {file_path}: {e}")
+            self.file_error.emit(tr("error_parsing_file", path=file_path))
+            self._complete_loading(parsed_file)
+            return
+        
+        if stream.exhausted:
+            self._complete_loading(parsed_file)
+        else:
+            QTimer.singleShot(0, lambda: self._continue_loading(file_path))
+    
+    def finish_loading(self, file_path: str) -> None:
+        """
+        Parse the remainder of a streaming file synchronously.
+        
+        Used before operations that need every line/item (e.g. saving).
+        """
+        stream = self._streams.get(file_path)
+        parsed_file = self._project.get_file(file_path)
+        if stream is None or parsed_file is None:
+            return
+        
+        try:
+            parsed_file.append_items(list(stream))
+        except Exception as e:
+            logger.error(f"Error streaming file {file_path}: {e}")
+            self.file_error.emit(tr("error_parsing_file", path=file_path))
+        self._complete_loading(parsed_file)
+    
+    def _complete_loading(self, parsed_file: ParsedFile):
+        """Finalize a streaming load."""
+        stream = self._streams.pop(parsed_file.file_path, None)
+        if stream is not None:
+            stream.close()
+            if parsed_file.target_language is None:
+                parsed_file.target_language = self._detected_target_language(stream)
+        
+        parsed_file.finish_loading()
+        self._log_opened(parsed_file)
+        self.file_loaded.emit(parsed_file.file_path)
+    
+    def _detected_target_language(self, stream: ParseStream) -> Optional[str]:
+        """Detected language, if the use_detected_target_lang setting allows it."""
+        if self._settings.use_detected_target_lang and stream.language:
+            return stream.language
+        return None
+    
+    def _log_opened(self, parsed_file: ParsedFile):
+        logger.info(
+            f"Opened file: {parsed_file.filename} "
+            f"({parsed_file.mode.value}, {parsed_file.item_count} items)"
+        )
+    
+    def is_loading(self, file_path: str) -> bool:
+        """True while a file's items are still being streamed in."""
+        return file_path in self._streams
+
     def _read_and_process_file(self, file_path: str) -> Tuple[Optional[List[str]], set]:
         """
         Read file and extract breakpoints.
@@ -156,65 +259,39 @@ class FileController(QObject):
         Returns:
             (lines, breakpoints_set)
         """
-        import re
-        import renforge_config as config
-        
+        breakpoints = set()
         try:
-            path_obj = Path(file_path)
-            raw_lines = path_obj.read_text(encoding='utf-8-sig').splitlines()
-            
-            processed_lines = []
-            breakpoints = set()
-            
-            breakpoint_pattern = re.compile(r'^(.*?)(\s+' + re.escape(config.BREAKPOINT_MARKER) + r'\s*)$')
-            
-            for i, raw_line in enumerate(raw_lines):
-                match = breakpoint_pattern.search(raw_line)
-                if match:
-                    line_content = match.group(1)
-                    breakpoints.add(i)
-                    processed_lines.append(line_content)
-                else:
-                    processed_lines.append(raw_line)
-                    
-            return processed_lines, breakpoints
+            lines = list(core.iter_source_lines(file_path, breakpoints))
+            return lines, breakpoints
             
         except Exception as e:
             logger.error(f"Read error {file_path}: {e}")
             return None, set()
     
-    def _determine_mode(self, lines: List[str], requested_mode: Optional[str]) -> FileMode:
-        """Determine the file mode."""
+    def _requested_mode(self, requested_mode: Optional[str]) -> Optional[FileMode]:
+        """Map an explicit mode request to FileMode (None = auto-detect)."""
         if requested_mode == "translate":
             return FileMode.TRANSLATE
         elif requested_mode == "direct":
             return FileMode.DIRECT
         
-        # Auto-detect
-        detected = self._detect_mode(lines)
-        
         # Check settings for auto/manual
         if self._settings.mode_selection_method == "manual":
             # Will need to emit signal for UI to ask user, or handle interactively?
-            # For now, return detected to proceed.
+            # For now, auto-detect to proceed.
             # Signal handling requires async flow usually.
             pass
         
-        return detected
+        return None
     
-    def _detect_mode(self, lines: List[str]) -> FileMode:
+    def _detect_mode(self, lines: Iterable[str]) -> FileMode:
         """
         Detect file mode from content.
         
         Returns:
             FileMode.TRANSLATE if translation blocks found, else DIRECT
         """
-        for line in lines[:100]:  # Check first 100 lines
-            stripped = line.strip()
-            if stripped.startswith("translate ") and ":" in stripped:
-                return FileMode.TRANSLATE
-        
-        return FileMode.DIRECT
+        return detect_mode(lines)
     
     def detect_file_mode(self, file_path: str) -> Optional[str]:
         """
@@ -226,35 +303,16 @@ class FileController(QObject):
         Returns:
             "translate" or "direct" string, or None if error
         """
-        lines, _ = self._read_and_process_file(file_path)
-        if lines is None:
-            return None
-        return self._detect_mode(lines).value
-
-    def _parse_file(
-        self, 
-        lines: List[str], 
-        mode: FileMode
-    ) -> Tuple[Optional[List[ParsedItem]], Optional[str]]:
-        """
-        Parse file lines into ParsedItems.
-        
-        Returns:
-            Tuple of (items list, detected language code)
-        """
         try:
-            if mode == FileMode.TRANSLATE:
-                items, detected_lang = parser.parse_translate_mode(lines)
-            else:
-                items = parser.parse_direct_mode(lines)
-                detected_lang = None
-            
-            return items, detected_lang
-            
+            source = core.iter_source_lines(file_path, set())
+            try:
+                return self._detect_mode(source).value
+            finally:
+                source.close()
         except Exception as e:
-            logger.error(f"Parse error: {e}")
-            return None, None
-    
+            logger.error(f"Read error {file_path}: {e}")
+            return None
+
     # =========================================================================
     # FILE SAVING
     # =========================================================================
@@ -270,24 +328,14 @@ class FileController(QObject):
             True if successful
         """
         try:
-            # Update lines with current item values
-            self._apply_items_to_lines(parsed_file)
+            # Saving needs every line; finish a streaming load first
+            if parsed_file.is_loading:
+                self.finish_loading(parsed_file.file_path)
             
-            # Prepare lines (re-insert breakpoints)
-            # Use core helper if available, or duplicate logic
-            import renforge_config as config
+            # Apply item values to lines, re-insert breakpoints and write
+            with telemetry.stage(telemetry.SAVE):
+                core.save_parsed_file(parsed_file)
             
-            # Prepare logic here to avoid core dependency on prepare_lines_for_saving if we want to decouple
-            # But relying on core logic is fine if it works.
-            # core.prepare_lines_for_saving(lines, breakpoints)
-            
-            lines_to_save = core.prepare_lines_for_saving(parsed_file.lines, parsed_file.breakpoints)
-            
-            # Write to disk
-            path_obj = Path(parsed_file.output_path)
-            path_obj.write_text('\n'.join(lines_to_save) + '\n', encoding='utf-8')
-            
-            parsed_file.is_modified = False
             self.file_saved.emit(parsed_file.file_path)
             logger.info(f"Saved file: {parsed_file.output_path}")
             return True
@@ -297,36 +345,6 @@ class FileController(QObject):
             self.file_error.emit(str(e))
             return False
     
-    def _apply_items_to_lines(self, parsed_file: ParsedFile):
-        """Apply item changes back to lines array."""
-        for item in parsed_file.items:
-            if item.is_modified_session:
-                line_idx = item.line_index
-                parsed_data = item.parsed_data
-                
-                # Reconstruct line based on type and mode
-                new_line = self._reconstruct_line(item, parsed_file.mode)
-                parsed_file.update_line(line_idx, new_line)
-    
-    def _reconstruct_line(self, item: ParsedItem, mode: FileMode) -> str:
-        """Reconstruct a file line from ParsedItem."""
-        pd = item.parsed_data
-        indent = pd.get('indent', '')
-        prefix = pd.get('prefix', '')
-        suffix = pd.get('suffix', '')
-        text = item.current_text or ""
-
-        # Use robust parser reconstruction to preserve character tags (Fix P0 Bug #1)
-        try:
-            formatted = parser.format_line_from_components(item, text)
-            if formatted is not None:
-                return formatted
-        except Exception as e:
-            logger.warning(f"Parser reconstruction failed for item {item.line_index}: {e}. Falling back.")
-
-        # Fallback to basic reconstruction if parser fails
-        return f'{indent}{prefix}"{text}"{suffix}'
-    
     # =========================================================================
     # FILE CLOSING
     # =========================================================================
@@ -351,6 +369,10 @@ class FileController(QObject):
             # Caller should handle unsaved changes prompt
             return False
         
+        stream = self._streams.pop(file_path, None)
+        if stream is not None:
+            stream.close()
+        
         self._project.close_file(file_path)
         self.file_closed.emit(file_path)
         
@@ -68,9 +68,15 @@ class ProjectController:
         root_index = self.main.file_system_model.index(project_path)
         self.main.project_tree_view.setRootIndex(root_index)
         
-        # Hide extra columns (size, date, etc.)
+        # Hide extra columns (size, date, etc.); keep the progress column if any
+        progress_column = getattr(self.main.file_system_model, 'PROGRESS_COLUMN', None)
         for i in range(1, self.main.file_system_model.columnCount()):
-            self.main.project_tree_view.hideColumn(i)
+            self.main.project_tree_view.setColumnHidden(i, i != progress_column)
+        
+        # Index per-file progress in the background (cached in .renforge/)
+        indexer = getattr(self.main, 'project_indexer', None)
+        if indexer is not None:
+            indexer.start(project_path)
         
         # Show project panel
         self.main.project_view_button.setChecked(True)
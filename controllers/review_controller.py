@@ -12,6 +12,7 @@ v2 Changes:
 - Connected to model.stats_updated signal
 - Added revert_to_saved, toggle_flag, next_problem methods
 - Added approve_and_next with selection movement
+- Next/previous problem via the model's sorted problem-row index (bisect)
 """
 
 from datetime import datetime
@@ -95,6 +96,12 @@ class ReviewController(QObject):
             QKeySequence(Qt.Key.Key_F8), self.review_page
         )
         shortcut_next_problem.activated.connect(self._on_next_issue)
+        
+        # Shift+F8 = Previous problem
+        shortcut_prev_problem = QShortcut(
+            QKeySequence("Shift+F8"), self.review_page
+        )
+        shortcut_prev_problem.activated.connect(self._on_prev_issue)
     
     # =========================================================================
     # MODEL ACCESS
@@ -283,21 +290,8 @@ class ReviewController(QObject):
         for row_id in selected_ids:
             idx = model.get_index_by_id(row_id)
             if idx is not None:
-                row = model._rows[idx]
-                old_status = row.status
-                old_flagged = row.is_flagged
-                
-                # Use RowData's revert method
-                row.revert_to_saved()
-                
-                # Update counters
-                model._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
-                
-                # Emit dataChanged
-                from gui.models.translation_table_model import TableColumn
-                top_left = model.index(idx, 0)
-                bottom_right = model.index(idx, TableColumn.COUNT - 1)
-                model.dataChanged.emit(top_left, bottom_right)
+                # Model updates counters and the problem-row index
+                model.revert_row_to_saved(idx)
         
         logger.info(f"Reverted {len(selected_ids)} rows to saved state")
     
@@ -336,12 +330,57 @@ class ReviewController(QObject):
     @Slot()
     def _on_next_issue(self):
         """Navigate to next problem row."""
+        self._goto_issue(forward=True)
+    
+    @Slot()
+    def _on_prev_issue(self):
+        """Navigate to previous problem row."""
+        self._goto_issue(forward=False)
+    
+    def _goto_issue(self, forward: bool):
+        """
+        Select the next/previous problem row (wrapping around).
+        
+        The row comes from the model's sorted problem-row index, so this is a
+        bisect lookup instead of a walk over proxy rows; rows hidden by the
+        search filter are skipped via mapFromSource (no re-filtering).
+        """
         proxy = self._get_proxy_model()
         table = self.review_page.table_widget
         
         if proxy is None or table is None:
             return
         
+        model = proxy.sourceModel()
+        if model is None or not hasattr(model, 'next_row'):
+            self._step_proxy_row(proxy, table, forward)
+            return
+        
+        count = model.count_rows("problems")
+        if count == 0:
+            return
+        
+        # Current source row
+        current_idx = table.currentIndex()
+        if current_idx.isValid():
+            source_row = proxy.mapToSource(current_idx).row()
+        else:
+            source_row = -1 if forward else model.rowCount()
+        
+        step = model.next_row if forward else model.prev_row
+        row = source_row
+        for _ in range(count):
+            row = step("problems", row)
+            if row is None:
+                return
+            proxy_index = proxy.mapFromSource(model.index(row, 0))
+            if proxy_index.isValid():
+                table.setCurrentIndex(proxy_index)
+                table.selectRow(proxy_index.row())
+                return
+    
+    def _step_proxy_row(self, proxy, table, forward: bool):
+        """Fallback: move one proxy row (models without a row index)."""
         if proxy.rowCount() == 0:
             return
         
@@ -350,7 +389,7 @@ class ReviewController(QObject):
         current_row = current_idx.row() if current_idx.isValid() else -1
         
         # Move to next row (wrap around)
-        next_row = (current_row + 1) % proxy.rowCount()
+        next_row = (current_row + (1 if forward else -1)) % proxy.rowCount()
         next_index = proxy.index(next_row, 0)
         table.setCurrentIndex(next_index)
         table.selectRow(next_row)
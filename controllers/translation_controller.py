@@ -19,6 +19,7 @@ from locales import tr
 from models.parsed_file import ParsedFile, ParsedItem
 from models.settings_model import SettingsModel
 import renforge_ai as ai
+from core import telemetry
 
 logger = get_logger("controllers.translation")
 
@@ -40,7 +41,8 @@ class BatchAIWorkerSignals(QObject):
 class BatchAIWorker(QRunnable):
     """Background worker for batch AI translation."""
     
-    def __init__(self, parsed_file: ParsedFile, indices: List[int], model: str, source_lang: str, target_lang: str, controller: 'TranslationController'):
+    def __init__(self, parsed_file: ParsedFile, indices: List[int], model: str, source_lang: str, target_lang: str, controller: 'TranslationController',
+                 use_cache: bool = True):
         super().__init__()
         self.parsed_file = parsed_file
         self.indices = indices
@@ -48,6 +50,7 @@ class BatchAIWorker(QRunnable):
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.controller = controller
+        self.use_cache = use_cache  # False: yeniden denemeler yanıt önbelleğini atlar
         self.signals = BatchAIWorkerSignals()
         self._is_canceled = False
         
@@ -96,12 +99,14 @@ class BatchAIWorker(QRunnable):
         tm_applied_items = []  # UI güncellemesi için
         ai_items = []          # AI'a gönderilecekler
         ai_indices_internal = []  # AI item'ları için internal indexler
+        tm_results = {}
         
         try:
             from core.tm_precheck import tm_precheck_batch
-            tm_results, remaining_internal = tm_precheck_batch(
-                all_items, self.source_lang, self.target_lang, tm_context
-            )
+            with telemetry.stage(telemetry.TM_PRECHECK):
+                tm_results, remaining_internal = tm_precheck_batch(
+                    all_items, self.source_lang, self.target_lang, tm_context
+                )
             
             # TM'den alınanları hemen uygula
             for internal_idx, tm_result in tm_results.items():
@@ -195,6 +200,13 @@ class BatchAIWorker(QRunnable):
         def cancel_check():
             return self._is_canceled
         
+        # Benzer (fuzzy) TM eşleşmeleri prompt'a referans çeviri olarak eklenir
+        ai_examples = {}
+        for ai_idx, internal_idx in enumerate(ai_indices_internal):
+            tm_result = tm_results.get(internal_idx)
+            if tm_result is not None and tm_result.examples:
+                ai_examples[ai_idx] = tm_result.examples
+        
         try:
             # Stage 21: AI'a sadece TM'de olmayanları gönder
             batch_result = ai_module.translate_text_batch_gemini_strict(
@@ -203,7 +215,9 @@ class BatchAIWorker(QRunnable):
                 target_lang=self.target_lang,
                 glossary=getattr(config, 'TRANSLATION_GLOSSARY', None),
                 on_chunk_done=on_chunk_done,
-                cancel_check=cancel_check
+                cancel_check=cancel_check,
+                examples=ai_examples,
+                use_cache=self.use_cache
             )
             
             # Process final stats - Stage 21: TM applied'ı da ekle
@@ -332,7 +346,8 @@ class BatchGoogleWorker(QRunnable):
             # =================================================================
             try:
                 from core.tm_precheck import tm_precheck
-                tm_result = tm_precheck(text, self.source_lang, self.target_lang, tm_context)
+                with telemetry.stage(telemetry.TM_PRECHECK):
+                    tm_result = tm_precheck(text, self.source_lang, self.target_lang, tm_context)
                 
                 if tm_result.should_skip_provider:
                     # TM'den çeviri alındı, provider atla
@@ -354,7 +369,9 @@ class BatchGoogleWorker(QRunnable):
                 translated = None
                 for attempt in range(2):
                     try:
-                        translated = translator.translate(text)
+                        telemetry.count("requests")
+                        with telemetry.stage(telemetry.NETWORK):
+                            translated = translator.translate(text)
                         
                         if self._is_canceled:
                             results['canceled'] = True
@@ -423,6 +440,99 @@ class BatchGoogleWorker(QRunnable):
         self.signals.finished.emit(results)
 
 
+class ProjectBatchWorkerSignals(QObject):
+    """Signals for the ProjectBatchWorker."""
+    progress = Signal(int, int)
+    file_progress = Signal(str, int, int)  # file_path, done, total
+    item_updated = Signal(int, str, dict)
+    finished = Signal(dict)
+    error = Signal(str)
+
+
+class ProjectBatchWorker(QRunnable):
+    """
+    Background worker for project-wide batch AI translation.
+
+    Runs a ProjectBatchScheduler over several files: identical source
+    strings are translated once and the result is written to every row
+    that uses them.
+    """
+
+    def __init__(self, batches: List['FileBatch'], source_lang: str, target_lang: str,
+                 controller: 'TranslationController', max_workers: int, requests_per_minute: int):
+        super().__init__()
+        import renforge_config as config
+        import renforge_ai as ai_module
+        from core.batch_scheduler import ProjectBatchScheduler
+
+        self.batches = batches
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.controller = controller
+        self.signals = ProjectBatchWorkerSignals()
+        self._files = {b.file_path: b.parsed_file for b in batches}
+
+        def translate_batch(texts: List[str]) -> dict:
+            return ai_module.translate_text_batch_gemini_strict(
+                items=texts,
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                glossary=getattr(config, 'TRANSLATION_GLOSSARY', None),
+                cancel_check=lambda: self.scheduler.is_canceled
+            )
+
+        self.scheduler = ProjectBatchScheduler(
+            translate_batch,
+            max_workers=max_workers,
+            requests_per_minute=requests_per_minute,
+            chunk_items=ai_module.BATCH_CHUNK_MAX_ITEMS,
+            chunk_chars=ai_module.BATCH_CHUNK_MAX_CHARS,
+        )
+
+    def cancel(self):
+        self.scheduler.cancel()
+
+    def cancel_file(self, file_path: str):
+        self.scheduler.cancel_file(file_path)
+
+    def _on_items_translated(self, file_path: str, batch_items: List[dict]):
+        parsed_file = self._files.get(file_path)
+        for entry in batch_items:
+            item = parsed_file.get_item(entry["index"]) if parsed_file else None
+            if not item:
+                continue
+            try:
+                self.controller._tm_record(
+                    source_text=item.original_text,
+                    target_text=entry["text"],
+                    source_lang=self.source_lang,
+                    target_lang=self.target_lang,
+                    origin="gemini"
+                )
+            except Exception:
+                pass
+        self.signals.item_updated.emit(
+            -1, "", {"file_path": file_path, "batch_items": batch_items}
+        )
+
+    @Slot()
+    def run(self):
+        try:
+            results = self.scheduler.run(
+                self.batches,
+                on_file_progress=self.signals.file_progress.emit,
+                on_items_translated=self._on_items_translated,
+                on_progress=self.signals.progress.emit,
+            )
+        except Exception as e:
+            logger.exception(f"ProjectBatchWorker Error: {e}")
+            self.signals.error.emit(str(e))
+            results = {'total': 0, 'success_count': 0, 'error_count': 0,
+                       'canceled': False, 'files': {}, 'errors': [str(e)]}
+        results['processed'] = results['success_count'] + results['error_count']
+        self.signals.finished.emit(results)
+
+
 class TranslationController(QObject):
     """
     Controller for translation operations.
@@ -863,7 +973,8 @@ class TranslationController(QObject):
         indices: List[int],
         model: Optional[str] = None,
         source_lang: Optional[str] = None,
-        target_lang: Optional[str] = None
+        target_lang: Optional[str] = None,
+        use_cache: bool = True
     ) -> tuple:
         """
         Start an asynchronous batch AI translation.
@@ -874,6 +985,7 @@ class TranslationController(QObject):
             model: Optional model name override
             source_lang: Optional source language override
             target_lang: Optional target language override
+            use_cache: If False, skip the response cache (retries of failed rows)
             
         Returns:
             Tuple of (worker, signals)
@@ -883,7 +995,7 @@ class TranslationController(QObject):
         target = target_lang or self.target_language
         
         # Create worker
-        worker = BatchAIWorker(parsed_file, indices, model_name, source, target, self)
+        worker = BatchAIWorker(parsed_file, indices, model_name, source, target, self, use_cache)
         
         # Start in thread pool
         QThreadPool.globalInstance().start(worker)
@@ -913,6 +1025,45 @@ class TranslationController(QObject):
         QThreadPool.globalInstance().start(worker)
         return worker, worker.signals
     
+    def start_project_batch_translation(
+        self,
+        files: List[tuple],
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        requests_per_minute: Optional[int] = None
+    ) -> tuple:
+        """
+        Start an asynchronous AI batch translation across several files.
+
+        Identical source strings are translated once for the whole project
+        and fanned back out to every row that uses them.
+
+        Args:
+            files: List of (ParsedFile, indices) pairs
+            source_lang: Optional source language override
+            target_lang: Optional target language override
+            max_workers: Concurrent engine calls (default from config)
+            requests_per_minute: Shared request budget (default from config)
+
+        Returns:
+            Tuple of (worker, signals)
+        """
+        import renforge_config as config
+        from core.batch_scheduler import FileBatch
+
+        batches = [FileBatch(parsed_file, list(indices)) for parsed_file, indices in files]
+        worker = ProjectBatchWorker(
+            batches,
+            source_lang or self.source_language,
+            target_lang or self.target_language,
+            self,
+            max_workers if max_workers is not None else config.PROJECT_BATCH_MAX_WORKERS,
+            requests_per_minute if requests_per_minute is not None else config.PROJECT_BATCH_REQUESTS_PER_MINUTE,
+        )
+        QThreadPool.globalInstance().start(worker)
+        return worker, worker.signals
+
     def cancel_translation(self):
         """Cancel ongoing translation."""
         if self._is_translating:
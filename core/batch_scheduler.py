@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Project Batch Scheduler
+
+Translates rows from many files in one run:
+- Dedupes identical source strings across the whole project
+- Fans unique strings out to the engine in chunks, under a global
+  concurrency limit and a shared requests-per-minute budget
+- Routes each translation back to every (file, row) that uses it
+- Reports per-file progress and supports per-file / global cancellation
+
+The engine is any callable with the `translate_text_batch_gemini_strict`
+contract: `translate_batch(texts) -> {"translations": [{"i", "t"}], "errors": [{"i", "error"}]}`.
+Engine calls run on worker threads; results are applied to the ParsedFile
+models on the thread that called `run()`.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from core import telemetry
+from models.parsed_file import ParsedFile
+from renforge_logger import get_logger
+
+logger = get_logger("core.batch_scheduler")
+
+# Mirrors renforge_ai.BATCH_CHUNK_MAX_ITEMS / BATCH_CHUNK_MAX_CHARS so that one
+# scheduler chunk maps to one engine request.
+DEFAULT_CHUNK_ITEMS = 50
+DEFAULT_CHUNK_CHARS = 6000
+
+
+@dataclass
+class FileBatch:
+    """Rows of one file to translate."""
+    parsed_file: ParsedFile
+    indices: List[int]
+
+    @property
+    def file_path(self) -> str:
+        return self.parsed_file.file_path
+
+
+@dataclass
+class BatchPlan:
+    """
+    Deduplicated work for a project batch.
+
+    Attributes:
+        texts: Unique source strings, in first-seen order.
+        consumers: For each unique string, the (file_path, item_index) rows using it.
+        file_totals: Number of rows scheduled per file.
+        row_count: Total scheduled rows (before dedup).
+    """
+    texts: List[str] = field(default_factory=list)
+    consumers: List[List[Tuple[str, int]]] = field(default_factory=list)
+    file_totals: Dict[str, int] = field(default_factory=dict)
+    row_count: int = 0
+
+    @property
+    def duplicate_count(self) -> int:
+        return self.row_count - len(self.texts)
+
+
+class RequestBudget:
+    """
+    Sliding-window requests-per-minute budget shared by all workers.
+
+    Args:
+        requests_per_minute: Allowed requests per 60s window (0 = unlimited).
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, requests_per_minute: int = 0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._limit = max(0, int(requests_per_minute or 0))
+        self._clock = clock
+        self._sleep = sleep
+        self._stamps: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel_check: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Block until a request slot is free.
+
+        Returns:
+            False if cancelled while waiting, True otherwise.
+        """
+        if not self._limit:
+            return True
+        while True:
+            with self._lock:
+                now = self._clock()
+                while self._stamps and now - self._stamps[0] >= self.WINDOW_SECONDS:
+                    self._stamps.popleft()
+                if len(self._stamps) < self._limit:
+                    self._stamps.append(now)
+                    return True
+                wait_for = self.WINDOW_SECONDS - (now - self._stamps[0])
+            if cancel_check and cancel_check():
+                return False
+            # Sleep in short steps so cancellation stays responsive
+            step = min(wait_for, 0.5)
+            self._sleep(step)
+            telemetry.record(telemetry.THROTTLE, step)
+
+
+def plan_batches(batches: List[FileBatch]) -> BatchPlan:
+    """
+    Collect translatable rows and dedupe their source strings.
+
+    Rows without source text (blank or whitespace) are skipped, matching
+    BatchAIWorker.
+    """
+    plan = BatchPlan()
+    positions: Dict[str, int] = {}
+
+    for batch in batches:
+        path = batch.file_path
+        scheduled = 0
+        for idx in batch.indices:
+            item = batch.parsed_file.get_item(idx)
+            if not item:
+                continue
+            text = item.original_text or item.current_text
+            if not text or not text.strip():
+                continue
+
+            pos = positions.get(text)
+            if pos is None:
+                pos = positions[text] = len(plan.texts)
+                plan.texts.append(text)
+                plan.consumers.append([])
+            plan.consumers[pos].append((path, idx))
+            scheduled += 1
+        plan.file_totals[path] = plan.file_totals.get(path, 0) + scheduled
+        plan.row_count += scheduled
+
+    return plan
+
+
+def chunk_unique_texts(texts: List[str], max_items: int = DEFAULT_CHUNK_ITEMS,
+                       max_chars: int = DEFAULT_CHUNK_CHARS) -> List[List[int]]:
+    """Split unique string positions into engine-sized chunks."""
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    chars = 0
+    for pos, text in enumerate(texts):
+        if current and (len(current) >= max_items or chars + len(text) > max_chars):
+            chunks.append(current)
+            current, chars = [], 0
+        current.append(pos)
+        chars += len(text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ProjectBatchScheduler:
+    """
+    Runs a deduplicated batch translation over several files.
+
+    Callbacks (all invoked on the thread running `run()`):
+        on_file_progress(file_path, done, total)
+        on_items_translated(file_path, [{"index": i, "text": t}, ...])
+        on_progress(done, total) - project-wide row counts
+    """
+
+    def __init__(
+        self,
+        translate_batch: Callable[[List[str]], dict],
+        *,
+        max_workers: int = 3,
+        requests_per_minute: int = 0,
+        chunk_items: int = DEFAULT_CHUNK_ITEMS,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    ):
+        self._translate_batch = translate_batch
+        self._max_workers = max(1, int(max_workers))
+        self._budget = RequestBudget(requests_per_minute)
+        self._chunk_items = chunk_items
+        self._chunk_chars = chunk_chars
+        self._canceled = threading.Event()
+        self._canceled_files: set = set()
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # CANCELLATION
+    # =========================================================================
+
+    def cancel(self):
+        """Cancel the whole run; requests already in flight are still applied."""
+        self._canceled.set()
+
+    def cancel_file(self, file_path: str):
+        """Stop routing results to one file; its rows no longer need requests."""
+        with self._lock:
+            self._canceled_files.add(file_path)
+
+    @property
+    def is_canceled(self) -> bool:
+        return self._canceled.is_set()
+
+    def _file_canceled(self, file_path: str) -> bool:
+        with self._lock:
+            return file_path in self._canceled_files
+
+    # =========================================================================
+    # RUN
+    # =========================================================================
+
+    def run(
+        self,
+        batches: List[FileBatch],
+        on_file_progress: Optional[Callable[[str, int, int], None]] = None,
+        on_items_translated: Optional[Callable[[str, List[dict]], None]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """
+        Translate all rows of `batches`.
+
+        Returns:
+            Result dict with project totals, merged 'errors' /
+            'structured_errors' (tagged with file_path) and a 'files' entry
+            per file holding success_count / error_count / failed_indices /
+            structured_errors / canceled, like BatchAIWorker results.
+        """
+        files = {b.file_path: b.parsed_file for b in batches}
+        plan = plan_batches(batches)
+        chunks = chunk_unique_texts(plan.texts, self._chunk_items, self._chunk_chars)
+
+        results = {
+            'total': plan.row_count,
+            'unique': len(plan.texts),
+            'deduplicated': plan.duplicate_count,
+            'chunks': len(chunks),
+            'api_calls': 0,
+            'success_count': 0,
+            'error_count': 0,
+            'canceled': False,
+            'errors': [],
+            'structured_errors': [],
+            'files': {
+                path: {
+                    'total': plan.file_totals.get(path, 0), 'processed': 0,
+                    'success_count': 0, 'error_count': 0, 'failed_indices': [],
+                    'structured_errors': [], 'canceled': False,
+                }
+                for path in files
+            },
+        }
+        logger.info(f"[ProjectBatch] {len(files)} files, {plan.row_count} rows, "
+                    f"{len(plan.texts)} unique ({plan.duplicate_count} deduplicated), "
+                    f"{len(chunks)} chunks")
+
+        done_rows = 0
+        pending = deque(chunks)
+
+        def wanted(chunk: List[int]) -> bool:
+            return any(not self._file_canceled(path)
+                       for pos in chunk for path, _ in plan.consumers[pos])
+
+        def call_engine(chunk: List[int]) -> Optional[dict]:
+            if not self._budget.acquire(self._canceled.is_set):
+                return None
+            if self._canceled.is_set():
+                return None
+            return self._translate_batch([plan.texts[pos] for pos in chunk])
+
+        with ThreadPoolExecutor(max_workers=self._max_workers,
+                                thread_name_prefix="ProjectBatch") as executor:
+            in_flight = {}
+            while pending or in_flight:
+                while pending and len(in_flight) < self._max_workers and not self.is_canceled:
+                    chunk = pending.popleft()
+                    if wanted(chunk):
+                        in_flight[executor.submit(call_engine, chunk)] = chunk
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk = in_flight.pop(future)
+                    try:
+                        response = future.result()
+                        error = None
+                    except Exception as e:
+                        logger.error(f"[ProjectBatch] Chunk failed: {e}")
+                        response, error = None, str(e)
+                    if response is None and error is None:
+                        continue  # Canceled before the request was made
+                    results['api_calls'] += 1
+
+                    done_rows += self._route(plan, files, chunk, response, error,
+                                             results, on_file_progress, on_items_translated)
+                    if on_progress:
+                        on_progress(done_rows, plan.row_count)
+
+        results['canceled'] = self.is_canceled
+        for path, file_result in results['files'].items():
+            if self.is_canceled or self._file_canceled(path):
+                file_result['canceled'] = file_result['processed'] < file_result['total']
+        return results
+
+    def _route(self, plan: BatchPlan, files: Dict[str, ParsedFile], chunk: List[int],
+               response: Optional[dict], error: Optional[str], results: dict,
+               on_file_progress, on_items_translated) -> int:
+        """Apply one engine response to every consumer row. Returns rows resolved."""
+        translations: Dict[int, str] = {}
+        failures: Dict[int, str] = {}
+        if response is not None:
+            for t_item in response.get("translations", []):
+                i, text = t_item.get("i"), t_item.get("t")
+                if i is None or not 0 <= i < len(chunk):
+                    continue
+                if t_item.get("fallback"):
+                    failures[i] = f"Fallback - {t_item.get('error_reason', 'validation failed')}"
+                elif text and text.strip():
+                    translations[i] = text
+            for err in response.get("errors", []):
+                i = err.get("i")
+                if i is not None and 0 <= i < len(chunk) and i not in translations:
+                    failures[i] = err.get('error', 'Unknown error')
+
+        updates: Dict[str, List[dict]] = {}
+        resolved = 0
+        for i, pos in enumerate(chunk):
+            text = translations.get(i)
+            message = None if text else (error or failures.get(i, 'No translation returned'))
+            for path, idx in plan.consumers[pos]:
+                if self._file_canceled(path):
+                    continue
+                file_result = results['files'][path]
+                file_result['processed'] += 1
+                resolved += 1
+                if text:
+                    files[path].update_item_text(idx, text)
+                    updates.setdefault(path, []).append({"index": idx, "text": text})
+                    file_result['success_count'] += 1
+                    results['success_count'] += 1
+                else:
+                    item = files[path].get_item(idx)
+                    line_idx = item.line_index if item else idx
+                    error_entry = {
+                        'row_id': idx,
+                        'file_line': line_idx,
+                        'message': message,
+                        'code': 'BATCH_API_ERROR',
+                    }
+                    file_result['error_count'] += 1
+                    file_result['failed_indices'].append(idx)
+                    file_result['structured_errors'].append(error_entry)
+                    results['error_count'] += 1
+                    results['errors'].append(f"{path}: Line {line_idx}: {message}")
+                    results['structured_errors'].append(dict(error_entry, file_path=path))
+
+        for path, batch_items in updates.items():
+            if on_items_translated:
+                on_items_translated(path, batch_items)
+        if on_file_progress:
+            touched = {path for pos in chunk for path, _ in plan.consumers[pos]}
+            for path in touched:
+                if not self._file_canceled(path):
+                    file_result = results['files'][path]
+                    on_file_progress(path, file_result['processed'], file_result['total'])
+        return resolved
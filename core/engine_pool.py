@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Engine Pool
+
+Load balancer over several translation backends: Gemini models bound to
+different API keys, plus secondary engines (Google) used only when no
+primary backend is healthy.
+
+- Each chunk goes to the least-loaded healthy backend of the best tier:
+  in-flight requests / weight, then total requests / weight, so serial
+  runs rotate through keys in proportion to their weights.
+- A backend with a requests-per-minute budget is skipped while its window
+  is full.
+- Quota errors (429, resource exhausted) put a backend in cooldown that
+  doubles with every repeated strike, up to a maximum. Key errors
+  (invalid, expired, leaked, permission denied) quarantine it for much
+  longer.
+- When every primary backend is down, the remaining chunks fail over to
+  the next tier. Primaries come back automatically after their cooldown.
+
+    pool = EnginePool([Backend("key-1", client=model_1), Backend("key-2", client=model_2, weight=2),
+                       Backend("google", kind=KIND_GOOGLE, client=GoogleTranslator, tier=1)])
+    backend = pool.acquire()
+    ...
+    pool.release(backend, error)   # error text or None
+
+Thread-safe: the project batch scheduler's workers share one pool.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.engine_pool")
+
+KIND_GEMINI = "gemini"
+KIND_GOOGLE = "google"
+
+ERROR_QUOTA = "quota"
+ERROR_AUTH = "auth"
+
+WINDOW_SECONDS = 60.0
+
+_QUOTA_KEYWORDS = ("429", "quota", "resource exhausted", "resource_exhausted", "rate limit")
+_AUTH_KEYWORDS = ("leaked", "expired", "invalid", "not valid", "permission", "403", "unauthenticated")
+
+
+def classify_error(error: Optional[str]) -> Optional[str]:
+    """ERROR_AUTH, ERROR_QUOTA or None for an engine error message."""
+    if not error:
+        return None
+    text = error.lower()
+    if any(k in text for k in _AUTH_KEYWORDS) and ("key" in text or "403" in text or "permission" in text):
+        return ERROR_AUTH
+    if any(k in text for k in _QUOTA_KEYWORDS):
+        return ERROR_QUOTA
+    return None
+
+
+@dataclass
+class Backend:
+    """
+    One translation backend.
+
+    Attributes:
+        name: Display name (e.g. "gemini-2.0-flash …a1b2"; never the full key)
+        kind: KIND_GEMINI (client has generate_content) or KIND_GOOGLE
+              (client is a translator class taking source=/target=)
+        client: Model object or translator class
+        weight: Share of the traffic relative to the other backends of its tier
+        tier: 0 = primary; higher tiers are used only when lower ones are down
+        requests_per_minute: Request budget of the key (0 = unlimited)
+    """
+    name: str
+    client: Any
+    kind: str = KIND_GEMINI
+    weight: float = 1.0
+    tier: int = 0
+    requests_per_minute: int = 0
+
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    strikes: int = 0                  # Consecutive quota errors
+    cooldown_until: float = 0.0
+    last_error: Optional[str] = None
+    _stamps: Deque[float] = field(default_factory=deque, repr=False)
+
+    def load(self) -> tuple:
+        weight = max(self.weight, 1e-6)
+        return (self.in_flight / weight, self.requests / weight)
+
+
+class EnginePool:
+    """
+    Weighted, quota-aware pool of backends with quarantine and failover.
+
+    Args:
+        backends: Backends in preference order (ties go to the first)
+        quota_cooldown: Seconds a backend rests after its first quota error
+        max_cooldown: Cap of the doubling quota cooldown
+        auth_cooldown: Seconds a backend rests after a key error
+    """
+
+    def __init__(self, backends: Iterable[Backend], quota_cooldown: float = 60.0,
+                 max_cooldown: float = 900.0, auth_cooldown: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.backends: List[Backend] = list(backends)
+        self.quota_cooldown = quota_cooldown
+        self.max_cooldown = max_cooldown
+        self.auth_cooldown = auth_cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # ROUTING
+    # =========================================================================
+
+    def acquire(self, exclude: Iterable[str] = ()) -> Optional[Backend]:
+        """
+        Reserve the least-loaded healthy backend of the best available tier.
+
+        Args:
+            exclude: Names of backends not to use (e.g. already tried for this chunk)
+
+        Returns:
+            The backend (call release() when done), or None if none is usable
+        """
+        excluded = set(exclude)
+        with self._lock:
+            now = self._clock()
+            candidates = [b for b in self.backends
+                          if b.name not in excluded and self._usable(b, now)]
+            if not candidates:
+                return None
+            tier = min(b.tier for b in candidates)
+            backend = min((b for b in candidates if b.tier == tier), key=Backend.load)
+            backend.in_flight += 1
+            backend.requests += 1
+            if backend.requests_per_minute:
+                backend._stamps.append(now)
+            return backend
+
+    def release(self, backend: Backend, error: Optional[str] = None):
+        """Return a backend; a quota or key error puts it in cooldown."""
+        kind = classify_error(error)
+        with self._lock:
+            backend.in_flight = max(0, backend.in_flight - 1)
+            if kind is None:
+                backend.strikes = 0
+                return
+            backend.failures += 1
+            backend.last_error = error
+            if kind == ERROR_AUTH:
+                cooldown = self.auth_cooldown
+            else:
+                backend.strikes += 1
+                cooldown = min(self.quota_cooldown * 2 ** (backend.strikes - 1), self.max_cooldown)
+            backend.cooldown_until = self._clock() + cooldown
+        logger.warning(f"[EnginePool] {backend.name} quarantined for {cooldown:.0f}s ({kind}): {error}")
+
+    def has_alternative(self, backend: Backend) -> bool:
+        """True if another backend could take over right now."""
+        with self._lock:
+            now = self._clock()
+            return any(b is not backend and self._usable(b, now) for b in self.backends)
+
+    def _usable(self, backend: Backend, now: float) -> bool:
+        if backend.cooldown_until > now:
+            return False
+        if backend.requests_per_minute:
+            stamps = backend._stamps
+            while stamps and now - stamps[0] >= WINDOW_SECONDS:
+                stamps.popleft()
+            if len(stamps) >= backend.requests_per_minute:
+                return False
+        return True
+
+    # =========================================================================
+    # STATUS
+    # =========================================================================
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-backend state for logs and the UI."""
+        with self._lock:
+            now = self._clock()
+            return [{
+                "name": b.name,
+                "kind": b.kind,
+                "tier": b.tier,
+                "weight": b.weight,
+                "in_flight": b.in_flight,
+                "requests": b.requests,
+                "failures": b.failures,
+                "cooldown": max(0.0, b.cooldown_until - now),
+                "last_error": b.last_error,
+            } for b in self.backends]
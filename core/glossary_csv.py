@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Glossary CSV Import/Export (streaming)
+
+Rows are read with csv.DictReader and handed to GlossaryStore.bulk_upsert
+as a generator, so a 50k-term client glossary is imported in a few chunked
+transactions without loading the file. .tbx files are routed to
+core.glossary_tbx by import_to_glossary_store.
+
+Column names (case-insensitive, first match wins):
+    term_src      source, term, src
+    term_dst      target, translation, dst
+    category, notes, case_sensitive, whole_word, enabled, is_regex,
+    source_lang, target_lang, updated_at
+
+Conflict strategies (same names as the Glossary page import dialog):
+    skip          Keep the existing term
+    overwrite     Replace with the imported term
+    keep_newest   Replace if the imported row's updated_at is newer
+"""
+
+import csv
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from core.glossary_store import ANY_LANG, GlossaryStore, STRATEGY_SKIP
+from renforge_logger import get_logger
+
+logger = get_logger("core.glossary_csv")
+
+DEFAULT_CHUNK_SIZE = 5000
+
+EXPORT_COLUMNS = (
+    "term_src", "term_dst", "source_lang", "target_lang", "category", "notes",
+    "case_sensitive", "whole_word", "is_regex", "enabled", "updated_at",
+)
+
+_COLUMN_ALIASES = {
+    "term_src": ("term_src", "source", "term", "src"),
+    "term_dst": ("term_dst", "target", "translation", "dst"),
+    "category": ("category",),
+    "notes": ("notes", "note", "comment"),
+    "case_sensitive": ("case_sensitive",),
+    "whole_word": ("whole_word",),
+    "is_regex": ("is_regex", "regex"),
+    "enabled": ("enabled",),
+    "source_lang": ("source_lang",),
+    "target_lang": ("target_lang",),
+    "updated_at": ("updated_at",),
+}
+
+_BOOL_FIELDS = ("case_sensitive", "whole_word", "is_regex", "enabled")
+_TRUE_VALUES = ("1", "true", "yes", "y", "evet", "x")
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _column_map(fieldnames) -> Dict[str, str]:
+    """Glossary field -> CSV header, using the aliases above."""
+    headers = {(name or "").strip().lower(): name for name in fieldnames or []}
+    mapping = {}
+    for field, aliases in _COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in headers:
+                mapping[field] = headers[alias]
+                break
+    return mapping
+
+
+def iter_csv_terms(csv_path, source_lang: Optional[str] = None,
+                   target_lang: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Stream term dicts from a glossary CSV.
+
+    Args:
+        csv_path: CSV file (UTF-8, optional BOM)
+        source_lang: Language pair for rows without a source_lang column value
+        target_lang: Language pair for rows without a target_lang column value
+    """
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        mapping = _column_map(reader.fieldnames)
+        if "term_src" not in mapping or "term_dst" not in mapping:
+            raise ValueError("CSV needs source and target term columns (term_src, term_dst)")
+
+        for row in reader:
+            term = {}
+            for field, header in mapping.items():
+                value = row.get(header)
+                if value is None or value == "":
+                    continue
+                term[field] = _parse_bool(value) if field in _BOOL_FIELDS else value
+            term.setdefault("source_lang", source_lang)
+            term.setdefault("target_lang", target_lang)
+            yield term
+
+
+def import_to_glossary_store(
+    file_path,
+    strategy: str = STRATEGY_SKIP,
+    source_lang: Optional[str] = None,
+    target_lang: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    store: Optional[GlossaryStore] = None,
+) -> Dict[str, int]:
+    """
+    Import a glossary CSV (or TBX) file into the glossary store.
+
+    Args:
+        file_path: .csv or .tbx file
+        strategy: Conflict strategy (see module docstring)
+        source_lang: Default source language of the imported terms (None = any)
+        target_lang: Default target language of the imported terms (None = any)
+        chunk_size: Terms per transaction
+        progress_callback: Optional callback(terms_read)
+        store: GlossaryStore to import into (default: singleton)
+
+    Returns:
+        {'total', 'added', 'updated', 'skipped', 'conflicts'}
+    """
+    store = store or GlossaryStore.instance()
+    if Path(file_path).suffix.lower() == ".tbx":
+        from core.glossary_tbx import iter_tbx_terms
+        terms = iter_tbx_terms(file_path, source_lang, target_lang)
+    else:
+        terms = iter_csv_terms(file_path, source_lang, target_lang)
+
+    result = store.bulk_upsert(terms, strategy, chunk_size=chunk_size,
+                               progress_callback=progress_callback)
+    logger.info(f"[Glossary] Imported {file_path}: {result}")
+    return result
+
+
+def export_from_glossary_store(
+    csv_path,
+    source_lang: Optional[str] = None,
+    target_lang: Optional[str] = None,
+    store: Optional[GlossaryStore] = None,
+) -> int:
+    """
+    Write the glossary (optionally one language pair) to a CSV file.
+
+    Returns:
+        Number of exported terms
+    """
+    store = store or GlossaryStore.instance()
+    count = 0
+    with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for entry in store.iter_entries(source_lang, target_lang, include_disabled=True):
+            writer.writerow([
+                entry.term_src, entry.term_dst,
+                "" if entry.source_lang == ANY_LANG else entry.source_lang,
+                "" if entry.target_lang == ANY_LANG else entry.target_lang,
+                entry.category, entry.notes,
+                int(entry.case_sensitive), int(entry.whole_word), int(entry.is_regex),
+                int(entry.enabled), entry.updated_at,
+            ])
+            count += 1
+    logger.info(f"[Glossary] Exported {count} terms to {csv_path}")
+    return count
@@ -1,8 +1,9 @@
+from typing import Optional
 
-import re
-import json
 from renforge_logger import get_logger
-import renforge_settings as rf_settings
+from core.glossary_store import (
+    GlossaryStore, GlossaryEntry, STRATEGY_SKIP, STRATEGY_OVERWRITE, terms_from_legacy
+)
 from core.text_utils import mask_renpy_tokens, unmask_renpy_tokens
 
 logger = get_logger("core.glossary")
@@ -10,142 +11,133 @@ logger = get_logger("core.glossary")
 class GlossaryManager:
     """
     Manages translation glossary terms and application logic.
-    Persists data via renforge_settings.
+    Persists data via GlossaryStore; terms are dicts of
+    {'source', 'target', 'mode', 'enabled'} for the dock panel and packs.
+
+    With a language pair set, only that pair's terms (and terms stored for
+    any pair) are listed and applied.
     """
-    
+
     MODE_EXACT = "exact"
-    MODE_CASE_INSENSITIVE = "case" 
+    MODE_CASE_INSENSITIVE = "case"
     MODE_REGEX = "regex"
 
-    def __init__(self):
-        self.terms = []
-        self.load_from_settings()
-
-    def load_from_settings(self):
-        """Load glossary terms from global settings."""
-        settings = rf_settings.load_settings()
-        self.terms = settings.get("glossary_terms", [])
-        logger.debug(f"Loaded {len(self.terms)} glossary terms.")
-
-    def save_to_settings(self):
-        """Save current terms to global settings."""
-        settings = rf_settings.load_settings()
-        settings["glossary_terms"] = self.terms
-        rf_settings.save_settings(settings)
+    # merge_glossary strategy -> GlossaryStore.bulk_upsert strategy
+    _MERGE_STRATEGIES = {
+        "MERGE_PREFER_LOCAL": STRATEGY_SKIP,
+        "MERGE_PREFER_IMPORTED": STRATEGY_OVERWRITE,
+        "OVERWRITE": STRATEGY_OVERWRITE,
+    }
+
+    def __init__(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None):
+        self.store = GlossaryStore.instance()
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+
+    def set_language_pair(self, source_lang: Optional[str], target_lang: Optional[str]):
+        """Restrict listing and application to one language pair."""
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+
+    @property
+    def terms(self):
+        return self.get_terms()
+
+    def _entries(self):
+        return self.store.list_all(include_disabled=True, source_lang=self.source_lang,
+                                   target_lang=self.target_lang)
+
+    @classmethod
+    def _to_dict(cls, entry: GlossaryEntry) -> dict:
+        if entry.is_regex:
+            mode = cls.MODE_REGEX
+        elif entry.case_sensitive:
+            mode = cls.MODE_EXACT
+        else:
+            mode = cls.MODE_CASE_INSENSITIVE
+        return {
+            "source": entry.term_src,
+            "target": entry.term_dst,
+            "mode": mode,
+            "enabled": entry.enabled,
+        }
+
+    def _store_fields(self, source, target, match_mode, enabled) -> dict:
+        fields = terms_from_legacy({"source": source, "target": target,
+                                    "mode": match_mode, "enabled": enabled})
+        fields["source_lang"] = self.source_lang
+        fields["target_lang"] = self.target_lang
+        return fields
 
     def add_term(self, source, target, match_mode=MODE_CASE_INSENSITIVE, enabled=True):
         """Add or update a term."""
-        # Simple implementation: unique by source
-        for term in self.terms:
-            if term["source"] == source:
-                term["target"] = target
-                term["mode"] = match_mode
-                term["enabled"] = enabled
-                self.save_to_settings()
-                return
-        
-        self.terms.append({
-            "source": source,
-            "target": target,
-            "mode": match_mode,
-            "enabled": enabled
-        })
-        self.save_to_settings()
+        if not source:
+            return
+        self.store.insert(**self._store_fields(source, target, match_mode, enabled))
 
     def delete_term(self, source):
         """Delete term by source string."""
-        self.terms = [t for t in self.terms if t["source"] != source]
-        self.save_to_settings()
+        self.store.delete_by_source(source, self.source_lang, self.target_lang)
 
     def update_term(self, index, data):
-        """Update term at specific index."""
-        if 0 <= index < len(self.terms):
-            self.terms[index] = data
-            self.save_to_settings()
+        """Update term at specific index (of get_terms())."""
+        entries = self._entries()
+        if 0 <= index < len(entries):
+            fields = self._store_fields(data.get("source", ""), data.get("target", ""),
+                                        data.get("mode", self.MODE_CASE_INSENSITIVE),
+                                        data.get("enabled", True))
+            fields.pop("source_lang")
+            fields.pop("target_lang")
+            self.store.update(entries[index].id, **fields)
 
     def apply_to_text(self, text):
         """
         Apply enabled glossary terms to text.
         PROTECTS: Ren'Py tokens (like tags and variables) are masked first.
         """
-        if not text or not self.terms:
+        if not text:
+            return text
+
+        matcher = self.store.matcher(self.source_lang, self.target_lang)
+        if not matcher.size:
             return text
 
         # 1. Mask Tokens (Safety First)
         masked_text, token_map = mask_renpy_tokens(text)
-        
-        # 2. Apply Replacements
-        final_text = masked_text
-        
-        # Sort terms by length (longest first) to avoid partial replacement issues in simple modes
-        sorted_terms = sorted(self.terms, key=lambda t: len(t["source"]), reverse=True)
-
-        for term in sorted_terms:
-            if not term.get("enabled", True):
-                continue
-
-            source = term["source"]
-            target = term["target"]
-            mode = term.get("mode", self.MODE_CASE_INSENSITIVE)
-
-            try:
-                if mode == self.MODE_REGEX:
-                    final_text = re.sub(source, target, final_text)
-                
-                elif mode == self.MODE_CASE_INSENSITIVE:
-                    # Case-insensitive replacement using regex
-                    pattern = re.escape(source)
-                    final_text = re.sub(pattern, target, final_text, flags=re.IGNORECASE)
-                    
-                else: # MODE_EXACT
-                    final_text = final_text.replace(source, target)
-            except Exception as e:
-                logger.error(f"Error applying glossary term '{source}': {e}")
-                continue
+
+        # 2. Apply Replacements (longest match first, left to right)
+        try:
+            final_text = matcher.apply(masked_text)
+        except Exception as e:
+            logger.error(f"Error applying glossary: {e}")
+            return text
 
         # 3. Unmask
         return unmask_renpy_tokens(final_text, token_map)
 
     def get_terms(self):
-        return self.terms
+        return [self._to_dict(entry) for entry in self._entries()]
 
     def merge_glossary(self, imported_terms: list, strategy: str = "MERGE_PREFER_LOCAL"):
         """
         Merge imported terms into current glossary.
         Strategies:
         - SKIP: Do nothing (should be handled by caller, but safety check)
-        - OVERWRITE: Replace entire list
+        - OVERWRITE: Replace entire glossary
         - MERGE_PREFER_LOCAL: Add new, keep local on conflict
         - MERGE_PREFER_IMPORTED: Add new, overwrite local on conflict
         """
         if strategy == "SKIP":
             return
-            
-        if strategy == "OVERWRITE":
-            self.terms = imported_terms
-            self.save_to_settings()
-            logger.info(f"Glossary overwritten with {len(self.terms)} terms.")
-            return
-
-        # Merge logic
-        # Map by source for conflict detection
-        local_map = {t["source"]: t for t in self.terms}
-        imported_map = {t["source"]: t for t in imported_terms}
-        
-        merged_map = local_map.copy()
-        
-        for src, imp_term in imported_map.items():
-            if src in merged_map:
-                # Conflict
-                if strategy == "MERGE_PREFER_IMPORTED":
-                    merged_map[src] = imp_term
-                # else PREFER_LOCAL: keep existing, do nothing
-            else:
-                # New term
-                merged_map[src] = imp_term
-                
-        # Reconstruct list
-        self.terms = list(merged_map.values())
-        self.save_to_settings()
-        logger.info(f"Glossary merged. Total terms: {len(self.terms)}")
 
+        if strategy == "OVERWRITE":
+            self.store.clear()
+
+        rows = (
+            self._store_fields(t.get("source", ""), t.get("target", ""),
+                               t.get("mode", self.MODE_CASE_INSENSITIVE), t.get("enabled", True))
+            for t in imported_terms
+        )
+        result = self.store.bulk_upsert(rows, self._MERGE_STRATEGIES.get(strategy, STRATEGY_SKIP))
+        logger.info(f"Glossary merged ({strategy}): {result['added']} added, "
+                    f"{result['updated']} updated, {result['skipped']} skipped.")
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Chunk Glossary
+
+Selects the glossary terms worth sending with one Gemini chunk: the
+chunk's masked source texts are run through the active pair's indexed
+matcher (GlossaryStore) and a matcher built from the optional
+TRANSLATION_GLOSSARY dict, and only terms that actually occur are put in
+the prompt (at most GLOSSARY_PROMPT_MAX_TERMS).
+
+Term sets are cached per chunk (LRU), so schema retries and re-runs of the
+same rows skip the matching. Savings against inlining every candidate term
+are reported through the telemetry counters `glossary_terms` and
+`glossary_tokens_saved` (estimated at ~4 characters per token).
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.glossary_prompt")
+
+CHARS_PER_TOKEN = 4
+CHUNK_CACHE_SIZE = 512
+
+_lock = threading.Lock()
+_chunk_cache: "OrderedDict[tuple, ChunkTerms]" = OrderedDict()
+_dict_matchers: Dict[frozenset, object] = {}
+
+
+@dataclass(frozen=True)
+class ChunkTerms:
+    """Glossary terms selected for one chunk."""
+    terms: Tuple[Tuple[str, str], ...]   # (source, target), first occurrence order
+    available: int = 0                   # Candidate terms for the language pair
+    inline_chars: int = 0                # Prompt length if every candidate were inlined
+
+    @property
+    def prompt_chars(self) -> int:
+        return sum(len(src) + len(dst) + 3 for src, dst in self.terms)
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated input tokens saved against inlining the whole glossary."""
+        return max(0, self.inline_chars - self.prompt_chars) // CHARS_PER_TOKEN
+
+    def instruction(self) -> str:
+        """Prompt rule line (empty when no term occurs in the chunk)."""
+        if not self.terms:
+            return ""
+        return "\n- Use these term mappings: " + ", ".join(f"{s}→{t}" for s, t in self.terms)
+
+
+def _dict_matcher(glossary: Dict[str, str]):
+    """Matcher of a plain {source: target} glossary (cached by content)."""
+    from core.glossary_store import GlossaryEntry, GlossaryMatcher
+
+    key = frozenset(glossary.items())
+    with _lock:
+        matcher = _dict_matchers.get(key)
+    if matcher is None:
+        matcher = GlossaryMatcher(
+            GlossaryEntry(id=-n, term_src=src, term_dst=dst)
+            for n, (src, dst) in enumerate(glossary.items(), start=1)
+            if src and dst
+        )
+        with _lock:
+            _dict_matchers.clear()  # Only the current dict is kept
+            _dict_matchers[key] = matcher
+    return matcher, key
+
+
+def select_chunk_terms(texts: Sequence[str], source_lang: Optional[str], target_lang: Optional[str],
+                       glossary: Optional[Dict[str, str]] = None,
+                       max_terms: Optional[int] = None) -> ChunkTerms:
+    """
+    Glossary terms occurring in a chunk's (masked) source texts.
+
+    Args:
+        texts: Masked source texts of the chunk
+        source_lang: Source language of the chunk
+        target_lang: Target language of the chunk
+        glossary: Optional extra {source: target} terms (config.TRANSLATION_GLOSSARY)
+        max_terms: Cap on injected terms (default config.GLOSSARY_PROMPT_MAX_TERMS)
+
+    Returns:
+        ChunkTerms; explicit glossary terms come before store terms
+    """
+    import renforge_config as config
+    from core.glossary_store import GlossaryStore, normalize_term
+
+    if max_terms is None:
+        max_terms = config.GLOSSARY_PROMPT_MAX_TERMS
+
+    matchers = []
+    dict_key = None
+    if glossary:
+        matcher, dict_key = _dict_matcher(glossary)
+        matchers.append(matcher)
+    store_version = None
+    try:
+        store = GlossaryStore.instance()
+        store_version = store.version
+        matchers.append(store.matcher(source_lang, target_lang))
+    except Exception as e:
+        logger.warning(f"[ChunkGlossary] Glossary store unavailable: {e}")
+
+    cache_key = (source_lang, target_lang, store_version, dict_key, max_terms, tuple(texts))
+    with _lock:
+        cached = _chunk_cache.get(cache_key)
+        if cached is not None:
+            _chunk_cache.move_to_end(cache_key)
+            return cached
+
+    terms: List[Tuple[str, str]] = []
+    seen = set()
+    for matcher in matchers:
+        for text in texts:
+            for entry in matcher.terms_in(text):
+                key = normalize_term(entry.term_src)
+                if entry.is_regex or key in seen:
+                    continue
+                seen.add(key)
+                terms.append((entry.term_src, entry.term_dst))
+    chunk_terms = ChunkTerms(
+        terms=tuple(terms[:max_terms]),
+        available=sum(m.size for m in matchers),
+        inline_chars=sum(m.inline_chars for m in matchers),
+    )
+
+    with _lock:
+        _chunk_cache[cache_key] = chunk_terms
+        while len(_chunk_cache) > CHUNK_CACHE_SIZE:
+            _chunk_cache.popitem(last=False)
+    return chunk_terms
+
+
+def clear_cache():
+    """Drop cached chunk term sets (for testing)."""
+    with _lock:
+        _chunk_cache.clear()
+        _dict_matchers.clear()
@@ -0,0 +1,654 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Glossary Store
+
+SQLite glossary (DB/glossary.db). Terms are keyed by normalized source
+term and language pair, so duplicate checks and upserts are index lookups
+instead of list scans, and large client glossaries (50k+ terms) are
+imported in bulk transactions.
+
+Language pairs partition the glossary: a term belongs to one
+(source_lang, target_lang) pair, or to every pair when stored with
+ANY_LANG ("*"). Only the active pair's terms are compiled into a
+GlossaryMatcher, which is cached until the store changes.
+
+Terms used to live in settings.json ("glossary_terms"); they are moved
+into the store the first time it is opened.
+"""
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.glossary_store")
+
+ANY_LANG = "*"
+
+# Import conflict strategies
+STRATEGY_SKIP = "skip"                # Keep the existing term
+STRATEGY_OVERWRITE = "overwrite"      # Replace it with the incoming term
+STRATEGY_KEEP_NEWEST = "keep_newest"  # Keep whichever has the newer updated_at
+STRATEGIES = (STRATEGY_SKIP, STRATEGY_OVERWRITE, STRATEGY_KEEP_NEWEST)
+
+# Columns written by inserts/imports (id, term_key and timestamps are managed)
+TERM_FIELDS = (
+    "term_src", "term_dst", "source_lang", "target_lang", "category", "notes",
+    "case_sensitive", "whole_word", "is_regex", "enabled",
+)
+
+_WORD_REGEX = re.compile(r"\w+")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+
+
+def normalize_term(term: str) -> str:
+    """Duplicate key of a source term: trimmed, whitespace collapsed, lowercased."""
+    return _WHITESPACE_REGEX.sub(" ", (term or "").strip()).lower()
+
+
+def _lang(value: Optional[str]) -> str:
+    value = (value or "").strip().lower()
+    return value or ANY_LANG
+
+
+@dataclass
+class GlossaryEntry:
+    """Glossary term."""
+    id: int
+    term_src: str
+    term_dst: str
+    source_lang: str = ANY_LANG
+    target_lang: str = ANY_LANG
+    category: str = ""
+    notes: str = ""
+    case_sensitive: bool = False
+    whole_word: bool = False
+    is_regex: bool = False
+    enabled: bool = True
+    created_at: str = ""
+    updated_at: str = ""
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'GlossaryEntry':
+        return cls(
+            id=row["id"],
+            term_src=row["term_src"],
+            term_dst=row["term_dst"],
+            source_lang=row["source_lang"],
+            target_lang=row["target_lang"],
+            category=row["category"] or "",
+            notes=row["notes"] or "",
+            case_sensitive=bool(row["case_sensitive"]),
+            whole_word=bool(row["whole_word"]),
+            is_regex=bool(row["is_regex"]),
+            enabled=bool(row["enabled"]),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+
+# =============================================================================
+# MATCHER
+# =============================================================================
+
+@dataclass
+class GlossaryMatch:
+    """A term occurrence in a text."""
+    entry: GlossaryEntry
+    start: int
+    end: int
+
+
+class GlossaryMatcher:
+    """
+    Compiled term matcher for one language pair.
+
+    Literal terms are indexed by their first word (lowercased), so a text is
+    matched with one pass over its words plus a check of the few candidates
+    starting there; per-term patterns are compiled lazily on first use.
+    Regex terms and terms without word characters are checked one by one.
+    Literal terms match at word starts (a whole_word term must also end at a
+    word boundary).
+    """
+
+    def __init__(self, entries: Iterable[GlossaryEntry]):
+        self._by_word: Dict[str, List[Tuple[GlossaryEntry, int]]] = {}
+        # Single-word terms that may also start a longer word ("elf" in "elfish")
+        self._by_prefix: Dict[str, List[Tuple[GlossaryEntry, int]]] = {}
+        self._prefix_lengths: List[int] = []
+        self._linear: List[GlossaryEntry] = []
+        self._patterns: Dict[int, Optional[re.Pattern]] = {}
+        self.size = 0
+        self.inline_chars = 0  # Prompt length of all terms as "src→dst, " pairs
+        for entry in entries:
+            self.size += 1
+            self.inline_chars += len(entry.term_src) + len(entry.term_dst) + 3
+            first = None if entry.is_regex else _WORD_REGEX.search(entry.term_src)
+            if first is None:
+                self._linear.append(entry)
+                continue
+            # Offset of the first word inside the term (e.g. "#" in "#tag")
+            word = first.group().lower()
+            self._by_word.setdefault(word, []).append((entry, first.start()))
+            if not entry.whole_word and first.end() == len(entry.term_src):
+                self._by_prefix.setdefault(word, []).append((entry, first.start()))
+        self._prefix_lengths = sorted({len(word) for word in self._by_prefix})
+
+    def _pattern(self, entry: GlossaryEntry) -> Optional[re.Pattern]:
+        pattern = self._patterns.get(entry.id, False)
+        if pattern is not False:
+            return pattern
+        flags = 0 if entry.case_sensitive else re.IGNORECASE
+        try:
+            if entry.is_regex:
+                pattern = re.compile(entry.term_src, flags)
+            else:
+                source = r"(?<!\w)" + re.escape(entry.term_src)
+                if entry.whole_word:
+                    source += r"(?!\w)"
+                pattern = re.compile(source, flags)
+        except re.error as e:
+            logger.warning(f"[Glossary] Invalid pattern for term '{entry.term_src}': {e}")
+            pattern = None
+        self._patterns[entry.id] = pattern
+        return pattern
+
+    def find(self, text: str) -> List[GlossaryMatch]:
+        """All term occurrences (may overlap), in text order."""
+        if not text or not self.size:
+            return []
+        matches = []
+        for word in _WORD_REGEX.finditer(text):
+            lowered = word.group().lower()
+            candidates = list(self._by_word.get(lowered, ()))
+            for length in self._prefix_lengths:
+                if length >= len(lowered):
+                    break
+                candidates.extend(self._by_prefix.get(lowered[:length], ()))
+            for entry, lead in candidates:
+                start = word.start() - lead
+                pattern = self._pattern(entry) if start >= 0 else None
+                hit = pattern.match(text, start) if pattern else None
+                if hit and hit.end() > hit.start():
+                    matches.append(GlossaryMatch(entry, hit.start(), hit.end()))
+        for entry in self._linear:
+            pattern = self._pattern(entry)
+            if pattern is None:
+                continue
+            for hit in pattern.finditer(text):
+                if hit.end() > hit.start():
+                    matches.append(GlossaryMatch(entry, hit.start(), hit.end()))
+        matches.sort(key=lambda m: (m.start, -(m.end - m.start)))
+        return matches
+
+    def select(self, text: str) -> List[GlossaryMatch]:
+        """Non-overlapping occurrences, longest first at each position."""
+        chosen = []
+        position = 0
+        for match in self.find(text):
+            if match.start >= position:
+                chosen.append(match)
+                position = match.end
+        return chosen
+
+    def terms_in(self, text: str) -> List[GlossaryEntry]:
+        """Distinct terms occurring in text, in order of first occurrence."""
+        seen = {}
+        for match in self.select(text):
+            seen.setdefault(match.entry.id, match.entry)
+        return list(seen.values())
+
+    def apply(self, text: str) -> str:
+        """Replace every selected occurrence with its target term."""
+        if not text:
+            return text
+        parts = []
+        position = 0
+        for match in self.select(text):
+            parts.append(text[position:match.start])
+            if match.entry.is_regex:
+                try:
+                    parts.append(self._pattern(match.entry).sub(
+                        match.entry.term_dst, text[match.start:match.end], count=1))
+                except re.error:
+                    parts.append(text[match.start:match.end])
+            else:
+                parts.append(match.entry.term_dst)
+            position = match.end
+        parts.append(text[position:])
+        return "".join(parts)
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class GlossaryStore:
+    """
+    SQLite glossary store (singleton, thread-local connections).
+    """
+
+    _instance: Optional['GlossaryStore'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
+
+    def __init__(self):
+        if hasattr(self, '_initialized') and self._initialized:
+            return
+
+        self._db_path = self._get_db_path()
+        self._local = threading.local()
+        self._version = 0
+        self._matchers: Dict[Tuple[str, str], Tuple[int, GlossaryMatcher]] = {}
+        self._matcher_lock = threading.Lock()
+
+        self._ensure_schema()
+        self._migrate_settings_terms()
+
+        self._initialized = True
+        logger.info(f"[Glossary] GlossaryStore initialized: {self._db_path}")
+
+    @classmethod
+    def instance(cls) -> 'GlossaryStore':
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = GlossaryStore()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        cls._instance = None
+
+    def _get_db_path(self) -> Path:
+        from renforge_config import DB_DIR
+        return DB_DIR / "glossary.db"
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, 'connection') or self._local.connection is None:
+            self._local.connection = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            self._local.connection.row_factory = sqlite3.Row
+        return self._local.connection
+
+    def _ensure_schema(self):
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS glossary_terms (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                term_key TEXT NOT NULL,
+                term_src TEXT NOT NULL,
+                term_dst TEXT NOT NULL,
+                source_lang TEXT NOT NULL DEFAULT '*',
+                target_lang TEXT NOT NULL DEFAULT '*',
+                category TEXT DEFAULT '',
+                notes TEXT DEFAULT '',
+                case_sensitive INTEGER DEFAULT 0,
+                whole_word INTEGER DEFAULT 0,
+                is_regex INTEGER DEFAULT 0,
+                enabled INTEGER DEFAULT 1,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                UNIQUE (source_lang, target_lang, term_key)
+            );
+            CREATE TABLE IF NOT EXISTS glossary_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        conn.commit()
+
+    def _migrate_settings_terms(self):
+        """Move legacy settings.json terms into the store (once)."""
+        conn = self._get_connection()
+        if conn.execute("SELECT 1 FROM glossary_meta WHERE key = 'settings_migrated'").fetchone():
+            return
+        try:
+            import renforge_settings as rf_settings
+            settings = rf_settings.load_settings()
+            legacy = settings.get("glossary_terms") or []
+            if legacy:
+                result = self.bulk_upsert((terms_from_legacy(t) for t in legacy), STRATEGY_OVERWRITE)
+                settings.pop("glossary_terms", None)
+                rf_settings.save_settings(settings)
+                logger.info(f"[Glossary] Migrated {result['added'] + result['updated']} terms from settings")
+        except Exception as e:
+            logger.warning(f"[Glossary] Settings migration skipped: {e}")
+            return
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO glossary_meta (key, value) VALUES ('settings_migrated', '1')")
+
+    def _changed(self):
+        with self._matcher_lock:
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Write counter; changes whenever terms are added, edited or removed."""
+        return self._version
+
+    # =========================================================================
+    # CRUD
+    # =========================================================================
+
+    def insert(self, term_src: str, term_dst: str, category: str = "", notes: str = "",
+               case_sensitive: bool = False, whole_word: bool = False, enabled: bool = True,
+               source_lang: str = ANY_LANG, target_lang: str = ANY_LANG,
+               is_regex: bool = False) -> Optional[int]:
+        """
+        Add a term, or update the existing term with the same key and pair.
+
+        Returns:
+            Entry id, or None for an empty term
+        """
+        if not (term_src or "").strip():
+            return None
+        now = datetime.now().isoformat()
+        key = normalize_term(term_src) if not is_regex else term_src
+        conn = self._get_connection()
+        with conn:
+            conn.execute("""
+                INSERT INTO glossary_terms (term_key, term_src, term_dst, source_lang, target_lang,
+                    category, notes, case_sensitive, whole_word, is_regex, enabled, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_lang, target_lang, term_key) DO UPDATE SET
+                    term_src = excluded.term_src, term_dst = excluded.term_dst,
+                    category = excluded.category, notes = excluded.notes,
+                    case_sensitive = excluded.case_sensitive, whole_word = excluded.whole_word,
+                    is_regex = excluded.is_regex, enabled = excluded.enabled,
+                    updated_at = excluded.updated_at
+            """, (key, term_src.strip(), term_dst, _lang(source_lang), _lang(target_lang),
+                  category or "", notes or "", int(case_sensitive), int(whole_word),
+                  int(is_regex), int(enabled), now, now))
+            row = conn.execute(
+                "SELECT id FROM glossary_terms WHERE source_lang = ? AND target_lang = ? AND term_key = ?",
+                (_lang(source_lang), _lang(target_lang), key)
+            ).fetchone()
+        self._changed()
+        return row["id"]
+
+    def update(self, entry_id: int, **changes) -> bool:
+        """Update fields of a term (see TERM_FIELDS). Returns True if found."""
+        changes = {k: v for k, v in changes.items() if k in TERM_FIELDS}
+        if not changes:
+            return False
+        entry = self.get(entry_id)
+        if entry is None:
+            return False
+        if "term_src" in changes:
+            changes["term_src"] = changes["term_src"].strip()
+        for name in ("source_lang", "target_lang"):
+            if name in changes:
+                changes[name] = _lang(changes[name])
+        for name in ("case_sensitive", "whole_word", "is_regex", "enabled"):
+            if name in changes:
+                changes[name] = int(bool(changes[name]))
+        is_regex = changes.get("is_regex", entry.is_regex)
+        term_src = changes.get("term_src", entry.term_src)
+        changes["term_key"] = term_src if is_regex else normalize_term(term_src)
+        changes["updated_at"] = datetime.now().isoformat()
+
+        assignments = ", ".join(f"{name} = ?" for name in changes)
+        conn = self._get_connection()
+        try:
+            with conn:
+                cursor = conn.execute(f"UPDATE glossary_terms SET {assignments} WHERE id = ?",
+                                      (*changes.values(), entry_id))
+        except sqlite3.IntegrityError:
+            logger.warning(f"[Glossary] Update of {entry_id} would duplicate '{term_src}'")
+            return False
+        self._changed()
+        return cursor.rowcount > 0
+
+    def delete(self, entry_id: int) -> bool:
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM glossary_terms WHERE id = ?", (entry_id,))
+        self._changed()
+        return cursor.rowcount > 0
+
+    def delete_by_source(self, term_src: str, source_lang: Optional[str] = None,
+                         target_lang: Optional[str] = None) -> int:
+        """Delete a term by its source text (in every pair unless given)."""
+        query = "DELETE FROM glossary_terms WHERE term_key IN (?, ?)"
+        params: list = [normalize_term(term_src), term_src]
+        if source_lang is not None:
+            query += " AND source_lang = ?"
+            params.append(_lang(source_lang))
+        if target_lang is not None:
+            query += " AND target_lang = ?"
+            params.append(_lang(target_lang))
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute(query, params)
+        self._changed()
+        return cursor.rowcount
+
+    def clear(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM glossary_terms")
+        self._changed()
+
+    def get(self, entry_id: int) -> Optional[GlossaryEntry]:
+        row = self._get_connection().execute(
+            "SELECT * FROM glossary_terms WHERE id = ?", (entry_id,)
+        ).fetchone()
+        return GlossaryEntry.from_row(row) if row else None
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def _pair_filter(self, source_lang: Optional[str], target_lang: Optional[str],
+                     include_disabled: bool) -> Tuple[str, list]:
+        clauses, params = [], []
+        if not include_disabled:
+            clauses.append("enabled = 1")
+        if source_lang is not None:
+            clauses.append("source_lang IN (?, '*')")
+            params.append(_lang(source_lang))
+        if target_lang is not None:
+            clauses.append("target_lang IN (?, '*')")
+            params.append(_lang(target_lang))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_entries(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None,
+                     include_disabled: bool = True, batch_size: int = 2000) -> Iterator[GlossaryEntry]:
+        """Stream terms (optionally those applying to one pair), ordered by id."""
+        where, params = self._pair_filter(source_lang, target_lang, include_disabled)
+        cursor = self._get_connection().execute(f"SELECT * FROM glossary_terms{where} ORDER BY id", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield GlossaryEntry.from_row(row)
+
+    def list_all(self, include_disabled: bool = False, source_lang: Optional[str] = None,
+                 target_lang: Optional[str] = None) -> List[GlossaryEntry]:
+        """Terms sorted by source term."""
+        entries = list(self.iter_entries(source_lang, target_lang, include_disabled))
+        entries.sort(key=lambda e: e.term_src.lower())
+        return entries
+
+    def count(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None) -> int:
+        where, params = self._pair_filter(source_lang, target_lang, include_disabled=True)
+        return self._get_connection().execute(
+            f"SELECT COUNT(*) FROM glossary_terms{where}", params
+        ).fetchone()[0]
+
+    def language_pairs(self) -> List[Tuple[str, str, int]]:
+        """(source_lang, target_lang, term count) partitions of the glossary."""
+        rows = self._get_connection().execute(
+            "SELECT source_lang, target_lang, COUNT(*) FROM glossary_terms "
+            "GROUP BY source_lang, target_lang ORDER BY source_lang, target_lang"
+        ).fetchall()
+        return [(r[0], r[1], r[2]) for r in rows]
+
+    def matcher(self, source_lang: Optional[str] = None,
+                target_lang: Optional[str] = None) -> GlossaryMatcher:
+        """
+        Compiled matcher of the enabled terms applying to a pair.
+
+        Only the requested pair is loaded; the matcher is rebuilt after the
+        store changes. None for a language means "any pair" (all terms).
+        """
+        key = (_lang(source_lang) if source_lang is not None else "",
+               _lang(target_lang) if target_lang is not None else "")
+        with self._matcher_lock:
+            version = self._version
+            cached = self._matchers.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+        matcher = GlossaryMatcher(self.iter_entries(source_lang, target_lang, include_disabled=False))
+        with self._matcher_lock:
+            self._matchers[key] = (version, matcher)
+        return matcher
+
+    # =========================================================================
+    # BULK IMPORT
+    # =========================================================================
+
+    def bulk_upsert(self, terms: Iterable[Dict[str, Any]], strategy: str = STRATEGY_SKIP,
+                    chunk_size: int = 5000,
+                    progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, int]:
+        """
+        Stream terms into the store in chunked transactions.
+
+        Args:
+            terms: Dicts with TERM_FIELDS keys (term_src and term_dst required,
+                optional 'updated_at' for keep_newest)
+            strategy: STRATEGY_SKIP / STRATEGY_OVERWRITE / STRATEGY_KEEP_NEWEST
+                for terms whose key already exists in the pair
+            progress_callback: Called with the number of terms processed
+
+        Returns:
+            {'total', 'added', 'updated', 'skipped', 'conflicts'} where
+            conflicts counts existing terms with a different translation
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown glossary import strategy: {strategy}")
+        result = {"total": 0, "added": 0, "updated": 0, "skipped": 0, "conflicts": 0}
+        chunk: List[Dict[str, Any]] = []
+        for term in terms:
+            chunk.append(term)
+            if len(chunk) >= chunk_size:
+                self._upsert_chunk(chunk, strategy, result)
+                chunk = []
+                if progress_callback:
+                    progress_callback(result["total"])
+        if chunk:
+            self._upsert_chunk(chunk, strategy, result)
+            if progress_callback:
+                progress_callback(result["total"])
+        self._changed()
+        return result
+
+    def _upsert_chunk(self, chunk: List[Dict[str, Any]], strategy: str, result: Dict[str, int]):
+        now = datetime.now().isoformat()
+        pending: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for term in chunk:
+            result["total"] += 1
+            row = _term_row(term, now)
+            if row is None:
+                result["skipped"] += 1
+                continue
+            key = (row["source_lang"], row["target_lang"], row["term_key"])
+            previous = pending.get(key)
+            if previous is not None:
+                result["skipped"] += 1
+                if not _incoming_wins(strategy, previous, row):
+                    continue
+            pending[key] = row
+
+        conn = self._get_connection()
+        inserts, updates = [], []
+        with conn:
+            for key, row in pending.items():
+                existing = conn.execute(
+                    "SELECT id, term_dst, updated_at FROM glossary_terms "
+                    "WHERE source_lang = ? AND target_lang = ? AND term_key = ?", key
+                ).fetchone()
+                if existing is None:
+                    inserts.append(row)
+                    continue
+                if existing["term_dst"] != row["term_dst"]:
+                    result["conflicts"] += 1
+                if _incoming_wins(strategy, existing, row):
+                    updates.append(dict(row, id=existing["id"]))
+                else:
+                    result["skipped"] += 1
+            conn.executemany("""
+                INSERT INTO glossary_terms (term_key, term_src, term_dst, source_lang, target_lang,
+                    category, notes, case_sensitive, whole_word, is_regex, enabled, created_at, updated_at)
+                VALUES (:term_key, :term_src, :term_dst, :source_lang, :target_lang, :category, :notes,
+                    :case_sensitive, :whole_word, :is_regex, :enabled, :updated_at, :updated_at)
+            """, inserts)
+            conn.executemany("""
+                UPDATE glossary_terms SET term_src = :term_src, term_dst = :term_dst,
+                    category = :category, notes = :notes, case_sensitive = :case_sensitive,
+                    whole_word = :whole_word, is_regex = :is_regex, enabled = :enabled,
+                    updated_at = :updated_at
+                WHERE id = :id
+            """, updates)
+        result["added"] += len(inserts)
+        result["updated"] += len(updates)
+
+
+def _incoming_wins(strategy: str, existing, incoming: Dict[str, Any]) -> bool:
+    if strategy == STRATEGY_OVERWRITE:
+        return True
+    if strategy == STRATEGY_KEEP_NEWEST:
+        return (incoming["updated_at"] or "") > (existing["updated_at"] or "")
+    return False
+
+
+def _term_row(term: Dict[str, Any], now: str) -> Optional[Dict[str, Any]]:
+    """Normalize an import dict into a row (None if it has no source/target)."""
+    term_src = (term.get("term_src") or "").strip()
+    term_dst = term.get("term_dst") or ""
+    if not term_src or not term_dst.strip():
+        return None
+    is_regex = bool(term.get("is_regex", False))
+    return {
+        "term_key": term_src if is_regex else normalize_term(term_src),
+        "term_src": term_src,
+        "term_dst": term_dst,
+        "source_lang": _lang(term.get("source_lang")),
+        "target_lang": _lang(term.get("target_lang")),
+        "category": term.get("category") or "",
+        "notes": term.get("notes") or "",
+        "case_sensitive": int(bool(term.get("case_sensitive", False))),
+        "whole_word": int(bool(term.get("whole_word", False))),
+        "is_regex": int(is_regex),
+        "enabled": int(bool(term.get("enabled", True))),
+        "updated_at": term.get("updated_at") or now,
+    }
+
+
+def terms_from_legacy(term: Dict[str, Any]) -> Dict[str, Any]:
+    """Legacy GlossaryManager dict {'source', 'target', 'mode', 'enabled'} -> import dict."""
+    mode = term.get("mode", "case")
+    return {
+        "term_src": term.get("source", ""),
+        "term_dst": term.get("target", ""),
+        "case_sensitive": mode == "exact",
+        "is_regex": mode == "regex",
+        "enabled": term.get("enabled", True),
+    }
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Glossary TBX Import (streaming)
+
+Reads TBX (TermBase eXchange, v2 <termEntry> and v3 <conceptEntry>) with
+ElementTree.iterparse, clearing every entry once read, and yields one term
+dict per entry for GlossaryStore.bulk_upsert.
+
+Each entry's first term in the source language is paired with its first
+term in the target language. Without explicit languages, the entry's first
+<langSet> is the source and the second the target. A subjectField
+<descrip> becomes the category, <note>s become notes.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, Optional
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.glossary_tbx")
+
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+_ENTRY_TAGS = ("termEntry", "conceptEntry")
+
+
+def _local(tag: str) -> str:
+    """Tag name without namespace (TBX v3 files are namespaced)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _lang_matches(lang: Optional[str], wanted: str) -> bool:
+    """'en-US' matches 'en' (primary subtag, case-insensitive)."""
+    if not lang:
+        return False
+    lang = lang.lower().replace("_", "-")
+    wanted = wanted.lower().replace("_", "-")
+    return lang == wanted or lang.split("-")[0] == wanted.split("-")[0]
+
+
+def _first_term(lang_set: ET.Element) -> Optional[str]:
+    for elem in lang_set.iter():
+        if _local(elem.tag) == "term":
+            text = "".join(elem.itertext()).strip()
+            if text:
+                return text
+    return None
+
+
+def _parse_entry(entry: ET.Element, source_lang: Optional[str],
+                 target_lang: Optional[str]) -> Dict:
+    lang_sets = [child for child in entry if _local(child.tag) == "langSet"]
+    source = target = None
+    src_code = tgt_code = None
+    for lang_set in lang_sets:
+        lang = lang_set.get(XML_LANG) or lang_set.get("lang")
+        if source is None and (_lang_matches(lang, source_lang) if source_lang else True):
+            source, src_code = _first_term(lang_set), lang
+            continue
+        if target is None and (_lang_matches(lang, target_lang) if target_lang else True):
+            target, tgt_code = _first_term(lang_set), lang
+
+    category = ""
+    notes = []
+    for elem in entry.iter():
+        name = _local(elem.tag)
+        if name == "descrip" and elem.get("type") == "subjectField" and not category:
+            category = (elem.text or "").strip()
+        elif name == "note" and elem.text and elem.text.strip():
+            notes.append(elem.text.strip())
+
+    return {
+        "term_src": source or "",
+        "term_dst": target or "",
+        "source_lang": source_lang or src_code,
+        "target_lang": target_lang or tgt_code,
+        "category": category,
+        "notes": "; ".join(notes),
+    }
+
+
+def iter_tbx_terms(tbx_path, source_lang: Optional[str] = None,
+                   target_lang: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Stream term dicts from a TBX file.
+
+    Entries lacking either language are yielded with empty terms so the
+    store counts them as skipped.
+    """
+    body = None
+    for event, elem in ET.iterparse(str(tbx_path), events=("start", "end")):
+        if event == "start":
+            if _local(elem.tag) == "body":
+                body = elem
+            continue
+        if _local(elem.tag) not in _ENTRY_TAGS:
+            continue
+        term = _parse_entry(elem, source_lang, target_lang)
+
+        # Free the entry (and everything before it) before yielding
+        elem.clear()
+        if body is not None:
+            body.clear()
+
+        yield term
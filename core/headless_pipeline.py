@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Headless Translation Pipeline
+
+Translates a whole project without Qt (used by `python -m renforge translate`):
+- Loads every .rpy file with the regular parser
+- Applies TM hits, then runs the ProjectBatchScheduler over the rest
+- Runs QC on every row it translated and saves the files
+- Streams progress as JSON lines and keeps a resumable checkpoint
+
+A file is marked done in the checkpoint only when it was saved without
+failed rows; rows translated so far are checkpointed as they arrive, so an
+interrupted run resumes without re-requesting them.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, IO, List, Optional, Set, Tuple
+
+from core import telemetry
+from models.parsed_file import ParsedFile
+from renforge_enums import FileMode
+from renforge_logger import get_logger
+
+logger = get_logger("core.headless_pipeline")
+
+# Process exit codes
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_QC_ERRORS = 2
+EXIT_TRANSLATION_ERRORS = 3
+EXIT_CANCELED = 130
+
+CHECKPOINT_VERSION = 1
+
+
+def discover_files(project_path) -> List[Path]:
+    """
+    Collect the .rpy files of a project (or a single file), sorted.
+
+    Hidden directories (e.g. .renforge, .git) are skipped.
+    """
+    root = Path(project_path)
+    if root.is_file():
+        return [root]
+    files = []
+    for path in root.rglob("*.rpy"):
+        if any(part.startswith(".") for part in path.relative_to(root).parts[:-1]):
+            continue
+        files.append(path)
+    return sorted(files)
+
+
+def _file_signature(path) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+class JsonLinesReporter:
+    """
+    Writes one JSON object per line: {"event": ..., "ts": ..., **fields}.
+
+    Args:
+        stream: Output stream (default stdout)
+        progress_interval: Minimum seconds between 'progress' events
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None, progress_interval: float = 1.0):
+        self._stream = stream or sys.stdout
+        self._progress_interval = progress_interval
+        self._last_progress = 0.0
+        self._last_counts = None
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        record = {"event": event, "ts": round(time.time(), 3)}
+        record.update(fields)
+        with self._lock:
+            self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._stream.flush()
+
+    def progress(self, done: int, total: int, force: bool = False):
+        now = time.monotonic()
+        if (done, total) == self._last_counts:
+            return
+        if not force and done < total and now - self._last_progress < self._progress_interval:
+            return
+        self._last_progress = now
+        self._last_counts = (done, total)
+        self.emit("progress", done=done, total=total)
+
+
+class Checkpoint:
+    """
+    Resumable run state stored as JSON.
+
+    Layout:
+        {"version": 1, "source_lang": ..., "target_lang": ...,
+         "files": {key: {"done": bool, "signature": [size, mtime_ns],
+                         "rows": {line_index: [source_hash, text]}}}}
+
+    A checkpoint written for another language pair is ignored.
+    """
+
+    def __init__(self, path, source_lang: str, target_lang: str, save_interval: float = 5.0):
+        self.path = Path(path)
+        self._source_lang = source_lang
+        self._target_lang = target_lang
+        self._save_interval = save_interval
+        self._last_save = 0.0
+        self._dirty = False
+        self._files: Dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Headless] Ignoring unreadable checkpoint {self.path}: {e}")
+            return
+        if (data.get("version") != CHECKPOINT_VERSION
+                or data.get("source_lang") != self._source_lang
+                or data.get("target_lang") != self._target_lang):
+            logger.info("[Headless] Checkpoint is for another run; starting fresh")
+            return
+        self._files = data.get("files", {})
+
+    def _entry(self, key: str) -> dict:
+        return self._files.setdefault(key, {"done": False, "signature": None, "rows": {}})
+
+    def is_done(self, key: str, signature: List[int]) -> bool:
+        entry = self._files.get(key)
+        return bool(entry and entry.get("done") and entry.get("signature") == signature)
+
+    def rows(self, key: str) -> Dict[int, Tuple[str, str]]:
+        """Checkpointed rows of a file: line_index -> (source_hash, text)."""
+        entry = self._files.get(key) or {}
+        return {int(line): tuple(value) for line, value in entry.get("rows", {}).items()}
+
+    def record(self, key: str, line_index: int, source_text: str, text: str):
+        entry = self._entry(key)
+        entry["done"] = False
+        entry["rows"][str(line_index)] = [_text_hash(source_text), text]
+        self._dirty = True
+
+    def mark_done(self, key: str, signature: List[int]):
+        """The file is saved and complete; its rows are no longer needed."""
+        self._files[key] = {"done": True, "signature": signature, "rows": {}}
+        self._dirty = True
+
+    def save(self, force: bool = False):
+        """Write the checkpoint atomically (throttled unless forced)."""
+        if not self._dirty:
+            return
+        if not force and time.monotonic() - self._last_save < self._save_interval:
+            return
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "source_lang": self._source_lang,
+            "target_lang": self._target_lang,
+            "files": self._files,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._last_save = time.monotonic()
+        self._dirty = False
+
+
+class HeadlessPipeline:
+    """
+    Project translation run without a GUI.
+
+    Args:
+        translate_batch: Engine callable with the ProjectBatchScheduler
+            contract (`texts -> {"translations": [...], "errors": [...]}`)
+        source_lang / target_lang: Language codes
+        reporter: JsonLinesReporter receiving progress events
+        checkpoint: Optional Checkpoint for resuming
+        jobs: Concurrent engine requests
+        requests_per_minute: Shared request budget (0 = unlimited)
+        use_tm: Apply TM hits before calling the engine and record results
+        retranslate: Translate every row, not only empty ones (translate mode)
+        output_dir: Write files under this directory instead of in place
+        dry_run: Translate and QC but do not write files
+        origin: TM origin tag for new translations
+    """
+
+    def __init__(
+        self,
+        translate_batch: Callable[[List[str]], dict],
+        *,
+        source_lang: str,
+        target_lang: str,
+        reporter: JsonLinesReporter,
+        checkpoint: Optional[Checkpoint] = None,
+        jobs: int = 3,
+        requests_per_minute: int = 0,
+        chunk_items: Optional[int] = None,
+        chunk_chars: Optional[int] = None,
+        use_tm: bool = True,
+        retranslate: bool = False,
+        output_dir=None,
+        dry_run: bool = False,
+        origin: str = "cli",
+    ):
+        from core.batch_scheduler import (
+            DEFAULT_CHUNK_CHARS, DEFAULT_CHUNK_ITEMS, ProjectBatchScheduler,
+        )
+
+        self._source_lang = source_lang
+        self._target_lang = target_lang
+        self._reporter = reporter
+        self._checkpoint = checkpoint
+        self._use_tm = use_tm
+        self._retranslate = retranslate
+        self._output_dir = Path(output_dir) if output_dir else None
+        self._dry_run = dry_run
+        self._origin = origin
+        self._tm = None
+        self.scheduler = ProjectBatchScheduler(
+            translate_batch,
+            max_workers=jobs,
+            requests_per_minute=requests_per_minute,
+            chunk_items=chunk_items or DEFAULT_CHUNK_ITEMS,
+            chunk_chars=chunk_chars or DEFAULT_CHUNK_CHARS,
+        )
+
+        # Per-run state
+        self._root: Optional[Path] = None
+        self._files: Dict[str, ParsedFile] = {}
+        self._keys: Dict[str, str] = {}
+        self._rows: Dict[str, Set[int]] = {}
+        self._finalized: Set[str] = set()
+        self._summary: dict = {}
+
+    def cancel(self):
+        """Stop after the requests in flight (safe to call from a signal handler)."""
+        self.scheduler.cancel()
+
+    # =========================================================================
+    # RUN
+    # =========================================================================
+
+    def run(self, project_path, mode: Optional[str] = None) -> dict:
+        """
+        Translate a project directory or a single file.
+
+        Returns:
+            Summary dict (also emitted as the final 'summary' event) with an
+            'exit_code' entry: EXIT_QC_ERRORS if any QC error was found,
+            EXIT_TRANSLATION_ERRORS if rows failed, EXIT_CANCELED if canceled.
+        """
+        start = time.monotonic()
+        run_telemetry = telemetry.start_run()
+        root = Path(project_path)
+        self._root = root if root.is_dir() else root.parent
+        self._summary = {
+            'files': 0, 'skipped_files': 0, 'saved_files': 0, 'rows': 0,
+            'resumed': 0, 'tm_hits': 0, 'translated': 0, 'failed': 0,
+            'qc_errors': 0, 'qc_warnings': 0, 'api_calls': 0, 'deduplicated': 0,
+            'canceled': False,
+        }
+
+        batches = []
+        for path in discover_files(project_path):
+            batch = self._prepare_file(path, mode)
+            if batch is not None:
+                batches.append(batch)
+        self._reporter.emit("plan", files=self._summary['files'],
+                            skipped_files=self._summary['skipped_files'],
+                            rows=self._summary['rows'],
+                            pending=sum(len(b.indices) for b in batches))
+
+        # Files with nothing left to request are complete already
+        scheduled = {b.file_path for b in batches if b.indices}
+        for file_path in self._files:
+            if file_path not in scheduled:
+                self._finalize_file(file_path, failed=0)
+        batches = [b for b in batches if b.indices]
+
+        if batches:
+            results = self.scheduler.run(
+                batches,
+                on_items_translated=self._on_items_translated,
+                on_progress=lambda done, total: self._reporter.progress(done, total),
+            )
+            self._summary['api_calls'] = results['api_calls']
+            self._summary['deduplicated'] = results['deduplicated']
+            self._summary['failed'] += results['error_count']
+            self._summary['canceled'] = results['canceled']
+            self._reporter.progress(results['success_count'] + results['error_count'],
+                                    results['total'], force=True)
+            for error in results['structured_errors'][:100]:
+                self._reporter.emit("row_error", file=self._keys[error['file_path']],
+                                    line=error['file_line'], message=error['message'])
+            for file_path, file_result in results['files'].items():
+                if file_path not in self._finalized and not file_result['canceled']:
+                    self._finalize_file(file_path, file_result['error_count'])
+
+        if self._checkpoint:
+            self._checkpoint.save(force=True)
+
+        summary = dict(self._summary)
+        summary['elapsed_s'] = round(time.monotonic() - start, 2)
+        summary['telemetry'] = telemetry.finish_run(run_telemetry)
+        if summary['canceled']:
+            summary['exit_code'] = EXIT_CANCELED
+        elif summary['qc_errors']:
+            summary['exit_code'] = EXIT_QC_ERRORS
+        elif summary['failed']:
+            summary['exit_code'] = EXIT_TRANSLATION_ERRORS
+        else:
+            summary['exit_code'] = EXIT_OK
+        self._reporter.emit("summary", **summary)
+        return summary
+
+    # =========================================================================
+    # PREPARATION
+    # =========================================================================
+
+    def _prepare_file(self, path: Path, mode: Optional[str]):
+        """Load one file, restore checkpointed rows, apply TM; return its FileBatch."""
+        import renforge_core as core
+        from core.batch_scheduler import FileBatch
+
+        key = path.relative_to(self._root).as_posix() if self._root in path.parents else path.name
+        if self._checkpoint and self._checkpoint.is_done(key, _file_signature(path)):
+            self._summary['skipped_files'] += 1
+            self._reporter.emit("file_skipped", file=key, reason="checkpoint")
+            return None
+
+        try:
+            parsed_file = core.load_parsed_file(path, mode)
+        except Exception as e:
+            logger.error(f"[Headless] Failed to load {path}: {e}")
+            self._reporter.emit("file_error", file=key, message=str(e))
+            self._summary['failed'] += 1
+            return None
+
+        file_path = parsed_file.file_path
+        self._files[file_path] = parsed_file
+        self._keys[file_path] = key
+        self._summary['files'] += 1
+        self._summary['rows'] += parsed_file.item_count
+
+        rows = self._select_rows(parsed_file)
+        self._rows[file_path] = set(rows)
+        pending = self._restore_checkpoint(parsed_file, key, rows)
+        pending = self._apply_tm(parsed_file, key, pending)
+        return FileBatch(parsed_file, pending)
+
+    def _select_rows(self, parsed_file: ParsedFile) -> List[int]:
+        """Rows this run is responsible for (untranslated ones in translate mode)."""
+        rows = []
+        for index, item in enumerate(parsed_file.items):
+            if not (item.original_text or "").strip():
+                continue
+            if (parsed_file.mode == FileMode.TRANSLATE and not self._retranslate
+                    and (item.current_text or "").strip()):
+                continue
+            rows.append(index)
+        return rows
+
+    def _restore_checkpoint(self, parsed_file: ParsedFile, key: str, rows: List[int]) -> List[int]:
+        if not self._checkpoint:
+            return rows
+        saved = self._checkpoint.rows(key)
+        if not saved:
+            return rows
+        pending = []
+        for index in rows:
+            item = parsed_file.items[index]
+            entry = saved.get(item.line_index)
+            if entry is None:
+                pending.append(index)
+                continue
+            source_hash, text = entry
+            if item.original_text == text:
+                # Already written by an earlier run (direct mode saves in place)
+                self._summary['resumed'] += 1
+            elif source_hash == _text_hash(item.original_text):
+                parsed_file.update_item_text(index, text)
+                self._summary['resumed'] += 1
+            else:
+                pending.append(index)
+        return pending
+
+    def _get_tm(self):
+        if self._tm is None:
+            from core.tm_store import TMStore
+            self._tm = TMStore.instance()
+        return self._tm
+
+    def _apply_tm(self, parsed_file: ParsedFile, key: str, rows: List[int]) -> List[int]:
+        if not self._use_tm or not rows:
+            return rows
+        try:
+            with telemetry.stage(telemetry.TM_PRECHECK):
+                hits = self._get_tm().lookup_batch(
+                    [parsed_file.items[index].original_text for index in rows],
+                    self._source_lang, self._target_lang,
+                )
+        except Exception as e:
+            logger.warning(f"[Headless] TM lookup failed for {key}: {e}")
+            return rows
+        pending = []
+        for position, index in enumerate(rows):
+            entry = hits.get(position)
+            if entry is None or not entry.target_text:
+                pending.append(index)
+                continue
+            item = parsed_file.items[index]
+            parsed_file.update_item_text(index, entry.target_text)
+            if self._checkpoint:
+                self._checkpoint.record(key, item.line_index, item.original_text, entry.target_text)
+            self._summary['tm_hits'] += 1
+        return pending
+
+    # =========================================================================
+    # SCHEDULER CALLBACKS
+    # =========================================================================
+
+    def _on_items_translated(self, file_path: str, batch_items: List[dict]):
+        parsed_file = self._files[file_path]
+        key = self._keys[file_path]
+        for entry in batch_items:
+            item = parsed_file.get_item(entry["index"])
+            if item is None:
+                continue
+            self._summary['translated'] += 1
+            if self._checkpoint:
+                self._checkpoint.record(key, item.line_index, item.original_text, entry["text"])
+            if self._use_tm:
+                try:
+                    self._get_tm().insert(
+                        source_text=item.original_text, target_text=entry["text"],
+                        source_lang=self._source_lang, target_lang=self._target_lang,
+                        origin=self._origin,
+                    )
+                except Exception as e:
+                    logger.debug(f"[Headless] TM insert skipped: {e}")
+        if self._checkpoint:
+            self._checkpoint.save()
+
+    # =========================================================================
+    # QC + SAVE
+    # =========================================================================
+
+    def _finalize_file(self, file_path: str, failed: int):
+        """QC the file's rows, save it and update the checkpoint."""
+        import renforge_core as core
+        from core.qc_engine import check_quality
+
+        self._finalized.add(file_path)
+        parsed_file = self._files[file_path]
+        key = self._keys[file_path]
+
+        qc_errors = qc_warnings = 0
+        for index in sorted(self._rows[file_path]):
+            item = parsed_file.items[index]
+            if not item.is_modified_session:
+                continue
+            with telemetry.stage(telemetry.QC):
+                issues = check_quality(item.original_text, item.current_text)
+            for issue in issues:
+                if issue.severity == "ERROR":
+                    qc_errors += 1
+                    self._reporter.emit("qc_error", file=key, line=item.line_index,
+                                        code=issue.code, message=issue.message)
+                else:
+                    qc_warnings += 1
+        self._summary['qc_errors'] += qc_errors
+        self._summary['qc_warnings'] += qc_warnings
+
+        saved = False
+        if parsed_file.is_modified and not self._dry_run:
+            output_path = self._output_path(key, parsed_file)
+            try:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with telemetry.stage(telemetry.SAVE):
+                    core.save_parsed_file(parsed_file, str(output_path))
+                saved = True
+                self._summary['saved_files'] += 1
+            except Exception as e:
+                logger.error(f"[Headless] Failed to save {output_path}: {e}")
+                self._reporter.emit("file_error", file=key, message=str(e))
+                failed += 1
+
+        if self._checkpoint and not self._dry_run and failed == 0:
+            self._checkpoint.mark_done(key, _file_signature(file_path))
+            self._checkpoint.save()
+
+        self._reporter.emit("file_done", file=key, rows=len(self._rows[file_path]),
+                            failed=failed, qc_errors=qc_errors, qc_warnings=qc_warnings,
+                            saved=saved)
+
+    def _output_path(self, key: str, parsed_file: ParsedFile) -> Path:
+        if self._output_dir is None:
+            return Path(parsed_file.output_path)
+        return self._output_dir / key
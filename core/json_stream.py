@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Incremental JSON Parser
+
+Parses a streamed batch response ({"translations":[{"i":0,"t":"..."}, ...]})
+piece by piece and hands out every {"i", "t"} object as soon as its closing
+brace arrives, so rows can be validated and applied while the rest of the
+response is still being generated. A stream that is cut off keeps the
+objects that were already complete.
+
+    parser = TranslationStreamParser()
+    for piece in stream:
+        for item in parser.feed(piece):
+            apply(item["i"], item["t"])
+    parser.complete  # True if the whole document was received
+
+Only string/escape state, nesting depth and object start offsets are
+tracked; each finished object is decoded with json.loads. Text outside
+the JSON value (e.g. markdown fences) is ignored.
+"""
+
+import json
+from typing import Dict, List
+
+
+class TranslationStreamParser:
+    """Incremental parser for strict batch translation responses."""
+
+    def __init__(self):
+        self._buffer: List[str] = []   # Text of the current top-level value
+        self._length = 0
+        self._starts: List[int] = []   # Buffer offsets of the open '{'s
+        self._depth = 0                # Open '{' and '[' (strings excluded)
+        self._in_string = False
+        self._escape = False
+        self._seen = set()
+        self.items: List[Dict] = []
+        self.complete = False
+
+    def feed(self, text: str) -> List[Dict]:
+        """
+        Consume the next piece of the response.
+
+        Returns:
+            {"i", "t"} objects completed by this piece (each index once)
+        """
+        found = []
+        for char in text:
+            if self.complete:
+                break
+            if self._depth == 0 and char not in "{[":
+                continue  # Outside the JSON value (fences, whitespace)
+            self._buffer.append(char)
+            self._length += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._starts.append(self._length - 1)
+                self._depth += 1
+            elif char == "[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._starts:
+                    item = self._decode(self._starts.pop())
+                    if item is not None:
+                        found.append(item)
+                if self._depth == 0:
+                    self.complete = True
+        return found
+
+    def _decode(self, start: int):
+        try:
+            value = json.loads("".join(self._buffer[start:]))
+        except ValueError:
+            return None
+        if not isinstance(value, dict) or "i" not in value or "t" not in value:
+            return None
+        if value["i"] in self._seen:
+            return None
+        self._seen.add(value["i"])
+        item = {"i": value["i"], "t": value["t"]}
+        self.items.append(item)
+        return item
@@ -2,12 +2,11 @@
 import os
 import sys
 import json
-import shutil
 import zipfile
 import time
 import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Generator
+from typing import Dict, Any, List, Optional, Tuple, Generator, Callable
 
 from renforge_logger import get_logger
 import renforge_config as config
@@ -44,15 +43,19 @@ class PackConstants:
 class PackManager:
     """
     Manages Export and Import of RenForge Project Packs (.rfpack).
+    
+    Pack members are written straight into the zip stream (no staging
+    directory). The TM travels as an SQLite snapshot taken with the online
+    backup API, so it is consistent even while TMStore is being written.
     """
     
-    def __init__(self):
-        self.temp_dir = config.APP_DIR / "temp" / "pack_staging"
-        
+    COPY_CHUNK_SIZE = 1024 * 1024
+    
     def export_pack(self, 
                     output_path: str,
                     include_options: Dict[str, bool],
-                    password: str = None) -> bool:
+                    password: str = None,
+                    progress_callback: Optional[Callable[[str, int, int], None]] = None) -> bool:
         """
         Export current workspace to a .rfpack file.
         
@@ -67,71 +70,55 @@ class PackManager:
                 "secrets": bool
             }
             password: Password for encrypting secrets (required if secrets=True)
+            progress_callback: Optional callback(stage, done, total)
             
         Returns:
             True if successful.
         """
+        timestamp = datetime.datetime.now().isoformat()
+        meta = {
+            "format_version": PackConstants.VERSION,
+            "created_at": timestamp,
+            "app_version": "0.3.10", # Todo: Get from config
+            "contents": []
+        }
+        
+        # Write next to the destination and rename when complete
+        part_path = Path(str(output_path) + ".part")
         try:
-            timestamp = datetime.datetime.now().isoformat()
-            meta = {
-                "format_version": PackConstants.VERSION,
-                "created_at": timestamp,
-                "app_version": "0.3.10", # Todo: Get from config
-                "contents": []
-            }
-            
-            # Prepare staging
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
-            self.temp_dir.mkdir(parents=True, exist_ok=True)
-            
-            plugins_dir = self.temp_dir / PackConstants.PLUGINS_DIR
-            plugins_dir.mkdir(exist_ok=True)
-            
-            # 1. Settings
-            if include_options.get("settings", True):
-                self._export_settings(self.temp_dir / PackConstants.SETTINGS_FILE, include_options.get("secrets", False))
-                meta["contents"].append("settings")
+            with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+                # 1. Settings
+                if include_options.get("settings", True):
+                    self._export_settings(zipf, include_options.get("secrets", False))
+                    meta["contents"].append("settings")
+                    
+                # 2. Glossary
+                if include_options.get("glossary", True):
+                    # TODO: Integrate with GlossaryManager export
+                    glossary_path = config.APP_DIR / "glossary.json" # Or wherever it lives
+                    if glossary_path.exists():
+                        zipf.write(glossary_path, PackConstants.GLOSSARY_FILE)
+                        meta["contents"].append("glossary")
                 
-            # 2. Glossary
-            if include_options.get("glossary", True):
-                # Assume glossary is a single JSON for now or handled via manager
-                # For now, just dumping the expected file if it exists
-                # TODO: Integrate with GlossaryManager export
-                glossary_path = config.APP_DIR / "glossary.json" # Or wherever it lives
-                if glossary_path.exists():
-                     shutil.copy2(glossary_path, self.temp_dir / PackConstants.GLOSSARY_FILE)
-                     meta["contents"].append("glossary")
-            
-            # 3. TM (Optional - heavy)
-            if include_options.get("tm", False):
-                tm_dir = self.temp_dir / PackConstants.TM_DIR
-                tm_dir.mkdir(exist_ok=True)
-                src_tm = config.DB_DIR / "tm.db"
-                if src_tm.exists():
-                    # Must close DB connection logic? SQLite usually safe to copy if WAL 
-                    # But ideally we should checkpoint. For now simple copy.
-                    shutil.copy2(src_tm, tm_dir / PackConstants.TM_DB_FILE)
-                    meta["contents"].append("tm")
-            
-            # 4. Plugins
-            if include_options.get("plugins", True):
-                self._export_plugins(plugins_dir, include_options.get("secrets", False), password)
-                meta["contents"].append("plugins")
+                # 3. TM (Optional - heavy)
+                if include_options.get("tm", False):
+                    if self._export_tm(zipf, progress_callback):
+                        meta["contents"].append("tm")
+                
+                # 4. Plugins
+                if include_options.get("plugins", True):
+                    self._export_plugins(zipf, include_options.get("secrets", False), password)
+                    meta["contents"].append("plugins")
 
-            # 5. History
-            if include_options.get("history", False):
-                hist_dir = self.temp_dir / PackConstants.HISTORY_DIR
-                hist_dir.mkdir(exist_ok=True)
-                # TODO: Copy ChangeLog
-                meta["contents"].append("history")
+                # 5. History
+                if include_options.get("history", False):
+                    # TODO: Copy ChangeLog
+                    meta["contents"].append("history")
 
-            # Write Meta
-            with open(self.temp_dir / PackConstants.META_FILE, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, indent=4)
-                
-            # Zip it up
-            self._create_zip(self.temp_dir, output_path)
+                # Write Meta
+                zipf.writestr(PackConstants.META_FILE, json.dumps(meta, indent=4))
+            
+            os.replace(part_path, output_path)
             logger.info(f"Pack exported successfully to {output_path}")
             return True
             
@@ -139,19 +126,52 @@ class PackManager:
             logger.error(f"Export failed: {e}")
             raise
         finally:
-            if self.temp_dir.exists():
-                 pass # Cleanup? Or keep for debug?
-                 shutil.rmtree(self.temp_dir, ignore_errors=True)
+            if part_path.exists():
+                part_path.unlink()
+
+    def _tm_db_path(self) -> Path:
+        """Database file TMStore writes to."""
+        from core.tm_store import TMStore
+        return TMStore.instance().db_path
+
+    def _export_tm(self, zipf: zipfile.ZipFile, progress_callback=None) -> bool:
+        """Snapshot the TM with the backup API and stream it into the pack."""
+        from core.tm_store import TMStore
+        
+        if not self._tm_db_path().exists():
+            return False
+        
+        def on_backup(done, total):
+            if progress_callback:
+                progress_callback("tm_snapshot", done, total)
+        
+        # The snapshot needs a real file (backup API); keep it beside the DB
+        snapshot = config.DB_DIR / f".tm_export_{os.getpid()}.db"
+        try:
+            TMStore.instance().backup_to(snapshot, progress=on_backup)
+            arcname = f"{PackConstants.TM_DIR}/{PackConstants.TM_DB_FILE}"
+            self._stream_into_zip(zipf, snapshot, arcname, "tm_write", progress_callback)
+        finally:
+            if snapshot.exists():
+                snapshot.unlink()
+        return True
 
-    def _create_zip(self, source_dir: Path, output_path: str):
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+    def _stream_into_zip(self, zipf: zipfile.ZipFile, src_path: Path, arcname: str,
+                         stage: str, progress_callback=None):
+        """Copy a file into the zip in chunks (no second full read of the pack)."""
+        total = src_path.stat().st_size
+        done = 0
+        with open(src_path, 'rb') as src, zipf.open(arcname, 'w', force_zip64=True) as dest:
+            while True:
+                chunk = src.read(self.COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                dest.write(chunk)
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(stage, done, total)
 
-    def _export_settings(self, dest_path: Path, include_secrets: bool):
+    def _export_settings(self, zipf: zipfile.ZipFile, include_secrets: bool):
         # Load current settings from disk
         import renforge_settings
         settings = renforge_settings.load_settings()
@@ -161,21 +181,11 @@ class PackManager:
             settings.pop("api_key", None)
             # Add more secret keys here if any
             
-        with open(dest_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
+        zipf.writestr(PackConstants.SETTINGS_FILE, json.dumps(settings, indent=4))
 
-    def _export_plugins(self, dest_dir: Path, include_secrets: bool, password: str):
-        # Gather plugin configs
-        # Assuming plugin configs are in settings["plugins"] for now or separate files
-        # We will iterate known plugins from PluginManager to find saved configs?
-        # Actually simplest is to export the "plugins" section of settings.json separate if needed,
-        # or just rely on settings.json export.
-        # BUT the requirement says "/plugins/config.json".
-        
-        # Let's check if there is a plugins folder in settings? 
-        # Or usually plugins store data in `SETTINGS_DIR`/plugins?
-        # If not, let's assume we extract "plugins" key from settings.json and save it here.
-        
+    def _export_plugins(self, zipf: zipfile.ZipFile, include_secrets: bool, password: str):
+        # Plugin configs live in settings["plugins"]; they are written to
+        # plugins/config.json with secrets split out into plugins/secrets.enc.
         import renforge_settings
         settings = renforge_settings.load_settings()
         plugin_configs = settings.get("plugins", {})
@@ -193,17 +203,18 @@ class PackManager:
                 secrets[f"{p_id}.api_key"] = val
                 
         # Write clean config
-        with open(dest_dir / PackConstants.PLUGINS_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(clean_configs, f, indent=4)
+        zipf.writestr(f"{PackConstants.PLUGINS_DIR}/{PackConstants.PLUGINS_CONFIG_FILE}",
+                      json.dumps(clean_configs, indent=4))
             
         # Encrypt secrets if requested
         if include_secrets and password and HAS_CRYPTO and secrets:
             try:
-                self._encrypt_secrets(secrets, password, dest_dir / PackConstants.SECRETS_FILE)
+                blob = self._encrypt_secrets(secrets, password)
+                zipf.writestr(f"{PackConstants.PLUGINS_DIR}/{PackConstants.SECRETS_FILE}", json.dumps(blob))
             except Exception as e:
                 logger.error(f"Encryption failed: {e}")
                 
-    def _encrypt_secrets(self, secrets_dict: Dict, password: str, output_path: Path):
+    def _encrypt_secrets(self, secrets_dict: Dict, password: str) -> Dict[str, Any]:
         from cryptography.hazmat.primitives.ciphers.aead import AESGCM
         from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
         import os
@@ -222,17 +233,14 @@ class PackManager:
         
         # Save format: version|salt|nonce|ciphertext (all base64 encoded)
         # Version 1
-        blob = {
+        return {
             "v": 1,
             "s": base64.b64encode(salt).decode('ascii'),
             "n": base64.b64encode(nonce).decode('ascii'),
             "c": base64.b64encode(ct).decode('ascii')
         }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(blob, f)
 
-    def _decrypt_secrets(self, file_path: Path, password: str) -> Dict:
+    def _decrypt_secrets(self, blob: Dict, password: str) -> Dict:
         if not HAS_CRYPTO:
             logger.error("Cannot decrypt secrets: cryptography library missing.")
             return {}
@@ -241,9 +249,6 @@ class PackManager:
         from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
         import base64
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            blob = json.load(f)
-            
         if blob.get("v") != 1:
             raise ValueError("Unknown secret format version")
             
@@ -275,32 +280,37 @@ class PackManager:
             except KeyError:
                 raise ValueError("Valid .rfpack must contain meta.json")
 
+    def _read_json(self, zipf: zipfile.ZipFile, arcname: str) -> Optional[Any]:
+        """Load a JSON member, or None if the pack does not contain it."""
+        try:
+            with zipf.open(arcname) as f:
+                return json.load(f)
+        except KeyError:
+            return None
+
     def import_pack(self, 
                    pack_path: str, 
                    strategies: Dict[str, str],
-                   password: str = None) -> List[str]:
+                   password: str = None,
+                   progress_callback: Optional[Callable[[str, int, int], None]] = None) -> List[str]:
         """
         Import a pack using defined strategies.
+        
+        Members are read straight from the zip; only the TM database is
+        extracted (streamed) to a temporary file so SQLite can open it.
+        
         Returns a report of actions taken.
         """
         report = []
         
-        # Prepare staging
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-            
-        try:
-            with zipfile.ZipFile(pack_path, 'r') as zipf:
-                 zipf.extractall(self.temp_dir)
-                 
+        with zipfile.ZipFile(pack_path, 'r') as zipf:
             # 1. Recover Secrets (if any)
-            secrets_path = self.temp_dir / PackConstants.PLUGINS_DIR / PackConstants.SECRETS_FILE
+            secrets_blob = self._read_json(zipf, f"{PackConstants.PLUGINS_DIR}/{PackConstants.SECRETS_FILE}")
             decrypted_secrets = {}
-            if secrets_path.exists():
+            if secrets_blob is not None:
                 if password:
                     try:
-                        decrypted_secrets = self._decrypt_secrets(secrets_path, password)
+                        decrypted_secrets = self._decrypt_secrets(secrets_blob, password)
                         report.append("Secrets decrypted successfully.")
                     except Exception as e:
                         report.append(f"ERROR: Failed to decrypt secrets: {e}")
@@ -310,11 +320,9 @@ class PackManager:
             # 2. Merge Settings
             settings_strategy = strategies.get("settings", "SKIP") # SKIP, OVERWRITE
             if settings_strategy == "OVERWRITE":
-                src = self.temp_dir / PackConstants.SETTINGS_FILE
-                if src.exists():
+                imported_settings = self._read_json(zipf, PackConstants.SETTINGS_FILE)
+                if imported_settings is not None:
                     import renforge_settings
-                    with open(src, 'r', encoding='utf-8') as f:
-                        imported_settings = json.load(f)
                     
                     # Merge restored secrets back into settings structure if needed
                     # Assumes secrets key "plugin_id.api_key" maps to structure
@@ -329,43 +337,69 @@ class PackManager:
             # 3. Merge Glossary
             glossary_strategy = strategies.get("glossary", "SKIP")
             if glossary_strategy != "SKIP":
-                src = self.temp_dir / PackConstants.GLOSSARY_FILE
-                if src.exists():
+                imported_data = self._read_json(zipf, PackConstants.GLOSSARY_FILE)
+                if imported_data is not None:
                     # Call glossary manager merge
                     try:
                         from core.glossary_manager import GlossaryManager
                         
-                        with open(src, 'r', encoding='utf-8') as gf:
-                            imported_data = json.load(gf)
-                            # Handle structure variations if any (list or dict with 'terms')
-                            terms = imported_data if isinstance(imported_data, list) else imported_data.get("terms", [])
-                            
-                            gm = GlossaryManager()
-                            gm.merge_glossary(terms, strategy=glossary_strategy)
-                            report.append(f"Glossary merged (Strategy: {glossary_strategy})")
+                        # Handle structure variations if any (list or dict with 'terms')
+                        terms = imported_data if isinstance(imported_data, list) else imported_data.get("terms", [])
+                        
+                        gm = GlossaryManager()
+                        gm.merge_glossary(terms, strategy=glossary_strategy)
+                        report.append(f"Glossary merged (Strategy: {glossary_strategy})")
                     except Exception as ge:
                         report.append(f"ERROR: Glossary merge failed: {ge}")
 
             # 4. Merge TM
             tm_strategy = strategies.get("tm", "SKIP")
             if tm_strategy != "SKIP":
-                 src_tm = self.temp_dir / PackConstants.TM_DIR / PackConstants.TM_DB_FILE
-                 if src_tm.exists():
-                     if tm_strategy == "REPLACE":
-                         dest = config.DB_DIR / "tm.db"
-                         shutil.copy2(src_tm, dest)
-                         report.append("TM Database replaced.")
-                     elif tm_strategy == "MERGE":
-                         # Call TM merge
-                         from core.tm_store import get_tm_manager
-                         tm = get_tm_manager() # Use global instance
-                         count = tm.import_from_db(str(src_tm))
-                         report.append(f"Merged {count} entries into TM.")
+                report.extend(self._import_tm(zipf, tm_strategy, progress_callback))
+
+        return report
 
-            return report
+    def _import_tm(self, zipf: zipfile.ZipFile, strategy: str, progress_callback=None) -> List[str]:
+        """Extract the TM snapshot and REPLACE or MERGE it into TMStore."""
+        from core.tm_store import TMStore
+        
+        arcname = f"{PackConstants.TM_DIR}/{PackConstants.TM_DB_FILE}"
+        try:
+            info = zipf.getinfo(arcname)
+        except KeyError:
+            return []
+        
+        # SQLite needs a real file; extract beside the DB (same filesystem)
+        config.DB_DIR.mkdir(parents=True, exist_ok=True)
+        snapshot = config.DB_DIR / f".tm_import_{os.getpid()}.db"
+        try:
+            done = 0
+            with zipf.open(info) as src, open(snapshot, 'wb') as dest:
+                while True:
+                    chunk = src.read(self.COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    done += len(chunk)
+                    if progress_callback:
+                        progress_callback("tm_extract", done, info.file_size)
+            
+            def on_progress(stage):
+                if progress_callback:
+                    return lambda d, t: progress_callback(stage, d, t)
+                return None
             
+            tm = TMStore.instance()
+            if strategy == "REPLACE":
+                tm.restore_from(snapshot, progress=on_progress("tm_replace"))
+                return ["TM Database replaced."]
+            if strategy == "MERGE":
+                count = tm.merge_from_db(snapshot, progress=on_progress("tm_merge"))
+                return [f"Merged {count} entries into TM."]
+            return [f"ERROR: Unknown TM strategy: {strategy}"]
+        except Exception as e:
+            logger.error(f"TM import failed: {e}")
+            return [f"ERROR: TM import failed: {e}"]
         finally:
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-
+            if snapshot.exists():
+                snapshot.unlink()
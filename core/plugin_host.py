@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Plugin Host
+
+Runs engine and tool plugins in a pool of worker processes, so a CPU-bound
+engine (local MT model, heavy post-processing) does not compete with the
+GUI for the GIL and a crashing plugin cannot take the app down.
+
+- One pool per plugin; its size is the plugin's concurrency (manifest
+  "isolation": {"mode": "process", "processes": N}, default
+  config.PLUGIN_WORKER_PROCESSES). Workers start on first use.
+- IPC is one message per pipe send, [op, request_id, payload], packed with
+  msgpack when it is installed and as compact JSON otherwise.
+- Translation results stream back one item per message. Cancellation is
+  forwarded to the worker, which checks it between items.
+- Idle workers are pinged before reuse. A worker that died, stopped
+  answering or timed out is killed and replaced on the next request.
+
+Workers use the "spawn" start method on every platform: forking a process
+that runs Qt and worker threads is not safe.
+"""
+
+import atexit
+import json
+import multiprocessing
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # Optional; compact JSON is used instead
+    msgpack = None
+
+import renforge_config as config
+from interfaces.i_plugin import (
+    EngineCapabilities, IPlugin, IToolPlugin, ITranslationEngineV2, PluginType, is_canceled,
+)
+from renforge_logger import get_logger
+
+logger = get_logger("core.plugin_host")
+
+POLL_SECONDS = 0.1     # Cancellation check interval while waiting on a worker
+CALL_TIMEOUT = 30.0    # Seconds for short requests (capabilities, tool process)
+PING_TIMEOUT = 5.0
+STOP_SECONDS = 2.0     # Grace period before a stopping worker is killed
+
+_pools: "weakref.WeakSet[PluginProcessPool]" = weakref.WeakSet()
+
+
+class PluginWorkerError(Exception):
+    """A worker crashed, timed out, could not load its plugin or the plugin raised."""
+
+
+# =============================================================================
+# IPC
+# =============================================================================
+
+def _pack(message: list) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _unpack(data: bytes) -> list:
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return json.loads(data)
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+class _PipeCancelToken:
+    """Worker-side cancel token, set by a "cancel" (or "stop") message from the host."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._set = False
+        self.stopping = False
+
+    def is_set(self) -> bool:
+        while not self._set and self._conn.poll():
+            op, request_id, _ = _unpack(self._conn.recv_bytes())
+            if op == "ping":
+                self._conn.send_bytes(_pack(["pong", request_id, None]))
+            elif op in ("cancel", "stop"):
+                self._set = True
+                self.stopping = op == "stop"
+        return self._set
+
+
+def _worker_main(conn, manifest: Dict, plugin_dir: str):
+    """Worker process entry point: load the plugin and serve requests until "stop"."""
+    from core.plugin_manager import load_plugin
+    from interfaces.i_plugin import ITranslationEngine, as_engine_v2
+
+    def send(op: str, request_id: int, payload: Any = None):
+        conn.send_bytes(_pack([op, request_id, payload]))
+
+    try:
+        plugin = load_plugin(manifest, Path(plugin_dir))
+        plugin.on_load(context=None)
+    except Exception as e:
+        send("error", 0, f"{type(e).__name__}: {e}")
+        return
+    engine = as_engine_v2(plugin) if isinstance(plugin, ITranslationEngine) else None
+    calls = {
+        "capabilities": lambda engine_config: asdict(engine.capabilities(engine_config)),
+        "is_available": lambda engine_config: bool(engine.is_available(engine_config)),
+        "get_supported_languages": lambda: list(engine.get_supported_languages()),
+    }
+    send("ready", 0)
+
+    while True:
+        try:
+            op, request_id, payload = _unpack(conn.recv_bytes())
+        except (EOFError, OSError):
+            break  # Host went away
+        if op == "stop":
+            break
+        if op == "ping":
+            send("pong", request_id)
+            continue
+        if op == "cancel":
+            continue  # The request already finished
+        try:
+            if op == "translate":
+                items, source_lang, target_lang, engine_config, timeout = payload
+                token = _PipeCancelToken(conn)
+                for result in engine.translate_stream(items, source_lang, target_lang, engine_config,
+                                                      cancel_token=token, timeout=timeout):
+                    send("item", request_id, result)
+                send("done", request_id)
+                if token.stopping:
+                    break
+            elif op == "process":
+                text, context = payload
+                send("result", request_id, plugin.process(text, context))
+            elif op == "call":
+                name, args = payload
+                send("result", request_id, calls[name](*args))
+            else:
+                send("error", request_id, f"Unknown request: {op}")
+        except Exception as e:
+            send("error", request_id, f"{type(e).__name__}: {e}")
+
+    try:
+        plugin.on_unload()
+    except Exception:
+        pass
+
+
+# =============================================================================
+# HOST SIDE
+# =============================================================================
+
+class _Worker:
+    """One worker process and the host end of its pipe."""
+
+    def __init__(self, ctx, manifest: Dict, plugin_dir: Path):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, manifest, str(plugin_dir)),
+                                   name=f"plugin:{manifest['id']}", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.broken = False
+        self.last_used = time.monotonic()
+        self._next_id = 0
+
+        message = self.poll(0, config.PLUGIN_WORKER_START_TIMEOUT)
+        if message is None or message[0] != "ready":
+            self.stop(graceful=False)
+            reason = message[2] if message else "timed out"
+            raise PluginWorkerError(f"Plugin {manifest['id']} failed to start: {reason}")
+
+    def send(self, op: str, payload: Any = None, request_id: Optional[int] = None) -> int:
+        if request_id is None:
+            self._next_id += 1
+            request_id = self._next_id
+        try:
+            self.conn.send_bytes(_pack([op, request_id, payload]))
+        except (OSError, ValueError) as e:
+            self.broken = True
+            raise PluginWorkerError(f"Worker pipe closed: {e}") from e
+        return request_id
+
+    def poll(self, request_id: int, timeout: float) -> Optional[list]:
+        """
+        Next message for `request_id`, or None if none arrives within `timeout`.
+
+        Raises:
+            PluginWorkerError: The worker process exited
+        """
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                if not self.conn.poll(max(0.0, end - time.monotonic())):
+                    return None
+                message = _unpack(self.conn.recv_bytes())
+            except (EOFError, OSError) as e:
+                self.broken = True
+                self.process.join(STOP_SECONDS)
+                raise PluginWorkerError(f"Worker process exited (code {self.process.exitcode})") from e
+            if message[1] == request_id:
+                return message
+            # Left over from an earlier request (e.g. a late answer to a cancel)
+
+    def request(self, op: str, payload: Any, timeout: float) -> Any:
+        """Send a request and wait for its single answer."""
+        request_id = self.send(op, payload)
+        message = self.poll(request_id, timeout)
+        if message is None:
+            self.broken = True
+            raise PluginWorkerError(f"No answer to '{op}' within {timeout:.0f}s")
+        if message[0] == "error":
+            raise PluginWorkerError(message[2])
+        return message[2]
+
+    def stop(self, graceful: bool = True):
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send_bytes(_pack(["stop", 0, None]))
+            except (OSError, ValueError):
+                pass
+            self.process.join(STOP_SECONDS)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(STOP_SECONDS)
+        self.conn.close()
+
+
+class PluginProcessPool:
+    """
+    Worker processes of one plugin; at most `processes` requests run at once.
+
+    Args:
+        manifest: Plugin manifest (its "entrypoint" is loaded in each worker)
+        plugin_dir: Directory of the plugin
+        processes: Pool size
+    """
+
+    def __init__(self, manifest: Dict, plugin_dir: Path, processes: int):
+        self.manifest = manifest
+        self.plugin_dir = Path(plugin_dir)
+        self.processes = max(1, int(processes))
+        self.restarts = 0
+        self._ctx = multiprocessing.get_context("spawn")
+        self._slots = threading.BoundedSemaphore(self.processes)
+        self._idle: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        _pools.add(self)
+
+    @contextmanager
+    def lease(self) -> Iterator[_Worker]:
+        """A healthy worker for one request; it goes back to the pool (or is replaced) afterwards."""
+        self._slots.acquire()
+        worker = None
+        try:
+            worker = self._take()
+            yield worker
+        finally:
+            if worker is not None:
+                self._give_back(worker)
+            self._slots.release()
+
+    def health_check(self) -> int:
+        """Ping every idle worker now. Returns how many were dropped."""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        dropped = 0
+        for worker in workers:
+            worker.last_used = float("-inf")
+            if self._healthy(worker):
+                self._give_back(worker)
+            else:
+                self._retire(worker)
+                dropped += 1
+        return dropped
+
+    def shutdown(self):
+        """Stop all idle workers; workers in use stop when their request ends."""
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stop()
+
+    def _take(self) -> _Worker:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise PluginWorkerError(f"Plugin host for {self.manifest['id']} is shut down")
+                worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                return _Worker(self._ctx, self.manifest, self.plugin_dir)
+            if self._healthy(worker):
+                return worker
+            self._retire(worker)
+
+    def _healthy(self, worker: _Worker) -> bool:
+        if not worker.process.is_alive():
+            return False
+        if time.monotonic() - worker.last_used < config.PLUGIN_WORKER_PING_INTERVAL:
+            return True
+        try:
+            worker.request("ping", None, PING_TIMEOUT)
+        except PluginWorkerError:
+            return False
+        worker.last_used = time.monotonic()
+        return True
+
+    def _give_back(self, worker: _Worker):
+        if worker.broken or not worker.process.is_alive():
+            self._retire(worker)
+            return
+        worker.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(worker)
+                return
+        worker.stop()
+
+    def _retire(self, worker: _Worker):
+        logger.warning(f"[PluginHost] Replacing worker of {self.manifest['id']} "
+                       f"(exit code {worker.process.exitcode})")
+        self.restarts += 1
+        worker.stop(graceful=False)
+
+
+@atexit.register
+def _shutdown_pools():
+    for pool in list(_pools):
+        pool.shutdown()
+
+
+# =============================================================================
+# PLUGIN PROXIES
+# =============================================================================
+
+class ProcessEngine(ITranslationEngineV2):
+    """Engine plugin whose calls run in a PluginProcessPool."""
+
+    def __init__(self, manifest: Dict, plugin_dir: Path, processes: int):
+        super().__init__()
+        self.manifest = manifest
+        self.pool = PluginProcessPool(manifest, plugin_dir, processes)
+
+    def on_load(self, context: Any) -> None:
+        pass  # Each worker loads the plugin on start
+
+    def on_unload(self) -> None:
+        self.pool.shutdown()
+
+    def _call(self, name: str, *args) -> Any:
+        with self.pool.lease() as worker:
+            return worker.request("call", [name, list(args)], CALL_TIMEOUT)
+
+    def capabilities(self, engine_config: Dict[str, Any]) -> EngineCapabilities:
+        """The plugin's capabilities, with concurrency capped at the pool size."""
+        try:
+            caps = EngineCapabilities.from_dict(self._call("capabilities", engine_config))
+        except PluginWorkerError as e:
+            logger.warning(f"[PluginHost] {self.id}: capabilities unavailable: {e}")
+            caps = super().capabilities(engine_config)
+        limit = self.pool.processes
+        return replace(caps, max_concurrency=min(caps.max_concurrency or limit, limit))
+
+    def get_supported_languages(self) -> List[str]:
+        try:
+            return self._call("get_supported_languages")
+        except PluginWorkerError as e:
+            logger.warning(f"[PluginHost] {self.id}: {e}")
+            return []
+
+    def is_available(self, engine_config: Dict[str, Any]) -> bool:
+        try:
+            return self._call("is_available", engine_config)
+        except PluginWorkerError as e:
+            logger.warning(f"[PluginHost] {self.id}: {e}")
+            return False
+
+    def translate_stream(self, items, source_lang, target_lang, engine_config, cancel_token=None, timeout=30):
+        pending = {item["i"] for item in items}
+        try:
+            with self.pool.lease() as worker:
+                yield from self._stream(worker, items, source_lang, target_lang, engine_config,
+                                        cancel_token, timeout, pending)
+            return
+        except PluginWorkerError as e:
+            logger.error(f"[PluginHost] {self.id}: {e}")
+            error = str(e)
+        for item in items:
+            if item["i"] in pending:
+                yield {"i": item["i"], "error": error}
+
+    @staticmethod
+    def _stream(worker: _Worker, items, source_lang, target_lang, engine_config,
+                cancel_token, timeout, pending: set) -> Iterator[Dict]:
+        request_id = worker.send("translate", [items, source_lang, target_lang, engine_config, timeout])
+        canceled = False
+        last_message = time.monotonic()
+        try:
+            while True:
+                if not canceled and is_canceled(cancel_token):
+                    worker.send("cancel", request_id=request_id)
+                    canceled = True
+                message = worker.poll(request_id, POLL_SECONDS)
+                if message is None:
+                    # `timeout` bounds the wait for each result, not the whole batch
+                    if time.monotonic() - last_message > timeout:
+                        worker.broken = True
+                        raise PluginWorkerError(f"No result within {timeout}s")
+                    continue
+                last_message = time.monotonic()
+                op, _, payload = message
+                if op == "item":
+                    pending.discard(payload.get("i"))
+                    yield payload
+                elif op == "done":
+                    return
+                else:
+                    raise PluginWorkerError(payload)
+        except GeneratorExit:
+            # Abandoned mid-stream: the worker is still sending, replace it
+            worker.broken = True
+            raise
+
+
+class ProcessTool(IToolPlugin):
+    """Tool plugin whose process() calls run in a PluginProcessPool."""
+
+    def __init__(self, manifest: Dict, plugin_dir: Path, processes: int):
+        super().__init__()
+        self.manifest = manifest
+        self.pool = PluginProcessPool(manifest, plugin_dir, processes)
+
+    def on_load(self, context: Any) -> None:
+        pass
+
+    def on_unload(self) -> None:
+        self.pool.shutdown()
+
+    def process(self, text: str, context: Dict[str, Any]) -> str:
+        """Transformed text; the input is returned unchanged if the worker fails."""
+        try:
+            with self.pool.lease() as worker:
+                return worker.request("process", [text, context], CALL_TIMEOUT)
+        except PluginWorkerError as e:
+            logger.warning(f"[PluginHost] {self.id}: {e}")
+            return text
+
+
+def create_process_plugin(manifest: Dict, plugin_dir: Path, processes: int) -> IPlugin:
+    """Process-isolated proxy for an engine or tool plugin."""
+    plugin_type = PluginType(manifest.get("type", "engine"))
+    if plugin_type == PluginType.ENGINE:
+        return ProcessEngine(manifest, plugin_dir, processes)
+    return ProcessTool(manifest, plugin_dir, processes)
@@ -2,14 +2,71 @@
 import os
 import sys
 import importlib
+import importlib.util
 import inspect
 from pathlib import Path
 from typing import Dict, List, Optional, Type
 from renforge_logger import get_logger
-from interfaces.i_plugin import IPlugin, ITranslationEngine, PluginType
+from interfaces.i_plugin import IPlugin, ITranslationEngine, ITranslationEngineV2, PluginType, as_engine_v2
 
 logger = get_logger("core.plugin_manager")
 
+
+class PluginLoadError(Exception):
+    """A plugin's entrypoint module or class could not be loaded."""
+
+
+def load_plugin(manifest: Dict, plugin_dir: Path) -> IPlugin:
+    """
+    Import a plugin's entrypoint and instantiate it (also used by plugin
+    worker processes).
+
+    Raises:
+        PluginLoadError: Module or class not found
+    """
+    mod_name, class_name = manifest["entrypoint"].split(":")
+    if mod_name.endswith(".py"): mod_name = mod_name[:-3]
+    
+    # Add plugin dir to sys.path temporarily to load module
+    # Ideally we use importlib machinery to avoid polluting sys.path too much
+    # But simple approach:
+    
+    spec = importlib.util.spec_from_file_location(f"{manifest['id']}_mod", plugin_dir / f"{mod_name}.py")
+    if not spec or not spec.loader:
+        raise PluginLoadError(f"Could not load module {mod_name} for plugin {manifest['id']}")
+        
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    if not hasattr(module, class_name):
+        raise PluginLoadError(f"Class {class_name} not found in module {mod_name} for plugin {manifest['id']}")
+         
+    cls = getattr(module, class_name)
+    
+    # Instantiate
+    plugin = cls()
+    plugin.manifest = manifest # Inject manifest data
+    return plugin
+
+
+def plugin_process_count(manifest: Dict) -> int:
+    """
+    Worker processes for a plugin, or 0 to run it in-process.
+
+    The manifest's "isolation" ("process", or {"mode": "process",
+    "processes": N}) wins over config.PLUGIN_PROCESS_ISOLATION.
+    """
+    import renforge_config as config
+
+    isolation = manifest.get("isolation")
+    if isinstance(isolation, str):
+        isolation = {"mode": isolation}
+    if isolation is None:
+        isolation = {"mode": "process" if config.PLUGIN_PROCESS_ISOLATION else "inprocess"}
+    if isolation.get("mode") != "process":
+        return 0
+    return max(1, int(isolation.get("processes") or config.PLUGIN_WORKER_PROCESSES))
+
 class PluginManager:
     _instance = None
 
@@ -91,31 +148,18 @@ class PluginManager:
                 logger.error(err)
                 self.failed_plugins.append({"name": plugin_dir.name, "error": err, "path": str(plugin_dir)})
                 return
-                
-            mod_name, class_name = entry_str.split(":")
-            if mod_name.endswith(".py"): mod_name = mod_name[:-3]
-            
-            # Add plugin dir to sys.path temporarily to load module
-            # Ideally we use importlib machinery to avoid polluting sys.path too much
-            # But simple approach:
-            
-            spec = importlib.util.spec_from_file_location(f"{manifest['id']}_mod", plugin_dir / f"{mod_name}.py")
-            if not spec or not spec.loader:
-                logger.error(f"Could not load module {mod_name} for plugin {manifest['id']}")
-                return
-                
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            if not hasattr(module, class_name):
-                 logger.error(f"Class {class_name} not found in module {mod_name} for plugin {manifest['id']}")
-                 return
-                 
-            cls = getattr(module, class_name)
-            
-            # Instantiate
-            plugin = cls()
-            plugin.manifest = manifest # Inject manifest data
+
+            processes = plugin_process_count(manifest)
+            if processes:
+                # Hosted in worker processes; the module is only imported there
+                from core.plugin_host import create_process_plugin
+                plugin = create_process_plugin(manifest, plugin_dir, processes)
+            else:
+                try:
+                    plugin = load_plugin(manifest, plugin_dir)
+                except PluginLoadError as e:
+                    logger.error(str(e))
+                    return
             self._register_plugin(plugin)
             
         except Exception as e:
@@ -135,9 +179,25 @@ class PluginManager:
         if isinstance(plugin, ITranslationEngine):
             self.engines[plugin.id] = plugin
 
+    def shutdown(self):
+        """Unload all plugins (stops the worker processes of isolated ones)."""
+        for plugin in self.plugins.values():
+            try:
+                plugin.on_unload()
+            except Exception as e:
+                logger.warning(f"Failed to unload plugin {plugin.id}: {e}")
+        self.plugins.clear()
+        self.engines.clear()
+        self._initialized = False
+
     def get_engine(self, engine_id: str) -> Optional[ITranslationEngine]:
         return self.engines.get(engine_id)
 
+    def get_engine_v2(self, engine_id: str) -> Optional[ITranslationEngineV2]:
+        """Engine with the streaming v2 API (v1 plugins are wrapped in an adapter)."""
+        engine = self.engines.get(engine_id)
+        return as_engine_v2(engine) if engine else None
+
     def get_all_engines(self) -> List[ITranslationEngine]:
         return list(self.engines.values())
 
@@ -7,9 +7,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Callable
 
 from renforge_logger import get_logger
-from renforge_localization import tr
+from renforge_localization import tr, get_language
 import renforge_config as config
 from parser.translate_parser import TranslateParser
+from core.rule_cache import cached_check
+
+# Bump when a check or message below changes (invalidates cached results)
+PREFLIGHT_RULESET_VERSION = 1
 
 # Reuse QA Engine definitions if possible, or define Preflight specific structures
 # We'll define a simple Issue structure here to be independent but compatible
@@ -156,38 +160,51 @@ class PreflightEngine:
             if item_type not in valid_types:
                 continue
                 
-            # If no translation, skip validation unless we want to flag untranslated?
-            # Issue 3: Untranslated or empty lines (where source is not empty)
-            if orig and (trans is None or trans.strip() == ""):
-                # Assuming empty translation means "Untranslated" in our model
-                # But sometimes validly empty? Usually no.
-                # Only flag if not explictly marked as TODO?
-                self.issues.append(PreflightIssue("error", "empty_translation", file_path, line_num, tr("pf_empty_trans_msg"), idx))
-                continue
-                
-            if not trans:
-                continue
+            for severity, rule, message in self._check_pair(orig, trans):
+                self.issues.append(PreflightIssue(severity, rule, file_path, line_num, message, idx))
 
-            # 1. Tokens (Interpolation)
-            self._check_tokens(file_path, line_num, idx, orig, trans)
-            
-            # 2. Markup Tags
-            self._check_markup(file_path, line_num, idx, orig, trans)
+    def _check_pair(self, orig: str, trans: str) -> tuple:
+        """(severity, rule, message) findings of one pair, cached by its texts and the thresholds."""
+        version = (PREFLIGHT_RULESET_VERSION, self.check_identical, self.check_length,
+                   self.length_threshold, get_language())
+        return cached_check("preflight", version, orig or "", trans or "",
+                            lambda: tuple(self._evaluate_pair(orig, trans)))
+
+    def _evaluate_pair(self, orig: str, trans: str) -> List[tuple]:
+        findings = []
+        # If no translation, skip validation unless we want to flag untranslated?
+        # Issue 3: Untranslated or empty lines (where source is not empty)
+        if orig and (trans is None or trans.strip() == ""):
+            # Assuming empty translation means "Untranslated" in our model
+            # But sometimes validly empty? Usually no.
+            # Only flag if not explictly marked as TODO?
+            findings.append(("error", "empty_translation", tr("pf_empty_trans_msg")))
+            return findings
             
-            # 4. Identical
-            if self.check_identical and orig == trans: 
-                # Some short words might be legitimately identical (OK, No, etc.)
-                # Simple heuristic: Only warn if length > 3
-                if len(orig) > 3:
-                     self.issues.append(PreflightIssue("warning", "identical", file_path, line_num, tr("pf_identical_msg"), idx))
-                     
-            # 5. Length overflow
-            if self.check_length and len(orig) > 0:
-                ratio = len(trans) / len(orig)
-                if ratio > self.length_threshold:
-                    self.issues.append(PreflightIssue("warning", "length_overflow", file_path, line_num, tr("pf_length_msg", ratio=f"{ratio:.1f}"), idx))
+        if not trans:
+            return findings
+
+        # 1. Tokens (Interpolation)
+        self._check_tokens(findings, orig, trans)
+        
+        # 2. Markup Tags
+        self._check_markup(findings, orig, trans)
+        
+        # 4. Identical
+        if self.check_identical and orig == trans: 
+            # Some short words might be legitimately identical (OK, No, etc.)
+            # Simple heuristic: Only warn if length > 3
+            if len(orig) > 3:
+                 findings.append(("warning", "identical", tr("pf_identical_msg")))
+                 
+        # 5. Length overflow
+        if self.check_length and orig and len(orig) > 0:
+            ratio = len(trans) / len(orig)
+            if ratio > self.length_threshold:
+                findings.append(("warning", "length_overflow", tr("pf_length_msg", ratio=f"{ratio:.1f}")))
+        return findings
 
-    def _check_tokens(self, fpath, line, row, orig, trans):
+    def _check_tokens(self, findings, orig, trans):
         # Regex for [var], %(var)s, {tag}
         # Simple bracket check reusing regex from QA or similar
         # For now, simplistic [interpolation] check
@@ -199,9 +216,9 @@ class PreflightEngine:
         tokens = re.findall(r'\[.+?\]', orig)
         for token in tokens:
             if token not in trans:
-                self.issues.append(PreflightIssue("error", "missing_token", fpath, line, tr("pf_missing_token_msg", token=token), row))
+                findings.append(("error", "missing_token", tr("pf_missing_token_msg", token=token)))
 
-    def _check_markup(self, fpath, line, row, orig, trans):
+    def _check_markup(self, findings, orig, trans):
         # Check for unclosed tags like {b}, {/b}
         # Count {tag} vs {/tag}
         # RenPy tags: {b}, {i}, {s}, {u}, {a=...}, {color=...}, {size=...}, {font=...}
@@ -214,4 +231,4 @@ class PreflightEngine:
             closer = f"{{/{t}}}"
             
             if trans.count(opener) != trans.count(closer):
-                self.issues.append(PreflightIssue("error", "markup_mismatch", fpath, line, tr("pf_markup_msg", tag=t), row))
+                findings.append(("error", "markup_mismatch", tr("pf_markup_msg", tag=t)))
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Project Index
+
+Per-file translation progress for a whole project without opening tabs:
+item counts, untranslated / modified rows, QC findings and the detected
+language of every .rpy file.
+
+Results are cached in `<project>/.renforge/project_index.json`, keyed by
+file size and mtime, so a rescan only re-parses files that changed since
+the last one (stat only for the rest). Qt-free; the GUI runs `scan()` in a
+background thread and calls it again when its file watcher fires.
+
+    index = ProjectIndex(project_path)
+    changed = index.scan()
+    progress = index.get("game/tl/turkish/script.rpy")
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from renforge_enums import FileMode
+from renforge_logger import get_logger
+
+logger = get_logger("core.project_index")
+
+INDEX_FILE_NAME = "project_index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class FileProgress:
+    """Translation progress of one file (paths are project relative, posix)."""
+    path: str
+    size: int = 0
+    mtime_ns: int = 0
+    mode: str = ""
+    language: str = ""
+    items: int = 0
+    untranslated: int = 0     # Translate mode: rows with an empty translation
+    modified: int = 0         # Rows whose text differs from the source
+    qc_errors: int = 0
+    qc_warnings: int = 0
+    error: str = ""           # Parse failure, if any
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Share of translated rows (translate mode), None when not applicable."""
+        if self.mode != FileMode.TRANSLATE.value or not self.items:
+            return None
+        return (self.items - self.untranslated) / self.items
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FileProgress':
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def index_file(path, rel_path: str) -> FileProgress:
+    """Parse one file and count its progress (never raises)."""
+    import renforge_core as core
+    from core.qc_engine import check_quality
+
+    stat = os.stat(path)
+    progress = FileProgress(path=rel_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    try:
+        parsed_file = core.load_parsed_file(path)
+    except Exception as e:
+        logger.warning(f"[ProjectIndex] Could not parse {rel_path}: {e}")
+        progress.error = str(e)
+        return progress
+
+    translate_mode = parsed_file.mode == FileMode.TRANSLATE
+    progress.mode = parsed_file.mode.value
+    progress.language = parsed_file.target_language or ""
+    for item in parsed_file.items:
+        source = item.original_text or ""
+        if not source.strip():
+            continue
+        progress.items += 1
+        text = item.current_text or ""
+        if translate_mode and not text.strip():
+            progress.untranslated += 1
+            continue
+        if text == source:
+            continue
+        progress.modified += 1
+        for issue in check_quality(source, text):
+            if issue.severity == "ERROR":
+                progress.qc_errors += 1
+            else:
+                progress.qc_warnings += 1
+    return progress
+
+
+class ProjectIndex:
+    """
+    mtime-keyed progress cache of a project's .rpy files.
+
+    Thread-safe: `scan()` may run in a worker while the GUI reads entries.
+    """
+
+    def __init__(self, project_path):
+        self.root = Path(project_path)
+        self.index_path = self.root / ".renforge" / INDEX_FILE_NAME
+        self._lock = threading.Lock()
+        self._entries: Dict[str, FileProgress] = {}
+        self._load()
+
+    def _load(self):
+        if not self.index_path.is_file():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[ProjectIndex] Ignoring unreadable index {self.index_path}: {e}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self._entries = {
+            entry["path"]: FileProgress.from_dict(entry) for entry in data.get("files", [])
+        }
+
+    def save(self):
+        """Write the index atomically."""
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "files": [asdict(entry) for entry in self._entries.values()],
+            }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+    def relative(self, path) -> str:
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    # =========================================================================
+    # SCAN
+    # =========================================================================
+
+    def scan(self, cancel_check: Optional[Callable[[], bool]] = None,
+             on_file: Optional[Callable[[FileProgress, int, int], None]] = None) -> List[FileProgress]:
+        """
+        Bring the index up to date with the files on disk.
+
+        Args:
+            cancel_check: Returns True to stop early (progress so far is kept)
+            on_file: Called as (progress, done, total) for each re-indexed file
+
+        Returns:
+            Entries that were (re)computed; removed files are dropped silently
+        """
+        from core.headless_pipeline import discover_files
+
+        paths = discover_files(self.root)
+        current = {self.relative(p): p for p in paths}
+        with self._lock:
+            removed = [key for key in self._entries if key not in current]
+            for key in removed:
+                del self._entries[key]
+            stale = []
+            for key, path in current.items():
+                entry = self._entries.get(key)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if entry is None or (entry.size, entry.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                    stale.append((key, path))
+
+        changed = []
+        for done, (key, path) in enumerate(stale, start=1):
+            if cancel_check and cancel_check():
+                break
+            try:
+                progress = index_file(path, key)
+            except OSError:
+                continue  # Deleted while scanning
+            with self._lock:
+                self._entries[key] = progress
+            changed.append(progress)
+            if on_file:
+                on_file(progress, done, len(stale))
+
+        if changed or removed:
+            try:
+                self.save()
+            except OSError as e:
+                logger.warning(f"[ProjectIndex] Could not save index: {e}")
+        return changed
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def get(self, path) -> Optional[FileProgress]:
+        """Entry of a file (absolute or project relative path)."""
+        key = path if isinstance(path, str) and not os.path.isabs(path) else self.relative(path)
+        with self._lock:
+            return self._entries.get(key)
+
+    def entries(self) -> List[FileProgress]:
+        """All entries, sorted by path."""
+        with self._lock:
+            return [self._entries[key] for key in sorted(self._entries)]
+
+    def totals(self) -> Dict[str, int]:
+        """Project wide sums of the counters."""
+        totals = {"files": 0, "items": 0, "untranslated": 0, "modified": 0,
+                  "qc_errors": 0, "qc_warnings": 0}
+        for entry in self.entries():
+            totals["files"] += 1
+            for key in ("items", "untranslated", "modified", "qc_errors", "qc_warnings"):
+                totals[key] += getattr(entry, key)
+        return totals
@@ -1,14 +1,20 @@
 
 import re
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from typing import List, Dict, Any, Iterable, Optional
 from dataclasses import dataclass
 from enum import Enum
 from models.parsed_file import ParsedItem
 import locales
 from renforge_logger import get_logger
+from core.rule_cache import cached_check
 
 logger = get_logger("core.qa_engine")
 
+# Bump when a rule's logic or message changes (invalidates cached results)
+RULESET_VERSION = 1
+
 class QASeverity(Enum):
     ERROR = "error"
     WARNING = "warning"
@@ -188,6 +194,12 @@ class WhitespaceRule(QARule):
 # =========================================================================
 
 class QAEngine:
+    """
+    Runs the QA rules. Results depend only on the (original, translation)
+    pair, so they are cached per (rule-set version, original, translation)
+    and shared by every row, file and scan with the same texts.
+    """
+
     def __init__(self):
         self.rules: List[QARule] = [
             TokenRule(),
@@ -196,6 +208,29 @@ class QAEngine:
             IdenticalRule(),
             WhitespaceRule()
         ]
+
+    @property
+    def version(self) -> tuple:
+        """Cache key part: rule set, its version and the message language."""
+        return (RULESET_VERSION, tuple(rule.id for rule in self.rules), locales.get_language())
+
+    def check_item(self, item: ParsedItem, index: int) -> List[QAIssue]:
+        """Issues of one item (cached by its texts)."""
+        findings = cached_check("qa", self.version, item.original_text or "", item.current_text or "",
+                                lambda: self._evaluate(item))
+        if not findings:
+            return []
+        line = (item.line_index or 0) + 1
+        return [QAIssue(rule_id, severity, line, index, message, can_fix)
+                for rule_id, severity, message, can_fix in findings]
+
+    def _evaluate(self, item: ParsedItem) -> tuple:
+        findings = []
+        for rule in self.rules:
+            issue = rule.check(item, 0)
+            if issue:
+                findings.append((issue.rule_id, issue.severity, issue.message, issue.can_fix))
+        return tuple(findings)
         
     def scan(self, items: List[ParsedItem], callback=None) -> List[QAIssue]:
         issues = []
@@ -205,11 +240,7 @@ class QAEngine:
         for i, item in enumerate(items):
             if i % 500 == 0 and callback:
                 if not callback(i, total): break # Cancelled
-                
-            for rule in self.rules:
-                issue = rule.check(item, i)
-                if issue:
-                    issues.append(issue)
+            issues.extend(self.check_item(item, i))
                     
         return issues
         
@@ -218,3 +249,196 @@ class QAEngine:
             if rule.id == issue.rule_id:
                 return rule.fix(item)
         return False
+
+# =========================================================================
+# Live Index
+# =========================================================================
+
+class QAIndex:
+    """
+    Live QA issues of one ParsedFile, re-checked incrementally.
+
+    A row is re-evaluated only when it is dirty: ParsedFile.update_item_text
+    (and the other 'items_updated' notifications), table model edits and
+    batch results mark it via mark_dirty(). Rows appended by a streaming
+    load are picked up as unchecked. Readers (QA panel, Health page) get the
+    current issue set after the dirty rows are refreshed, so after the first
+    scan a QA run costs only the edits made since.
+
+    Thread-safe: the QA worker refreshes while the GUI marks rows dirty.
+    A refresh holds `_lock` (the issue state) only to take the dirty set
+    and to store each row's result, so mark_dirty() and the refresh=False
+    readers never wait for a scan; concurrent refreshes are serialized by
+    `_refresh_lock`.
+    """
+
+    def __init__(self, parsed_file, engine: Optional[QAEngine] = None):
+        self.engine = engine or QAEngine()
+        self._file = weakref.ref(parsed_file)
+        self._lock = threading.Lock()             # Issue state; held briefly
+        self._refresh_lock = threading.Lock()     # One scan at a time
+        self._texts: List[Optional[str]] = []          # current_text each row was checked with
+        self._row_issues: Dict[int, List[QAIssue]] = {}
+        self._dirty = set()
+        self._version = None
+        self._issues: Optional[List[QAIssue]] = None   # Flattened view, rebuilt on change
+        self.scanned = False
+        parsed_file.subscribe('items_updated', self.mark_dirty)
+
+    def close(self):
+        """Stop tracking the file."""
+        parsed_file = self._file()
+        if parsed_file is not None:
+            parsed_file.unsubscribe('items_updated', self.mark_dirty)
+
+    def mark_dirty(self, indices: Iterable[int]):
+        """Queue rows for re-evaluation on the next read (does not wait for a running scan)."""
+        with self._lock:
+            self._dirty.update(indices)
+
+    def pending(self) -> int:
+        """Rows that the next refresh will evaluate."""
+        parsed_file = self._file()
+        if parsed_file is None:
+            return 0
+        with self._lock:
+            return len(self._dirty) + max(0, len(parsed_file.items) - len(self._texts))
+
+    def refresh(self, callback=None, verify: bool = False) -> bool:
+        """
+        Re-evaluate dirty and unchecked rows.
+
+        Args:
+            callback: callback(done, total) -> False to cancel (as QAEngine.scan)
+            verify: Also re-check rows whose text was replaced without
+                    notification (an identity comparison per row)
+
+        Returns:
+            False if canceled (the remaining rows stay pending)
+        """
+        parsed_file = self._file()
+        if parsed_file is None:
+            return True
+        with self._refresh_lock:
+            with self._lock:
+                items = parsed_file.items
+                if self._version != self.engine.version or len(items) < len(self._texts):
+                    self._reset()
+                checked = len(self._texts)
+                rows = {i for i in self._dirty if i < checked}
+                if verify:
+                    rows.update(i for i in range(checked) if items[i].current_text is not self._texts[i])
+                rows = sorted(rows)
+                self._dirty.clear()
+            end = len(items)
+            total = len(rows) + end - checked
+
+            done = 0
+            for n, i in enumerate(rows):
+                if callback and done % 500 == 0 and not callback(done, total):
+                    self.mark_dirty(rows[n:])
+                    return False
+                self._check_row(i, items[i])
+                done += 1
+            for i in range(checked, end):
+                if callback and done % 500 == 0 and not callback(done, total):
+                    return False
+                self._check_row(i, items[i])
+                done += 1
+            self.scanned = True
+            return True
+
+    def _reset(self):
+        self._texts = []
+        self._row_issues = {}
+        self._dirty.clear()
+        self._issues = None
+        self._version = self.engine.version
+
+    def _check_row(self, index: int, item: ParsedItem):
+        # Evaluated outside the state lock; an edit made meanwhile marks the row dirty again
+        text = item.current_text
+        issues = self.engine.check_item(item, index)
+        with self._lock:
+            if index == len(self._texts):
+                self._texts.append(text)
+            else:
+                self._texts[index] = text
+            if issues or self._row_issues.get(index):
+                self._issues = None
+            if issues:
+                self._row_issues[index] = issues
+            else:
+                self._row_issues.pop(index, None)
+
+    def issues(self, refresh: bool = True) -> List[QAIssue]:
+        """
+        All issues in row order.
+
+        With refresh=False the current results are returned at once, even
+        while a scan is running (GUI-thread readers).
+        """
+        if refresh:
+            self.refresh()
+        with self._lock:
+            if self._issues is None:
+                self._issues = [issue for index in sorted(self._row_issues)
+                                for issue in self._row_issues[index]]
+            return list(self._issues)
+
+    def row_issues(self, index: int) -> List[QAIssue]:
+        with self._lock:
+            return list(self._row_issues.get(index, ()))
+
+    def counts(self, refresh: bool = True) -> Dict[str, int]:
+        """Issue totals per severity plus the number of affected rows (refresh as in issues())."""
+        if refresh:
+            self.refresh()
+        with self._lock:
+            totals = {severity.value: 0 for severity in QASeverity}
+            for issues in self._row_issues.values():
+                for issue in issues:
+                    totals[issue.severity.value] += 1
+            totals["rows"] = len(self._row_issues)
+            return totals
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_qa_index(parsed_file) -> QAIndex:
+    """The live QA index of a file (created on first use)."""
+    with _indexes_lock:
+        index = _indexes.get(parsed_file)
+        if index is None:
+            index = _indexes[parsed_file] = QAIndex(parsed_file)
+        return index
+
+
+def mark_dirty(parsed_file, indices: Iterable[int]):
+    """Mark rows changed outside ParsedFile.update_item_text (no-op without an index)."""
+    index = _indexes.get(parsed_file)
+    if index is not None:
+        index.mark_dirty(indices)
+
+
+def live_counts(refresh: bool = True) -> Dict[str, int]:
+    """
+    Issue totals over the open files that have been QA-scanned. Only their
+    dirty rows are re-evaluated; files never scanned are not included.
+    GUI-thread callers pass refresh=False to read the last results without
+    evaluating (or waiting for a running scan).
+    """
+    totals = {severity.value: 0 for severity in QASeverity}
+    totals["rows"] = 0
+    totals["files"] = 0
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        if not index.scanned:
+            continue
+        for key, value in index.counts(refresh).items():
+            totals[key] += value
+        totals["files"] += 1
+    return totals
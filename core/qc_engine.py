@@ -4,6 +4,10 @@ RenForge Quality Check (QC) Engine
 
 This module provides logic to detect quality issues in translations,
 such as missing placeholders, empty content, or length anomalies.
+
+Results are cached per (QC_RULESET_VERSION, source, target) in the shared
+rule cache, so re-checking unchanged rows (batch chunks, manual edits, the
+headless pipeline, the project index) costs a dict lookup.
 """
 
 import re
@@ -11,10 +15,14 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from renforge_logger import get_logger
+from core.rule_cache import cached_check
 
 logger = get_logger("core.qc_engine")
 
-@dataclass
+# Bump when a check, code or message below changes (invalidates cached results)
+QC_RULESET_VERSION = 1
+
+@dataclass(frozen=True)
 class QCIssue:
     code: str
     message: str
@@ -51,11 +59,17 @@ def check_quality(source_text: str, target_text: str) -> List[QCIssue]:
     Returns:
         List of QCIssue objects found.
     """
-    issues = []
-    
     if source_text is None: source_text = ""
     if target_text is None: target_text = ""
     
+    return list(cached_check("qc", QC_RULESET_VERSION, source_text, target_text,
+                             lambda: tuple(_evaluate_quality(source_text, target_text))))
+
+
+def _evaluate_quality(source_text: str, target_text: str) -> List[QCIssue]:
+    """Uncached QC checks (see check_quality)."""
+    issues = []
+    
     # 1. Empty Translation (ERROR)
     if not target_text.strip() and source_text.strip():
         issues.append(QCIssue(
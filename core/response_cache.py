@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Response Cache
+
+Persistent, content-addressed cache for Gemini batch responses with SQLite
+persistence. Re-running a batch after a crash replays the stored responses of
+completed chunks instead of paying for the same API call twice. Only
+responses that passed schema and token validation are stored; retries of
+failed rows bypass the cache.
+
+Keys are derived from the model name, the prompt template version and the
+normalized prompt. The prompt already embeds the masked source texts, the
+glossary terms and the language pair, so any change to those produces a new
+key. Entries expire after a TTL and the store is kept under a size budget
+by evicting least-recently-used entries.
+
+Thread-safe for worker usage.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.response_cache")
+
+
+# Bump when prompt templates change in a way that makes old responses invalid
+PROMPT_TEMPLATE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024       # 64 MB of response text
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600       # 30 days
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize line endings and trailing whitespace so cosmetic changes still hit."""
+    lines = prompt.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip()
+
+
+def compute_cache_key(model: str, prompt: str, json_mode: bool = False,
+                      template_version: int = PROMPT_TEMPLATE_VERSION) -> str:
+    """
+    Compute the cache key for one request.
+
+    Args:
+        model: Model name (e.g. "gemini-2.0-flash")
+        prompt: Full prompt text (masked sources, glossary, languages)
+        json_mode: Whether JSON output mode was requested
+        template_version: Prompt template version
+    """
+    combined = f"{model}\x1f{template_version}\x1f{int(bool(json_mode))}\x1f{normalize_prompt(prompt)}"
+    return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    Gemini response cache with SQLite backend.
+
+    Thread-safe singleton with connection-per-thread. Hit/miss counters
+    are kept for the current session.
+    """
+
+    _instance: Optional['ResponseCache'] = None
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._db_path = Path(db_path) if db_path else self._get_db_path()
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expired': 0}
+
+        self._ensure_schema()
+        logger.info(f"[ResponseCache] Initialized: {self._db_path}")
+
+    @classmethod
+    def instance(cls) -> 'ResponseCache':
+        """Get singleton instance."""
+        with cls._lock:
+            if cls._instance is None:
+                import renforge_config as config
+                cls._instance = ResponseCache(
+                    max_bytes=getattr(config, 'RESPONSE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES),
+                    ttl_seconds=getattr(config, 'RESPONSE_CACHE_TTL_SECONDS', DEFAULT_TTL_SECONDS),
+                )
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        with cls._lock:
+            cls._instance = None
+
+    def _get_db_path(self) -> Path:
+        from renforge_config import DB_DIR
+        return DB_DIR / "response_cache.db"
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if getattr(self._local, 'connection', None) is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = conn
+        return self._local.connection
+
+    def _ensure_schema(self):
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        conn.commit()
+
+    # =========================================================================
+    # LOOKUP / STORE
+    # =========================================================================
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key`, or None on miss/expiry."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT response, created_at FROM responses WHERE cache_key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+
+        if row is None:
+            with self._write_lock:
+                self._counters['misses'] += 1
+            return None
+
+        response, created_at = row
+        with self._write_lock:
+            if self._ttl and now - created_at > self._ttl:
+                conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                conn.commit()
+                self._counters['expired'] += 1
+                self._counters['misses'] += 1
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (now, key))
+            conn.commit()
+            self._counters['hits'] += 1
+        return response
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response and evict LRU entries if over the size budget."""
+        if not response:
+            return
+        size = len(response.encode('utf-8'))
+        if self._max_bytes and size > self._max_bytes:
+            return
+
+        now = time.time()
+        conn = self._get_connection()
+        with self._write_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, model, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._counters['stores'] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least-recently-used entries until under the size budget."""
+        if not self._max_bytes:
+            return
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+
+        # Evict down to 90% so steady-state puts don't evict on every call
+        target = int(self._max_bytes * 0.9)
+        evicted = 0
+        for key, size in conn.execute(
+            "SELECT cache_key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._counters['evictions'] += evicted
+        logger.debug(f"[ResponseCache] Evicted {evicted} entries")
+
+    def clear(self):
+        """Remove all cached responses."""
+        conn = self._get_connection()
+        with self._write_lock:
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Session counters plus persisted entry count / size."""
+        conn = self._get_connection()
+        entries, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        lookups = self._counters['hits'] + self._counters['misses']
+        stats = dict(self._counters)
+        stats.update({
+            'entries': entries,
+            'size_bytes': total,
+            'max_bytes': self._max_bytes,
+            'hit_rate': round(100.0 * self._counters['hits'] / lookups, 1) if lookups else 0.0,
+        })
+        return stats
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared cache, or None if disabled or unavailable."""
+    import renforge_config as config
+    if not getattr(config, 'RESPONSE_CACHE_ENABLED', True):
+        return None
+    try:
+        return ResponseCache.instance()
+    except Exception as e:
+        logger.warning(f"[ResponseCache] Unavailable: {e}")
+        return None
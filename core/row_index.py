@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Problem-Row Index
+
+Sorted row-number sets per review category (untranslated, error, QC,
+flagged, modified and the review page's "problems"), kept up to date row by row
+by TranslationTableModel. Next/previous issue, first/last row and counts
+are bisect lookups, so navigation in huge files never scans the rows or
+asks the filter proxy to re-filter.
+
+    index = ProblemRowIndex()
+    index.rebuild(rows)
+    index.update(row_number, row)          # after any change to the row
+    index.next_row(PROBLEMS, current_row)  # wraps around
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+UNTRANSLATED = "untranslated"
+ERROR = "error"
+QC = "qc"
+FLAGGED = "flagged"
+MODIFIED = "modified"
+PROBLEMS = "problems"          # Untranslated, error or flagged (the proxy's FILTER_PROBLEMS)
+
+CATEGORIES = (UNTRANSLATED, ERROR, QC, FLAGGED, MODIFIED, PROBLEMS)
+
+
+def row_categories(row) -> List[str]:
+    """Categories a RowData belongs to."""
+    status = getattr(row.status, "value", row.status)
+    found = []
+    if status == UNTRANSLATED:
+        found.append(UNTRANSLATED)
+    elif status == ERROR:
+        found.append(ERROR)
+    elif status == MODIFIED:
+        found.append(MODIFIED)
+    if row.qc_flag:
+        found.append(QC)
+    if row.is_flagged:
+        found.append(FLAGGED)
+    if status in (UNTRANSLATED, ERROR) or row.is_flagged:
+        found.append(PROBLEMS)
+    return found
+
+
+class SortedRowSet:
+    """Sorted list of row numbers with bisect membership and neighbour lookups."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: Iterable[int] = ()):
+        self._rows: List[int] = sorted(set(rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, row: int) -> bool:
+        i = bisect_left(self._rows, row)
+        return i < len(self._rows) and self._rows[i] == row
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def add(self, row: int):
+        i = bisect_left(self._rows, row)
+        if i == len(self._rows) or self._rows[i] != row:
+            self._rows.insert(i, row)
+
+    def discard(self, row: int):
+        i = bisect_left(self._rows, row)
+        if i < len(self._rows) and self._rows[i] == row:
+            del self._rows[i]
+
+    def append(self, row: int):
+        """Add a row known to be greater than every member (streaming loads)."""
+        if self._rows and row <= self._rows[-1]:
+            self.add(row)
+        else:
+            self._rows.append(row)
+
+    def first(self) -> Optional[int]:
+        return self._rows[0] if self._rows else None
+
+    def last(self) -> Optional[int]:
+        return self._rows[-1] if self._rows else None
+
+    def next_after(self, row: int, wrap: bool = True) -> Optional[int]:
+        """Smallest member > row (the first one when wrapping past the end)."""
+        i = bisect_right(self._rows, row)
+        if i < len(self._rows):
+            return self._rows[i]
+        return self.first() if wrap else None
+
+    def prev_before(self, row: int, wrap: bool = True) -> Optional[int]:
+        """Largest member < row (the last one when wrapping past the start)."""
+        i = bisect_left(self._rows, row)
+        if i > 0:
+            return self._rows[i - 1]
+        return self.last() if wrap else None
+
+
+class ProblemRowIndex:
+    """One SortedRowSet per category (see CATEGORIES)."""
+
+    def __init__(self):
+        self.sets: Dict[str, SortedRowSet] = {name: SortedRowSet() for name in CATEGORIES}
+
+    def rebuild(self, rows: Iterable):
+        """Index all rows from scratch (initial load)."""
+        members: Dict[str, List[int]] = {name: [] for name in CATEGORIES}
+        for n, row in enumerate(rows):
+            for name in row_categories(row):
+                members[name].append(n)
+        self.sets = {name: SortedRowSet(found) for name, found in members.items()}
+
+    def extend(self, start: int, rows: Iterable):
+        """Index rows appended at `start`."""
+        for n, row in enumerate(rows, start):
+            for name in row_categories(row):
+                self.sets[name].append(n)
+
+    def update(self, row_number: int, row):
+        """Re-file one row after it changed."""
+        found = row_categories(row)
+        for name, members in self.sets.items():
+            if name in found:
+                members.add(row_number)
+            else:
+                members.discard(row_number)
+
+    def count(self, category: str) -> int:
+        return len(self.sets[category])
+
+    def first(self, category: str) -> Optional[int]:
+        return self.sets[category].first()
+
+    def last(self, category: str) -> Optional[int]:
+        return self.sets[category].last()
+
+    def next_row(self, category: str, row: int, wrap: bool = True) -> Optional[int]:
+        return self.sets[category].next_after(row, wrap)
+
+    def prev_row(self, category: str, row: int, wrap: bool = True) -> Optional[int]:
+        return self.sets[category].prev_before(row, wrap)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Rule Result Cache
+
+Shared, bounded cache of quality-rule results. The QA engine, the QC checks
+(check_quality) and the preflight scan all evaluate pure functions of an
+(original, translation) pair, so each result is stored once under
+
+    (rule set, rule-set version, original, translation)
+
+and replayed for every later row, file or run with the same texts. The key
+holds the strings themselves: the dict hashes them (str caches its hash) and
+compares them on a hit, so distinct texts never share a result.
+
+Results must be immutable (tuples of frozen objects) since they are shared.
+
+    findings = cached_check("qc", QC_RULESET_VERSION, source, target,
+                            lambda: tuple(_evaluate(source, target)))
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import renforge_config as config
+from renforge_logger import get_logger
+
+logger = get_logger("core.rule_cache")
+
+_MISSING = object()
+
+
+class RuleResultCache:
+    """
+    Thread-safe LRU of rule results.
+
+    Args:
+        max_entries: Pairs kept before the least recently used are evicted
+    """
+
+    def __init__(self, max_entries: int = 200_000):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Cached result for `key`, computing (outside the lock) on a miss."""
+        with self._lock:
+            result = self._entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache: Optional[RuleResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_rule_cache() -> RuleResultCache:
+    """The process-wide cache (sized by QA_RESULT_CACHE_SIZE)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RuleResultCache(getattr(config, 'QA_RESULT_CACHE_SIZE', 200_000))
+    return _cache
+
+
+def cached_check(ruleset: str, version: Hashable, original: str, translation: str,
+                 compute: Callable[[], Any]) -> Any:
+    """
+    Result of a rule set for one text pair, computed at most once.
+
+    Args:
+        ruleset: Rule set name ("qa", "qc", "preflight")
+        version: Anything that changes when the rules or their messages do
+        original: Source text
+        translation: Translated text
+        compute: Evaluates the rules; must return an immutable value
+
+    Returns:
+        The cached or freshly computed result
+    """
+    return get_rule_cache().get_or_compute((ruleset, version, original, translation), compute)
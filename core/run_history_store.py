@@ -4,13 +4,19 @@ RenForge Run History Store
 
 Stores batch run history for the Health Panel dashboard.
 Persistence: project-first (if project open) + global fallback.
+
+Storage is SQLite and append-only: each finished run is one INSERT of its
+summary (plus one of its per-row details), nothing is rewritten. Summaries
+are read with an indexed query; details are read only for the run opened
+on the Health page (load_details).
 """
 
 import json
-import os
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+import sqlite3
+import threading
+from dataclasses import dataclass, field, fields, asdict
+from datetime import datetime, timedelta
+from typing import Iterator, List, Dict, Optional, Any, Tuple
 from pathlib import Path
 
 from renforge_logger import get_logger
@@ -75,16 +81,32 @@ class RunRecord:
     # Glossary metrics (Stage 16.2)
     glossary_misses: int = 0      # Number of glossary term misses
     glossary_violations: int = 0  # Number of glossary violations
+    
+    # Per-stage timings and counters (core.telemetry snapshot)
+    telemetry: Dict[str, Any] = field(default_factory=dict)
+    
+    # Storage bookkeeping (not persisted in the summary)
+    run_id: Optional[int] = field(default=None, compare=False, repr=False)
+    details_loaded: bool = field(default=True, compare=False, repr=False)
 
 
 # =============================================================================
 # PERSISTENCE PATHS
 # =============================================================================
 
+HISTORY_DB_NAME = "run_history.db"
+LEGACY_JSON_NAME = "run_history.json"   # Pre-SQLite format, migrated on first open
+
+# Per-row fields kept out of the summary table and loaded on demand
+DETAIL_FIELDS = ('error_row_ids', 'qc_row_ids', 'error_items', 'qc_items')
+# Bookkeeping fields that are not part of the stored summary
+_INTERNAL_FIELDS = ('run_id', 'details_loaded')
+
+
 def get_global_history_path() -> Path:
     """Global run history dosya yolunu döndür (uygulama içindeki DB klasörü)."""
     from renforge_config import DB_DIR
-    return DB_DIR / "run_history.json"
+    return DB_DIR / HISTORY_DB_NAME
 
 
 def get_project_history_path(project_path: str) -> Optional[Path]:
@@ -96,7 +118,149 @@ def get_project_history_path(project_path: str) -> Optional[Path]:
         project_dir = project_dir.parent
     renforge_dir = project_dir / ".renforge"
     renforge_dir.mkdir(exist_ok=True)
-    return renforge_dir / "run_history.json"
+    return renforge_dir / HISTORY_DB_NAME
+
+
+def _split_record(record: RunRecord) -> Tuple[dict, dict]:
+    """RunRecord -> (summary dict, details dict)."""
+    data = asdict(record)
+    for name in _INTERNAL_FIELDS:
+        data.pop(name, None)
+    details = {name: data.pop(name) for name in DETAIL_FIELDS}
+    return data, details
+
+
+def _record_from_summary(run_id: int, summary: dict) -> RunRecord:
+    """Build a RunRecord without details; unknown keys (newer versions) are ignored."""
+    known = {f.name for f in fields(RunRecord)} - set(DETAIL_FIELDS) - set(_INTERNAL_FIELDS)
+    record = RunRecord(**{k: v for k, v in summary.items() if k in known})
+    record.run_id = run_id
+    record.details_loaded = False
+    return record
+
+
+class _HistoryDB:
+    """One run history database file (append-only runs + lazily read details)."""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                summary TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs(timestamp);
+            CREATE TABLE IF NOT EXISTS run_details (
+                run_id INTEGER PRIMARY KEY,
+                details TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self._migrate_legacy_json()
+    
+    def append(self, record: RunRecord) -> int:
+        """Insert one run (summary + details) in a single transaction."""
+        summary, details = _split_record(record)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (timestamp, summary) VALUES (?, ?)",
+                (record.timestamp, json.dumps(summary, ensure_ascii=False, separators=(',', ':')))
+            )
+            run_id = cursor.lastrowid
+            if any(details.values()):
+                self._conn.execute(
+                    "INSERT INTO run_details (run_id, details) VALUES (?, ?)",
+                    (run_id, json.dumps(details, ensure_ascii=False, separators=(',', ':')))
+                )
+        return run_id
+    
+    def summaries(self, n: Optional[int] = None, since: Optional[str] = None,
+                  newest_first: bool = True) -> List[RunRecord]:
+        order = "DESC" if newest_first else "ASC"
+        query = "SELECT id, summary FROM runs"
+        params: list = []
+        if since:
+            query += " WHERE timestamp >= ?"
+            params.append(since)
+        query += f" ORDER BY timestamp {order}, id {order}"
+        if n is not None:
+            query += " LIMIT ?"
+            params.append(n)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_record_from_summary(run_id, json.loads(summary)) for run_id, summary in rows]
+    
+    def details(self, run_id: int) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT details FROM run_details WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+    
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+    
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM runs")
+            self._conn.execute("DELETE FROM run_details")
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+    
+    def compact(self, detail_cutoff: str) -> int:
+        """Drop per-row details of runs older than `detail_cutoff`; summaries stay."""
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM run_details WHERE run_id IN "
+                    "(SELECT id FROM runs WHERE timestamp < ?)",
+                    (detail_cutoff,)
+                )
+            dropped = cursor.rowcount
+            if dropped:
+                self._conn.execute("VACUUM")
+        return dropped
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def _migrate_legacy_json(self):
+        """Import run_history.json written by older versions (oldest first), then rename it."""
+        legacy = self.path.with_name(LEGACY_JSON_NAME)
+        if not legacy.exists():
+            return
+        try:
+            with open(legacy, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            known = {f.name for f in fields(RunRecord)} - set(_INTERNAL_FIELDS)
+            records = [RunRecord(**{k: v for k, v in item.items() if k in known})
+                       for item in data if isinstance(item, dict)]
+            records.sort(key=lambda r: r.timestamp)
+            for record in records:
+                self.append(record)
+            legacy.replace(legacy.with_name(LEGACY_JSON_NAME + ".migrated"))
+            logger.info(f"Migrated {len(records)} run records from {legacy}")
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy run history {legacy}: {e}")
 
 
 # =============================================================================
@@ -107,18 +271,21 @@ class RunHistoryStore:
     """
     Manages run history with project-first + global fallback persistence.
     
-    - If project is open: store in project/.renforge/run_history.json
-    - Always also update global ~/.renforge/run_history.json as fallback
-    - Limit to MAX_RECORDS per store
+    - If project is open: store in project/.renforge/run_history.db
+    - Always also append to the global DB/run_history.db as fallback
+    - Runs are appended, never rewritten; retention is unbounded. Per-row
+      details (error/QC items and row ids) live in a separate table and are
+      only read by load_details(). compact() drops details of old runs.
     """
     
-    MAX_RECORDS = 50  # Keep last 50 runs
+    DETAIL_RETENTION_DAYS = 180     # compact(): keep per-row details this long
+    COMPACT_INTERVAL_DAYS = 7       # ensure_loaded(): auto-compact at most this often
     
     _instance = None  # Singleton
     
     def __init__(self):
-        self._runs: List[RunRecord] = []
         self._project_path: Optional[str] = None
+        self._dbs: Dict[Path, _HistoryDB] = {}
         self._loaded = False
     
     @classmethod
@@ -128,37 +295,87 @@ class RunHistoryStore:
             cls._instance = RunHistoryStore()
         return cls._instance
     
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        if cls._instance is not None:
+            for db in cls._instance._dbs.values():
+                db.close()
+        cls._instance = None
+    
     def set_project_path(self, project_path: Optional[str]):
-        """Set current project path for persistence."""
+        """Set current project path for persistence (reads switch to the project DB)."""
         self._project_path = project_path
-        # Reload from project if changed
-        if project_path:
-            self._load_from_project()
-        else:
-            self._load_from_global()
+    
+    def _db(self, path: Path) -> _HistoryDB:
+        db = self._dbs.get(path)
+        if db is None:
+            db = self._dbs[path] = _HistoryDB(path)
+        return db
+    
+    def _project_db(self) -> Optional[_HistoryDB]:
+        path = get_project_history_path(self._project_path) if self._project_path else None
+        return self._db(path) if path else None
+    
+    def _read_db(self) -> _HistoryDB:
+        """Project DB if it has runs, otherwise the global DB."""
+        project_db = None
+        try:
+            project_db = self._project_db()
+        except Exception as e:
+            logger.warning(f"Failed to open project run history: {e}")
+        if project_db is not None and project_db.count():
+            return project_db
+        return self._db(get_global_history_path())
     
     def add_run(self, record: RunRecord):
-        """Add a run record and persist."""
-        self._runs.insert(0, record)  # Most recent first
-        
-        # Trim to max
-        if len(self._runs) > self.MAX_RECORDS:
-            self._runs = self._runs[:self.MAX_RECORDS]
+        """Append a run record (O(1): one insert per database)."""
+        try:
+            project_db = self._project_db()
+            if project_db is not None:
+                record.run_id = project_db.append(record)
+        except Exception as e:
+            logger.warning(f"Failed to save project run history: {e}")
         
-        # Persist
-        self._save()
+        try:
+            run_id = self._db(get_global_history_path()).append(record)
+            if record.run_id is None:
+                record.run_id = run_id
+        except Exception as e:
+            logger.warning(f"Failed to save global run history: {e}")
         
         logger.info(f"Run recorded: {record.processed} processed, {record.errors_count} errors, {record.qc_count_updated} QC")
     
     def get_last_run(self) -> Optional[RunRecord]:
-        """Get the most recent run."""
-        return self._runs[0] if self._runs else None
+        """Get the most recent run (summary only, see load_details)."""
+        runs = self.get_runs(1)
+        return runs[0] if runs else None
     
     def get_runs(self, n: int = 10) -> List[RunRecord]:
         """Get last N runs (most recent first, deterministic order by timestamp desc)."""
-        # Sort by timestamp descending to ensure deterministic order
-        sorted_runs = sorted(self._runs, key=lambda r: r.timestamp, reverse=True)
-        return sorted_runs[:n]
+        return self._read_db().summaries(n)
+    
+    def iter_runs(self, since: Optional[str] = None) -> Iterator[RunRecord]:
+        """All run summaries, oldest first (for trend analysis)."""
+        return iter(self._read_db().summaries(since=since, newest_first=False))
+    
+    def load_details(self, record: Optional[RunRecord]) -> Optional[RunRecord]:
+        """
+        Fill the per-row detail fields of a summary record (in place).
+        
+        Args:
+            record: RunRecord returned by get_runs / get_last_run
+        
+        Returns:
+            The same record
+        """
+        if record is None or record.details_loaded or record.run_id is None:
+            return record
+        details = self._read_db().details(record.run_id)
+        for name in DETAIL_FIELDS:
+            setattr(record, name, details.get(name) or [])
+        record.details_loaded = True
+        return record
     
     def get_aggregated_stats(self, n: int = 10) -> Dict[str, Any]:
         """
@@ -215,6 +432,8 @@ class RunHistoryStore:
         Returns:
             Minimum row_id with error, or None
         """
+        if model is not None and hasattr(model, 'first_row'):
+            return model.first_row("error")  # Sorted row index, O(1)
         if not model or not hasattr(model, '_rows'):
             return None
         
@@ -235,6 +454,8 @@ class RunHistoryStore:
         Returns:
             Minimum row_id with QC issue, or None
         """
+        if model is not None and hasattr(model, 'first_row'):
+            return model.first_row("qc")  # Sorted row index, O(1)
         if not model or not hasattr(model, '_rows'):
             return None
         
@@ -246,99 +467,47 @@ class RunHistoryStore:
         return min(qc_rows) if qc_rows else None
     
     def clear(self):
-        """Clear all run history."""
-        self._runs = []
-        self._save()
-    
-    # =========================================================================
-    # PERSISTENCE
-    # =========================================================================
+        """Clear all run history (project and global)."""
+        for db in self._target_dbs():
+            db.clear()
     
-    def _save(self):
-        """Save to both project (if available) and global."""
-        data = [asdict(r) for r in self._runs]
+    def compact(self, detail_retention_days: Optional[int] = None) -> int:
+        """
+        Drop per-row details of runs older than the retention window.
         
-        # Save to project if available
-        if self._project_path:
-            project_path = get_project_history_path(self._project_path)
-            if project_path:
-                try:
-                    with open(project_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                    logger.debug(f"Run history saved to project: {project_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to save project run history: {e}")
+        Summaries are never removed, so trends cover the whole history.
         
-        # Always save to global
-        global_path = get_global_history_path()
+        Returns:
+            Number of runs whose details were dropped
+        """
+        days = self.DETAIL_RETENTION_DAYS if detail_retention_days is None else detail_retention_days
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat(sep=' ', timespec='seconds')
+        dropped = 0
+        for db in self._target_dbs():
+            dropped += db.compact(cutoff)
+            db.set_meta('last_compact', datetime.now().isoformat())
+        if dropped:
+            logger.info(f"Run history compacted: details of {dropped} runs older than {days} days dropped")
+        return dropped
+    
+    def _target_dbs(self) -> List[_HistoryDB]:
+        dbs = [self._db(get_global_history_path())]
         try:
-            with open(global_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Run history saved to global: {global_path}")
+            project_db = self._project_db()
+            if project_db is not None:
+                dbs.append(project_db)
         except Exception as e:
-            logger.warning(f"Failed to save global run history: {e}")
+            logger.warning(f"Failed to open project run history: {e}")
+        return dbs
     
-    def _load_from_project(self):
-        """Load from project path."""
-        if not self._project_path:
+    def ensure_loaded(self):
+        """Open the history (migrating legacy JSON) and compact it if due (call on app start)."""
+        if self._loaded:
             return
-        
-        project_path = get_project_history_path(self._project_path)
-        if project_path and project_path.exists():
-            self._load_from_file(project_path)
-        else:
-            # Fallback to global
-            self._load_from_global()
-    
-    def _load_from_global(self):
-        """Load from global path."""
-        global_path = get_global_history_path()
-        if global_path.exists():
-            self._load_from_file(global_path)
-        else:
-            self._runs = []
-    
-    def _load_from_file(self, path: Path):
-        """Load run history from a JSON file."""
+        self._loaded = True
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self._runs = []
-            for item in data:
-                # Convert dict to RunRecord
-                record = RunRecord(
-                    timestamp=item.get('timestamp', ''),
-                    file_name=item.get('file_name'),
-                    file_path=item.get('file_path'),
-                    provider=item.get('provider'),
-                    model=item.get('model'),
-                    source_lang=item.get('source_lang'),
-                    target_lang=item.get('target_lang'),
-                    chunk_size=item.get('chunk_size'),
-                    processed=item.get('processed', 0),
-                    success_updated=item.get('success_updated', 0),
-                    errors_count=item.get('errors_count', 0),
-                    qc_count_updated=item.get('qc_count_updated', 0),
-                    qc_count_total=item.get('qc_count_total', 0),
-                    duration_ms=item.get('duration_ms', 0),
-                    error_category_counts=item.get('error_category_counts', {}),
-                    qc_code_counts=item.get('qc_code_counts', {}),
-                    error_row_ids=item.get('error_row_ids', []),  # Backward compat
-                    qc_row_ids=item.get('qc_row_ids', []),  # Backward compat
-                    error_items=item.get('error_items', []),  # Stage 9
-                    qc_items=item.get('qc_items', [])  # Stage 9
-                )
-                self._runs.append(record)
-            
-            logger.info(f"Loaded {len(self._runs)} run records from {path}")
-            self._loaded = True
-            
+            last = self._db(get_global_history_path()).get_meta('last_compact')
+            if not last or datetime.fromisoformat(last) < datetime.now() - timedelta(days=self.COMPACT_INTERVAL_DAYS):
+                self.compact()
         except Exception as e:
-            logger.warning(f"Failed to load run history from {path}: {e}")
-            self._runs = []
-    
-    def ensure_loaded(self):
-        """Ensure history is loaded (call on app start)."""
-        if not self._loaded:
-            self._load_from_global()
+            logger.warning(f"Run history compaction failed: {e}")
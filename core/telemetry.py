@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Batch Telemetry
+
+Per-stage timers and counters for a batch run. Code on the translation
+path wraps its work in `stage(...)`; while a run is active
+(`start_run` ... `finish_run`) every timing lands in a fixed-bucket
+latency histogram, otherwise the calls are no-ops.
+
+    from core import telemetry
+
+    with telemetry.stage(telemetry.NETWORK):
+        response = model.generate_content(prompt)
+    telemetry.count("cache_hits")
+
+The snapshot returned by `finish_run` is plain JSON (stored with each
+RunRecord) and is what the Health page breakdown card shows. Stages may
+nest: e.g. `repair` includes the `network` time of its own request.
+
+Thread-safe: workers, the scheduler pool and the GUI thread share the
+active run.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+TM_PRECHECK = "tm_precheck"
+MASKING = "masking"
+PROMPT_BUILD = "prompt_build"
+NETWORK = "network"
+FIRST_ROW = "first_row"    # Streaming: request start to the first row handed out
+BACKOFF = "backoff"
+THROTTLE = "throttle"      # Fixed pacing delay between chunks
+JSON_PARSE = "json_parse"
+REPAIR = "repair"
+GLOSSARY = "glossary"
+ENGINE = "engine"          # Plugin engine call (TranslationService)
+QC = "qc"
+GUI_APPLY = "gui_apply"
+SAVE = "save"
+
+# Display order for reports; unknown stages are listed after these
+STAGE_ORDER = (
+    TM_PRECHECK, MASKING, PROMPT_BUILD, NETWORK, FIRST_ROW, BACKOFF, THROTTLE, JSON_PARSE,
+    REPAIR, GLOSSARY, ENGINE, QC, GUI_APPLY, SAVE,
+)
+
+# Histogram upper bounds in milliseconds (last bucket is open-ended)
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+# =============================================================================
+# HISTOGRAM / RUN
+# =============================================================================
+
+class StageHistogram:
+    """Latency histogram of one stage (count, total, min, max, buckets)."""
+
+    __slots__ = ("count", "total_ms", "min_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, ms: float):
+        if self.count == 0 or ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self.count += 1
+        self.total_ms += ms
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th sample (capped at max)."""
+        if not self.count:
+            return 0.0
+        rank = pct * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "min_ms": round(self.min_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": round(self.percentile(0.5), 2),
+            "p95_ms": round(self.percentile(0.95), 2),
+            "buckets": list(self.buckets),
+        }
+
+
+class RunTelemetry:
+    """Stage histograms and counters of one batch run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageHistogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = StageHistogram()
+            histogram.add(seconds * 1000.0)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready {'wall_ms', 'stages': {name: histogram}, 'counters': {...}}."""
+        with self._lock:
+            order = {name: i for i, name in enumerate(STAGE_ORDER)}
+            names = sorted(self._stages, key=lambda n: (order.get(n, len(order)), n))
+            return {
+                "wall_ms": round((time.perf_counter() - self._started) * 1000.0, 1),
+                "stages": {name: self._stages[name].to_dict() for name in names},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+
+# =============================================================================
+# ACTIVE RUN
+# =============================================================================
+
+_active: Optional[RunTelemetry] = None
+_active_lock = threading.Lock()
+
+
+def start_run() -> RunTelemetry:
+    """Start collecting for a new run (replaces any active run)."""
+    global _active
+    with _active_lock:
+        _active = RunTelemetry()
+        return _active
+
+
+def finish_run(run: Optional[RunTelemetry] = None) -> Dict[str, Any]:
+    """
+    Stop collecting and return the run's snapshot ({} if no run was active).
+
+    With `run` (the object `start_run` returned), that run is finished and
+    collection only stops if it is still the active one, so an owner never
+    ends or reports a run started by someone else.
+    """
+    global _active
+    with _active_lock:
+        if run is None:
+            run, _active = _active, None
+        elif _active is run:
+            _active = None
+    return run.snapshot() if run else {}
+
+
+def current() -> Optional[RunTelemetry]:
+    return _active
+
+
+@contextmanager
+def stage(name: str):
+    """Time the enclosed block as `name` (no-op when no run is active)."""
+    run = _active
+    if run is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.record(name, time.perf_counter() - start)
+
+
+def record(name: str, seconds: float):
+    """Record an already measured duration (e.g. a backoff sleep)."""
+    run = _active
+    if run is not None:
+        run.record(name, seconds)
+
+
+def count(name: str, n: int = 1):
+    """Increment a throughput counter (items, requests, cache hits...)."""
+    run = _active
+    if run is not None:
+        run.count(name, n)
+
+
+def sleep(name: str, seconds: float):
+    """time.sleep that is recorded as stage `name`."""
+    time.sleep(seconds)
+    record(name, seconds)
+
+
+def breakdown(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Rows for a breakdown view, in display order.
+
+    Returns:
+        [{'stage', 'count', 'total_ms', 'share', 'p50_ms', 'p95_ms'}, ...]
+        where share is total_ms / wall_ms (stages may overlap or nest)
+    """
+    stages = (snapshot or {}).get("stages") or {}
+    wall = (snapshot or {}).get("wall_ms") or sum(s.get("total_ms", 0) for s in stages.values()) or 1.0
+    return [
+        {
+            "stage": name,
+            "count": data.get("count", 0),
+            "total_ms": data.get("total_ms", 0.0),
+            "share": data.get("total_ms", 0.0) / wall,
+            "p50_ms": data.get("p50_ms", 0.0),
+            "p95_ms": data.get("p95_ms", 0.0),
+        }
+        for name, data in stages.items()
+    ]
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Translation Memory - Fuzzy Matching
+
+Similarity-based TM lookup on top of the exact-hash `tm_entries` table.
+
+- Text is normalized like exact matching (`normalize_text`) and Ren'Py
+  tokens ([name], {i}, %s, ...) are masked to a single symbol, so
+  "Hello, [name]!" and "Hello, [player]!" have the same key.
+- Each key gets a one-permutation MinHash signature over trigrams. The
+  signature is cut into LSH bands stored in `tm_fuzzy_bands` next to
+  `tm_entries`; a lookup only reads the rows of its own bands, so
+  candidate retrieval does not scan the TM.
+- Candidates are scored with Levenshtein similarity on the masked key
+  (bit-parallel, Hyyrö 2001) and filtered by a threshold.
+
+The index is synchronized lazily: entry ids are AUTOINCREMENT and the
+source text of an entry never changes, so every entry above the stored
+watermark is simply indexed before the next lookup. Rows left behind by
+deleted entries are dropped by the join with `tm_entries`.
+"""
+
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.text_utils import _get_token_regex
+from core.tm_store import TMEntry, normalize_text
+from renforge_logger import get_logger
+
+logger = get_logger("core.tm_fuzzy")
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+NUM_BANDS = 8                      # LSH bands per entry (rows in tm_fuzzy_bands)
+ROWS_PER_BAND = 3                  # MinHash values per band
+NUM_HASHES = NUM_BANDS * ROWS_PER_BAND
+MAX_BUCKET_ROWS = 2000             # Cap per band so very common buckets stay cheap
+DEFAULT_MAX_CANDIDATES = 32        # Candidates scored with edit distance
+SYNC_CHUNK_SIZE = 5000             # Entries indexed per transaction
+
+TOKEN_SYMBOL = "\ue000"      # Stand-in for a masked Ren'Py token
+
+# Looser and much cheaper than text_utils' token regex: any [..] / {..} / %-format
+# is a token for the purpose of similarity
+_FUZZY_TOKEN_REGEX = re.compile(r'\[[^\]]+\]|\{[^{}]*\}|%\([^)]+\)[sd]|%[sd]')
+_MAX_INT64 = (1 << 63) - 1
+
+
+# =============================================================================
+# KEYS / SIGNATURES
+# =============================================================================
+
+def fuzzy_key(text: str) -> str:
+    """Normalized text with every Ren'Py token replaced by TOKEN_SYMBOL."""
+    if not text:
+        return ""
+    if '[' in text or '{' in text or '%' in text:
+        text = _FUZZY_TOKEN_REGEX.sub(TOKEN_SYMBOL, text)
+    return normalize_text(text)
+
+
+def _shingles(key: str) -> set:
+    """Byte trigrams of the padded UTF-8 key."""
+    padded = f" {key} ".encode('utf-8')
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _signature(key: str) -> List[int]:
+    """
+    One-permutation MinHash: each shingle is hashed once and kept only if
+    it is the minimum of its bin, so the cost is O(len(key)) instead of
+    O(len(key) * NUM_HASHES). Empty bins (short texts) borrow the value of
+    the next non-empty bin, offset by the distance (rotation densification).
+    """
+    bins: List[Optional[int]] = [None] * NUM_HASHES
+    crc32 = zlib.crc32
+    for gram in _shingles(key):
+        h = crc32(gram)
+        slot = ((h * 0x9E3779B1) & 0xFFFFFFFF) % NUM_HASHES
+        current = bins[slot]
+        if current is None or h < current:
+            bins[slot] = h
+    for i in range(NUM_HASHES):
+        if bins[i] is None:
+            for distance in range(1, NUM_HASHES):
+                borrowed = bins[(i + distance) % NUM_HASHES]
+                if borrowed is not None and borrowed < (1 << 32):
+                    bins[i] = borrowed + (distance << 32)
+                    break
+    return bins
+
+
+def band_keys(key: str, source_lang: str, target_lang: str) -> List[int]:
+    """
+    LSH band keys of a fuzzy key.
+
+    Keys are salted with the language pair, so buckets never mix pairs.
+
+    Returns:
+        NUM_BANDS signed 64-bit integers (SQLite INTEGER range)
+    """
+    signature = _signature(key)
+    salt = zlib.crc32(f"{source_lang}:{target_lang}".encode('utf-8'))
+    keys = []
+    for band in range(NUM_BANDS):
+        value = (salt << 32) ^ band
+        for row in signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]:
+            value = (value * 0x100000001B3 ^ row) & _MAX_INT64
+        keys.append(value)
+    return keys
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance using the bit-parallel algorithm (one big-int pass over b)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    # Pattern = shorter string, one bit per character
+    peq: Dict[str, int] = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    full = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = full, 0, len(b)
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return score
+
+
+def similarity(a: str, b: str) -> float:
+    """Levenshtein similarity in [0, 1] (1.0 = identical)."""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    return 1.0 - levenshtein(a, b) / longest
+
+
+def adapt_target(query_text: str, tm_source: str, tm_target: str) -> Optional[str]:
+    """
+    Re-map Ren'Py tokens of a TM target to the tokens of the query.
+
+    "Hello, [name]!" -> "Merhaba, [name]!" applied to "Hello, [player]!"
+    gives "Merhaba, [player]!". Tokens are paired by position in the source.
+
+    Returns:
+        Adapted target, or None if the tokens can not be mapped one-to-one
+    """
+    regex = _get_token_regex()
+    old_tokens = [m.group(0) for m in regex.finditer(tm_source)]
+    new_tokens = [m.group(0) for m in regex.finditer(query_text)]
+    if len(old_tokens) != len(new_tokens):
+        return None
+    mapping: Dict[str, str] = {}
+    for old, new in zip(old_tokens, new_tokens):
+        if mapping.setdefault(old, new) != new:
+            return None
+    if all(old == new for old, new in mapping.items()):
+        return tm_target
+    return regex.sub(lambda m: mapping.get(m.group(0), m.group(0)), tm_target)
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+@dataclass
+class FuzzyMatch:
+    """A fuzzy TM hit."""
+    entry: TMEntry
+    score: float        # Similarity of the masked keys, 0..1
+
+    @property
+    def is_exact_key(self) -> bool:
+        """Same text once case, spacing and Ren'Py tokens are ignored."""
+        return self.score >= 1.0
+
+
+class FuzzyIndex:
+    """
+    MinHash/LSH candidate index stored in the TM database.
+
+    Args:
+        get_connection: Returns the caller's thread-local TM connection
+    """
+
+    def __init__(self, get_connection: Callable[[], sqlite3.Connection]):
+        self._get_connection = get_connection
+        self._sync_lock = threading.Lock()
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_bands (
+                band_key INTEGER NOT NULL,
+                entry_id INTEGER NOT NULL,
+                PRIMARY KEY (band_key, entry_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        conn.commit()
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def indexed_upto(self) -> int:
+        row = self._get_connection().execute(
+            "SELECT value FROM tm_fuzzy_meta WHERE key = 'indexed_upto'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def sync(self, chunk_size: int = SYNC_CHUNK_SIZE,
+             progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Index every entry added since the last sync.
+
+        Args:
+            chunk_size: Entries per transaction
+            progress: Optional callback(entries_indexed_so_far)
+
+        Returns:
+            Number of newly indexed entries
+        """
+        with self._sync_lock:
+            conn = self._get_connection()
+            upto = self.indexed_upto()
+            indexed = 0
+            while True:
+                rows = conn.execute(
+                    "SELECT id, source_text, source_lang, target_lang FROM tm_entries "
+                    "WHERE id > ? ORDER BY id LIMIT ?",
+                    (upto, chunk_size)
+                ).fetchall()
+                if not rows:
+                    break
+                postings = [
+                    (band_key, entry_id)
+                    for entry_id, source_text, source_lang, target_lang in rows
+                    for band_key in band_keys(fuzzy_key(source_text), source_lang, target_lang)
+                ]
+                upto = rows[-1][0]
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO tm_fuzzy_bands (band_key, entry_id) VALUES (?, ?)",
+                        postings
+                    )
+                    conn.execute(
+                        "INSERT INTO tm_fuzzy_meta (key, value) VALUES ('indexed_upto', ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+                        (upto,)
+                    )
+                indexed += len(rows)
+                if progress:
+                    progress(indexed)
+            if indexed:
+                logger.debug(f"[TM] Fuzzy index: +{indexed} entries (up to id {upto})")
+            return indexed
+
+    def clear(self):
+        """Drop all postings (rebuilt by the next sync)."""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM tm_fuzzy_bands")
+            conn.execute("DELETE FROM tm_fuzzy_meta")
+
+    def rebuild(self) -> int:
+        """Re-index the whole TM (also compacts rows of deleted entries)."""
+        self.clear()
+        return self.sync()
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def _candidates(self, keys: Sequence[int], max_candidates: int) -> List[int]:
+        """Entry ids sharing the most bands with the query."""
+        subquery = "SELECT entry_id FROM (SELECT entry_id FROM tm_fuzzy_bands WHERE band_key = ? LIMIT ?)"
+        params: List[int] = []
+        for key in keys:
+            params.extend((key, MAX_BUCKET_ROWS))
+        rows = self._get_connection().execute(
+            " UNION ALL ".join([subquery] * len(keys)), params
+        ).fetchall()
+        hits = Counter(row[0] for row in rows)
+        return [entry_id for entry_id, _ in hits.most_common(max_candidates)]
+
+    def lookup(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+        threshold: float,
+        limit: int = 5,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    ) -> List[FuzzyMatch]:
+        """
+        Find TM entries similar to source_text.
+
+        Args:
+            source_text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            threshold: Minimum similarity (0..1)
+            limit: Maximum matches returned
+            max_candidates: Candidates scored with edit distance
+
+        Returns:
+            Matches sorted by score (best first)
+        """
+        key = fuzzy_key(source_text)
+        if not key.strip():
+            return []
+        self.sync()
+
+        candidate_ids = self._candidates(band_keys(key, source_lang, target_lang), max_candidates)
+        if not candidate_ids:
+            return []
+
+        conn = self._get_connection()
+        placeholders = ", ".join("?" * len(candidate_ids))
+        rows = conn.execute(
+            f"SELECT * FROM tm_entries WHERE id IN ({placeholders}) "
+            "AND source_lang = ? AND target_lang = ?",
+            (*candidate_ids, source_lang, target_lang)
+        ).fetchall()
+
+        matches = []
+        for row in rows:
+            other = fuzzy_key(row['source_text'])
+            # Length alone bounds the similarity; skip the edit distance when it can't pass
+            longest = max(len(key), len(other))
+            if longest and 1.0 - abs(len(key) - len(other)) / longest < threshold:
+                continue
+            score = similarity(key, other)
+            if score >= threshold:
+                matches.append(FuzzyMatch(entry=_row_to_entry(row), score=score))
+
+        matches.sort(key=lambda m: (-m.score, -m.entry.use_count))
+        return matches[:limit]
+
+
+def _row_to_entry(row) -> TMEntry:
+    return TMEntry(
+        id=row['id'],
+        source_hash=row['source_hash'],
+        source_text=row['source_text'],
+        target_text=row['target_text'],
+        source_lang=row['source_lang'],
+        target_lang=row['target_lang'],
+        created_at=row['created_at'],
+        updated_at=row['updated_at'],
+        use_count=row['use_count'],
+        origin=row['origin'] or "",
+    )
+
+
+def example_pairs(matches: Sequence[FuzzyMatch]) -> List[Tuple[str, str]]:
+    """(source, target) pairs for few-shot prompting, best match first."""
+    return [(m.entry.source_text, m.entry.target_text) for m in matches]
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge TM Pre-Check (Stage 21)
+
+Runs before a provider call: rows the Translation Memory can answer are
+filled from it, everything else goes to the provider.
+
+Tiers:
+1. Exact hash match -> applied when `tm_auto_apply_exact` is on.
+2. Fuzzy match (core.tm_fuzzy) at or above `tm_fuzzy_auto_apply_score`
+   -> applied with its Ren'Py tokens re-mapped to the row's tokens.
+3. Fuzzy matches at or above `tm_fuzzy_threshold` -> not applied, but
+   returned as `examples` so the caller can pass them to Gemini as
+   reference translations.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from renforge_logger import get_logger
+
+logger = get_logger("core.tm_precheck")
+
+
+@dataclass
+class TMPrecheckResult:
+    """Outcome of the TM pre-check for one row."""
+    translation: Optional[str] = None
+    should_skip_provider: bool = False
+    match_type: str = "none"           # "exact" | "fuzzy" | "none"
+    score: float = 0.0
+    examples: List[Tuple[str, str]] = field(default_factory=list)  # (source, target)
+
+
+def _settings():
+    from models.settings_model import SettingsModel
+    return SettingsModel.instance()
+
+
+def _get_store():
+    from core.tm_store import TMStore
+    return TMStore.instance()
+
+
+def tm_precheck(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    tm_context: Optional[dict] = None,
+    store=None,
+    settings=None,
+) -> TMPrecheckResult:
+    """
+    Check one row against the TM.
+
+    Args:
+        text: Source text of the row
+        source_lang: Source language code
+        target_lang: Target language code
+        tm_context: Counters dict ('tm_hits', 'tm_applied'), updated in place
+        store: TMStore (default: singleton)
+        settings: SettingsModel (default: singleton)
+
+    Returns:
+        TMPrecheckResult
+    """
+    result = TMPrecheckResult()
+    if not text or not text.strip():
+        return result
+
+    settings = settings or _settings()
+    if not settings.tm_enabled:
+        return result
+    store = store or _get_store()
+
+    exact = store.lookup(text, source_lang, target_lang, touch=False)
+    if exact:
+        _count(tm_context, 'tm_hits')
+        if settings.tm_auto_apply_exact:
+            store.increment_use_count(exact.source_hash)
+            _count(tm_context, 'tm_applied')
+            return TMPrecheckResult(exact.target_text, True, "exact", 1.0)
+        return TMPrecheckResult(match_type="exact", score=1.0,
+                                examples=[(exact.source_text, exact.target_text)])
+
+    if not settings.tm_fuzzy_enabled:
+        return result
+
+    from core.tm_fuzzy import adapt_target
+    matches = store.lookup_fuzzy(text, source_lang, target_lang,
+                                 threshold=settings.tm_fuzzy_threshold)
+    if not matches:
+        return result
+
+    _count(tm_context, 'tm_hits')
+    best = matches[0]
+    if best.score >= settings.tm_fuzzy_auto_apply_score:
+        adapted = adapt_target(text, best.entry.source_text, best.entry.target_text)
+        if adapted:
+            store.increment_use_count(best.entry.source_hash)
+            _count(tm_context, 'tm_applied')
+            logger.debug(f"[TM] Fuzzy applied ({best.score:.2f}): {best.entry.source_hash[:8]}...")
+            return TMPrecheckResult(adapted, True, "fuzzy", best.score)
+
+    return TMPrecheckResult(
+        match_type="fuzzy",
+        score=best.score,
+        examples=[(m.entry.source_text, m.entry.target_text) for m in matches],
+    )
+
+
+def tm_precheck_batch(
+    texts: List[str],
+    source_lang: str,
+    target_lang: str,
+    tm_context: Optional[dict] = None,
+    store=None,
+    settings=None,
+) -> Tuple[Dict[int, TMPrecheckResult], List[int]]:
+    """
+    Check a batch of rows against the TM.
+
+    Returns:
+        (results, remaining) - results maps index -> TMPrecheckResult for
+        every row with a TM match (applied or example-only); remaining lists
+        the indices that still need the provider, in input order
+    """
+    settings = settings or _settings()
+    results: Dict[int, TMPrecheckResult] = {}
+    remaining: List[int] = []
+    for i, text in enumerate(texts):
+        result = tm_precheck(text, source_lang, target_lang, tm_context, store, settings)
+        if result.match_type != "none":
+            results[i] = result
+        if not result.should_skip_provider:
+            remaining.append(i)
+    return results, remaining
+
+
+def _count(tm_context: Optional[dict], key: str):
+    if tm_context is not None:
+        tm_context[key] = tm_context.get(key, 0) + 1
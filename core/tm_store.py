@@ -3,6 +3,7 @@
 RenForge Translation Memory Store (Stage 16.1)
 
 Hash-based exact-match Translation Memory with SQLite persistence.
+Similarity matching (lookup_fuzzy) is provided by core.tm_fuzzy.
 Thread-safe for worker usage.
 """
 
@@ -13,12 +14,18 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 from renforge_logger import get_logger
 
 logger = get_logger("core.tm_store")
 
+# Columns copied between TM databases (id is assigned by the target)
+TM_COLUMNS = (
+    "source_hash", "source_text", "target_text", "source_lang", "target_lang",
+    "created_at", "updated_at", "use_count", "origin",
+)
+
 
 # =============================================================================
 # TEXT NORMALIZATION
@@ -102,6 +109,7 @@ class TMStore:
         
         self._db_path = self._get_db_path()
         self._local = threading.local()
+        self._fuzzy = None
         
         # Initialize schema on main thread
         self._ensure_schema()
@@ -261,6 +269,46 @@ class TMStore:
         
         return results
     
+    # =========================================================================
+    # FUZZY LOOKUP
+    # =========================================================================
+    
+    @property
+    def fuzzy_index(self):
+        """Lazily created core.tm_fuzzy.FuzzyIndex for this database."""
+        if self._fuzzy is None:
+            from core.tm_fuzzy import FuzzyIndex
+            self._fuzzy = FuzzyIndex(self._get_connection)
+        return self._fuzzy
+    
+    def lookup_fuzzy(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+        threshold: Optional[float] = None,
+        limit: int = 5
+    ) -> List[Any]:
+        """
+        Look up similar entries (does not touch use_count).
+        
+        Args:
+            source_text: Original text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            threshold: Minimum similarity 0..1 (default: config.TM_FUZZY_MIN_SCORE)
+            limit: Maximum number of matches
+        
+        Returns:
+            List of core.tm_fuzzy.FuzzyMatch, best first
+        """
+        if not source_text or not source_text.strip():
+            return []
+        if threshold is None:
+            from renforge_config import TM_FUZZY_MIN_SCORE
+            threshold = TM_FUZZY_MIN_SCORE
+        return self.fuzzy_index.lookup(source_text, source_lang, target_lang, threshold, limit)
+    
     # =========================================================================
     # INSERT / UPDATE
     # =========================================================================
@@ -431,4 +479,126 @@ class TMStore:
         conn = self._get_connection()
         conn.execute("DELETE FROM tm_entries")
         conn.commit()
+        self.fuzzy_index.clear()
         logger.info("[TM] Database cleared")
+
+    # =========================================================================
+    # SNAPSHOT / MERGE (packaging)
+    # =========================================================================
+    
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+    
+    def backup_to(self, dest_path, pages: int = 1024,
+                  progress: Optional[Callable[[int, int], None]] = None) -> Path:
+        """
+        Write a consistent snapshot of the TM to `dest_path` with the SQLite
+        online backup API (copied in page batches, so writers are not
+        blocked for the whole copy).
+        
+        Args:
+            dest_path: Snapshot file (overwritten)
+            pages: Pages copied per step
+            progress: Optional callback(copied_pages, total_pages)
+        """
+        dest_path = Path(dest_path)
+        if dest_path.exists():
+            dest_path.unlink()
+        
+        def on_step(status, remaining, total):
+            if progress:
+                progress(total - remaining, total)
+        
+        src = sqlite3.connect(str(self._db_path))
+        dest = sqlite3.connect(str(dest_path))
+        try:
+            src.backup(dest, pages=pages, progress=on_step)
+        finally:
+            dest.close()
+            src.close()
+        logger.info(f"[TM] Snapshot written: {dest_path}")
+        return dest_path
+    
+    def restore_from(self, src_path, pages: int = 1024,
+                     progress: Optional[Callable[[int, int], None]] = None):
+        """Replace the whole TM with the database at `src_path` (backup API)."""
+        
+        def on_step(status, remaining, total):
+            if progress:
+                progress(total - remaining, total)
+        
+        src = sqlite3.connect(str(src_path))
+        try:
+            src.backup(self._get_connection(), pages=pages, progress=on_step)
+        finally:
+            src.close()
+        self._ensure_schema()
+        self._fuzzy = None  # the restored file brings its own (or no) fuzzy index
+        logger.info(f"[TM] Restored from {src_path}")
+    
+    def merge_from_db(self, src_path, chunk_size: int = 20000,
+                      progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Merge entries of another TM database into this one.
+        
+        The source is ATTACHed and copied with INSERT ... ON CONFLICT in
+        rowid chunks (one transaction per chunk). On a hash collision the
+        entry with the newer updated_at wins and use counts are summed.
+        
+        Args:
+            src_path: TM database to merge in
+            chunk_size: Source rows per transaction
+            progress: Optional callback(rows_done, rows_total)
+        
+        Returns:
+            Number of inserted or updated entries
+        """
+        columns = ", ".join(TM_COLUMNS)
+        conn = self._get_connection()
+        conn.execute("ATTACH DATABASE ? AS pack_src", (str(src_path),))
+        try:
+            src_columns = {row[1] for row in conn.execute("PRAGMA pack_src.table_info(tm_entries)")}
+            if not src_columns:
+                logger.warning(f"[TM] No tm_entries table in {src_path}")
+                return 0
+            select = ", ".join(
+                col if col in src_columns else ("0" if col == "use_count" else "''")
+                for col in TM_COLUMNS
+            )
+            total, max_id = conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM pack_src.tm_entries"
+            ).fetchone()
+            
+            changed = 0
+            done = 0
+            low = 0
+            while low < max_id:
+                high = low + chunk_size
+                before = conn.total_changes
+                with conn:
+                    conn.execute(f"""
+                        INSERT INTO tm_entries ({columns})
+                        SELECT {select} FROM pack_src.tm_entries
+                        WHERE rowid > ? AND rowid <= ?
+                        ON CONFLICT(source_hash) DO UPDATE SET
+                            target_text = CASE WHEN excluded.updated_at > tm_entries.updated_at
+                                               THEN excluded.target_text ELSE tm_entries.target_text END,
+                            origin = CASE WHEN excluded.updated_at > tm_entries.updated_at
+                                          THEN excluded.origin ELSE tm_entries.origin END,
+                            updated_at = MAX(tm_entries.updated_at, excluded.updated_at),
+                            use_count = tm_entries.use_count + excluded.use_count
+                    """, (low, high))
+                changed += conn.total_changes - before
+                done += conn.execute(
+                    "SELECT COUNT(*) FROM pack_src.tm_entries WHERE rowid > ? AND rowid <= ?",
+                    (low, high)
+                ).fetchone()[0]
+                low = high
+                if progress:
+                    progress(done, total)
+        finally:
+            conn.execute("DETACH DATABASE pack_src")
+        
+        logger.info(f"[TM] Merged {changed} entries from {src_path}")
+        return changed
@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge TMX Import/Export (streaming)
+
+TMX files are processed in constant memory:
+- Import uses ElementTree.iterparse and clears every <tu> once read;
+  units are staged with executemany in large batches and conflicts with
+  existing TM entries are resolved in SQL (one upsert per batch).
+- Export walks the TM with a cursor and writes <tu> elements one by one.
+
+Conflict strategies (same names as the TM page import dialog):
+    skip                  Keep the existing entry
+    overwrite             Replace with the imported translation
+    keep_newest           Replace if the imported unit is newer (changedate)
+    keep_higher_usecount  Replace if the imported unit has a higher usagecount
+"""
+
+import os
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from core.tm_store import TM_COLUMNS, TMStore, compute_hash
+from renforge_logger import get_logger
+
+logger = get_logger("core.tm_tmx")
+
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+TMX_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+DEFAULT_BATCH_SIZE = 10000
+TMX_ORIGIN = "tmx"
+
+# Upsert condition per strategy (None = never update an existing entry)
+_STRATEGY_CONDITIONS = {
+    "skip": None,
+    "overwrite": "1",
+    "keep_newest": "excluded.updated_at > tm_entries.updated_at",
+    "keep_higher_usecount": "excluded.use_count > tm_entries.use_count",
+}
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _lang_matches(lang: Optional[str], wanted: str) -> bool:
+    """'en-US' matches 'en' (primary subtag, case-insensitive)."""
+    if not lang:
+        return False
+    lang = lang.lower().replace("_", "-")
+    wanted = wanted.lower().replace("_", "-")
+    return lang == wanted or lang.split("-")[0] == wanted.split("-")[0]
+
+
+def _from_tmx_date(value: Optional[str]) -> Optional[str]:
+    """TMX date (YYYYMMDDThhmmssZ) -> ISO string as stored by TMStore."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, TMX_DATE_FORMAT).isoformat()
+    except ValueError:
+        return None
+
+
+def _to_tmx_date(value: Optional[str]) -> Optional[str]:
+    """ISO string -> TMX date."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).strftime(TMX_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _seg_text(tuv: ET.Element) -> Optional[str]:
+    """Text of a <tuv>'s <seg>, including inline codes (<ph>, <bpt>, ...)."""
+    seg = tuv.find("seg")
+    if seg is None:
+        return None
+    return "".join(seg.itertext())
+
+
+# =============================================================================
+# IMPORT
+# =============================================================================
+
+def iter_tmx_units(tmx_path, source_lang: Optional[str], target_lang: str
+                   ) -> Iterator[Tuple[str, str, Optional[str], Optional[str], int]]:
+    """
+    Stream (source_text, target_text, created_at, updated_at, use_count)
+    from a TMX file. Units lacking either language are yielded with an
+    empty target text so callers can count them as invalid.
+
+    Args:
+        tmx_path: TMX file
+        source_lang: Source language (None = header srclang)
+        target_lang: Target language
+    """
+    body = None
+    for event, elem in ET.iterparse(str(tmx_path), events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == "body":
+                body = elem
+            continue
+
+        if tag == "header":
+            if source_lang is None:
+                source_lang = elem.get("srclang")
+                if source_lang in (None, "*all*"):
+                    source_lang = None
+            continue
+        if tag != "tu":
+            continue
+
+        source = target = None
+        for tuv in elem.iterfind("tuv"):
+            lang = tuv.get(XML_LANG) or tuv.get("lang")
+            if source is None and source_lang and _lang_matches(lang, source_lang):
+                source = _seg_text(tuv)
+            elif target is None and _lang_matches(lang, target_lang):
+                target = _seg_text(tuv)
+
+        changed = _from_tmx_date(elem.get("changedate"))
+        created = _from_tmx_date(elem.get("creationdate")) or changed
+        try:
+            use_count = int(elem.get("usagecount") or 0)
+        except ValueError:
+            use_count = 0
+
+        # Free the unit (and everything before it) before yielding
+        elem.clear()
+        if body is not None:
+            body.clear()
+
+        yield source or "", target or "", created, changed or created, use_count
+
+
+def import_to_tm_store(
+    tmx_path,
+    target_lang: str,
+    source_lang: Optional[str] = None,
+    strategy: str = "skip",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None,
+    store: Optional[TMStore] = None,
+) -> Dict[str, int]:
+    """
+    Import a TMX file into the TM.
+
+    Args:
+        tmx_path: TMX file
+        target_lang: Target language code (entries are stored under it)
+        source_lang: Source language code (None = TMX header srclang)
+        strategy: Conflict strategy (see module docstring)
+        batch_size: Units per staged batch / transaction
+        progress: Optional callback(units_read)
+        store: TMStore to import into (default: singleton)
+
+    Returns:
+        {'total', 'added', 'updated', 'skipped', 'conflicts', 'invalid'}
+        where conflicts counts existing entries with a different translation.
+    """
+    if strategy not in _STRATEGY_CONDITIONS:
+        raise ValueError(f"Unknown TMX import strategy: {strategy}")
+    if source_lang is None:
+        source_lang = _read_header_srclang(tmx_path)
+        if not source_lang:
+            raise ValueError("TMX has no srclang; pass source_lang explicitly")
+
+    store = store or TMStore.instance()
+    conn = store._get_connection()
+    conn.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS tmx_stage (
+            source_hash TEXT PRIMARY KEY,
+            {", ".join(col + (" INTEGER" if col == "use_count" else " TEXT") for col in TM_COLUMNS[1:])}
+        )
+    """)
+
+    result = {'total': 0, 'added': 0, 'updated': 0, 'skipped': 0, 'conflicts': 0, 'invalid': 0}
+    now = datetime.now().isoformat()
+    batch: List[tuple] = []
+    start = time.perf_counter()
+
+    for source, target, created, updated, use_count in iter_tmx_units(tmx_path, source_lang, target_lang):
+        result['total'] += 1
+        source, target = source.strip(), target.strip()
+        if not source or not target:
+            result['invalid'] += 1
+            continue
+        batch.append((
+            compute_hash(source, source_lang, target_lang), source, target,
+            source_lang, target_lang, created or now, updated or now, use_count, TMX_ORIGIN,
+        ))
+        if len(batch) >= batch_size:
+            _flush_batch(conn, batch, strategy, result)
+            batch.clear()
+            if progress:
+                progress(result['total'])
+
+    if batch:
+        _flush_batch(conn, batch, strategy, result)
+    if progress:
+        progress(result['total'])
+
+    conn.execute("DROP TABLE IF EXISTS temp.tmx_stage")
+    logger.info(f"[TMX] Imported {tmx_path}: {result} in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+def _read_header_srclang(tmx_path) -> Optional[str]:
+    for _, elem in ET.iterparse(str(tmx_path), events=("end",)):
+        if elem.tag == "header":
+            srclang = elem.get("srclang")
+            return None if srclang == "*all*" else srclang
+        if elem.tag in ("tu", "body"):
+            break
+    return None
+
+
+def _flush_batch(conn, batch: List[tuple], strategy: str, result: Dict[str, int]):
+    """Stage one batch and upsert it into tm_entries in a single transaction."""
+    columns = ", ".join(TM_COLUMNS)
+    condition = _STRATEGY_CONDITIONS[strategy]
+    if condition is None:
+        conflict_clause = "DO NOTHING"
+    else:
+        conflict_clause = f"""DO UPDATE SET
+            target_text = excluded.target_text,
+            updated_at = excluded.updated_at,
+            use_count = MAX(tm_entries.use_count, excluded.use_count),
+            origin = excluded.origin
+        WHERE excluded.target_text != tm_entries.target_text AND ({condition})"""
+
+    with conn:
+        conn.execute("DELETE FROM temp.tmx_stage")
+        # Duplicate units inside the file: the last one wins
+        conn.executemany(
+            f"INSERT OR REPLACE INTO temp.tmx_stage ({columns}) VALUES ({', '.join('?' * len(TM_COLUMNS))})",
+            batch
+        )
+        staged, existing, conflicts = conn.execute("""
+            SELECT COUNT(*), COUNT(t.source_hash),
+                   COALESCE(SUM(t.target_text != s.target_text), 0)
+            FROM temp.tmx_stage s LEFT JOIN tm_entries t ON t.source_hash = s.source_hash
+        """).fetchone()
+        before = conn.total_changes
+        conn.execute(f"""
+            INSERT INTO tm_entries ({columns})
+            SELECT {columns} FROM temp.tmx_stage WHERE 1
+            ON CONFLICT(source_hash) {conflict_clause}
+        """)
+        changed = conn.total_changes - before
+
+    added = staged - existing
+    updated = changed - added
+    result['added'] += added
+    result['updated'] += updated
+    result['conflicts'] += conflicts
+    result['skipped'] += len(batch) - added - updated
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def iter_tmx_lines(entries: Iterable[tuple], source_lang: str,
+                   creation_tool: str = "RenForge") -> Iterator[str]:
+    """
+    Yield a TMX 1.4 document piece by piece.
+
+    Args:
+        entries: (source_text, target_text, source_lang, target_lang,
+                  created_at, updated_at, use_count) tuples
+        source_lang: Header srclang
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<tmx version="1.4">\n'
+    yield (f'  <header creationtool={quoteattr(creation_tool)} creationtoolversion="1.0" '
+           f'segtype="sentence" o-tmf="RenForge TM" adminlang="en" '
+           f'srclang={quoteattr(source_lang)} datatype="plaintext"/>\n')
+    yield '  <body>\n'
+    for source, target, src_lang, tgt_lang, created, updated, use_count in entries:
+        attrs = []
+        created = _to_tmx_date(created)
+        updated = _to_tmx_date(updated)
+        if created:
+            attrs.append(f'creationdate="{created}"')
+        if updated:
+            attrs.append(f'changedate="{updated}"')
+        if use_count:
+            attrs.append(f'usagecount="{int(use_count)}"')
+        yield (
+            f'    <tu{" " + " ".join(attrs) if attrs else ""}>\n'
+            f'      <tuv xml:lang={quoteattr(src_lang)}><seg>{escape(source)}</seg></tuv>\n'
+            f'      <tuv xml:lang={quoteattr(tgt_lang)}><seg>{escape(target)}</seg></tuv>\n'
+            f'    </tu>\n'
+        )
+    yield '  </body>\n'
+    yield '</tmx>\n'
+
+
+def export_from_tm_store(
+    tmx_path,
+    source_lang: Optional[str] = None,
+    target_lang: Optional[str] = None,
+    fetch_size: int = DEFAULT_BATCH_SIZE,
+    store: Optional[TMStore] = None,
+) -> int:
+    """
+    Export TM entries to a TMX file (written incrementally).
+
+    Args:
+        tmx_path: Output file
+        source_lang / target_lang: Language filter (None = all)
+        fetch_size: Rows fetched per cursor round-trip
+
+    Returns:
+        Number of exported units
+    """
+    store = store or TMStore.instance()
+    # Separate connection so the export cursor does not interfere with writers
+    import sqlite3
+    conn = sqlite3.connect(str(store.db_path))
+
+    where, params = [], []
+    if source_lang:
+        where.append("source_lang = ?")
+        params.append(source_lang)
+    if target_lang:
+        where.append("target_lang = ?")
+        params.append(target_lang)
+    sql = ("SELECT source_text, target_text, source_lang, target_lang, created_at, updated_at, use_count "
+           "FROM tm_entries" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY id")
+
+    count = 0
+
+    def rows():
+        nonlocal count
+        cursor = conn.execute(sql, params)
+        while True:
+            chunk = cursor.fetchmany(fetch_size)
+            if not chunk:
+                return
+            for row in chunk:
+                count += 1
+                yield row
+
+    part_path = Path(str(tmx_path) + ".part")
+    try:
+        with open(part_path, "w", encoding="utf-8", newline="\n") as handle:
+            handle.writelines(iter_tmx_lines(rows(), source_lang or "*all*"))
+        os.replace(part_path, tmx_path)
+    finally:
+        conn.close()
+        if part_path.exists():
+            part_path.unlink()
+
+    logger.info(f"[TMX] Exported {count} units to {tmx_path}")
+    return count
@@ -306,25 +306,17 @@ def batch_translate_google(main_window):
         
     signals.finished.connect(restore_sorting) 
 
-def batch_translate_ai(main_window):
-    logger.debug("[batch_translate_ai] Action triggered.")
-    
-    # 1. Check prerequisites via Controller
-    controller = getattr(main_window, '_app_controller', None)
-    if not controller or not getattr(controller, 'translation_controller', None):
-        logger.error("Controller unavailable.")
-        main_window.statusBar().showMessage("Controller unavailable", 4000)
-        return
-
-    # 2. Ensure Gemini Initialized (Active check via settings manager)
+def _ensure_batch_ai_available(main_window, controller) -> bool:
+    """Initialize Gemini and check network/model for a batch AI run (shows the errors)."""
+    # Ensure Gemini Initialized (Active check via settings manager)
     # MUST be done BEFORE check_ai_availability because availability depends on initialization
     if not settings_manager.ensure_gemini_initialized(main_window, force_init=False):
         main_window.statusBar().showMessage(tr("batch_ai_failed_init"), 5000)
         # Show explicit error to avoid "no reaction"
         QMessageBox.warning(main_window, tr("error"), tr("batch_ai_failed_init"))
-        return
+        return False
 
-    # 3. Check Prerequisites (Internet, Model etc.) via Controller
+    # Check Prerequisites (Internet, Model etc.) via Controller
     # Now that we tried to init, this check will be accurate
     is_avail, error_msg_key = controller.translation_controller.check_ai_availability()
     if not is_avail:
@@ -337,6 +329,21 @@ def batch_translate_ai(main_window):
              QMessageBox.warning(main_window, tr("edit_ai_gemini_error_title"), tr("edit_ai_gemini_error_msg"))
         else:
              main_window.statusBar().showMessage(tr(error_msg_key or "error"), 5000)
+        return False
+    return True
+
+def batch_translate_ai(main_window):
+    logger.debug("[batch_translate_ai] Action triggered.")
+    
+    # 1. Check prerequisites via Controller
+    controller = getattr(main_window, '_app_controller', None)
+    if not controller or not getattr(controller, 'translation_controller', None):
+        logger.error("Controller unavailable.")
+        main_window.statusBar().showMessage("Controller unavailable", 4000)
+        return
+
+    # 2-3. Gemini initialized, network and model available
+    if not _ensure_batch_ai_available(main_window, controller):
         return
     
     # 3. Get UI Data
@@ -472,6 +479,70 @@ def batch_translate_ai(main_window):
         
     signals.finished.connect(restore_sorting)
 
+def batch_translate_project_ai(main_window):
+    """
+    Translate the untranslated rows of every open translate-mode file in one
+    project batch: identical source lines are sent to Gemini once.
+    """
+    logger.debug("[batch_translate_project_ai] Action triggered.")
+    
+    controller = getattr(main_window, '_app_controller', None)
+    if not controller or not getattr(controller, 'translation_controller', None):
+        logger.error("Controller unavailable.")
+        main_window.statusBar().showMessage("Controller unavailable", 4000)
+        return
+    
+    if not _ensure_batch_ai_available(main_window, controller):
+        return
+    
+    # Rows to translate: same selection as the headless pipeline
+    files = []
+    for file_path in main_window.get_open_file_paths():
+        parsed_file = main_window.file_data.get(file_path)
+        if parsed_file is None or parsed_file.mode != 'translate':
+            continue
+        if parsed_file.is_loading:
+            controller.file_controller.finish_loading(file_path)
+        indices = [index for index, item in enumerate(parsed_file.items)
+                   if (item.original_text or "").strip() and not (item.current_text or "").strip()]
+        if indices:
+            files.append((parsed_file, indices))
+    
+    row_count = sum(len(indices) for _, indices in files)
+    if not row_count:
+        main_window.statusBar().showMessage(tr("batch_project_no_rows"), 3000)
+        return
+    
+    selected_model = main_window.model_combo.currentText() if main_window.model_combo.count() > 0 else None
+    if not selected_model or selected_model == "Loading models...":
+        QMessageBox.warning(main_window, tr("batch_lang_required_title"), tr("error_no_model"))
+        return
+    
+    # Use language NAMES for Gemini, as in batch_translate_ai
+    source_name = main_window.source_lang_combo.currentText().strip()
+    target_name = main_window.target_lang_combo.currentText().strip()
+    
+    confirm_msg = tr("batch_project_ai_confirm_msg", count=row_count, files=len(files),
+                     model=selected_model, target=target_name)
+    reply = QMessageBox.question(main_window, tr("batch_ai_title"), confirm_msg,
+                                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                 QMessageBox.StandardButton.No)
+    if reply != QMessageBox.StandardButton.Yes:
+        main_window.statusBar().showMessage(tr("batch_canceled"), 3000)
+        return
+    
+    for parsed_file, indices in files:
+        main_window.batch_controller.capture_undo_snapshot(
+            parsed_file.file_path, indices, parsed_file.items, batch_type="ai"
+        )
+    
+    context = {'model': selected_model, 'source_lang': source_name, 'target_lang': target_name}
+    worker = main_window.batch_controller.start_project_batch(files, context=context)
+    if worker is None:
+        main_window.statusBar().showMessage(tr("error_batch_start_failed"), 5000)
+        return
+    main_window.statusBar().showMessage(tr("batch_starting"), 0)
+
 def navigate_prev(main_window):
     current_table = main_window._get_current_table()
     current_idx = main_window._get_current_item_index()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Proje İlerleme İndeksi - Arka plan tarayıcı ve dosya ağacı modeli
+
+ProjectIndexer, core.project_index.ProjectIndex'i bir QThread içinde
+tarar ve QFileSystemWatcher ile değişen dosyaları (debounce ile) yeniden
+indeksler. ProjectProgressModel, proje ağacındaki .rpy dosyalarının
+yanında ilerleme sütunu gösterir.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import (
+    Qt, QObject, QThread, QTimer, Signal, QFileSystemWatcher, QModelIndex
+)
+from PySide6.QtGui import QFileSystemModel
+
+from core.project_index import FileProgress, ProjectIndex
+from renforge_logger import get_logger
+
+logger = get_logger("gui.models.project_progress")
+
+# Değişiklik bildirimlerini birleştirme süresi (ms)
+RESCAN_DEBOUNCE_MS = 750
+
+
+def format_progress(progress: Optional[FileProgress]) -> str:
+    """Ağaç/tablo için kısa ilerleme metni."""
+    if progress is None:
+        return "…"
+    if progress.error:
+        return "hata"
+    ratio = progress.progress
+    text = f"%{int(ratio * 100)}" if ratio is not None else f"{progress.items} satır"
+    if progress.qc_errors:
+        text += f" · {progress.qc_errors} QC"
+    return text
+
+
+def progress_tooltip(progress: Optional[FileProgress]) -> str:
+    if progress is None:
+        return "Henüz indekslenmedi"
+    if progress.error:
+        return f"Ayrıştırılamadı: {progress.error}"
+    return (
+        f"Mod: {progress.mode}  Dil: {progress.language or '-'}\n"
+        f"Satır: {progress.items}  Çevrilmemiş: {progress.untranslated}  "
+        f"Değiştirilmiş: {progress.modified}\n"
+        f"QC: {progress.qc_errors} hata, {progress.qc_warnings} uyarı"
+    )
+
+
+class _ScanWorker(QThread):
+    """ProjectIndex.scan() çağrısını arka planda çalıştırır."""
+
+    file_indexed = Signal(object, int, int)  # (FileProgress, done, total)
+
+    def __init__(self, index: ProjectIndex, parent=None):
+        super().__init__(parent)
+        self.index = index
+
+    def run(self):
+        try:
+            self.index.scan(
+                cancel_check=self.isInterruptionRequested,
+                on_file=lambda progress, done, total: self.file_indexed.emit(progress, done, total),
+            )
+        except Exception as e:
+            logger.error(f"[ProjectIndexer] Scan failed: {e}")
+
+
+class ProjectIndexer(QObject):
+    """
+    Açık projenin ilerleme indeksini güncel tutar.
+
+    Sinyaller:
+        file_indexed: Bir dosya yeniden indekslendiğinde (FileProgress)
+        index_updated: Bir tarama bittiğinde
+    """
+
+    file_indexed = Signal(object)
+    index_updated = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index: Optional[ProjectIndex] = None
+        self._worker: Optional[_ScanWorker] = None
+        self._rescan_pending = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(RESCAN_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.rescan)
+
+    def start(self, project_path: str):
+        """Projeyi aç: önbelleği yükle, izlemeyi kur ve taramayı başlat."""
+        self.stop()
+        self.index = ProjectIndex(project_path)
+        self.index_updated.emit()  # Önbellekteki sonuçlar hemen görünsün
+        self._watch_tree()
+        self.rescan()
+
+    def stop(self):
+        """Taramayı durdur ve izlemeyi bırak."""
+        self._debounce.stop()
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker.wait()
+            self._worker = None
+        paths = self._watcher.directories() + self._watcher.files()
+        if paths:
+            self._watcher.removePaths(paths)
+        self.index = None
+
+    def get(self, path) -> Optional[FileProgress]:
+        return self.index.get(path) if self.index else None
+
+    def rescan(self):
+        """Değişen dosyaları yeniden indeksle (tarama sürüyorsa sonra)."""
+        if self.index is None:
+            return
+        if self._worker is not None and self._worker.isRunning():
+            self._rescan_pending = True
+            return
+        self._rescan_pending = False
+        self._worker = _ScanWorker(self.index, self)
+        self._worker.file_indexed.connect(lambda progress, *_: self.file_indexed.emit(progress))
+        self._worker.finished.connect(self._on_scan_finished)
+        self._worker.start()
+
+    def _on_scan_finished(self):
+        self.index_updated.emit()
+        if self._rescan_pending:
+            self.rescan()
+
+    def _watch_tree(self):
+        """Proje klasörlerini ve .rpy dosyalarını izle (gizli klasörler hariç)."""
+        root = self.index.root
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            paths.append(dirpath)
+            paths.extend(os.path.join(dirpath, f) for f in filenames if f.lower().endswith(".rpy"))
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def _on_path_changed(self, path: str):
+        # Yeni dosya/klasörler de izlensin; taramayı birleştir
+        if self.index is not None and os.path.isdir(path):
+            known = set(self._watcher.directories()) | set(self._watcher.files())
+            for entry in Path(path).iterdir():
+                if str(entry) in known or entry.name.startswith("."):
+                    continue
+                if entry.is_dir() or entry.suffix.lower() == ".rpy":
+                    self._watcher.addPath(str(entry))
+        elif os.path.isfile(path) and path not in self._watcher.files():
+            # Atomik kaydetme dosyayı değiştirir; izlemeyi yenile
+            self._watcher.addPath(path)
+        self._debounce.start()
+
+
+class ProjectProgressModel(QFileSystemModel):
+    """
+    .rpy dosyaları için ilerleme sütunu gösteren dosya sistemi modeli.
+
+    Sütun 1 (Boyut) yerine ilerleme metni gösterilir; ad sütununun
+    ipucu ayrıntılı sayıları içerir.
+    """
+
+    PROGRESS_COLUMN = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._indexer: Optional[ProjectIndexer] = None
+
+    def set_indexer(self, indexer: ProjectIndexer):
+        self._indexer = indexer
+        indexer.file_indexed.connect(self._on_file_indexed)
+        indexer.index_updated.connect(self._on_index_updated)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (section == self.PROGRESS_COLUMN and orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return "İlerleme"
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if self._indexer is not None and index.isValid() and not self.isDir(index):
+            column = index.column()
+            if column == self.PROGRESS_COLUMN and role == Qt.ItemDataRole.DisplayRole:
+                return self._progress_for(index, text=True)
+            if column == 0 and role == Qt.ItemDataRole.ToolTipRole:
+                return self._progress_for(index, text=False)
+        return super().data(index, role)
+
+    def _progress_for(self, index: QModelIndex, text: bool):
+        path = self.filePath(index)
+        if not path.lower().endswith(".rpy"):
+            return ""
+        progress = self._indexer.get(path)
+        return format_progress(progress) if text else progress_tooltip(progress)
+
+    def _on_file_indexed(self, progress: FileProgress):
+        if self._indexer is None or self._indexer.index is None:
+            return
+        index = self.index(str(self._indexer.index.root / progress.path), self.PROGRESS_COLUMN)
+        if index.isValid():
+            self.dataChanged.emit(index.siblingAtColumn(0), index)
+
+    def _on_index_updated(self):
+        if self._indexer is None or self._indexer.index is None:
+            return
+        for progress in self._indexer.index.entries():
+            self._on_file_indexed(progress)
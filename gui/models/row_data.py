@@ -14,9 +14,9 @@ v2 Changes:
 - APPROVED + edit → MODIFIED transition
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime
 
 
@@ -29,13 +29,14 @@ class RowStatus(Enum):
     ERROR = "error"                 # Validation failed OR engine failed
 
 
-@dataclass
+@dataclass(slots=True)
 class RowData:
     """
     Data structure representing a single translation row.
     
     This is the single source of truth for a row's state in the UI.
     Uses stable row_id for all actions (never row index).
+    Slotted; text fields reference the ParsedItem strings instead of copying.
     """
     # === Identity ===
     id: str                         # Stable UUID (from parser or generated)
@@ -59,15 +60,13 @@ class RowData:
     approved_at: Optional[datetime] = None
     notes: str = ""                 # User notes for this row
     
-    # === Validation Cache ===
-    placeholders_ok: bool = True
     # === Validation Cache ===
     placeholders_ok: bool = True
     tags_ok: bool = True
     
     # === QC / Problem Detection (Stage 6) ===
     qc_flag: bool = False
-    qc_codes: list = field(default_factory=list)
+    qc_codes: Sequence[str] = ()
     qc_summary: Optional[str] = None
     
     # =========================================================================
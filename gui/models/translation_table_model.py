@@ -11,6 +11,8 @@ v2 Değişiklikleri:
 - update_row_by_id() ID bazlı güncelleme
 - get_index_by_id() helper
 - O(1) counter güncellemesi için _update_stats_delta()
+- Sorunlu satır indeksi (core.row_index): sonraki/önceki sorun, ilk/son
+  hata ve sayımlar bisect ile O(log n)
 
 PERFORMANS GARANTİLERİ:
 - data() O(1): Sadece list[index] erişimi
@@ -28,6 +30,7 @@ from PySide6.QtCore import (
 from PySide6.QtGui import QBrush, QColor
 
 from renforge_logger import get_logger
+from core.row_index import ProblemRowIndex
 from gui.models.row_data import RowData, RowStatus
 
 logger = get_logger("gui.models.table")
@@ -104,6 +107,12 @@ class TranslationTableModel(QAbstractTableModel):
         # === INCREMENTAL COUNTERS (v2) ===
         self._stats: Dict[RowStatus, int] = {status: 0 for status in RowStatus}
         self._flagged_count: int = 0
+        
+        # Sorted row sets per category (untranslated, error, qc, flagged, modified, problems)
+        self._row_index = ProblemRowIndex()
+        
+        # Live QA index of the shown file (core.qa_engine.QAIndex); edits mark rows dirty
+        self.qa_index = None
     
     # =========================================================================
     # QAbstractTableModel ZORUNLU METODLARİ
@@ -266,7 +275,11 @@ class TranslationTableModel(QAbstractTableModel):
         except Exception as e:
             logger.warning(f"QC check failed for row {row_idx}: {e}")
         
+        if self.qa_index is not None:
+            self.qa_index.mark_dirty([row_idx])
+        
         # Update incremental counters
+        self._row_index.update(row_idx, row)
         self._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
         
         # Emit dataChanged for entire row
@@ -290,6 +303,7 @@ class TranslationTableModel(QAbstractTableModel):
             self._stats[row.status] += 1
             if row.is_flagged:
                 self._flagged_count += 1
+        self._row_index.rebuild(self._rows)
         self.stats_updated.emit(self.get_global_stats())
     
     def _update_stats_delta(self, old_status: RowStatus, new_status: RowStatus,
@@ -316,8 +330,34 @@ class TranslationTableModel(QAbstractTableModel):
             "approved": self._stats[RowStatus.APPROVED],
             "error": self._stats[RowStatus.ERROR],
             "flagged": self._flagged_count,
+            "qc": self._row_index.count("qc"),
+            "problems": self._row_index.count("problems"),
         }
     
+    # =========================================================================
+    # PROBLEM-ROW NAVIGATION (bisect, O(log n))
+    # =========================================================================
+    
+    def count_rows(self, category: str) -> int:
+        """Rows in a category ("untranslated", "error", "qc", "flagged", "modified", "problems")."""
+        return self._row_index.count(category)
+    
+    def first_row(self, category: str) -> Optional[int]:
+        """Smallest source row in the category, or None."""
+        return self._row_index.first(category)
+    
+    def last_row(self, category: str) -> Optional[int]:
+        """Largest source row in the category, or None."""
+        return self._row_index.last(category)
+    
+    def next_row(self, category: str, row: int, wrap: bool = True) -> Optional[int]:
+        """Next source row of the category after `row` (wraps to the first)."""
+        return self._row_index.next_row(category, row, wrap)
+    
+    def prev_row(self, category: str, row: int, wrap: bool = True) -> Optional[int]:
+        """Previous source row of the category before `row` (wraps to the last)."""
+        return self._row_index.prev_row(category, row, wrap)
+    
     # =========================================================================
     # VERİ YÖNETİM API'Sİ
     # =========================================================================
@@ -335,7 +375,12 @@ class TranslationTableModel(QAbstractTableModel):
         logger.debug(f"[TranslationTableModel] Loaded {len(rows)} rows")
     
     def append_rows(self, new_rows: List[RowData]) -> None:
-        """Yeni satırlar ekle."""
+        """
+        Yeni satırlar ekle.
+        
+        Streaming dosya yüklemesinde her dilim için çağrılır; maliyet
+        sadece eklenen satır sayısıyla orantılıdır (O(k)).
+        """
         if not new_rows:
             return
         
@@ -344,13 +389,16 @@ class TranslationTableModel(QAbstractTableModel):
         
         self.beginInsertRows(QModelIndex(), start_row, end_row)
         
-        for row in new_rows:
-            self._rows.append(row)
-            self._id_to_index[str(row.id)] = len(self._rows) - 1
+        self._rows.extend(new_rows)
+        id_index = self._id_to_index
+        stats = self._stats
+        for idx, row in enumerate(new_rows, start_row):
+            id_index[str(row.id)] = idx
             # Update counters
-            self._stats[row.status] += 1
+            stats[row.status] += 1
             if row.is_flagged:
                 self._flagged_count += 1
+        self._row_index.extend(start_row, new_rows)
         
         self.endInsertRows()
         self.stats_updated.emit(self.get_global_stats())
@@ -412,6 +460,7 @@ class TranslationTableModel(QAbstractTableModel):
         
         if changed:
             # Update counters
+            self._row_index.update(idx, row)
             self._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
             
             # Emit dataChanged
@@ -443,6 +492,7 @@ class TranslationTableModel(QAbstractTableModel):
                     changed = True
         
         if changed:
+            self._row_index.update(row_idx, row)
             self._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
             
             top_left = self.index(row_idx, 0)
@@ -450,6 +500,31 @@ class TranslationTableModel(QAbstractTableModel):
             self.dataChanged.emit(top_left, bottom_right)
             self.row_updated.emit(row_idx, row)
 
+    def revert_row_to_saved(self, row_idx: int) -> None:
+        """
+        Satırı son kaydedilen haline döndür (Index bazlı).
+        Sayaçları, problem satır indeksini ve QA kirli işaretini günceller.
+        """
+        if not (0 <= row_idx < len(self._rows)):
+            return
+        
+        row = self._rows[row_idx]
+        old_status = row.status
+        old_flagged = row.is_flagged
+        
+        row.revert_to_saved()
+        
+        if self.qa_index is not None:
+            self.qa_index.mark_dirty([row_idx])
+        
+        self._row_index.update(row_idx, row)
+        self._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
+        
+        top_left = self.index(row_idx, 0)
+        bottom_right = self.index(row_idx, TableColumn.COUNT - 1)
+        self.dataChanged.emit(top_left, bottom_right)
+        self.row_updated.emit(row_idx, row)
+
     def update_rows_by_id(self, updates: Dict[str, Dict[str, Any]]) -> None:
         """
         ID bazlı toplu güncelleme.
@@ -477,6 +552,7 @@ class TranslationTableModel(QAbstractTableModel):
                         changed = True
             
             if changed:
+                self._row_index.update(idx, row)
                 self._update_stats_delta(old_status, row.status, old_flagged, row.is_flagged)
                 affected_indices.append(idx)
         
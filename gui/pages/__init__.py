@@ -1,22 +1,32 @@
 # -*- coding: utf-8 -*-
-"""RenForge Pages Package"""
+"""
+RenForge Pages Package
 
-from gui.pages.page_files import FilesPage
-from gui.pages.page_translate import TranslatePage
-from gui.pages.page_review import ReviewPage
-from gui.pages.page_tm import TMPage
-from gui.pages.page_glossary import GlossaryPage
-from gui.pages.page_packaging import PackagingPage
-from gui.pages.page_settings import SettingsPage
-from gui.pages.page_health import HealthPage
+Page classes are imported on first attribute access so that importing one
+page (or the package) does not pull in every page module at startup.
+"""
 
-__all__ = [
-    'FilesPage',
-    'TranslatePage',
-    'ReviewPage', 
-    'TMPage',
-    'GlossaryPage',
-    'PackagingPage',
-    'SettingsPage',
-    'HealthPage'
-]
+import importlib
+
+_PAGE_MODULES = {
+    'FilesPage': 'gui.pages.page_files',
+    'TranslatePage': 'gui.pages.page_translate',
+    'ReviewPage': 'gui.pages.page_review',
+    'TMPage': 'gui.pages.page_tm',
+    'GlossaryPage': 'gui.pages.page_glossary',
+    'PackagingPage': 'gui.pages.page_packaging',
+    'SettingsPage': 'gui.pages.page_settings',
+    'HealthPage': 'gui.pages.page_health',
+    'LazyPage': 'gui.pages.lazy_page',
+}
+
+__all__ = list(_PAGE_MODULES)
+
+
+def __getattr__(name):
+    module_name = _PAGE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
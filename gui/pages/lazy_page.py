@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Lazy Page
+
+Lightweight navigation placeholder that builds the real page the first
+time it is shown (or explicitly requested), so rarely used pages and their
+heavy imports do not slow down application start.
+"""
+
+import time
+from typing import Callable, Optional
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+from renforge_logger import get_logger
+
+logger = get_logger("gui.pages.lazy_page")
+
+
+class LazyPage(QWidget):
+    """
+    Sayfa yer tutucusu: gerçek sayfa ilk gösterimde oluşturulur.
+
+    Args:
+        object_name: objectName of the real page (used by navigation and
+            `_is_page_visible` checks before the page exists)
+        factory: Callable(parent) -> QWidget creating the real page
+        on_created: Optional callback(page) run once after creation
+    """
+
+    def __init__(self, object_name: str, factory: Callable[[QWidget], QWidget],
+                 on_created: Optional[Callable[[QWidget], None]] = None, parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self._factory = factory
+        self._on_created = on_created
+        self._page: Optional[QWidget] = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
+
+    @property
+    def is_created(self) -> bool:
+        return self._page is not None
+
+    def page(self) -> QWidget:
+        """Return the real page, creating it on first use."""
+        if self._page is None:
+            start = time.perf_counter()
+            self._page = self._factory(self)
+            self._layout.addWidget(self._page)
+            logger.debug(f"Lazy page created: {self.objectName()} "
+                         f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+            if self._on_created:
+                self._on_created(self._page)
+        return self._page
+
+    def showEvent(self, event):
+        self.page()
+        super().showEvent(event)
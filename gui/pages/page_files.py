@@ -4,15 +4,18 @@ RenForge Files Page (Session Manager)
 
 Shows:
 - Project info card
-- Open Files list (synced with TranslatePage tabs)
+- Open Files list (synced with TranslatePage tabs), with project batch
+  AI translation progress per file
 - Recent Files list (persisted in settings)
+- Project files with per-file translation progress (core.project_index)
 """
 
 from pathlib import Path
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidgetItem, QListWidget, QListWidgetItem
+    QTreeWidgetItem, QListWidget, QListWidgetItem, QMenu
 )
 
 from qfluentwidgets import (
@@ -35,12 +38,22 @@ class FilesPage(QWidget):
     # Signal when user wants to open a file from the list
     file_open_requested = Signal(str)  # file_path
     
+    # Signal when user cancels one file of the running project batch
+    cancel_file_requested = Signal(str)  # file_path
+    
+    # Proje dosyaları tablosunun sütunları
+    PROJECT_COLUMNS = ("Dosya", "İlerleme", "Satır", "Çevrilmemiş", "Değiştirilmiş", "QC", "Dil")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("FilesPage")
         
         self._project_path = None
         
+        # Project batch state: file_path -> (done, total)
+        self._batch_running = False
+        self._batch_progress = {}
+        
         # Load recents from settings for persistence
         from models.settings_model import SettingsModel
         self._settings = SettingsModel.instance()
@@ -88,9 +101,24 @@ class FilesPage(QWidget):
         left_layout.setContentsMargins(10, 10, 10, 10)
         left_layout.setSpacing(8)
         
+        open_header_row = QHBoxLayout()
+        open_header_row.setSpacing(8)
+        
         open_header = BodyLabel("📂 Açık Dosyalar")
         open_header.setStyleSheet("font-weight: bold; font-size: 13px;")
-        left_layout.addWidget(open_header)
+        open_header_row.addWidget(open_header)
+        
+        open_header_row.addStretch()
+        
+        # Project batch: all open files in one deduplicated AI run
+        self.translate_all_btn = TransparentPushButton("Tümünü Çevir")
+        self.translate_all_btn.setIcon(FIF.ROBOT)
+        self.translate_all_btn.setFixedHeight(24)
+        self.translate_all_btn.setToolTip("Açık dosyalardaki çevrilmemiş satırları AI ile çevir")
+        self.translate_all_btn.clicked.connect(self._on_translate_all)
+        open_header_row.addWidget(self.translate_all_btn)
+        
+        left_layout.addLayout(open_header_row)
         
         self.open_files_list = QListWidget()
         self.open_files_list.setStyleSheet("""
@@ -113,6 +141,8 @@ class FilesPage(QWidget):
         """)
         self.open_files_list.itemClicked.connect(self._on_open_file_clicked)
         self.open_files_list.itemDoubleClicked.connect(self._on_open_file_double_clicked)
+        self.open_files_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.open_files_list.customContextMenuRequested.connect(self._show_open_file_menu)
         left_layout.addWidget(self.open_files_list)
         
         # Kompakt empty state for open files
@@ -178,6 +208,40 @@ class FilesPage(QWidget):
         
         layout.addWidget(content_splitter)
         
+        # Proje dosyaları + ilerleme (proje açılınca görünür)
+        self.project_card = CardWidget()
+        project_layout = QVBoxLayout(self.project_card)
+        project_layout.setContentsMargins(10, 10, 10, 10)
+        project_layout.setSpacing(8)
+        
+        project_header_row = QHBoxLayout()
+        project_header = BodyLabel("🗂 Proje Dosyaları")
+        project_header.setStyleSheet("font-weight: bold; font-size: 13px;")
+        project_header_row.addWidget(project_header)
+        project_header_row.addStretch()
+        self.project_totals_label = BodyLabel("")
+        self.project_totals_label.setStyleSheet("color: #888; font-size: 11px;")
+        project_header_row.addWidget(self.project_totals_label)
+        project_layout.addLayout(project_header_row)
+        
+        self.project_tree = TreeWidget()
+        self.project_tree.setColumnCount(len(self.PROJECT_COLUMNS))
+        self.project_tree.setHeaderLabels(list(self.PROJECT_COLUMNS))
+        self.project_tree.setRootIsDecorated(False)
+        self.project_tree.setSortingEnabled(True)
+        self.project_tree.itemDoubleClicked.connect(self._on_project_file_double_clicked)
+        project_layout.addWidget(self.project_tree)
+        
+        self.project_card.setVisible(False)
+        layout.addWidget(self.project_card, 1)
+        
+        # Arka plan indeksleyici (mtime önbelleği .renforge/ içinde)
+        from gui.models.project_progress_model import ProjectIndexer
+        self._indexer = ProjectIndexer(self)
+        self._indexer.file_indexed.connect(self._on_project_file_indexed)
+        self._indexer.index_updated.connect(self._refresh_project_files)
+        self._project_items = {}
+        
         # Populate lists
         self._refresh_open_files_list()
         self._refresh_recent_list()
@@ -198,6 +262,27 @@ class FilesPage(QWidget):
         if hasattr(main_window, 'open_project_requested'):
             main_window.open_project_requested.emit()
     
+    def _on_translate_all(self):
+        """Handle translate all button click (project batch AI)."""
+        main_window = self.window()
+        if hasattr(main_window, 'project_batch_ai_requested'):
+            main_window.project_batch_ai_requested.emit()
+    
+    def _show_open_file_menu(self, pos):
+        """Sağ tık menüsü: çalışan proje çevirisinden dosyayı çıkar."""
+        item = self.open_files_list.itemAt(pos)
+        if item is None:
+            return
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not self._batch_running or file_path not in self._batch_progress:
+            return
+        
+        menu = QMenu(self)
+        cancel_action = QAction("Bu dosyanın çevirisini iptal et", self)
+        cancel_action.triggered.connect(lambda: self.cancel_file_requested.emit(file_path))
+        menu.addAction(cancel_action)
+        menu.exec(self.open_files_list.viewport().mapToGlobal(pos))
+    
     def _on_clear_recent_files(self):
         """Clear all recent files."""
         self._recent_files.clear()
@@ -231,6 +316,17 @@ class FilesPage(QWidget):
         if file_path:
             self._open_file_and_navigate(file_path)
     
+    def _on_project_file_double_clicked(self, item, column):
+        """Handle project file double-click - open/focus file."""
+        file_path = item.data(0, Qt.ItemDataRole.UserRole)
+        if not file_path:
+            return
+        main_window = self.window()
+        if hasattr(main_window, 'get_open_file_paths') and file_path in main_window.get_open_file_paths():
+            self._switch_to_file_and_navigate(file_path)
+        else:
+            self._open_file_and_navigate(file_path)
+    
     def _switch_to_file_and_navigate(self, file_path: str):
         """Switch to an open file and navigate to Translate page."""
         main_window = self.window()
@@ -309,7 +405,11 @@ class FilesPage(QWidget):
         
         for file_path in open_paths:
             path = Path(file_path)
-            item = QListWidgetItem(f"📄 {path.name}")
+            label = f"📄 {path.name}"
+            if file_path in self._batch_progress:
+                done, total = self._batch_progress[file_path]
+                label += f" · {done}/{total}"
+            item = QListWidgetItem(label)
             item.setData(Qt.ItemDataRole.UserRole, file_path)
             item.setToolTip(file_path)
             self.open_files_list.addItem(item)
@@ -318,6 +418,27 @@ class FilesPage(QWidget):
             if file_path == active_path:
                 self.open_files_list.setCurrentItem(item)
     
+    # =========================================================================
+    # PROJECT BATCH
+    # =========================================================================
+    
+    def set_batch_running(self, running: bool):
+        """Enable/disable translate all; drop per-file progress when a run ends."""
+        self._batch_running = running
+        self.translate_all_btn.setEnabled(not running)
+        if not running and self._batch_progress:
+            self._batch_progress.clear()
+            self._refresh_open_files_list()
+    
+    def set_file_batch_progress(self, file_path: str, done: int, total: int):
+        """Show one file's project batch progress in the open files list."""
+        self._batch_progress[file_path] = (done, total)
+        for i in range(self.open_files_list.count()):
+            item = self.open_files_list.item(i)
+            if item.data(Qt.ItemDataRole.UserRole) == file_path:
+                item.setText(f"📄 {Path(file_path).name} · {done}/{total}")
+                break
+    
     def _refresh_recent_list(self):
         """Refresh the recent files list."""
         self.recent_files_list.clear()
@@ -340,6 +461,59 @@ class FilesPage(QWidget):
             item.setToolTip(file_path)
             self.recent_files_list.addItem(item)
     
+    def _refresh_project_files(self):
+        """Rebuild the project files table from the index."""
+        index = self._indexer.index
+        self.project_tree.setSortingEnabled(False)
+        self.project_tree.clear()
+        self._project_items = {}
+        if index is None:
+            self.project_card.setVisible(False)
+            return
+        
+        self.project_card.setVisible(True)
+        for progress in index.entries():
+            item = QTreeWidgetItem()
+            self._project_items[progress.path] = item
+            self._fill_project_item(item, progress)
+            self.project_tree.addTopLevelItem(item)
+        self.project_tree.setSortingEnabled(True)
+        self._update_project_totals()
+    
+    def _on_project_file_indexed(self, progress):
+        """Update (or add) one row while a scan is running."""
+        item = self._project_items.get(progress.path)
+        if item is None:
+            item = QTreeWidgetItem()
+            self._project_items[progress.path] = item
+            self.project_tree.addTopLevelItem(item)
+        self._fill_project_item(item, progress)
+    
+    def _fill_project_item(self, item, progress):
+        from gui.models.project_progress_model import format_progress, progress_tooltip
+        
+        values = (
+            progress.path,
+            format_progress(progress),
+            str(progress.items),
+            str(progress.untranslated),
+            str(progress.modified),
+            f"{progress.qc_errors}/{progress.qc_warnings}",
+            progress.language or "-",
+        )
+        for column, value in enumerate(values):
+            item.setText(column, value)
+        item.setData(0, Qt.ItemDataRole.UserRole, str(self._indexer.index.root / progress.path))
+        item.setToolTip(0, progress_tooltip(progress))
+    
+    def _update_project_totals(self):
+        totals = self._indexer.index.totals()
+        done = totals['items'] - totals['untranslated']
+        self.project_totals_label.setText(
+            f"{totals['files']} dosya · {done}/{totals['items']} satır · "
+            f"{totals['qc_errors']} QC hatası"
+        )
+    
     def _highlight_active_file(self, file_path: str):
         """Highlight the active file in the open files list."""
         for i in range(self.open_files_list.count()):
@@ -370,6 +544,15 @@ class FilesPage(QWidget):
         # Update UI
         self._refresh_recent_list()
     
+    def load_project(self, project_path: str):
+        """Show the project's files and index their progress in the background."""
+        self._project_path = project_path
+        if project_path and Path(project_path).is_dir():
+            self._indexer.start(project_path)
+        else:
+            self._indexer.stop()
+            self._refresh_project_files()
+    
     def connect_to_main_window(self):
         """Connect to MainFluentWindow signals for file lifecycle events."""
         main_window = self.window()
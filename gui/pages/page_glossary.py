@@ -3,7 +3,7 @@
 RenForge Glossary (Sözlük) Sayfası
 
 GlossaryStore'dan veri okuyarak sözlük terimlerini listeler.
-Terim ekleme/silme ve CSV içe/dışa aktarma destekler.
+Terim ekleme/silme, CSV/TBX içe ve CSV dışa aktarma destekler.
 Stage 17: Enabled checkbox, detaylı import özeti, Health jump API.
 Stage 18: Enforce Önizleme dialog.
 Stage 19: Import conflict strategy seçimi.
@@ -336,7 +336,7 @@ class GlossaryPage(QWidget):
         self.delete_btn.clicked.connect(self._on_delete_term)
         cmd_layout.addWidget(self.delete_btn)
         
-        self.import_btn = PushButton("CSV İçe Aktar")
+        self.import_btn = PushButton("CSV/TBX İçe Aktar")
         self.import_btn.setIcon(FIF.DOWNLOAD)
         self.import_btn.clicked.connect(self._on_import_csv)
         cmd_layout.addWidget(self.import_btn)
@@ -658,12 +658,12 @@ class GlossaryPage(QWidget):
             )
     
     def _on_import_csv(self):
-        """CSV dosyasından içe aktar (Stage 19: Strategy seçimi ile)."""
+        """CSV/TBX dosyasından içe aktar (Stage 19: Strategy seçimi ile)."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
-            "CSV Dosyası Seç",
+            "CSV / TBX Dosyası Seç",
             "",
-            "CSV Files (*.csv);;All Files (*)"
+            "Glossary Files (*.csv *.tbx);;CSV Files (*.csv);;TBX Files (*.tbx);;All Files (*)"
         )
         
         if not file_path:
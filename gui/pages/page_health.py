@@ -21,6 +21,7 @@ from renforge_logger import get_logger
 from core.run_history_store import RunHistoryStore, RunRecord
 from core.run_analytics import compute_run_deltas, compute_trends
 from core.auto_insights import generate_insights, InsightResult, ActionSuggestion
+from core import telemetry
 
 logger = get_logger("gui.pages.health")
 
@@ -773,6 +774,78 @@ class TrendCard(CardWidget):
             self.problem_label.setText("Sorunlu model tespit edilmedi.")
 
 
+class StageBreakdownCard(CardWidget):
+    """Per-stage time breakdown of the selected run (core.telemetry snapshot)."""
+    
+    STAGE_LABELS = {
+        "tm_precheck": "TM Ön Kontrol", "masking": "Maskeleme", "prompt_build": "Prompt",
+        "network": "Ağ", "first_row": "İlk Satır", "backoff": "Geri Çekilme", "throttle": "Hız Sınırı",
+        "json_parse": "JSON Ayrıştırma", "repair": "Onarım", "glossary": "Sözlük",
+        "engine": "Motor", "qc": "QC", "gui_apply": "Arayüz", "save": "Kaydetme",
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 12)
+        layout.setSpacing(8)
+        
+        header = QHBoxLayout()
+        header.addWidget(StrongBodyLabel("Aşama Süreleri"))
+        header.addStretch()
+        self.wall_label = BodyLabel("")
+        self.wall_label.setStyleSheet("color: #888;")
+        header.addWidget(self.wall_label)
+        layout.addLayout(header)
+        
+        self.grid = QGridLayout()
+        self.grid.setHorizontalSpacing(12)
+        self.grid.setVerticalSpacing(4)
+        layout.addLayout(self.grid)
+        
+        self.counters_label = BodyLabel("")
+        self.counters_label.setStyleSheet("color: #888;")
+        self.counters_label.setWordWrap(True)
+        layout.addWidget(self.counters_label)
+    
+    def set_run(self, run: RunRecord = None):
+        """Show the telemetry of `run` (older runs have none)."""
+        while self.grid.count():
+            item = self.grid.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        
+        snapshot = run.telemetry if run else {}
+        rows = telemetry.breakdown(snapshot)
+        if not rows:
+            self.wall_label.setText("")
+            self.counters_label.setText("Bu çalıştırma için ölçüm yok")
+            return
+        
+        self.wall_label.setText(f"Toplam {snapshot.get('wall_ms', 0) / 1000:.1f}s")
+        for col, title in enumerate(("Aşama", "Adet", "Toplam", "Pay", "p50", "p95")):
+            label = BodyLabel(title)
+            label.setStyleSheet("color: #888;")
+            self.grid.addWidget(label, 0, col)
+        
+        for i, row in enumerate(rows, start=1):
+            values = (
+                self.STAGE_LABELS.get(row["stage"], row["stage"]),
+                str(row["count"]),
+                f"{row['total_ms'] / 1000:.2f}s",
+                f"%{row['share'] * 100:.0f}",
+                f"{row['p50_ms']:.0f}ms",
+                f"{row['p95_ms']:.0f}ms",
+            )
+            for col, value in enumerate(values):
+                self.grid.addWidget(BodyLabel(value), i, col)
+        
+        counters = snapshot.get("counters") or {}
+        self.counters_label.setText(
+            ", ".join(f"{name}: {value}" for name, value in counters.items())
+        )
+
+
 class InsightActionCard(CardWidget):
     """Card showing auto-insights and action buttons (Stage 13)."""
     
@@ -1094,11 +1167,15 @@ class HealthPage(QWidget):
         self.kpi_errors = KPICard("Hata", "-", FIF.CLOSE)
         self.kpi_qc = KPICard("QC Sorun", "-", FIF.INFO)
         self.kpi_duration = KPICard("Süre", "-", FIF.SPEED_OFF)
+        self.kpi_cache = KPICard("Yanıt Önbelleği", "-", FIF.SAVE)
+        self.kpi_live_qa = KPICard("Canlı QA", "-", FIF.INFO)
         
         kpi_layout.addWidget(self.kpi_success)
         kpi_layout.addWidget(self.kpi_errors)
         kpi_layout.addWidget(self.kpi_qc)
         kpi_layout.addWidget(self.kpi_duration)
+        kpi_layout.addWidget(self.kpi_cache)
+        kpi_layout.addWidget(self.kpi_live_qa)
         kpi_layout.addStretch()
         
         content_layout.addLayout(kpi_layout)
@@ -1180,6 +1257,9 @@ class HealthPage(QWidget):
         self.trend_card = TrendCard()
         middle_layout.addWidget(self.trend_card)
         
+        self.stage_card = StageBreakdownCard()
+        middle_layout.addWidget(self.stage_card)
+        
         # Insight + Action Card (Stage 13)
         self.insight_card = InsightActionCard()
         self.insight_card.action_requested.connect(self._on_insight_action)
@@ -1275,6 +1355,48 @@ class HealthPage(QWidget):
         hours = hours % 24
         return f"{days}d {hours}h"
     
+    def _refresh_cache_stats(self):
+        """Gemini yanıt önbelleği isabet/ıska sayaçlarını göster."""
+        from core.response_cache import get_response_cache
+        
+        cache = get_response_cache()
+        if cache is None:
+            self.kpi_cache.set_value("Kapalı")
+            self.kpi_cache.setToolTip("")
+            return
+        
+        try:
+            cs = cache.get_stats()
+        except Exception as e:
+            logger.warning(f"Response cache stats unavailable: {e}")
+            self.kpi_cache.set_value("-")
+            return
+        
+        self.kpi_cache.set_value(f"%{cs['hit_rate']:.0f}")
+        self.kpi_cache.setToolTip(
+            f"İsabet: {cs['hits']}  Iska: {cs['misses']}\n"
+            f"Kayıt: {cs['entries']} ({cs['size_bytes'] / (1024 * 1024):.1f} / "
+            f"{cs['max_bytes'] / (1024 * 1024):.0f} MB)\n"
+            f"Tahliye: {cs['evictions']}  Süresi dolan: {cs['expired']}"
+        )
+    
+    def _refresh_live_qa(self):
+        """Açık dosyaların canlı QA indeksinden sorun sayıları (yeniden tarama yok)."""
+        from core.qa_engine import live_counts
+        
+        # GUI thread: son sonuçlar okunur, çalışan bir QA taraması beklenmez
+        counts = live_counts(refresh=False)
+        if not counts["files"]:
+            self.kpi_live_qa.set_value("-")
+            self.kpi_live_qa.setToolTip("QA paneli henüz çalıştırılmadı.")
+            return
+        
+        self.kpi_live_qa.set_value(str(counts["error"] + counts["warning"]))
+        self.kpi_live_qa.setToolTip(
+            f"Hata: {counts['error']}  Uyarı: {counts['warning']}  Bilgi: {counts['info']}\n"
+            f"Sorunlu satır: {counts['rows']}  Dosya: {counts['files']}"
+        )
+    
     def refresh(self):
         """Refresh the dashboard with latest data."""
         from core.run_history_store import RunHistoryStore
@@ -1285,6 +1407,9 @@ class HealthPage(QWidget):
         runs = store.get_runs(10)
         stats = store.get_aggregated_stats(10)
         
+        self._refresh_cache_stats()
+        self._refresh_live_qa()
+        
         # Get selected run (default to latest)
         if runs and self._selected_run_index < len(runs):
             self._selected_run = runs[self._selected_run_index]
@@ -1292,6 +1417,9 @@ class HealthPage(QWidget):
             self._selected_run = runs[0] if runs else None
             self._selected_run_index = 0
         
+        # Satır detayları (hata/QC öğeleri) yalnızca seçili koşu için yüklenir
+        store.load_details(self._selected_run)
+        
         # Update empty state
         has_data = len(runs) > 0
         self.empty_state.setVisible(not has_data)
@@ -1347,6 +1475,7 @@ class HealthPage(QWidget):
         
         # Update run details (Stage 9)
         self.run_details.set_run(self._selected_run, self._format_duration_ms)
+        self.stage_card.set_run(self._selected_run)
         
         # Generate insights (Stage 13)
         if self._selected_run:
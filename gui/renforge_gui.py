@@ -160,7 +160,11 @@ class RenForgeGUI(QMainWindow):
 
         self._load_languages()
 
-        self.file_system_model = QFileSystemModel()
+        # Proje ağacı: .rpy dosyalarının yanında çeviri ilerlemesi
+        from gui.models.project_progress_model import ProjectIndexer, ProjectProgressModel
+        self.project_indexer = ProjectIndexer(self)
+        self.file_system_model = ProjectProgressModel()
+        self.file_system_model.set_indexer(self.project_indexer)
 
         # Stage 5: Create FilterToolbar (created before layout assembly)
         from gui.widgets.filter_toolbar import FilterToolbar
@@ -137,13 +137,16 @@ def get_source_model(view: TranslationTableView) -> Optional[TranslationTableMod
 # VERİ YÜKLEME (POPULATE)
 # =============================================================================
 
-def parsed_items_to_table_rows(parsed_items: list, mode_str: str) -> list[RowData]:
+def parsed_items_to_table_rows(parsed_items: list, mode_str: str, start_index: int = 0) -> list[RowData]:
     """
     ParsedItem listesini RowData listesine dönüştür. (New Architecture)
+    
+    start_index: İlk öğenin ParsedFile.items içindeki indeksi (streaming
+    yüklemede eklenen dilimler için; row id'leri indeks tabanlıdır).
     """
     rows = []
     
-    for idx, item in enumerate(parsed_items):
+    for idx, item in enumerate(parsed_items, start_index):
         item_type = str(item.item_type) if hasattr(item, 'item_type') else "unknown"
         
         # Tag
@@ -202,6 +205,28 @@ def parsed_items_to_table_rows(parsed_items: list, mode_str: str) -> list[RowDat
     return rows
 
 
+def stream_rows_into_model(model: TranslationTableModel, parsed_file: ParsedFile) -> None:
+    """
+    Dosya hâlâ dilim dilim yükleniyorsa (FileController streaming; dilimler
+    olay döngüsü turları arasında GUI thread'inde ayrıştırılır), eklenen
+    öğeleri satır olarak modele ekle. Yükleme bitince abonelikler kaldırılır.
+    """
+    if not parsed_file.is_loading:
+        return
+    
+    def on_items_appended(start: int, count: int) -> None:
+        items = parsed_file.items[start:start + count]
+        model.append_rows(parsed_items_to_table_rows(items, parsed_file.mode, start))
+    
+    def on_loading_finished() -> None:
+        parsed_file.unsubscribe('items_appended', on_items_appended)
+        parsed_file.unsubscribe('loading_finished', on_loading_finished)
+        logger.debug(f"[file_table_view] Streaming finished: {model.rowCount()} rows")
+    
+    parsed_file.subscribe('items_appended', on_items_appended)
+    parsed_file.subscribe('loading_finished', on_loading_finished)
+
+
 def load_data_to_view(view: TranslationTableView, parsed_file: ParsedFile) -> None:
     """
     ParsedFile verisini view'a yükle.
@@ -216,6 +241,11 @@ def load_data_to_view(view: TranslationTableView, parsed_file: ParsedFile) -> No
     
     # Modele yükle
     model.set_rows(rows)
+    stream_rows_into_model(model, parsed_file)
+    
+    # Elle düzenlemeler canlı QA indeksinde satırı kirli işaretler
+    from core.qa_engine import get_qa_index
+    model.qa_index = get_qa_index(parsed_file)
     
     logger.info(f"[file_table_view] Loaded {len(rows)} rows to view")
 
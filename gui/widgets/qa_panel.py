@@ -6,7 +6,7 @@ from PySide6.QtCore import Qt, Signal, QThread, Slot
 from PySide6.QtGui import QColor, QIcon, QAction
 
 from renforge_logger import get_logger
-from core.qa_engine import QAEngine, QAIssue, QASeverity
+from core.qa_engine import QAEngine, QAIssue, QASeverity, get_qa_index
 from locales import tr
 
 
@@ -16,10 +16,9 @@ class QAWorker(QThread):
     progress = Signal(int, int)
     finished = Signal(list)
     
-    def __init__(self, engine, items):
+    def __init__(self, index):
         super().__init__()
-        self.engine = engine
-        self.items = items
+        self.index = index
         self.is_cancelled = False
         
     def run(self):
@@ -28,8 +27,9 @@ class QAWorker(QThread):
             if curr % 100 == 0: self.progress.emit(curr, total)
             return True
             
-        results = self.engine.scan(self.items, cb)
-        self.finished.emit(results)
+        # Only rows changed since the last scan are re-checked
+        self.index.refresh(cb, verify=True)
+        self.finished.emit(self.index.issues(refresh=False))
         
     def cancel(self):
         self.is_cancelled = True
@@ -42,6 +42,7 @@ class QAPanel(QWidget):
         super().__init__()
         self.main_window = main_window
         self.engine = QAEngine()
+        self.index = None
         self.issues = []
         self.worker = None
         
@@ -99,15 +100,16 @@ class QAPanel(QWidget):
             self.worker.cancel()
             self.worker.wait()
             
-        items = self.main_window._get_current_translatable_items()
-        if not items:
+        file_data = self.main_window._get_current_file_data()
+        if not file_data or not file_data.items:
             self.status_lbl.setText("No items to scan.")
             return
             
         self.run_btn.setEnabled(False)
         self.status_lbl.setText(tr("qa_status_scanning", progress=0))
         
-        self.worker = QAWorker(self.engine, items)
+        self.index = get_qa_index(file_data)
+        self.worker = QAWorker(self.index)
         self.worker.progress.connect(self.on_progress)
         self.worker.finished.connect(self.on_scan_finished)
         self.worker.start()
@@ -247,6 +249,11 @@ class QAPanel(QWidget):
                   
              self.main_window._set_current_tab_modified(True)
              
-             # Remove issue from list? or just refresh?
-             self.issues.remove(issue)
+             # Re-check just the fixed row (during a scan it stays queued for the next refresh)
+             if self.index is not None:
+                  self.index.mark_dirty([issue.raw_index])
+                  scanning = self.worker is not None and self.worker.isRunning()
+                  self.issues = self.index.issues(refresh=not scanning)
+             else:
+                  self.issues.remove(issue)
              self.update_table(self.issues)
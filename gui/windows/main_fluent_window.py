@@ -22,8 +22,6 @@ from renforge_logger import get_logger
 
 logger = get_logger("gui.windows.main_fluent_window")
 
-from controllers.review_controller import ReviewController
-
 
 class MainFluentWindow(FluentWindow):
     """
@@ -59,6 +57,7 @@ class MainFluentWindow(FluentWindow):
     translate_ai_requested = Signal()
     translate_google_requested = Signal()
     batch_ai_requested = Signal()
+    project_batch_ai_requested = Signal()
     batch_google_requested = Signal()
     
     # Settings changes
@@ -203,21 +202,26 @@ class MainFluentWindow(FluentWindow):
         from gui.pages.page_files import FilesPage
         from gui.pages.page_translate import TranslatePage
         from gui.pages.page_review import ReviewPage
-        from gui.pages.page_tm import TMPage
-        from gui.pages.page_glossary import GlossaryPage
-        from gui.pages.page_packaging import PackagingPage
         from gui.pages.page_settings import SettingsPage
-        from gui.pages.page_health import HealthPage
+        from gui.pages.lazy_page import LazyPage
         
         # Create page instances
+        # Files/Translate/Review/Settings are wired during bootstrap; the tool
+        # pages are only built when first opened (see LazyPage).
         self.files_page = FilesPage(self)
         self.translate_page = TranslatePage(self)
         self.review_page = ReviewPage(self)
-        self.tm_page = TMPage(self)
-        self.glossary_page = GlossaryPage(self)
-        self.packaging_page = PackagingPage(self)
         self.settings_page = SettingsPage(self)
-        self.health_page = HealthPage(self)
+        
+        self._lazy_pages = {
+            'tm': LazyPage("TMPage", self._create_tm_page, parent=self),
+            'glossary': LazyPage("GlossaryPage", self._create_glossary_page, parent=self),
+            'packaging': LazyPage("PackagingPage", self._create_packaging_page, parent=self),
+            'health': LazyPage(
+                "healthPage", self._create_health_page,
+                on_created=self._connect_health_signals, parent=self
+            ),
+        }
         
         # Add pages to navigation
         # Primary workflow pages
@@ -242,19 +246,19 @@ class MainFluentWindow(FluentWindow):
         
         # Tools section
         self.addSubInterface(
-            self.tm_page, 
+            self._lazy_pages['tm'], 
             FIF.HISTORY, 
             "TM", 
             NavigationItemPosition.SCROLL
         )
         self.addSubInterface(
-            self.glossary_page, 
+            self._lazy_pages['glossary'], 
             FIF.DICTIONARY, 
             "Sözlük",
             NavigationItemPosition.SCROLL
         )
         self.addSubInterface(
-            self.packaging_page, 
+            self._lazy_pages['packaging'], 
             FIF.ZIP_FOLDER, 
             "Paketleme",
             NavigationItemPosition.SCROLL
@@ -262,7 +266,7 @@ class MainFluentWindow(FluentWindow):
         
         # Health dashboard
         self.addSubInterface(
-            self.health_page,
+            self._lazy_pages['health'],
             FIF.HEART,
             "Sağlık",
             NavigationItemPosition.SCROLL
@@ -277,12 +281,50 @@ class MainFluentWindow(FluentWindow):
         )
         
         # Initialize Controllers
+        from controllers.review_controller import ReviewController
         self.review_controller = ReviewController(self)
         
-        # Connect Health page signals
-        self._connect_health_signals()
-        
-        logger.debug("Navigation initialized with 8 pages")
+        logger.debug("Navigation initialized with 8 pages (4 lazy)")
+    
+    # =========================================================================
+    # LAZY PAGES
+    # =========================================================================
+    
+    def _create_tm_page(self, parent):
+        from gui.pages.page_tm import TMPage
+        return TMPage(parent)
+    
+    def _create_glossary_page(self, parent):
+        from gui.pages.page_glossary import GlossaryPage
+        return GlossaryPage(parent)
+    
+    def _create_packaging_page(self, parent):
+        from gui.pages.page_packaging import PackagingPage
+        return PackagingPage(parent)
+    
+    def _create_health_page(self, parent):
+        from gui.pages.page_health import HealthPage
+        return HealthPage(parent)
+    
+    @property
+    def tm_page(self):
+        """TM sayfası (ilk erişimde oluşturulur)."""
+        return self._lazy_pages['tm'].page()
+    
+    @property
+    def glossary_page(self):
+        """Sözlük sayfası (ilk erişimde oluşturulur)."""
+        return self._lazy_pages['glossary'].page()
+    
+    @property
+    def packaging_page(self):
+        """Paketleme sayfası (ilk erişimde oluşturulur)."""
+        return self._lazy_pages['packaging'].page()
+    
+    @property
+    def health_page(self):
+        """Sağlık sayfası (ilk erişimde oluşturulur)."""
+        return self._lazy_pages['health'].page()
     
     def _init_content_area(self):
         """Initialize the right-side inspector panel with splitter."""
@@ -617,19 +659,16 @@ class MainFluentWindow(FluentWindow):
     # HEALTH PAGE SIGNALS (Stage 8)
     # =========================================================================
     
-    def _connect_health_signals(self):
-        """Connect Health page signals for navigation and actions."""
-        if not hasattr(self, 'health_page'):
-            return
-        
-        self.health_page.navigate_to_translate.connect(self._on_health_navigate_translate)
-        self.health_page.navigate_to_first_error.connect(self._on_health_goto_first_error)
-        self.health_page.navigate_to_first_qc.connect(self._on_health_goto_first_qc)
-        self.health_page.filter_by_error_category.connect(self._on_health_filter_errors)
-        self.health_page.filter_by_qc_code.connect(self._on_health_filter_qc)
+    def _connect_health_signals(self, health_page):
+        """Connect Health page signals for navigation and actions (called on page creation)."""
+        health_page.navigate_to_translate.connect(self._on_health_navigate_translate)
+        health_page.navigate_to_first_error.connect(self._on_health_goto_first_error)
+        health_page.navigate_to_first_qc.connect(self._on_health_goto_first_qc)
+        health_page.filter_by_error_category.connect(self._on_health_filter_errors)
+        health_page.filter_by_qc_code.connect(self._on_health_filter_qc)
         
         # Stage 8.2: Row-specific navigation with filter toggle
-        self.health_page.navigate_to_row_requested.connect(self._on_health_navigate_to_row)
+        health_page.navigate_to_row_requested.connect(self._on_health_navigate_to_row)
         
         logger.debug("Health page signals connected")
     
@@ -804,7 +843,7 @@ class MainFluentWindow(FluentWindow):
         """
         from gui.models.translation_table_model import TranslationTableModel
         from gui.models.translation_filter_proxy import TranslationFilterProxyModel
-        from gui.views.file_table_view import parsed_items_to_table_rows
+        from gui.views.file_table_view import parsed_items_to_table_rows, stream_rows_into_model
         
         # Convert ParsedItems to TableRowData
         rows = parsed_items_to_table_rows(parsed_file.items, parsed_file.mode)
@@ -812,6 +851,7 @@ class MainFluentWindow(FluentWindow):
         # Create model and proxy for this file
         model = TranslationTableModel()
         model.set_rows(rows)
+        stream_rows_into_model(model, parsed_file)
         
         proxy = TranslationFilterProxyModel()
         proxy.setSourceModel(model)
@@ -1149,7 +1189,7 @@ class MainFluentWindow(FluentWindow):
         Returns:
             True if file was opened/focused successfully
         """
-        from gui.views.file_table_view import parsed_items_to_table_rows
+        from gui.views.file_table_view import parsed_items_to_table_rows, stream_rows_into_model
         from gui.models.translation_table_model import TranslationTableModel
         from gui.models.translation_filter_proxy import TranslationFilterProxyModel
         from pathlib import Path
@@ -1164,9 +1204,12 @@ class MainFluentWindow(FluentWindow):
             return True
         
         # Create model and proxy for this file
+        # Large files are still streaming in: show the first screen now,
+        # the remaining rows are appended as the controller parses them
         rows = parsed_items_to_table_rows(parsed_file.items, parsed_file.mode)
         model = TranslationTableModel()
         model.set_rows(rows)
+        stream_rows_into_model(model, parsed_file)
         
         proxy = TranslationFilterProxyModel()
         proxy.setSourceModel(model)
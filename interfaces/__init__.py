@@ -5,30 +5,33 @@ RenForge Interfaces Package
 This package contains Protocol interfaces for dependency injection.
 Using Protocol from typing allows structural subtyping (duck typing)
 without requiring explicit inheritance.
+
+Names are resolved on first access so that Qt-free modules (plugins,
+headless CLI) can import `interfaces.i_plugin` without pulling in the
+Qt-based view interfaces.
 """
 
-from interfaces.i_view import (
-    IMainView,
-    IDialogView,
-    ITableView,
-)
-from interfaces.i_controller import (
-    IAppController,
-    IFileController,
-    ITranslationController,
-    IBatchController,
-    IProjectController,
-)
-from interfaces.di_container import DIContainer
+import importlib
+
+_INTERFACE_MODULES = {
+    'IMainView': 'interfaces.i_view',
+    'IDialogView': 'interfaces.i_view',
+    'ITableView': 'interfaces.i_view',
+    'IAppController': 'interfaces.i_controller',
+    'IFileController': 'interfaces.i_controller',
+    'ITranslationController': 'interfaces.i_controller',
+    'IBatchController': 'interfaces.i_controller',
+    'IProjectController': 'interfaces.i_controller',
+    'DIContainer': 'interfaces.di_container',
+}
+
+__all__ = list(_INTERFACE_MODULES)
+
 
-__all__ = [
-    'IMainView',
-    'IDialogView',
-    'ITableView',
-    'IAppController',
-    'IFileController',
-    'ITranslationController',
-    'IBatchController',
-    'IProjectController',
-    'DIContainer',
-]
+def __getattr__(name):
+    module_name = _INTERFACE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,12 @@
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterator, List, Optional, Callable
 
 # Core API Version - Increment if breaking changes occur
-RENFORGE_PLUGIN_API_VERSION = 1
+# 2: ITranslationEngineV2 (translate_stream + capabilities); v1 engines are adapted
+RENFORGE_PLUGIN_API_VERSION = 2
 
 class PluginType(Enum):
     ENGINE = "engine"
@@ -95,3 +97,183 @@ class IToolPlugin(IPlugin):
         context keys: 'source_lang', 'target_lang', 'is_pre_process', 'item_data'
         """
         return text
+
+
+def is_canceled(cancel_token: Any) -> bool:
+    """True if `cancel_token` (anything with .is_set(), or None) is set."""
+    return bool(cancel_token is not None and hasattr(cancel_token, "is_set") and cancel_token.is_set())
+
+
+class CancelToken:
+    """
+    Cancel token over a callable, for callers that track cancellation with a
+    function instead of a threading.Event.
+    """
+
+    def __init__(self, check: Callable[[], bool]):
+        self._check = check
+
+    def is_set(self) -> bool:
+        return bool(self._check())
+
+
+@dataclass(frozen=True)
+class EngineCapabilities:
+    """
+    Limits and features an engine declares to the schedulers.
+
+    A "request" is one translate_stream / translate_batch call. Zero means
+    no limit.
+    """
+    max_items_per_request: int = 50
+    max_chars_per_request: int = 6000
+    max_concurrency: int = 1
+    requests_per_minute: int = 0
+    supports_dedup: bool = False      # Engine dedupes identical items itself
+    streams_results: bool = False     # Results are yielded before the request finishes
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "EngineCapabilities":
+        """Build from a manifest "capabilities" object; unknown keys are ignored."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+    def limit_jobs(self, jobs: int) -> int:
+        """Cap a requested number of concurrent requests."""
+        return min(jobs, self.max_concurrency) if self.max_concurrency else jobs
+
+    def limit_rpm(self, requests_per_minute: int) -> int:
+        """Stricter of a requested requests-per-minute budget and the engine's (0 = unlimited)."""
+        limits = [r for r in (requests_per_minute, self.requests_per_minute) if r]
+        return min(limits) if limits else 0
+
+
+class ITranslationEngineV2(ITranslationEngine):
+    """
+    Interface for translation engines (API version 2).
+
+    Results are streamed: translate_stream yields one {"i", "t"} or
+    {"i", "error"} dict per item as soon as it is ready, so callers can
+    apply rows while the request runs. Cancellation is cooperative: an
+    engine checks cancel_token between items and yields {"i", "error":
+    "Canceled"} for the items it did not start.
+    """
+
+    def capabilities(self, config: Dict[str, Any]) -> EngineCapabilities:
+        """Declared limits; defaults to the manifest's "capabilities" object."""
+        return EngineCapabilities.from_dict(self.manifest.get("capabilities"))
+
+    @abstractmethod
+    def translate_stream(self,
+                         items: List[Dict],
+                         source_lang: str,
+                         target_lang: str,
+                         config: Dict[str, Any],
+                         cancel_token: Any = None,
+                         timeout: int = 30) -> Iterator[Dict]:
+        """
+        Translate items, yielding results as they complete (any order).
+
+        Args:
+            items: [{"i": i, "text": "...", "masked": "..."}]
+            cancel_token: Object with .is_set() method (e.g. threading.Event)
+            timeout: Seconds before giving up.
+
+        Yields:
+            Dict: {"i": i, "t": "..."} or {"i": i, "error": "..."}, once per item
+        """
+        pass
+
+    def translate_batch(self,
+                        items: List[Dict],
+                        source_lang: str,
+                        target_lang: str,
+                        config: Dict[str, Any],
+                        cancel_token: Any = None,
+                        timeout: int = 30) -> List[Dict]:
+        """v1 call: the collected stream."""
+        return list(self.translate_stream(items, source_lang, target_lang, config,
+                                          cancel_token=cancel_token, timeout=timeout))
+
+
+class EngineV1Adapter(ITranslationEngineV2):
+    """
+    Presents a v1 ITranslationEngine as a v2 engine.
+
+    Items are sent in requests of at most max_items_per_request /
+    max_chars_per_request, so results stream per sub-batch and cancellation
+    is checked between them. Capabilities come from the manifest, with a
+    concurrency of 1 unless the plugin declares otherwise.
+    """
+
+    def __init__(self, engine: ITranslationEngine):
+        super().__init__()
+        self.engine = engine
+        self.manifest = engine.manifest
+
+    @property
+    def id(self) -> str:
+        return self.engine.id
+
+    @property
+    def name(self) -> str:
+        return self.engine.name
+
+    @property
+    def version(self) -> str:
+        return self.engine.version
+
+    def on_load(self, context: Any) -> None:
+        self.engine.on_load(context)
+
+    def on_unload(self) -> None:
+        self.engine.on_unload()
+
+    def get_supported_languages(self) -> List[str]:
+        return self.engine.get_supported_languages()
+
+    def is_available(self, config: Dict[str, Any]) -> bool:
+        return self.engine.is_available(config)
+
+    def translate_batch(self, items, source_lang, target_lang, config, cancel_token=None, timeout=30):
+        return self.engine.translate_batch(items, source_lang, target_lang, config,
+                                           cancel_token=cancel_token, timeout=timeout)
+
+    def translate_stream(self, items, source_lang, target_lang, config, cancel_token=None, timeout=30):
+        caps = self.capabilities(config)
+        for start, end in _request_spans(items, caps):
+            if is_canceled(cancel_token):
+                for item in items[start:]:
+                    yield {"i": item["i"], "error": "Canceled"}
+                return
+            request = items[start:end]
+            returned = set()
+            for result in self.engine.translate_batch(request, source_lang, target_lang, config,
+                                                      cancel_token=cancel_token, timeout=timeout):
+                returned.add(result.get("i"))
+                yield result
+            for item in request:
+                if item["i"] not in returned:
+                    yield {"i": item["i"], "error": "Missing result"}
+
+
+def _request_spans(items: List[Dict], caps: EngineCapabilities) -> Iterator[tuple]:
+    """(start, end) slices of `items` within the per-request limits."""
+    start, chars = 0, 0
+    for n, item in enumerate(items):
+        size = len(item.get("masked") or item.get("text") or "")
+        full = (caps.max_items_per_request and n - start >= caps.max_items_per_request) or \
+            (caps.max_chars_per_request and n > start and chars + size > caps.max_chars_per_request)
+        if full:
+            yield start, n
+            start, chars = n, 0
+        chars += size
+    if start < len(items):
+        yield start, len(items)
+
+
+def as_engine_v2(engine: ITranslationEngine) -> ITranslationEngineV2:
+    """The engine itself if it implements v2, else a v1 adapter."""
+    if isinstance(engine, ITranslationEngineV2):
+        return engine
+    return EngineV1Adapter(engine)
@@ -1,6 +1,10 @@
 import sys
 import os
 import argparse
+import multiprocessing
+
+from utils.startup_timing import get_startup_timer
+startup_timer = get_startup_timer()
 
 from renforge_logger import get_logger
 logger = get_logger("main")
@@ -93,6 +97,15 @@ except ImportError as e:
          logger.error(f"Could not show GUI error message: {msg_e}")
     sys.exit(1)
 
+startup_timer.mark("modules_imported")
+
+
+def _on_first_event_loop_turn():
+    """İlk pencere ekrana geldikten sonra başlangıç raporunu yaz."""
+    startup_timer.mark("first_window")
+    startup_timer.log_report(logger)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Interactive Ren'Py script editor with AI support (RenForge).",
@@ -123,16 +136,23 @@ def main():
     args = parser.parse_args()
     
     # Load settings and initialize UI language BEFORE creating GUI
-    initial_settings = load_settings()
-    ui_lang = initial_settings.get("ui_language", config.DEFAULT_UI_LANGUAGE)
-    locales.set_language(ui_lang)
+    with startup_timer.phase("settings"):
+        initial_settings = load_settings()
+        ui_lang = initial_settings.get("ui_language", config.DEFAULT_UI_LANGUAGE)
+        locales.set_language(ui_lang)
     logger.info(f"UI language initialized: {ui_lang}")
     
-    app = QApplication(sys.argv)
+    with startup_timer.phase("qapplication"):
+        app = QApplication(sys.argv)
     
     # Phase 4: Use bootstrap to create controller and view with DI
-    controller, window = bootstrap()
+    with startup_timer.phase("bootstrap"):
+        controller, window = bootstrap()
     logger.info("Bootstrap complete. Controller and View created.")
+    
+    # Yalıtılmış eklentilerin worker süreçleri uygulamayla birlikte kapanır
+    from core.plugin_manager import PluginManager
+    app.aboutToQuit.connect(PluginManager().shutdown)
 
     window.target_language = args.lang
     window.source_language = args.source_lang
@@ -153,8 +173,10 @@ def main():
     window.model_combo.setCurrentText(window.selected_model)
     window.model_combo.blockSignals(False)
 
-    window.show()
+    with startup_timer.phase("window.show"):
+        window.show()
     logger.info("RenForge GUI started.")
+    QTimer.singleShot(0, _on_first_event_loop_turn)
 
     if args.input_file:
         input_path = os.path.abspath(args.input_file) 
@@ -187,5 +209,7 @@ def main():
     sys.exit(exit_code)
 
 if __name__ == "__main__":
+    # Paketlenmiş (frozen) Windows sürümünde eklenti worker süreçleri için gerekli
+    multiprocessing.freeze_support()
     logger.info("Starting RenForge...")
     main()
\ No newline at end of file
@@ -8,8 +8,8 @@ A complete file model with:
 - Encapsulated business logic
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Set, Callable
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Set, Callable, Sequence
 from pathlib import Path
 
 from renforge_enums import ItemType, FileMode, ContextType
@@ -18,12 +18,17 @@ from renforge_logger import get_logger
 logger = get_logger("models.parsed_file")
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedItem:
     """
     Represents a single editable item (dialogue, string, etc.) in the editor.
     Unifies 'Translate' and 'Direct' mode items into a single structure.
 
+    Items are slotted (no per-instance __dict__) since a large project keeps
+    hundreds of thousands of them alive. Text fields start out as references
+    to the same parser string and only diverge when one is reassigned, and
+    the parser interns the reconstruction metadata in `parsed_data`.
+
     Attributes:
         line_index (int): The line number in the file (0-indexed).
         original_text (str): The original source text.
@@ -59,12 +64,11 @@ class ParsedItem:
     
     # Batch translation markers
     batch_marker: Optional[str] = None     # "AI_FAIL" | "AI_WARN" | "OK" | None
-    batch_marker: Optional[str] = None     # "AI_FAIL" | "AI_WARN" | "OK" | None
     batch_tooltip: Optional[str] = None    # Reason text for marker
 
     # QC / Problem Detection (Stage 6)
     qc_flag: bool = False                  # True if any QC issue exists
-    qc_codes: List[str] = field(default_factory=list) # List of issue codes
+    qc_codes: Sequence[str] = ()           # Issue codes (replaced, never mutated)
     qc_summary: Optional[str] = None       # Human readable summary
 
 
@@ -157,9 +161,14 @@ class ParsedFile:
             'modified': [],
             'item_changed': [],
             'items_updated': [],
+            'items_appended': [],
+            'loading_finished': [],
             'breakpoints_changed': [],
         }
         
+        # Streaming load state (see FileController.open_file)
+        self._is_loading = False
+        
         logger.debug(f"ParsedFile created: {Path(file_path).name} ({mode.value}, {len(items)} items)")
 
     # =============================================================================
@@ -194,6 +203,11 @@ class ParsedFile:
     def output_path(self, value: str):
         self._output_path = value
     
+    @property
+    def is_loading(self) -> bool:
+        """True while items are still being streamed in from disk."""
+        return self._is_loading
+    
     @property
     def item_index(self) -> int:
         return self._item_index
@@ -247,7 +261,8 @@ class ParsedFile:
         Subscribe to an event.
         
         Args:
-            event: Event name ('modified', 'item_changed', 'items_updated', 'breakpoints_changed')
+            event: Event name ('modified', 'item_changed', 'items_updated',
+                   'items_appended', 'loading_finished', 'breakpoints_changed')
             callback: Function to call when event occurs
         """
         if event in self._observers:
@@ -302,6 +317,33 @@ class ParsedFile:
             return True
         return False
     
+    def begin_loading(self):
+        """Mark the file as partially loaded; items will be appended."""
+        self._is_loading = True
+    
+    def append_items(self, items: List[ParsedItem]) -> int:
+        """
+        Append items produced by a streaming parse.
+        
+        Args:
+            items: New items, in file order
+            
+        Returns:
+            Index of the first appended item
+        """
+        start = len(self._items)
+        if items:
+            self._items.extend(items)
+            self._notify('items_appended', start, len(items))
+        return start
+    
+    def finish_loading(self):
+        """Mark the streaming load as complete and notify subscribers."""
+        if self._is_loading:
+            self._is_loading = False
+            logger.debug(f"ParsedFile loaded: {self.filename} ({len(self._items)} items)")
+            self._notify('loading_finished')
+    
     def set_item_error(self, index: int, message: str) -> bool:
         """
         Mark an item as having an error.
@@ -67,6 +67,9 @@ class SettingsModel:
     # Translation Memory (Stage 16.1)
     KEY_TM_ENABLED = "tm_enabled"  # bool - enable TM lookup
     KEY_TM_AUTO_APPLY_EXACT = "tm_auto_apply_exact"  # bool - auto-apply exact matches
+    KEY_TM_FUZZY_ENABLED = "tm_fuzzy_enabled"  # bool - similarity-based TM lookup
+    KEY_TM_FUZZY_THRESHOLD = "tm_fuzzy_threshold"  # float 0..1 - min score for suggestions/examples
+    KEY_TM_FUZZY_AUTO_APPLY_SCORE = "tm_fuzzy_auto_apply_score"  # float 0..1 - min score to apply
     
     # Glossary (Stage 16.2)
     KEY_GLOSSARY_ENABLED = "glossary_enabled"  # bool - enable glossary checks
@@ -138,6 +141,9 @@ class SettingsModel:
             # Translation Memory (Stage 16.1)
             self.KEY_TM_ENABLED: True,
             self.KEY_TM_AUTO_APPLY_EXACT: True,
+            self.KEY_TM_FUZZY_ENABLED: True,
+            self.KEY_TM_FUZZY_THRESHOLD: config.TM_FUZZY_MIN_SCORE,
+            self.KEY_TM_FUZZY_AUTO_APPLY_SCORE: config.TM_FUZZY_AUTO_APPLY_SCORE,
             # Glossary (Stage 16.2)
             self.KEY_GLOSSARY_ENABLED: True,
             self.KEY_GLOSSARY_MODE: "qc_only",
@@ -535,6 +541,33 @@ class SettingsModel:
     def tm_auto_apply_exact(self, value: bool):
         self.set(self.KEY_TM_AUTO_APPLY_EXACT, value)
     
+    @property
+    def tm_fuzzy_enabled(self) -> bool:
+        """Is similarity-based (fuzzy) TM lookup enabled?"""
+        return self._settings.get(self.KEY_TM_FUZZY_ENABLED, True)
+    
+    @tm_fuzzy_enabled.setter
+    def tm_fuzzy_enabled(self, value: bool):
+        self.set(self.KEY_TM_FUZZY_ENABLED, value)
+    
+    @property
+    def tm_fuzzy_threshold(self) -> float:
+        """Minimum similarity for fuzzy suggestions and prompt examples."""
+        return float(self._settings.get(self.KEY_TM_FUZZY_THRESHOLD, config.TM_FUZZY_MIN_SCORE))
+    
+    @tm_fuzzy_threshold.setter
+    def tm_fuzzy_threshold(self, value: float):
+        self.set(self.KEY_TM_FUZZY_THRESHOLD, max(0.0, min(1.0, float(value))))
+    
+    @property
+    def tm_fuzzy_auto_apply_score(self) -> float:
+        """Fuzzy matches at or above this score are applied without the provider."""
+        return float(self._settings.get(self.KEY_TM_FUZZY_AUTO_APPLY_SCORE, config.TM_FUZZY_AUTO_APPLY_SCORE))
+    
+    @tm_fuzzy_auto_apply_score.setter
+    def tm_fuzzy_auto_apply_score(self, value: float):
+        self.set(self.KEY_TM_FUZZY_AUTO_APPLY_SCORE, max(0.0, min(1.0, float(value))))
+    
     # =========================================================================
     # GLOSSARY (Stage 16.2)
     # =========================================================================
@@ -10,6 +10,8 @@ from parser.base import BaseParser, ParserStrategy
 from parser.translate_parser import TranslateParser
 from parser.direct_parser import DirectParser
 from parser.patterns import RenpyPatterns
+from parser.line_classifier import LineKind, ClassifiedLine, classify_line
+from parser.engine import ParseResult, ParseStream, parse_lines, detect_mode
 
 # Re-export main parsing functions for backward compatibility
 from parser.core import (
@@ -25,6 +27,13 @@ __all__ = [
     'TranslateParser',
     'DirectParser',
     'RenpyPatterns',
+    'LineKind',
+    'ClassifiedLine',
+    'classify_line',
+    'ParseResult',
+    'ParseStream',
+    'parse_lines',
+    'detect_mode',
     'parse_file',
     'parse_translate_mode',
     'parse_direct_mode',
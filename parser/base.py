@@ -5,6 +5,7 @@ Base Parser Classes
 Abstract base classes and Strategy pattern interfaces for parsing.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Any, Protocol
 from dataclasses import dataclass
@@ -12,9 +13,17 @@ from dataclasses import dataclass
 from renforge_logger import get_logger
 from renforge_enums import ContextType, ItemType
 from models.parsed_file import ParsedItem
+from parser.line_classifier import ClassifiedLine
 
 logger = get_logger("parser.base")
 
+# Reconstruction metadata that repeats across thousands of items
+# (indentation, character prefixes, "with dissolve" suffixes, rule names).
+INTERNED_METADATA_KEYS = (
+    'indent', 'prefix', 'suffix', 'character', 'character_tag',
+    'modifiers', 'keyword', 'reconstruction_rule',
+)
+
 
 class ParserStrategy(Protocol):
     """
@@ -71,6 +80,21 @@ class BaseParser(ABC):
         """Check if this parser can handle the content."""
         pass
     
+    @abstractmethod
+    def _process_line(self, line_index: int, line: str, classified: ClassifiedLine):
+        """Process a single line already classified by `classify_line`."""
+        pass
+    
+    @property
+    def items(self) -> List[ParsedItem]:
+        """Items produced so far."""
+        return self._items
+    
+    @property
+    def detected_language(self) -> Optional[str]:
+        """Detected language code (only translate files carry one)."""
+        return None
+    
     def _get_indentation(self, line: str) -> int:
         """Get the number of leading spaces."""
         return len(line) - len(line.lstrip(' '))
@@ -109,7 +133,16 @@ class BaseParser(ABC):
         context: ContextType,
         parsed_data: dict
     ) -> ParsedItem:
-        """Create a ParsedItem with standard fields."""
+        """
+        Create a ParsedItem with standard fields.
+
+        Short metadata strings are interned so that items share one copy
+        instead of each holding its own slice of the source line.
+        """
+        for key in INTERNED_METADATA_KEYS:
+            value = parsed_data.get(key)
+            if value.__class__ is str:
+                parsed_data[key] = sys.intern(value)
         return ParsedItem(
             line_index=line_index,
             original_text=original_text,
@@ -14,6 +14,7 @@ from renforge_models import ParsedItem
 from parser.translate_parser import TranslateParser
 from parser.direct_parser import DirectParser
 from parser.patterns import RenpyPatterns
+from parser.engine import parse_lines
 
 logger = get_logger("parser.core")
 
@@ -23,7 +24,7 @@ def parse_file(lines: List[str], mode: Optional[str] = None) -> Tuple[List[Parse
     Parse a Ren'Py file.
     
     Automatically detects the appropriate parser based on content,
-    or uses the specified mode.
+    or uses the specified mode. Detection and parsing share one pass.
     
     Args:
         lines: List of file lines
@@ -32,19 +33,8 @@ def parse_file(lines: List[str], mode: Optional[str] = None) -> Tuple[List[Parse
     Returns:
         Tuple of (parsed items, detected language code or None)
     """
-    if mode == "translate":
-        parser = TranslateParser()
-    elif mode == "direct":
-        parser = DirectParser()
-    else:
-        # Auto-detect
-        translate_parser = TranslateParser()
-        if translate_parser.can_parse(lines):
-            parser = translate_parser
-        else:
-            parser = DirectParser()
-    
-    return parser.parse(lines)
+    result = parse_lines(lines, mode)
+    return result.items, result.language
 
 
 def parse_translate_mode(lines: List[str]) -> Tuple[List[ParsedItem], Optional[str]]:
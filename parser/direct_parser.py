@@ -12,6 +12,7 @@ from renforge_enums import ContextType, ItemType
 from models.parsed_file import ParsedItem
 from parser.base import BaseParser
 from parser.patterns import RenpyPatterns
+from parser.line_classifier import ClassifiedLine, LineKind, classify_line
 
 logger = get_logger("parser.direct")
 
@@ -24,6 +25,15 @@ NON_TEXT_KEYWORDS = {
     'if', 'while', 'for', 'pass', 'add'
 }
 
+# Leading keywords (case-folded) that can start a screen text element
+SCREEN_TEXT_KEYWORDS = {'text', 'button', 'textbutton'}
+
+# Line kinds that open a new parsing context
+CONTEXT_KINDS = frozenset({
+    LineKind.LABEL_START, LineKind.SCREEN_START,
+    LineKind.MENU_START, LineKind.PYTHON_START,
+})
+
 
 class DirectParser(BaseParser):
     """
@@ -59,61 +69,69 @@ class DirectParser(BaseParser):
         self.reset()
         
         for i, line in enumerate(lines):
-            self._process_line(i, line, lines)
+            self._process_line(i, line, classify_line(line))
         
         logger.debug(f"Parsed {len(self._items)} items in direct mode")
         return self._items, None
     
-    def _process_line(self, line_index: int, line: str, all_lines: List[str]):
-        """Process a single line."""
-        stripped = line.strip()
-        indent = self._get_indentation(line)
+    def _process_line(self, line_index: int, line: str, classified: ClassifiedLine):
+        """Process a single pre-classified line."""
+        kind = classified.kind
         
         # Skip empty lines and comments
-        if not stripped or stripped.startswith('#'):
+        if kind == LineKind.BLANK or kind == LineKind.COMMENT:
             return
         
-        # Update context based on block starts
-        self._update_context(stripped, indent)
+        stripped = classified.stripped
         
-        # Skip non-text keywords
-        first_word = stripped.split()[0] if stripped.split() else ''
-        if first_word.lower() in NON_TEXT_KEYWORDS:
-            return
+        # Indentation only matters for block starts and leaving a menu
+        if kind in CONTEXT_KINDS or self._in_menu:
+            indent = self._get_indentation(line)
+            self._update_context(kind, indent)
+        else:
+            indent = None
         
         # Try to match text patterns
-        if self._try_menu_choice(line_index, line, stripped, indent):
+        if kind == LineKind.QUOTED:
+            if self._try_menu_choice(line_index, line, stripped, indent):
+                return
+            self._try_narration(line_index, line, stripped, indent)
             return
-
-        if self._try_dialogue(line_index, line, stripped, indent):
+        
+        if kind not in LineKind.WORD_KINDS:
             return
         
-        if self._try_narration(line_index, line, stripped, indent):
+        # Skip non-text keywords
+        first_word = stripped.split(None, 1)[0]
+        if first_word.lower() in NON_TEXT_KEYWORDS:
+            return
+
+        if self._try_dialogue(line_index, line, stripped, indent):
             return
         
-        if self._current_context == ContextType.SCREEN:
+        if self._current_context == ContextType.SCREEN and classified.keyword in SCREEN_TEXT_KEYWORDS:
             self._try_screen_text(line_index, line, stripped, indent)
     
-    def _update_context(self, stripped: str, indent: int):
-        """Update current context based on line content."""
+    def _update_context(self, kind: int, indent: int):
+        """Update current context based on the classified line kind."""
         # Check for context block starts
-        if RenpyPatterns.LABEL_START.match(stripped):
+        if kind == LineKind.LABEL_START:
             self._current_context = ContextType.LABEL
             self._current_indent = indent
             return
         
-        if RenpyPatterns.SCREEN_START.match(stripped):
+        if kind == LineKind.SCREEN_START:
             self._current_context = ContextType.SCREEN
             self._current_indent = indent
             return
         
-        if RenpyPatterns.MENU_START.match(stripped):
+        if kind == LineKind.MENU_START:
             self._in_menu = True
             self._menu_indent = indent
             self._current_context = ContextType.MENU
             return
         
-        if RenpyPatterns.PYTHON_START.match(stripped):
+        if kind == LineKind.PYTHON_START:
             self._current_context = ContextType.PYTHON
             self._current_indent = indent
             return
@@ -122,7 +140,7 @@ class DirectParser(BaseParser):
         if self._in_menu and indent <= self._menu_indent:
             self._in_menu = False
     
-    def _try_dialogue(self, line_index: int, line: str, stripped: str, indent: int) -> bool:
+    def _try_dialogue(self, line_index: int, line: str, stripped: str, indent: Optional[int]) -> bool:
         """Try to match dialogue pattern."""
         match = RenpyPatterns.DIALOGUE.match(line)
         if match:
@@ -151,7 +169,7 @@ class DirectParser(BaseParser):
             return True
         return False
     
-    def _try_narration(self, line_index: int, line: str, stripped: str, indent: int) -> bool:
+    def _try_narration(self, line_index: int, line: str, stripped: str, indent: Optional[int]) -> bool:
         """Try to match narration pattern."""
         match = RenpyPatterns.NARRATION.match(line)
         if match:
@@ -175,7 +193,7 @@ class DirectParser(BaseParser):
             return True
         return False
     
-    def _try_menu_choice(self, line_index: int, line: str, stripped: str, indent: int) -> bool:
+    def _try_menu_choice(self, line_index: int, line: str, stripped: str, indent: Optional[int]) -> bool:
         """Try to match menu choice pattern."""
         if not self._in_menu:
             return False
@@ -202,7 +220,7 @@ class DirectParser(BaseParser):
             return True
         return False
     
-    def _try_screen_text(self, line_index: int, line: str, stripped: str, indent: int):
+    def _try_screen_text(self, line_index: int, line: str, stripped: str, indent: Optional[int]):
         """Try to match screen text elements."""
         # Try screen text statement
         match = RenpyPatterns.SCREEN_TEXT_STMT.match(line)
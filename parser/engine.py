@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Single-Pass Parser Engine
+
+Classifies every line exactly once, detects the file mode from the first
+lines of that same pass and feeds the classified lines straight into the
+matching parser. Replaces the old "detect, then parse again" flow.
+
+`parse_lines` returns everything at once; `ParseStream` yields items
+incrementally from any line iterator (e.g. an open file).
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from renforge_logger import get_logger
+from renforge_enums import FileMode
+from models.parsed_file import ParsedItem
+from parser.base import BaseParser
+from parser.translate_parser import TranslateParser
+from parser.direct_parser import DirectParser
+from parser.line_classifier import ClassifiedLine, LineKind, classify_line
+
+logger = get_logger("parser.engine")
+
+# Number of leading lines inspected for a translate block (matches can_parse)
+DETECTION_WINDOW = 100
+
+
+@dataclass
+class ParseResult:
+    """Outcome of a single-pass parse."""
+    items: List[ParsedItem]
+    language: Optional[str]
+    mode: FileMode
+
+
+def _create_parser(mode: FileMode) -> BaseParser:
+    return TranslateParser() if mode == FileMode.TRANSLATE else DirectParser()
+
+
+def _coerce_mode(mode: Union[str, FileMode, None]) -> Optional[FileMode]:
+    if mode is None:
+        return None
+    try:
+        return FileMode(mode)
+    except ValueError:
+        logger.warning(f"Unknown parse mode '{mode}', auto-detecting")
+        return None
+
+
+def detect_mode(lines: Iterable[str]) -> FileMode:
+    """
+    Detect the file mode from the leading lines.
+
+    Args:
+        lines: File lines (only the first DETECTION_WINDOW are read)
+
+    Returns:
+        FileMode.TRANSLATE if a translate block starts early, else DIRECT
+    """
+    for i, line in enumerate(lines):
+        if i >= DETECTION_WINDOW:
+            break
+        if classify_line(line).kind == LineKind.TRANSLATE_START:
+            return FileMode.TRANSLATE
+    return FileMode.DIRECT
+
+
+def _start_parser(
+    line_iter: Iterator[Tuple[int, str]],
+    mode: Optional[FileMode]
+) -> Tuple[BaseParser, List[Tuple[int, str, ClassifiedLine]]]:
+    """
+    Create the parser for `mode`, detecting it from `line_iter` if None.
+
+    While the mode is unknown, classified lines are buffered (at most
+    DETECTION_WINDOW of them) and returned so the caller can replay them
+    into the parser without classifying them again.
+    """
+    pending: List[Tuple[int, str, ClassifiedLine]] = []
+
+    if mode is None:
+        mode = FileMode.DIRECT
+        for i, line in line_iter:
+            classified = classify_line(line)
+            pending.append((i, line, classified))
+            if classified.kind == LineKind.TRANSLATE_START:
+                mode = FileMode.TRANSLATE
+                break
+            if len(pending) >= DETECTION_WINDOW:
+                break
+
+    parser = _create_parser(mode)
+    parser.reset()
+    return parser, pending
+
+
+def parse_lines(
+    lines: Iterable[str],
+    mode: Union[str, FileMode, None] = None
+) -> ParseResult:
+    """
+    Parse lines in one pass, detecting the mode on the fly if not given.
+
+    Args:
+        lines: Any iterable of file lines
+        mode: 'translate', 'direct', a FileMode, or None to auto-detect
+
+    Returns:
+        ParseResult with items, detected language and the mode used
+    """
+    line_iter = enumerate(lines)
+    parser, pending = _start_parser(line_iter, _coerce_mode(mode))
+    process = parser._process_line
+
+    for i, line, classified in pending:
+        process(i, line, classified)
+    for i, line in line_iter:
+        process(i, line, classify_line(line))
+
+    file_mode = _parser_mode(parser)
+    items = parser.items
+    logger.debug(f"Single-pass parse: {len(items)} items ({file_mode.value})")
+    return ParseResult(items=items, language=parser.detected_language, mode=file_mode)
+
+
+def _parser_mode(parser: BaseParser) -> FileMode:
+    return FileMode.TRANSLATE if isinstance(parser, TranslateParser) else FileMode.DIRECT
+
+
+class ParseStream:
+    """
+    Incremental single-pass parse over any line iterable.
+
+    Items are yielded as soon as the line that completes them has been read,
+    so callers can show the first rows of a multi-megabyte script while the
+    rest is still being parsed. Lines are pulled from the source lazily; a
+    file object or generator is never materialized by the stream itself.
+
+    Usage:
+        stream = ParseStream(iter_source_lines(path, breakpoints))
+        first_screen = stream.take(200)
+        for item in stream:   # remaining items
+            ...
+    """
+
+    def __init__(self, lines: Iterable[str], mode: Union[str, FileMode, None] = None):
+        self._source = lines
+        self._line_iter = enumerate(lines)
+        self._requested_mode = _coerce_mode(mode)
+        self._parser: Optional[BaseParser] = None
+        self._items_read = 0
+        self._exhausted = False
+        self._generator = self._generate()
+
+    @property
+    def mode(self) -> Optional[FileMode]:
+        """Mode in use, or None until the first item/line batch was pulled."""
+        return _parser_mode(self._parser) if self._parser else self._requested_mode
+
+    @property
+    def language(self) -> Optional[str]:
+        """Language of the first translate block seen so far."""
+        return self._parser.detected_language if self._parser else None
+
+    @property
+    def items_read(self) -> int:
+        """Number of items yielded so far."""
+        return self._items_read
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the source has been fully parsed."""
+        return self._exhausted
+
+    def __iter__(self) -> Iterator[ParsedItem]:
+        return self
+
+    def __next__(self) -> ParsedItem:
+        return next(self._generator)
+
+    def take(self, count: int) -> List[ParsedItem]:
+        """Pull up to `count` items (fewer only when the source is exhausted)."""
+        return list(islice(self._generator, count))
+
+    def close(self):
+        """Stop parsing and release the line source (e.g. an open file)."""
+        self._generator.close()
+        close_source = getattr(self._source, 'close', None)
+        if close_source is not None:
+            close_source()
+
+    def _generate(self) -> Iterator[ParsedItem]:
+        parser, pending = _start_parser(self._line_iter, self._requested_mode)
+        self._parser = parser
+        process = parser._process_line
+        # The parser appends to this list; drain it after every line so the
+        # stream never holds more than one line's worth of items.
+        produced = parser.items
+
+        for i, line, classified in pending:
+            process(i, line, classified)
+        for i, line in self._line_iter:
+            if produced:
+                self._items_read += len(produced)
+                yield from produced
+                produced.clear()
+            process(i, line, classify_line(line))
+
+        if produced:
+            self._items_read += len(produced)
+            yield from produced
+            produced.clear()
+        self._exhausted = True
+        logger.debug(f"Streaming parse finished: {self._items_read} items ({self.mode.value})")
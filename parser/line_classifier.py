@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Single-Pass Line Classifier
+
+Classifies a Ren'Py source line in one step using a first-character /
+leading-keyword dispatch table, so the parsers only run the one
+`RenpyPatterns` regex that can possibly match instead of trying every
+pattern in sequence.
+"""
+
+import re
+from typing import NamedTuple, Optional, Match
+
+from parser.patterns import RenpyPatterns
+
+
+class LineKind:
+    """
+    Line categories produced by `classify_line`.
+
+    Keyword kinds (TRANSLATE_START .. PYTHON_START) are only reported when the
+    corresponding `RenpyPatterns` regex actually matched; the match object is
+    returned alongside so callers never re-run it.
+    """
+    BLANK = 0
+    COMMENT = 1
+    QUOTED = 2            # Line starts with '"' (narration / menu choice)
+    WORD = 3              # Line starts with an identifier (dialogue, statements)
+    OTHER = 4             # Anything else ($ statements, punctuation, ...)
+    TRANSLATE_START = 5
+    TRANSLATE_OLD = 6
+    TRANSLATE_NEW = 7
+    LABEL_START = 8
+    SCREEN_START = 9
+    MENU_START = 10
+    PYTHON_START = 11
+
+    # Kinds whose line begins with an identifier
+    WORD_KINDS = frozenset({
+        WORD, TRANSLATE_START, TRANSLATE_OLD, TRANSLATE_NEW,
+        LABEL_START, SCREEN_START, MENU_START, PYTHON_START,
+    })
+
+
+class ClassifiedLine(NamedTuple):
+    """Result of classifying one line."""
+    kind: int
+    stripped: str
+    keyword: str                  # Known leading keyword, case-folded ('' if none)
+    match: Optional[Match]        # Match of the keyword pattern, if any
+
+
+# Leading identifier of a stripped line
+_LEADING_WORD = re.compile(r'\w+')
+
+# Keyword -> (kind, pattern) dispatch table. Patterns are only tried when the
+# leading identifier equals the keyword, which is a necessary condition for
+# every one of them to match. Keywords without a pattern are only recorded.
+_KEYWORD_TABLE = {
+    'translate': (LineKind.TRANSLATE_START, RenpyPatterns.TRANSLATE_START),
+    'old': (LineKind.TRANSLATE_OLD, RenpyPatterns.TRANSLATE_OLD),
+    'new': (LineKind.TRANSLATE_NEW, RenpyPatterns.TRANSLATE_NEW),
+    'label': (LineKind.LABEL_START, RenpyPatterns.LABEL_START),
+    'screen': (LineKind.SCREEN_START, RenpyPatterns.SCREEN_START),
+    'menu': (LineKind.MENU_START, RenpyPatterns.MENU_START),
+    'python': (LineKind.PYTHON_START, RenpyPatterns.PYTHON_START),
+    'init': (LineKind.PYTHON_START, RenpyPatterns.PYTHON_START),
+    'text': (LineKind.WORD, None),
+    'button': (LineKind.WORD, None),
+    'textbutton': (LineKind.WORD, None),
+}
+
+# ASCII first characters that can start a keyword. Lines starting with any
+# other ASCII character skip the keyword lookup entirely; non-ASCII heads
+# always take the slow path so case-insensitive matching stays exact.
+_KEYWORD_HEADS = frozenset(
+    c for key in _KEYWORD_TABLE for c in (key[0], key[0].upper())
+)
+
+_BLANK = ClassifiedLine(LineKind.BLANK, '', '', None)
+
+
+def classify_line(line: str) -> ClassifiedLine:
+    """
+    Classify a single line.
+
+    Args:
+        line: Raw line (without newline)
+
+    Returns:
+        ClassifiedLine with kind, stripped text, leading keyword and match
+    """
+    stripped = line.strip()
+    if not stripped:
+        return _BLANK
+
+    head = stripped[0]
+    if head == '#':
+        return ClassifiedLine(LineKind.COMMENT, stripped, '', None)
+    if head == '"':
+        return ClassifiedLine(LineKind.QUOTED, stripped, '', None)
+
+    if head.isascii():
+        if not (head.isalnum() or head == '_'):
+            return ClassifiedLine(LineKind.OTHER, stripped, '', None)
+        if head not in _KEYWORD_HEADS:
+            return ClassifiedLine(LineKind.WORD, stripped, '', None)
+
+    word = _LEADING_WORD.match(stripped)
+    if word is None:
+        return ClassifiedLine(LineKind.OTHER, stripped, '', None)
+
+    # casefold() mirrors re.IGNORECASE on the keyword patterns
+    keyword = word.group(0).casefold()
+    entry = _KEYWORD_TABLE.get(keyword)
+    if entry is None:
+        return ClassifiedLine(LineKind.WORD, stripped, '', None)
+
+    kind, pattern = entry
+    if pattern is not None:
+        match = pattern.match(line)
+        if match:
+            return ClassifiedLine(kind, stripped, keyword, match)
+    return ClassifiedLine(LineKind.WORD, stripped, keyword, None)
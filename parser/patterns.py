@@ -16,6 +16,10 @@ class RenpyPatterns:
     - Context detection (screen, label, translate, etc.)
     - Text extraction (dialogue, narration, menu choices)
     - Translation mode specific (old/new pairs)
+    
+    Quoted strings use the "unrolled loop" form `[^"\\]*(?:\\.[^"\\]*)*`,
+    which matches exactly what `(?:\\.|[^"\\])*` does but scans plain runs
+    of characters without per-character backtracking state.
     """
     
     # =========================================================================
@@ -37,26 +41,26 @@ class RenpyPatterns:
     # =========================================================================
     
     # Dialogue: "character [modifiers] 'text'"
-    DIALOGUE = re.compile(r'^(\s*)([a-zA-Z0-9_]+)((?:\s+[a-zA-Z0-9_]+)*)?(?:\s+([a-z]+))?\s+"((?:\\.|[^"\\])*)"(.*)$')
-    DIALOGUE_COMMENT = re.compile(r'^([a-zA-Z0-9_]+)((?:\s+[a-zA-Z0-9_]+)*)?(?:\s+([a-z]+))?\s+"((?:\\.|[^"\\])*)"(.*)$')
+    DIALOGUE = re.compile(r'^(\s*)([a-zA-Z0-9_]+)((?:\s+[a-zA-Z0-9_]+)*)?(?:\s+([a-z]+))?\s+"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
+    DIALOGUE_COMMENT = re.compile(r'^([a-zA-Z0-9_]+)((?:\s+[a-zA-Z0-9_]+)*)?(?:\s+([a-z]+))?\s+"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
     
     # Narration: standalone quoted text
-    NARRATION = re.compile(r'^(\s*)"((?:\\.|[^"\\])*)"(.*)$')
-    NARRATION_COMMENT = re.compile(r'^"((?:\\.|[^"\\])*)"(.*)$')
+    NARRATION = re.compile(r'^(\s*)"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
+    NARRATION_COMMENT = re.compile(r'^"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
     
     # Menu choice: "text":
-    MENU_CHOICE = re.compile(r'^(\s*)"((?:\\.|[^"\\])*)"(\s*:.*)$')
+    MENU_CHOICE = re.compile(r'^(\s*)"([^"\\]*(?:\\.[^"\\]*)*)"(\s*:.*)$')
     
     # Variable assignment: $ var = "text"
-    VAR_ASSIGN_DOLLAR = re.compile(r'^(\s*)\$\s+([a-zA-Z_]\w*)\s*=\s*"((?:\\.|[^"\\])*)"(.*)$')
-    VAR_ASSIGN_PYTHON = re.compile(r'^(\s*)([a-zA-Z_]\w*)\s*=\s*"((?:\\.|[^"\\])*)"(.*)$')
+    VAR_ASSIGN_DOLLAR = re.compile(r'^(\s*)\$\s+([a-zA-Z_]\w*)\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
+    VAR_ASSIGN_PYTHON = re.compile(r'^(\s*)([a-zA-Z_]\w*)\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
     
     # =========================================================================
     # SCREEN-SPECIFIC PATTERNS
     # =========================================================================
     
     # Screen text elements
-    _TEXT_PATTERN = r'(?:\_\(\s*"((?:\\.|[^"\\])*)"\s*\)|"((?:\\.|[^"\\])*)")'
+    _TEXT_PATTERN = r'(?:\_\(\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*\)|"([^"\\]*(?:\\.[^"\\]*)*)")'
     
     SCREEN_TEXT_STMT = re.compile(r'^(\s*)(text)\s+' + _TEXT_PATTERN + r'(.*)$', re.IGNORECASE)
     SCREEN_BUTTON = re.compile(r'^(\s*)(button|textbutton)\s+' + _TEXT_PATTERN + r'(.*)$', re.IGNORECASE)
@@ -75,9 +79,9 @@ class RenpyPatterns:
         r'^(\s*)'
         r'(?:(text|button|textbutton|label)\s+)?'
         r'(?:'
-            r'"((?:\\.|[^"\\])*)"'
+            r'"([^"\\]*(?:\\.[^"\\]*)*)"'
           r'|'
-            r'_\("((?:\\.|[^"\\])*)"\)'
+            r'_\("([^"\\]*(?:\\.[^"\\]*)*)"\)'
         r')'
         r'(.*)$'
     )
@@ -86,8 +90,8 @@ class RenpyPatterns:
     # TRANSLATE MODE PATTERNS
     # =========================================================================
     
-    TRANSLATE_OLD = re.compile(r'^(\s*)old\s+"((?:\\.|[^"\\])*)"(.*)$')
-    TRANSLATE_NEW = re.compile(r'^(\s*)new\s+"((?:\\.|[^"\\])*)"(.*)$')
+    TRANSLATE_OLD = re.compile(r'^(\s*)old\s+"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
+    TRANSLATE_NEW = re.compile(r'^(\s*)new\s+"([^"\\]*(?:\\.[^"\\]*)*)"(.*)$')
     TRANSLATE_COMMENT = re.compile(r'^(\s*)#\s?(.*)')
     
     # =========================================================================
@@ -12,6 +12,7 @@ from renforge_enums import ContextType, ItemType
 from models.parsed_file import ParsedItem
 from parser.base import BaseParser
 from parser.patterns import RenpyPatterns
+from parser.line_classifier import ClassifiedLine, LineKind, classify_line
 
 logger = get_logger("parser.translate")
 
@@ -57,23 +58,27 @@ class TranslateParser(BaseParser):
         self.reset()
         
         for i, line in enumerate(lines):
-            self._process_line(i, line)
+            self._process_line(i, line, classify_line(line))
         
         logger.debug(f"Parsed {len(self._items)} items, language: {self._detected_language}")
         return self._items, self._detected_language
     
-    def _process_line(self, line_index: int, line: str):
-        """Process a single line."""
-        stripped = line.strip()
+    @property
+    def detected_language(self) -> Optional[str]:
+        """Language code of the first translate block seen so far."""
+        return self._detected_language
+    
+    def _process_line(self, line_index: int, line: str, classified: ClassifiedLine):
+        """Process a single pre-classified line."""
+        kind = classified.kind
         
         # Skip empty lines
-        if not stripped:
+        if kind == LineKind.BLANK:
             return
         
         # Check for translate block start
-        match = RenpyPatterns.TRANSLATE_START.match(stripped)
-        if match:
-            lang_code = match.group(1)
+        if kind == LineKind.TRANSLATE_START:
+            lang_code = classified.match.group(1)
             if not self._detected_language:
                 self._detected_language = lang_code
             self._current_context = ContextType.TRANSLATE
@@ -84,15 +89,14 @@ class TranslateParser(BaseParser):
         # =================================
         
         # Handle old line
-        match = RenpyPatterns.TRANSLATE_OLD.match(line)
-        if match:
-            self._pending_old_text = match.group(2)
+        if kind == LineKind.TRANSLATE_OLD:
+            self._pending_old_text = classified.match.group(2)
             self._pending_old_line = line_index
             return
         
         # Handle new line - pair with pending old
-        match = RenpyPatterns.TRANSLATE_NEW.match(line)
-        if match:
+        if kind == LineKind.TRANSLATE_NEW:
+            match = classified.match
             new_text = match.group(2)
             indent = match.group(1)
             suffix = match.group(3)
@@ -127,8 +131,8 @@ class TranslateParser(BaseParser):
         
         # Handle comment line with dialogue (original text)
         # Format: #   character_id "text" or # "text"
-        if stripped.startswith('#'):
-            comment_content = stripped[1:].lstrip()
+        if kind == LineKind.COMMENT:
+            comment_content = classified.stripped[1:].lstrip()
             
             # Try to extract text from comment
             original_text = self._extract_text_from_comment(comment_content)
@@ -141,7 +145,7 @@ class TranslateParser(BaseParser):
         # Format:     character_id "text" or "text"
         if self._pending_original_from_comment is not None:
             # Extract text AND character info
-            extraction_result = self._extract_data_from_dialogue(line)
+            extraction_result = self._extract_data_from_dialogue(line, kind)
             
             if extraction_result:
                 translated_text, char_str = extraction_result
@@ -169,24 +173,35 @@ class TranslateParser(BaseParser):
     
     def _extract_text_from_comment(self, content: str) -> Optional[str]:
         """Extract quoted text from a comment line."""
-        # Try dialogue pattern: character_id [modifiers] "text"
+        if not content:
+            return None
+        
+        # Narration pattern: "text"
+        if content[0] == '"':
+            match = RenpyPatterns.NARRATION_COMMENT.match(content)
+            return match.group(1) if match else None
+        
+        # Dialogue pattern: character_id [modifiers] "text"
         match = RenpyPatterns.DIALOGUE_COMMENT.match(content)
         if match:
             return match.group(4)
         
-        # Try narration pattern: "text"
-        match = RenpyPatterns.NARRATION_COMMENT.match(content)
-        if match:
-            return match.group(1)
-        
         return None
     
-    def _extract_data_from_dialogue(self, line: str) -> Optional[Tuple[str, str]]:
+    def _extract_data_from_dialogue(self, line: str, kind: int) -> Optional[Tuple[str, str]]:
         """
         Extract text and character from a dialogue line.
         Returns: (text, character_string) or None
         """
-        # Try dialogue pattern
+        # Narration pattern
+        if kind == LineKind.QUOTED:
+            match = RenpyPatterns.NARRATION.match(line)
+            return (match.group(2), "") if match else None
+        
+        if kind not in LineKind.WORD_KINDS:
+            return None
+        
+        # Dialogue pattern
         match = RenpyPatterns.DIALOGUE.match(line)
         if match:
             text = match.group(5)
@@ -205,11 +220,6 @@ class TranslateParser(BaseParser):
                  char_full = char
             return text, char_full if char_full else ""
         
-        # Try narration pattern
-        match = RenpyPatterns.NARRATION.match(line)
-        if match:
-            return match.group(2), ""
-        
         return None
     
     def reset(self):
@@ -1,8 +1,8 @@
 
-from typing import Dict, Any, List
-from interfaces.i_plugin import ITranslationEngine
+from typing import Dict, Any, Iterator, List
+from interfaces.i_plugin import EngineCapabilities, ITranslationEngineV2, is_canceled
 
-class DummyEngine(ITranslationEngine):
+class DummyEngine(ITranslationEngineV2):
     
     def on_load(self, context: Any) -> None:
         pass
@@ -15,29 +15,39 @@ class DummyEngine(ITranslationEngine):
             {"key": "prefix", "label": "Prefix", "type": "text", "default": "[TEST] "}
         ]
 
-    def translate_batch(self, 
-                        items: List[Dict], 
-                        source_lang: str, 
-                        target_lang: str, 
-                        config: Dict[str, Any],
-                        cancel_token: Any = None,
-                        timeout: int = 30) -> List[Dict]:
+    def capabilities(self, config: Dict[str, Any]) -> EngineCapabilities:
+        # Local and instant: large requests, no rate limit
+        return EngineCapabilities(
+            max_items_per_request=500,
+            max_chars_per_request=0,
+            max_concurrency=8,
+            supports_dedup=True,
+            streams_results=True,
+        )
+
+    def translate_stream(self, 
+                         items: List[Dict], 
+                         source_lang: str, 
+                         target_lang: str, 
+                         config: Dict[str, Any],
+                         cancel_token: Any = None,
+                         timeout: int = 30) -> Iterator[Dict]:
         
         prefix = config.get("prefix", "[TEST] ")
-        results = []
+        done: Dict[str, str] = {}
         
         for item in items:
-            if cancel_token and hasattr(cancel_token, 'is_set') and cancel_token.is_set():
-                results.append({"i": item["i"], "error": "Canceled"})
+            if is_canceled(cancel_token):
+                yield {"i": item["i"], "error": "Canceled"}
                 continue
                 
             # Simulate work
             # time.sleep(0.01) 
             
-            translated = f"{prefix}{item.get('masked', '')}"
-            results.append({"i": item["i"], "t": translated})
-            
-        return results
+            masked = item.get('masked', '')
+            if masked not in done:
+                done[masked] = f"{prefix}{masked}"
+            yield {"i": item["i"], "t": done[masked]}
 
     def get_supported_languages(self) -> List[str]:
         return ["en", "tr", "es", "fr", "de"]
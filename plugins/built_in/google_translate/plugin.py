@@ -1,11 +1,10 @@
-
-from typing import Dict, Any, List
-from interfaces.i_plugin import ITranslationEngine
+from typing import Dict, Any, Iterator, List
+from interfaces.i_plugin import ITranslationEngineV2, is_canceled
 from renforge_logger import get_logger
 
 logger = get_logger("plugin.google")
 
-class GoogleTranslatePlugin(ITranslationEngine):
+class GoogleTranslatePlugin(ITranslationEngineV2):
 
     def on_load(self, context: Any) -> None:
         logger.info("Google Translate Plugin loaded")
@@ -17,44 +16,51 @@ class GoogleTranslatePlugin(ITranslationEngine):
         # No special config for Google Translate (Free)
         return []
 
-    def translate_batch(self, 
-                        items: List[Dict], 
-                        source_lang: str, 
-                        target_lang: str, 
-                        config: Dict[str, Any],
-                        cancel_token: Any = None,
-                        timeout: int = 30) -> List[Dict]:
-        results = []
+    # Capabilities are declared in manifest.json (free endpoint: small requests, few in parallel)
+
+    def translate_stream(self, 
+                         items: List[Dict], 
+                         source_lang: str, 
+                         target_lang: str, 
+                         config: Dict[str, Any],
+                         cancel_token: Any = None,
+                         timeout: int = 30) -> Iterator[Dict]:
         try:
             from deep_translator import GoogleTranslator
             translator = GoogleTranslator(source=source_lang, target=target_lang)
-            
-            for item in items:
-                if cancel_token and hasattr(cancel_token, 'is_set') and cancel_token.is_set():
-                    results.append({"i": item["i"], "error": "Canceled"})
-                    continue
-
-                masked_text = item.get('masked', '')
-                if not masked_text:
-                    results.append({"i": item["i"], "t": ""})
-                    continue
-                    
-                try:
-                    trans = translator.translate(masked_text)
-                    results.append({"i": item["i"], "t": trans})
-                except Exception as e:
-                    logger.warning(f"Failed to translate item {item['i']}: {e}")
-                    results.append({"i": item["i"], "error": str(e)})
-
         except ImportError:
-             for item in items:
-                 results.append({"i": item["i"], "error": "deep_translator missing"})
+            for item in items:
+                yield {"i": item["i"], "error": "deep_translator missing"}
+            return
         except Exception as e:
-             logger.error(f"Google Engine Error: {e}")
-             for item in items:
-                 results.append({"i": item["i"], "error": str(e)})
-                 
-        return results
+            logger.error(f"Google Engine Error: {e}")
+            for item in items:
+                yield {"i": item["i"], "error": str(e)}
+            return
+
+        # Identical masked texts in one request are sent once
+        done: Dict[str, str] = {}
+        for item in items:
+            if is_canceled(cancel_token):
+                yield {"i": item["i"], "error": "Canceled"}
+                continue
+
+            masked_text = item.get('masked', '')
+            if not masked_text:
+                yield {"i": item["i"], "t": ""}
+                continue
+            if masked_text in done:
+                yield {"i": item["i"], "t": done[masked_text]}
+                continue
+                
+            try:
+                trans = translator.translate(masked_text)
+            except Exception as e:
+                logger.warning(f"Failed to translate item {item['i']}: {e}")
+                yield {"i": item["i"], "error": str(e)}
+                continue
+            done[masked_text] = trans
+            yield {"i": item["i"], "t": trans}
 
     def get_supported_languages(self) -> List[str]:
         return ["en", "tr", "es", "fr", "de", "it", "jp", "ru"]
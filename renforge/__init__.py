@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge command line entry point package (`python -m renforge ...`).
+
+The implementation lives in renforge_cli; this package only makes the
+module runnable without the GUI.
+"""
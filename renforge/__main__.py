@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Allow `python -m renforge translate <project> ...`."""
+
+import sys
+
+from renforge_cli import main
+
+sys.exit(main())
@@ -4,6 +4,7 @@ import time
 import re
 import json
 import random
+import threading
 from pathlib import Path
 import socket
 
@@ -14,10 +15,16 @@ import renforge_config as config
 import renforge_settings as rf_settings
 
 from renforge_exceptions import APIKeyError, ModelError, TranslationError, NetworkError
+from core import telemetry
+from core.engine_pool import ERROR_QUOTA, KIND_GOOGLE, Backend, EnginePool, classify_error
+from core.glossary_prompt import select_chunk_terms
 
 genai = None
 GoogleTranslator = None
 gemini_model = None
+engine_pool = None          # EnginePool over several keys/engines (see configure_engine_pool)
+_engine_pool_owner = None   # gemini_model the pool was built with
+_routing = threading.local()  # Per-thread model chosen by the engine pool for the current chunk
 _loaded_api_key = None 
 _available_models_cache = None 
 no_ai = False 
@@ -174,23 +181,71 @@ BATCH_CHUNK_MAX_CHARS = 6000  # Max characters per chunk
 BATCH_CHUNK_MAX_ITEMS = 50    # Max items per chunk
 
 
-def _call_gemini_with_backoff(prompt: str, max_retries: int = 4, json_mode: bool = False) -> tuple:
+def _current_model():
+    """Model for requests on this thread: the engine pool's choice for the chunk, else gemini_model."""
+    return getattr(_routing, "model", None) or gemini_model
+
+
+def _fail_fast(error: str) -> bool:
+    """True if a quota error should be returned at once because the pool can route elsewhere."""
+    return getattr(_routing, "fail_fast", False) and classify_error(error) == ERROR_QUOTA
+
+
+def _response_cache_key(prompt: str, json_mode: bool = False):
+    """Return (cache, key) for a Gemini request, or (None, None) if caching is off."""
+    from core.response_cache import get_response_cache, compute_cache_key
+
+    cache = get_response_cache()
+    if cache is None:
+        return None, None
+    model_name = getattr(_current_model(), 'model_name', None) or config.DEFAULT_MODEL_NAME
+    return cache, compute_cache_key(model_name, prompt, json_mode)
+
+
+def _store_response(prompt: str, response_text: str, json_mode: bool = False):
+    """
+    Store a response in the persistent response cache.
+    
+    Only called once the response has been validated (strict schema and
+    token checks), so a replayed response never carries a bad answer.
+    """
+    cache, cache_key = _response_cache_key(prompt, json_mode)
+    if cache is not None:
+        cache.put(cache_key, getattr(_current_model(), 'model_name', ''), response_text)
+
+
+def _call_gemini_with_backoff(prompt: str, max_retries: int = 4, json_mode: bool = False,
+                              use_cache: bool = True) -> tuple:
     """
     Call Gemini with exponential backoff + jitter on rate limits/errors.
     
+    A response stored in the persistent response cache (see _store_response;
+    callers store it only after validating it) is replayed for an identical
+    request (same model, prompt template and prompt) without an API call.
+    
     Args:
         prompt: The prompt to send to Gemini
         max_retries: Maximum number of retry attempts
         json_mode: If True, force JSON output mode
+        use_cache: If False, skip the response cache lookup
         
     Returns:
         Tuple of (response_text, error_message)
     """
     global gemini_model, no_ai
     
-    if no_ai or gemini_model is None:
+    model = _current_model()
+    if no_ai or model is None:
         return (None, "Gemini model not initialized")
     
+    cache, cache_key = _response_cache_key(prompt, json_mode)
+    if cache is not None and use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[_call_gemini_with_backoff] Response cache hit")
+            telemetry.count("response_cache_hits")
+            return (cached, None)
+    
     safety_settings = [
         {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
         {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
@@ -208,25 +263,32 @@ def _call_gemini_with_backoff(prompt: str, max_retries: int = 4, json_mode: bool
     
     for attempt in range(max_retries):
         try:
-            if generation_config:
-                response = gemini_model.generate_content(
-                    prompt, 
-                    safety_settings=safety_settings,
-                    generation_config=generation_config
-                )
-            else:
-                response = gemini_model.generate_content(prompt, safety_settings=safety_settings)
+            telemetry.count("requests")
+            with telemetry.stage(telemetry.NETWORK):
+                if generation_config:
+                    response = model.generate_content(
+                        prompt, 
+                        safety_settings=safety_settings,
+                        generation_config=generation_config
+                    )
+                else:
+                    response = model.generate_content(prompt, safety_settings=safety_settings)
             
             if not response.parts:
                 logger.warning(f"[_call_gemini_with_backoff] Empty response (attempt {attempt+1})")
                 if attempt + 1 < max_retries:
-                    time.sleep(1)
+                    telemetry.sleep(telemetry.BACKOFF, 1)
                     continue
                 return (None, "Empty response from Gemini")
             
-            return (response.text.strip(), None)
+            response_text = response.text.strip()
+            return (response_text, None)
             
         except Exception as e:
+            if _fail_fast(str(e)):
+                logger.warning(f"[_call_gemini_with_backoff] Quota error, leaving it to the engine pool: {e}")
+                return (None, str(e))
+            
             error_str = str(e).lower()
             
             # Check for rate limit or transient errors
@@ -239,7 +301,8 @@ def _call_gemini_with_backoff(prompt: str, max_retries: int = 4, json_mode: bool
                 # Exponential backoff with jitter
                 delay = min(2 ** attempt + random.uniform(0, 1), 30)
                 logger.warning(f"[_call_gemini_with_backoff] Rate limit/error, retrying in {delay:.1f}s: {e}")
-                time.sleep(delay)
+                telemetry.count("retries")
+                telemetry.sleep(telemetry.BACKOFF, delay)
                 continue
             
             logger.error(f"[_call_gemini_with_backoff] Final error: {e}")
@@ -248,6 +311,107 @@ def _call_gemini_with_backoff(prompt: str, max_retries: int = 4, json_mode: bool
     return (None, "Max retries exceeded")
 
 
+def _call_gemini_streaming(prompt: str, on_text: callable, max_retries: int = 4,
+                           json_mode: bool = False, use_cache: bool = True) -> tuple:
+    """
+    Streaming variant of _call_gemini_with_backoff.
+    
+    The response is requested with stream=True and every piece of text is
+    passed to `on_text` as it arrives. Rate limits and transient errors are
+    retried with backoff only while nothing has been received; an error in
+    the middle of a stream returns the text received so far together with
+    the error, so the caller can keep the rows that already completed.
+    A response cache hit is delivered as a single piece.
+    
+    Args:
+        prompt: The prompt to send to Gemini
+        on_text: Callback(piece) for each received piece of text
+        max_retries: Maximum number of retry attempts
+        json_mode: If True, force JSON output mode
+        use_cache: If False, skip the response cache lookup
+        
+    Returns:
+        Tuple of (response_text, error_message)
+    """
+    global gemini_model, no_ai
+    
+    model = _current_model()
+    if no_ai or model is None:
+        return (None, "Gemini model not initialized")
+    
+    cache, cache_key = _response_cache_key(prompt, json_mode)
+    if cache is not None and use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[_call_gemini_streaming] Response cache hit")
+            telemetry.count("response_cache_hits")
+            on_text(cached)
+            return (cached, None)
+    
+    safety_settings = [
+        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+    ]
+    generation_config = {"response_mime_type": "application/json"} if json_mode else None
+    
+    for attempt in range(max_retries):
+        pieces = []
+        try:
+            telemetry.count("requests")
+            with telemetry.stage(telemetry.NETWORK):
+                kwargs = {"safety_settings": safety_settings, "stream": True}
+                if generation_config:
+                    kwargs["generation_config"] = generation_config
+                for response_chunk in model.generate_content(prompt, **kwargs):
+                    try:
+                        piece = response_chunk.text
+                    except ValueError:
+                        continue  # Chunk without text parts (e.g. finish metadata)
+                    if piece:
+                        pieces.append(piece)
+                        on_text(piece)
+            
+            response_text = "".join(pieces).strip()
+            if not response_text:
+                logger.warning(f"[_call_gemini_streaming] Empty response (attempt {attempt+1})")
+                if attempt + 1 < max_retries:
+                    telemetry.sleep(telemetry.BACKOFF, 1)
+                    continue
+                return (None, "Empty response from Gemini")
+            
+            return (response_text, None)
+            
+        except Exception as e:
+            if pieces:
+                # Cut off mid-stream: retrying here would replay text the caller already has
+                logger.warning(f"[_call_gemini_streaming] Stream interrupted after {len(pieces)} pieces: {e}")
+                telemetry.count("stream_interrupted")
+                return ("".join(pieces), str(e))
+            if _fail_fast(str(e)):
+                logger.warning(f"[_call_gemini_streaming] Quota error, leaving it to the engine pool: {e}")
+                return (None, str(e))
+            
+            error_str = str(e).lower()
+            is_retryable = any(keyword in error_str for keyword in [
+                "429", "503", "quota", "rate", "limit", "timeout", 
+                "deadline", "unavailable", "resource exhausted"
+            ])
+            
+            if is_retryable and attempt + 1 < max_retries:
+                delay = min(2 ** attempt + random.uniform(0, 1), 30)
+                logger.warning(f"[_call_gemini_streaming] Rate limit/error, retrying in {delay:.1f}s: {e}")
+                telemetry.count("retries")
+                telemetry.sleep(telemetry.BACKOFF, delay)
+                continue
+            
+            logger.error(f"[_call_gemini_streaming] Final error: {e}")
+            return (None, str(e))
+    
+    return (None, "Max retries exceeded")
+
+
 def translate_text_batch_gemini_strict(
     items: list,
     source_lang: str,
@@ -255,7 +419,9 @@ def translate_text_batch_gemini_strict(
     model: str = None,
     glossary: dict = None,
     on_chunk_done: callable = None,
-    cancel_check: callable = None
+    cancel_check: callable = None,
+    examples: dict = None,
+    use_cache: bool = True
 ) -> dict:
     """
     Batch translate multiple items with strict JSON contract.
@@ -271,11 +437,19 @@ def translate_text_batch_gemini_strict(
         items: List of strings to translate
         source_lang: Source language (e.g., 'english', 'auto' for auto-detect)
         target_lang: Target language (e.g., 'turkish')
-        model: Optional model name (uses current gemini_model)
+        model: Optional model name (uses current gemini_model, or the
+               engine pool's backends when configure_engine_pool set one up)
         glossary: Optional dict of term mappings {source_term: target_term}
         on_chunk_done: Optional callback(processed_count, total_count, chunk_translations)
-                       Called after each chunk completes for progress reporting
+                       Called after each chunk completes for progress reporting;
+                       with config.GEMINI_STREAMING also while a chunk streams,
+                       with the rows finished so far (each row is reported once)
         cancel_check: Optional callable() -> bool, returns True to cancel
+        examples: Optional {item index: [(source, target), ...]} similar TM
+                  entries, added to the prompt of that item's chunk as
+                  reference translations
+        use_cache: If False, responses are not replayed from the response
+                   cache (reruns of failed rows ask the model again)
         
     Returns:
         {
@@ -287,6 +461,7 @@ def translate_text_batch_gemini_strict(
     """
     global gemini_model, no_ai
     
+    pool = _active_engine_pool()
     result = {
         "translations": [],
         "meta": {
@@ -306,7 +481,7 @@ def translate_text_batch_gemini_strict(
         "canceled": False
     }
     
-    if no_ai or gemini_model is None:
+    if pool is None and (no_ai or gemini_model is None):
         for i, item in enumerate(items):
             result["errors"].append({"i": i, "error": "Gemini not initialized"})
         result["stats"]["failed"] = len(items)
@@ -323,20 +498,21 @@ def translate_text_batch_gemini_strict(
     
     # Prepare items with masking
     prepared_items = []
-    for i, text in enumerate(items):
-        if not text or not text.strip():
-            # Empty items get empty translation
-            result["translations"].append({"i": i, "t": ""})
-            result["stats"]["empty_skipped"] += 1
-            continue
-        
-        masked_text, token_map = mask_renpy_tokens(text)
-        prepared_items.append({
-            "i": i,
-            "original": text,
-            "masked": masked_text,
-            "token_map": token_map
-        })
+    with telemetry.stage(telemetry.MASKING):
+        for i, text in enumerate(items):
+            if not text or not text.strip():
+                # Empty items get empty translation
+                result["translations"].append({"i": i, "t": ""})
+                result["stats"]["empty_skipped"] += 1
+                continue
+            
+            masked_text, token_map = mask_renpy_tokens(text)
+            prepared_items.append({
+                "i": i,
+                "original": text,
+                "masked": masked_text,
+                "token_map": token_map
+            })
     
     if not prepared_items:
         return result
@@ -357,8 +533,17 @@ def translate_text_batch_gemini_strict(
             break
         
         chunk_start = time.time()
+        # Streaming: report rows of this chunk as soon as they are finished
+        on_translations = _streamed_progress(on_chunk_done, processed_count, total_items) if on_chunk_done else None
         try:
-            chunk_result = _translate_chunk(chunk, source_lang, target_lang, glossary)
+            if pool is not None:
+                chunk_result = _translate_chunk_routed(pool, chunk, source_lang, target_lang, glossary,
+                                                       _chunk_examples(chunk, examples), on_translations,
+                                                       use_cache)
+            else:
+                chunk_result = _translate_chunk(chunk, source_lang, target_lang, glossary,
+                                                _chunk_examples(chunk, examples), on_translations,
+                                                use_cache)
         except Exception as e:
             # Catch APIKeyError and other critical errors from _translate_chunk
             from renforge_exceptions import APIKeyError
@@ -392,16 +577,21 @@ def translate_text_batch_gemini_strict(
                    f"success={cs.get('success', 0)}, failed={cs.get('failed', 0)}, "
                    f"fallback={cs.get('fallback', 0)}, time={chunk_time:.2f}s")
         
-        # Call progress callback
+        # Call progress callback (rows already reported while streaming are left out)
         if on_chunk_done:
+            streamed = chunk_result.get("streamed") or set()
             try:
-                on_chunk_done(processed_count, total_items, chunk_translations)
+                on_chunk_done(processed_count, total_items,
+                              [t for t in chunk_translations if t["i"] not in streamed])
             except Exception as cb_err:
                 logger.warning(f"[translate_batch_strict] on_chunk_done callback error: {cb_err}")
         
+        telemetry.count("chunks")
+        telemetry.count("items", len(chunk))
+        
         # Small delay between chunks
         if chunk_idx + 1 < total_chunks:
-            time.sleep(0.3)
+            telemetry.sleep(telemetry.THROTTLE, 0.3)
     
     # Sort translations by index
     result["translations"].sort(key=lambda x: x["i"])
@@ -415,6 +605,140 @@ def translate_text_batch_gemini_strict(
     return result
 
 
+def _streamed_progress(on_chunk_done: callable, processed_before: int, total_items: int) -> callable:
+    """on_translations callback of one chunk that reports streamed rows through on_chunk_done."""
+    reported = 0
+    
+    def report(rows: list):
+        nonlocal reported
+        reported += len(rows)
+        on_chunk_done(processed_before + reported, total_items, rows)
+    
+    return report
+
+
+def _active_engine_pool():
+    """The engine pool, if it was built for the current gemini_model."""
+    if engine_pool is not None and _engine_pool_owner is gemini_model and gemini_model is not None:
+        return engine_pool
+    return None
+
+
+def _translate_chunk_routed(pool: EnginePool, chunk: list, source_lang: str, target_lang: str,
+                            glossary: dict = None, examples: list = None,
+                            on_translations: callable = None, use_cache: bool = True) -> dict:
+    """
+    Translate a chunk on the engine pool's least-loaded healthy backend.
+    
+    A quota or key error quarantines the backend and the chunk goes to the
+    next one (secondary engines once no Gemini key is left). If every
+    backend fails, the last backend's result (fallback rows) is returned.
+    
+    Raises:
+        APIKeyError: No backend is usable at all
+    """
+    tried = []
+    chunk_result = None
+    while True:
+        backend = pool.acquire(exclude=tried)
+        if backend is None:
+            if chunk_result is not None:
+                return chunk_result
+            raise APIKeyError("No healthy translation backend left (all keys quarantined)")
+        tried.append(backend.name)
+        
+        error = None
+        try:
+            if backend.kind == KIND_GOOGLE:
+                chunk_result = _translate_chunk_google(backend.client, chunk, source_lang, target_lang)
+            else:
+                # Quota errors return at once when another backend can take the chunk
+                _routing.model, _routing.fail_fast = backend.client, pool.has_alternative(backend)
+                chunk_result = _translate_chunk(chunk, source_lang, target_lang, glossary,
+                                                examples, on_translations, use_cache)
+            error = chunk_result.get("api_error")
+        except APIKeyError as e:
+            error = str(e)
+        finally:
+            _routing.model, _routing.fail_fast = None, False
+            pool.release(backend, error)
+        
+        if classify_error(error) is None:
+            return chunk_result
+        telemetry.count("failovers")
+        logger.warning(f"[translate_chunk_routed] {backend.name} failed ({error}); trying another backend")
+
+
+def _translate_chunk_google(translator_cls, chunk: list, source_lang: str, target_lang: str) -> dict:
+    """
+    Failover translation of a chunk with a deep_translator-style engine,
+    one request per item. Items whose placeholders do not survive keep
+    their original text, like a Gemini fallback.
+    """
+    result = {
+        "translations": [],
+        "errors": [],
+        "stats": {"success": 0, "failed": 0, "fallback": 0, "retried": 0},
+        "streamed": set()
+    }
+    
+    def fallback(item: dict, error_reason: str):
+        result["translations"].append({
+            "i": item["i"],
+            "t": item["original"],
+            "fallback": True,
+            "error_reason": error_reason
+        })
+        result["errors"].append({"i": item["i"], "error": error_reason})
+        result["stats"]["fallback"] += 1
+    
+    glossary_manager = None
+    try:
+        from core.glossary_manager import GlossaryManager
+        glossary_manager = GlossaryManager(source_lang, target_lang)
+    except Exception as gm_init_err:
+        logger.warning(f"[translate_chunk_google] Could not initialize GlossaryManager: {gm_init_err}")
+    
+    try:
+        translator = translator_cls(source=source_lang, target=target_lang)
+    except Exception as e:
+        for item in chunk:
+            fallback(item, str(e))
+        result["api_error"] = str(e)
+        return result
+    
+    for item in chunk:
+        try:
+            telemetry.count("requests")
+            with telemetry.stage(telemetry.NETWORK):
+                translated_masked = translator.translate(item["masked"])
+        except Exception as e:
+            if classify_error(str(e)):
+                # Quota/key problem: the rest of the chunk would fail the same way
+                for rest in chunk[chunk.index(item):]:
+                    fallback(rest, str(e))
+                result["api_error"] = str(e)
+                return result
+            fallback(item, str(e))
+            continue
+        
+        if not translated_masked or not translated_masked.strip():
+            fallback(item, "Empty result")
+            continue
+        missing_tokens = validate_tokens_preserved(item["masked"], translated_masked, item["token_map"])
+        if missing_tokens:
+            fallback(item, f"Missing tokens: {missing_tokens}")
+            continue
+        
+        final_translation, _ = _clean_translation(
+            item, unmask_renpy_tokens(translated_masked, item["token_map"]))
+        final_translation = _apply_chunk_glossary(glossary_manager, final_translation, item["i"])
+        result["translations"].append({"i": item["i"], "t": final_translation})
+        result["stats"]["success"] += 1
+    
+    return result
+
+
 def _split_into_chunks(items: list) -> list:
     """Split items into chunks respecting size limits."""
     chunks = []
@@ -442,33 +766,80 @@ def _split_into_chunks(items: list) -> list:
     return chunks
 
 
-def _translate_chunk(chunk: list, source_lang: str, target_lang: str, glossary: dict = None) -> dict:
-    """Translate a single chunk of items with retry logic."""
+def _chunk_examples(chunk: list, examples: dict = None) -> list:
+    """Unique TM example pairs for the items of one chunk (best match of each item first)."""
+    if not examples:
+        return []
+    pairs = []
+    seen = set()
+    for rank in range(config.TM_FUZZY_MAX_EXAMPLES):
+        for item in chunk:
+            item_examples = examples.get(item["i"]) or ()
+            if rank < len(item_examples) and item_examples[rank] not in seen:
+                seen.add(item_examples[rank])
+                pairs.append(item_examples[rank])
+                if len(pairs) >= config.TM_FUZZY_MAX_EXAMPLES:
+                    return pairs
+    return pairs
+
+
+def _translate_chunk(chunk: list, source_lang: str, target_lang: str, glossary: dict = None,
+                     examples: list = None, on_translations: callable = None,
+                     use_cache: bool = True) -> dict:
+    """
+    Translate a single chunk of items with retry logic.
+    
+    With config.GEMINI_STREAMING the response is streamed and parsed
+    incrementally: rows that arrive complete and valid are finished
+    (unmasked, cleaned, glossary applied) right away and passed to
+    `on_translations([{"i", "t"}, ...])`; their indices are listed in
+    result["streamed"]. Rows that need a repair are finished after the
+    response. If the stream is cut off, completed rows are kept and only
+    the missing ones are requested again.
+    
+    If every attempt fails, result["api_error"] holds the last API error
+    (used by the engine pool to quarantine the backend).
+    
+    The response to the first prompt is stored in the response cache only
+    when it parsed strictly and every row passed validation without a
+    repair. Retry prompts never read from the cache; with use_cache=False
+    the first prompt does not either.
+    """
     result = {
         "translations": [], 
         "errors": [],
-        "stats": {"success": 0, "failed": 0, "fallback": 0, "retried": 0}
+        "stats": {"success": 0, "failed": 0, "fallback": 0, "retried": 0},
+        "streamed": set()
     }
     
-    # Initialize GlossaryManager ONCE per chunk (not per item) to avoid disk I/O per item
+    # Initialize GlossaryManager ONCE per chunk (not per item); only the
+    # chunk's language pair is loaded into its matcher
     glossary_manager = None
     try:
         from core.glossary_manager import GlossaryManager
-        glossary_manager = GlossaryManager()
+        glossary_manager = GlossaryManager(source_lang, target_lang)
     except Exception as gm_init_err:
         logger.warning(f"[translate_chunk] Could not initialize GlossaryManager: {gm_init_err}")
     
+    prompt_build_start = time.perf_counter()
+    
     # Build source language instruction
     source_instruction = f"from {source_lang}" if source_lang.lower() != "auto" else "(auto-detect source language)"
     
-    # Build glossary instruction
-    glossary_instruction = ""
-    if glossary:
-        terms = ", ".join([f"{k}→{v}" for k, v in glossary.items()])
-        glossary_instruction = f"\n- Use these term mappings: {terms}"
-    
-    # Build indexed source list
-    items_json = json.dumps([{"i": item["i"], "s": item["masked"]} for item in chunk], ensure_ascii=False)
+    # Build glossary instruction: only terms that occur in this chunk
+    chunk_terms = select_chunk_terms([item["masked"] for item in chunk], source_lang, target_lang, glossary)
+    glossary_instruction = chunk_terms.instruction()
+    telemetry.count("glossary_terms", len(chunk_terms.terms))
+    telemetry.count("glossary_tokens_saved", chunk_terms.saved_tokens)
+    
+    # Similar TM entries as reference translations (fuzzy TM matches)
+    examples_section = ""
+    if examples:
+        examples_json = json.dumps([{"s": s, "t": t} for s, t in examples], ensure_ascii=False)
+        examples_section = f"""
+REFERENCE TRANSLATIONS (similar lines from the translation memory; follow their terminology and style, do not output them):
+{examples_json}
+"""
     
     # Collect all tokens for repair prompts
     all_tokens = set()
@@ -476,7 +847,10 @@ def _translate_chunk(chunk: list, source_lang: str, target_lang: str, glossary:
         all_tokens.update(item["token_map"].keys())
     tokens_str = ', '.join(sorted(all_tokens)) if all_tokens else "(none)"
     
-    base_prompt = f"""You are a strict translation engine for Ren'Py visual novel scripts.
+    def build_prompt(items: list) -> str:
+        # Build indexed source list
+        items_json = json.dumps([{"i": item["i"], "s": item["masked"]} for item in items], ensure_ascii=False)
+        return f"""You are a strict translation engine for Ren'Py visual novel scripts.
 
 TASK: Translate the following texts {source_instruction} to {target_lang}.
 
@@ -486,24 +860,70 @@ RULES:
 3. Keep punctuation, spacing, and formatting intact.
 4. Translate naturally while maintaining original meaning and tone.
 5. NO explanations, NO markdown, ONLY the JSON object.{glossary_instruction}
-
+{examples_section}
 SOURCE TEXTS:
 {items_json}
 
 OUTPUT (JSON only):"""
-
+    
+    base_prompt = build_prompt(chunk)
+    telemetry.record(telemetry.PROMPT_BUILD, time.perf_counter() - prompt_build_start)
+    
+    items_by_index = {item["i"]: item for item in chunk}
+    finished = {}   # i -> final text of rows handed out while streaming
+    
+    def finish_item(item: dict, translated_masked: str):
+        """Unmask and clean up; None if the row needs a repair first."""
+        if validate_tokens_preserved(item["masked"], translated_masked, item["token_map"]):
+            return None
+        final_translation, needs_dash_repair = _clean_translation(
+            item, unmask_renpy_tokens(translated_masked, item["token_map"]))
+        if needs_dash_repair:
+            return None
+        return _apply_chunk_glossary(glossary_manager, final_translation, item["i"])
+    
+    request_start = None
+    
+    def on_streamed(parsed: list):
+        """Finish complete, valid rows while the response is still streaming."""
+        ready = []
+        for t_item in parsed:
+            item = items_by_index.get(t_item["i"])
+            if item is None or t_item["i"] in finished or not isinstance(t_item["t"], str):
+                continue
+            final_translation = finish_item(item, t_item["t"])
+            if final_translation is not None:
+                finished[t_item["i"]] = final_translation
+                ready.append({"i": t_item["i"], "t": final_translation})
+        if not ready:
+            return
+        if not result["streamed"]:
+            telemetry.record(telemetry.FIRST_ROW, time.perf_counter() - request_start)
+        result["streamed"].update(t["i"] for t in ready)
+        try:
+            on_translations(ready)
+        except Exception as cb_err:
+            logger.warning(f"[translate_chunk] on_translations callback error: {cb_err}")
+    
+    streaming = getattr(config, "GEMINI_STREAMING", False)
+    
     # Retry loop: up to 2 retries (3 total attempts)
     MAX_SCHEMA_RETRIES = 2
-    translations = None
+    collected = {}      # i -> masked translation
+    pending = chunk     # Items still without a translation
+    parsed_ok = False
     last_response = None
     last_error = None
+    base_response = None  # Response to base_prompt, if it parsed strictly
     
     for attempt in range(MAX_SCHEMA_RETRIES + 1):
         if attempt == 0:
             prompt = base_prompt
         else:
-            # Repair prompt for retries
-            logger.warning(f"[translate_chunk] Retry attempt {attempt}/{MAX_SCHEMA_RETRIES} due to parse/schema error")
+            # Repair prompt for retries (only the rows still missing)
+            logger.warning(f"[translate_chunk] Retry attempt {attempt}/{MAX_SCHEMA_RETRIES} due to parse/schema error "
+                           f"({len(pending)}/{len(chunk)} items)")
+            telemetry.count("schema_retries")
             prompt = f"""Your previous response was INVALID. You MUST output JSON ONLY.
 
 REQUIRED JSON SCHEMA (EXACT FORMAT):
@@ -517,9 +937,30 @@ CRITICAL RULES:
 
 Your failed response started with: {last_response[:200] if last_response else 'N/A'}...
 
-{base_prompt}"""
+{build_prompt(pending)}"""
         
-        response_text, error = _call_gemini_with_backoff(prompt, json_mode=True)
+        if streaming:
+            from core.json_stream import TranslationStreamParser
+            parser = TranslationStreamParser()
+            
+            def on_text(piece: str):
+                rows = parser.feed(piece)
+                if rows and on_translations is not None:
+                    on_streamed(rows)
+            
+            request_start = time.perf_counter()
+            response_text, error = _call_gemini_streaming(prompt, on_text, json_mode=True,
+                                                          use_cache=use_cache and attempt == 0)
+            # A well-formed stream only counts when its rows cover the request; anything
+            # else (e.g. {"translation": "..."}) goes through the strict parser below
+            translations = None
+            if parser.complete and {t["i"] for t in parser.items} >= {item["i"] for item in pending}:
+                translations = parser.items
+            partial = parser.items
+        else:
+            response_text, error = _call_gemini_with_backoff(prompt, json_mode=True,
+                                                             use_cache=use_cache and attempt == 0)
+            translations = partial = None
         
         if error:
             # CHECK FOR CRITICAL ERRORS that should stop execution immediately
@@ -531,25 +972,43 @@ Your failed response started with: {last_response[:200] if last_response else 'N
             
             last_error = error
             logger.warning(f"[translate_chunk] API error on attempt {attempt+1}: {error}")
-            continue
-        
-        last_response = response_text
-        
-        # Parse and validate schema
-        translations = _parse_batch_response_strict(response_text)
+            if _fail_fast(error):
+                break  # The engine pool sends the chunk to another backend
+        else:
+            last_response = response_text
+            
+            # Parse and validate schema
+            if translations is None:
+                with telemetry.stage(telemetry.JSON_PARSE):
+                    translations = _parse_batch_response_strict(response_text)
         
         if translations is not None:
             # Success! Log if we retried
             if attempt > 0:
                 logger.info(f"[translate_chunk] Schema parse succeeded on attempt {attempt+1}")
-                result["stats"]["retried"] += len(chunk)
+                result["stats"]["retried"] += len(pending)
+            else:
+                base_response = response_text
+            collected.update((t["i"], t["t"]) for t in translations if t["i"] not in collected)
+            parsed_ok = True
             break
-        else:
+        
+        if partial:
+            # Truncated stream: keep the completed rows, ask again for the rest
+            collected.update((t["i"], t["t"]) for t in partial if t["i"] not in collected)
+            pending = [item for item in pending if item["i"] not in collected]
+            logger.warning(f"[translate_chunk] Truncated response on attempt {attempt+1}: "
+                           f"kept {len(partial)} items, {len(pending)} missing")
+            if not pending:
+                parsed_ok = True
+                break
+        elif not error:
             logger.warning(f"[translate_chunk] Schema validation failed on attempt {attempt+1}")
     
     # If all attempts failed, fallback all items to original
-    if translations is None:
+    if not parsed_ok and not collected:
         logger.error(f"[translate_chunk] All {MAX_SCHEMA_RETRIES+1} attempts failed, falling back to original for {len(chunk)} items")
+        result["api_error"] = last_error
         for item in chunk:
             error_reason = last_error or "JSON schema validation failed after retries"
             logger.info(f"[translate_chunk] Fallback kept original for i={item['i']} reason={error_reason}")
@@ -564,14 +1023,20 @@ Your failed response started with: {last_response[:200] if last_response else 'N
         return result
     
     # Process each translation
-    translated_indices = {t["i"]: t["t"] for t in translations}
+    translated_indices = collected
+    accepted = {}        # i -> masked translation with all tokens
+    token_repairs = []   # (item, masked translation, missing tokens)
     
     for item in chunk:
         idx = item["i"]
+        if idx in finished:
+            continue
         
-        if idx not in translated_indices:
+        if idx not in translated_indices or not isinstance(translated_indices[idx], str):
             # Missing translation, use original as fallback
             error_reason = "Translation missing from response"
+            if not parsed_ok and last_error:
+                error_reason = last_error
             logger.info(f"[translate_chunk] Fallback kept original for i={idx} reason={error_reason}")
             result["translations"].append({
                 "i": idx, 
@@ -587,92 +1052,201 @@ Your failed response started with: {last_response[:200] if last_response else 'N
         
         # Validate token preservation
         missing_tokens = validate_tokens_preserved(item["masked"], translated_masked, item["token_map"])
-        item_retried = False
-        
         if missing_tokens:
-            # Try to repair single item
-            repaired = _repair_single_item(item, translated_masked, missing_tokens, target_lang)
-            if repaired:
-                translated_masked = repaired
-                item_retried = True
+            token_repairs.append((item, translated_masked, missing_tokens))
+        else:
+            accepted[idx] = translated_masked
+    
+    # Repair every item with missing tokens in ONE request, then fall back per item
+    if token_repairs:
+        with telemetry.stage(telemetry.REPAIR):
+            repaired = _repair_missing_tokens(token_repairs, target_lang)
+        for item, _, missing_tokens in token_repairs:
+            idx = item["i"]
+            if idx in repaired:
+                accepted[idx] = repaired[idx]
                 result["stats"]["retried"] += 1
-            else:
-                # Fallback to original
-                error_reason = f"Missing tokens: {missing_tokens}"
-                logger.info(f"[translate_chunk] Fallback kept original for i={idx} reason={error_reason}")
-                result["translations"].append({
-                    "i": idx, 
-                    "t": item["original"],
-                    "fallback": True,
-                    "error_reason": error_reason
-                })
-                result["errors"].append({"i": idx, "error": error_reason})
-                result["stats"]["fallback"] += 1
                 continue
+            error_reason = f"Missing tokens: {missing_tokens}"
+            logger.info(f"[translate_chunk] Fallback kept original for i={idx} reason={error_reason}")
+            result["translations"].append({
+                "i": idx, 
+                "t": item["original"],
+                "fallback": True,
+                "error_reason": error_reason
+            })
+            result["errors"].append({"i": idx, "error": error_reason})
+            result["stats"]["fallback"] += 1
+    
+    # Unmask and clean up
+    finals = {}
+    dash_repairs = []   # (item, translation) starting with a dash the original lacks
+    for item in chunk:
+        idx = item["i"]
+        if idx not in accepted:
+            continue
+        final_translation, needs_dash_repair = _clean_translation(
+            item, unmask_renpy_tokens(accepted[idx], item["token_map"]))
+        if needs_dash_repair:
+            dash_repairs.append((item, final_translation))
+        finals[idx] = final_translation
+    
+    if dash_repairs:
+        # One repair request for all of them
+        with telemetry.stage(telemetry.REPAIR):
+            repaired = _repair_leading_punctuation(dash_repairs, target_lang)
+        for item, _ in dash_repairs:
+            idx = item["i"]
+            if idx in repaired:
+                finals[idx] = repaired[idx]
+                result["stats"]["retried"] += 1
+            else:
+                # Accept anyway but log warning (don't count as fallback)
+                logger.warning(f"[translate_chunk] i={idx} has leading dash not in original (accepted with warning)")
+    
+    for item in chunk:
+        idx = item["i"]
+        if idx in finished:
+            final_translation = finished[idx]
+        elif idx in finals:
+            # Stage 6: Apply Glossary Enforcement (use pre-initialized manager)
+            final_translation = _apply_chunk_glossary(glossary_manager, finals[idx], idx)
+        else:
+            continue
         
-        # Unmask and clean up
-        final_translation = unmask_renpy_tokens(translated_masked, item["token_map"])
-        
-        # Post-processing cleanup
-        if final_translation:
-            # Handle leading colon (always strip, never valid)
-            if final_translation.startswith(":"):
-                final_translation = final_translation.lstrip(": ").strip()
-            
-            # Handle leading dash/em-dash: only if original didn't have it
-            original_starts_dash = item["original"].startswith("-") or item["original"].startswith("—")
-            trans_starts_dash = final_translation.startswith("-") or final_translation.startswith("—")
-            
-            if trans_starts_dash and not original_starts_dash:
-                # Try repair prompt to remove leading dash
-                repair_result = _repair_leading_punctuation(final_translation, item["original"], target_lang)
-                if repair_result:
-                    final_translation = repair_result
-                    result["stats"]["retried"] += 1
-                else:
-                    # Accept anyway but log warning (don't count as fallback)
-                    logger.warning(f"[translate_chunk] i={idx} has leading dash not in original (accepted with warning)")
-        
-        # Stage 6: Apply Glossary Enforcement (use pre-initialized manager)
-        if final_translation and glossary_manager:
-            try:
-                final_translation = glossary_manager.apply_to_text(final_translation)
-            except Exception as gle:
-                logger.error(f"[translate_chunk] Glossary application failed: {gle}")
-
         result["translations"].append({"i": idx, "t": final_translation})
         result["stats"]["success"] += 1
     
+    if base_response is not None and not result["errors"] and not token_repairs and not dash_repairs:
+        _store_response(base_prompt, base_response, json_mode=True)
+    
     return result
 
 
-def _repair_leading_punctuation(translation: str, original: str, target_lang: str) -> str:
+def _clean_translation(item: dict, final_translation: str) -> tuple:
+    """
+    Post-processing cleanup of an unmasked translation.
+    
+    Returns:
+        (translation, needs_dash_repair) - needs_dash_repair is True when the
+        translation starts with a dash the original does not have
+    """
+    if not final_translation:
+        return final_translation, False
+    
+    # Handle leading colon (always strip, never valid)
+    if final_translation.startswith(":"):
+        final_translation = final_translation.lstrip(": ").strip()
+    
+    # Handle leading dash/em-dash: only if original didn't have it
+    original_starts_dash = item["original"].startswith("-") or item["original"].startswith("—")
+    trans_starts_dash = final_translation.startswith("-") or final_translation.startswith("—")
+    return final_translation, trans_starts_dash and not original_starts_dash
+
+
+def _apply_chunk_glossary(glossary_manager, final_translation: str, idx: int) -> str:
+    """Apply glossary enforcement to one finished translation."""
+    if final_translation and glossary_manager:
+        try:
+            with telemetry.stage(telemetry.GLOSSARY):
+                return glossary_manager.apply_to_text(final_translation)
+        except Exception as gle:
+            logger.error(f"[translate_chunk] Glossary application failed for i={idx}: {gle}")
+    return final_translation
+
+
+# Marker of the item list in repair prompts (the fake benchmark engine keys on it)
+REPAIR_ITEMS_MARKER = "ITEMS TO FIX:\n"
+
+
+def _request_repairs(task: str, rules: list, entries: list, target_lang: str) -> dict:
     """
-    Try to repair a translation that has unexpected leading punctuation.
+    Send several broken translations of a chunk in one JSON-contract request.
     
+    Args:
+        task: First line of the prompt
+        rules: Task specific rules (added after the JSON contract)
+        entries: [{"i": idx, "s": source, "bad": translation, ...}]
+        target_lang: Target language
+        
     Returns:
-        Repaired translation, or None if repair failed/unchanged
+        {i: repaired text} for the items present in a valid response
+        (empty on request or parse failure; callers validate each item)
     """
-    repair_prompt = f"""The translation below incorrectly starts with a dash/hyphen that was not in the original.
-Remove the leading punctuation unless the original text requires it.
+    numbered = "\n".join(f"{n}. {rule}" for n, rule in enumerate(rules, start=2))
+    prompt = f"""{task}
+
+RULES:
+1. Output MUST be valid JSON only: {{"translations":[{{"i":0,"t":"..."}},{{"i":1,"t":"..."}}]}}
+{numbered}
+{len(rules) + 2}. Output ONLY the corrected {target_lang} translations, one per item, NO explanations.
 
-Original: {original}
-Translation with error: {translation}
+{REPAIR_ITEMS_MARKER}{json.dumps(entries, ensure_ascii=False)}
 
-Output ONLY the corrected translation to {target_lang}, nothing else:"""
+OUTPUT (JSON only):"""
     
-    response_text, error = _call_gemini_with_backoff(repair_prompt, max_retries=1)
+    telemetry.count("repair_items", len(entries))
+    response_text, error = _call_gemini_with_backoff(prompt, max_retries=2, json_mode=True, use_cache=False)
     if error:
-        return None
-    
-    response_text = response_text.strip()
+        logger.warning(f"[repair] Repair request for {len(entries)} items failed: {error}")
+        return {}
+    with telemetry.stage(telemetry.JSON_PARSE):
+        repaired = _parse_batch_response_strict(response_text)
+    wanted = {entry["i"] for entry in entries}
+    return {r["i"]: r["t"] for r in repaired or () if r["i"] in wanted and isinstance(r["t"], str)}
+
+
+def _repair_missing_tokens(repairs: list, target_lang: str) -> dict:
+    """
+    Repair translations that lost placeholders, all items in one request.
     
-    # Check if it actually removed the dash
-    if response_text and not response_text.startswith("-") and not response_text.startswith("—"):
-        return response_text
+    Args:
+        repairs: [(item, bad masked translation, missing placeholders)]
+        
+    Returns:
+        {i: repaired masked translation} for items whose repair keeps every token
+    """
+    entries = [
+        {"i": item["i"], "s": item["masked"], "bad": translated, "need": missing}
+        for item, translated, missing in repairs
+    ]
+    repaired = _request_repairs(
+        f"Fix these translations to {target_lang}: they lost placeholders of the masked original \"s\".",
+        ["Each \"t\" MUST contain every placeholder of \"s\" exactly (⟦T0⟧, ⟦T1⟧, ...), "
+         "including those listed in \"need\".",
+         "Keep the wording of \"bad\" where it is correct."],
+        entries, target_lang,
+    )
+    items = {item["i"]: item for item, _, _ in repairs}
+    return {
+        idx: text for idx, text in repaired.items()
+        if not validate_tokens_preserved(items[idx]["masked"], text, items[idx]["token_map"])
+    }
+
+
+def _repair_leading_punctuation(repairs: list, target_lang: str) -> dict:
+    """
+    Try to repair translations that have unexpected leading punctuation
+    (all items in one request).
     
-    # Repair didn't help
-    return None
+    Args:
+        repairs: [(item, translation starting with a dash)]
+        
+    Returns:
+        {i: repaired translation} for items that no longer start with a dash
+    """
+    entries = [{"i": item["i"], "s": item["original"], "bad": translation}
+               for item, translation in repairs]
+    repaired = _request_repairs(
+        "These translations incorrectly start with a dash/hyphen that is not in the original \"s\".",
+        ["Remove the leading punctuation of \"bad\" unless the original text requires it.",
+         "Keep everything else, including [variables] and {tags}, unchanged."],
+        entries, target_lang,
+    )
+    return {
+        idx: text.strip() for idx, text in repaired.items()
+        if text.strip() and not text.strip().startswith("-") and not text.strip().startswith("—")
+    }
 
 
 def _parse_batch_response_strict(response_text: str) -> list:
@@ -786,33 +1360,13 @@ Previous failed response (DO NOT repeat this error):
 
 {original_prompt}"""
     
-    response_text, error = _call_gemini_with_backoff(repair_prompt)
+    response_text, error = _call_gemini_with_backoff(repair_prompt, use_cache=False)
     if error:
         return None
     
     return _parse_batch_response(response_text)
 
 
-def _repair_single_item(item: dict, translated: str, missing_tokens: list, target_lang: str) -> str:
-    """Attempt to repair a single translation with missing tokens."""
-    repair_prompt = f"""Fix this translation. CRITICAL: Include these exact tokens: {', '.join(missing_tokens)}
-
-Original (masked): {item["masked"]}
-Bad translation: {translated}
-
-Output ONLY the fixed translation to {target_lang}, nothing else:"""
-    
-    response_text, error = _call_gemini_with_backoff(repair_prompt, max_retries=2)
-    if error:
-        return None
-    
-    # Check if repair worked
-    missing = validate_tokens_preserved(item["masked"], response_text, item["token_map"])
-    if missing:
-        return None
-    
-    return response_text
-
 def translate_text_batch_gemini(
     text: str,
     source_lang: str,
@@ -1033,6 +1587,119 @@ def load_api_key():
         
     return None 
 
+def load_api_keys():
+    """
+    All configured Gemini keys for the engine pool, primary key first:
+    1. load_api_key()
+    2. Environment variable GEMINI_API_KEYS (comma separated)
+    3. Settings 'gemini_api_keys': list of keys or of
+       {"key", "model", "weight", "rpm"} objects
+    
+    Returns:
+        [{"key", "model", "weight", "rpm"}] without duplicate keys
+        (model None = the configured model)
+    """
+    entries = []
+    primary = load_api_key()
+    if primary:
+        entries.append({"key": primary})
+    entries.extend({"key": k} for k in os.environ.get("GEMINI_API_KEYS", "").split(","))
+    try:
+        from models.settings_model import SettingsModel
+        extra = SettingsModel.instance().get("gemini_api_keys") or []
+    except Exception as e:
+        logger.debug(f"[load_api_keys] Settings unavailable: {e}")
+        extra = []
+    for entry in extra if isinstance(extra, list) else []:
+        entries.append({"key": entry} if isinstance(entry, str) else dict(entry))
+    
+    keys = []
+    seen = set()
+    for entry in entries:
+        key = (entry.get("key") or "").strip()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        keys.append({
+            "key": key,
+            "model": entry.get("model"),
+            "weight": float(entry.get("weight", 1.0) or 1.0),
+            "rpm": int(entry.get("rpm", 0) or 0),
+        })
+    return keys
+
+
+def _create_keyed_model(api_key: str, model_name: str):
+    """
+    GenerativeModel whose requests use `api_key`.
+    
+    genai.configure() binds one key for the whole process, so each extra
+    key gets its own GenerativeServiceClient.
+    """
+    genai_module = _lazy_import_genai()
+    if genai_module is None:
+        return None
+    try:
+        from google.ai import generativelanguage as glm
+        model = genai_module.GenerativeModel(model_name)
+        model._client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+        return model
+    except Exception as e:
+        logger.warning(f"[engine_pool] Could not create model for key ...{api_key[-4:]}: {e}")
+        return None
+
+
+def configure_engine_pool(model_name: str = None, primary_key: str = None):
+    """
+    Build the engine pool over every configured key, with Google Translate
+    as the failover tier (config.ENGINE_POOL_*). The primary key reuses
+    gemini_model. Leaves engine_pool unset when there is nothing to
+    balance (one key, no failover engine).
+    
+    Returns:
+        The EnginePool or None
+    """
+    global engine_pool, _engine_pool_owner
+    
+    engine_pool = _engine_pool_owner = None
+    if not config.ENGINE_POOL_ENABLED or no_ai or gemini_model is None:
+        return None
+    model_name = model_name or config.DEFAULT_MODEL_NAME
+    
+    keys = load_api_keys()
+    primary = next((k for k in keys if k["key"] == primary_key), None) or \
+        {"key": primary_key or "", "model": None, "weight": 1.0, "rpm": 0}
+    backends = [Backend(f"{model_name} ...{primary['key'][-4:]}", gemini_model,
+                        weight=primary["weight"], requests_per_minute=primary["rpm"])]
+    for entry in keys:
+        if entry["key"] == primary["key"]:
+            continue
+        entry_model = entry["model"] or model_name
+        model = _create_keyed_model(entry["key"], entry_model)
+        if model is not None:
+            backends.append(Backend(f"{entry_model} ...{entry['key'][-4:]}", model,
+                                    weight=entry["weight"], requests_per_minute=entry["rpm"]))
+    
+    if config.ENGINE_POOL_GOOGLE_FALLBACK:
+        try:
+            from deep_translator import GoogleTranslator as Translator
+            backends.append(Backend("google", Translator, kind=KIND_GOOGLE, tier=1))
+        except ImportError:
+            logger.debug("[engine_pool] deep_translator not installed; no failover engine")
+    
+    if len(backends) < 2:
+        return None
+    engine_pool = EnginePool(
+        backends,
+        quota_cooldown=config.ENGINE_POOL_QUOTA_COOLDOWN,
+        max_cooldown=config.ENGINE_POOL_MAX_COOLDOWN,
+        auth_cooldown=config.ENGINE_POOL_AUTH_COOLDOWN,
+    )
+    _engine_pool_owner = gemini_model
+    logger.info(f"[engine_pool] {len(backends)} backends: {', '.join(b.name for b in backends)}")
+    return engine_pool
+
+
 def save_api_key(api_key):
 
     settings = rf_settings.load_settings() 
@@ -1273,6 +1940,7 @@ def configure_gemini(model_name_to_use=None):
         
         logger.info(f"Model '{model_name_to_use}' configured successfully.") 
         no_ai = False 
+        configure_engine_pool(model_name_to_use, api_key)
         return True 
 
     except ImportError:
@@ -1296,6 +1964,32 @@ def configure_gemini(model_name_to_use=None):
         return False
  
 
+def _finalize_refined_text(refined_text, text_before_refinement, source_lang=None, target_lang=None):
+    """Strip wrappers from a raw refinement response and apply the glossary."""
+    if refined_text.startswith('```') and refined_text.endswith('```'):
+        refined_text = refined_text[3:-3].strip()
+    elif refined_text.startswith('"') and refined_text.endswith('"'):
+        refined_text = refined_text[1:-1].strip()
+
+    logger.debug(f"Gemini suggested: \"{refined_text}\"")
+
+    original_vars = re.findall(r'(\[.*?\])', text_before_refinement or "")
+    refined_vars = re.findall(r'(\[.*?\])', refined_text)
+
+    if original_vars != refined_vars:
+         logger.warning(f"Variable set [...] might have changed! Original: {original_vars}, Refined: {refined_vars}")
+
+    # Stage 6: Apply Glossary Enforcement
+    try:
+        from core.glossary_manager import GlossaryManager
+        glossary_manager = GlossaryManager(source_lang, target_lang) # Cached per-pair matcher
+        refined_text = glossary_manager.apply_to_text(refined_text)
+        logger.debug("Glossary applied to refined text.")
+    except Exception as gl_err:
+        logger.error(f"Failed to apply glossary: {gl_err}")
+
+    return refined_text
+
 def refine_text_with_gemini(original_text, current_text, user_instruction, context_info,
                             source_lang, target_lang, mode, character_tag=None):
 
@@ -1414,32 +2108,8 @@ def refine_text_with_gemini(original_text, current_text, user_instruction, conte
             time.sleep(config.REQUEST_DELAY_SECONDS)
 
             if response.parts:
-                refined_text = response.text.strip()
-
-                if refined_text.startswith('```') and refined_text.endswith('```'):
-                    refined_text = refined_text[3:-3].strip()
-                elif refined_text.startswith('"') and refined_text.endswith('"'):
-                    refined_text = refined_text[1:-1].strip()
-
-                logger.debug(f"Gemini suggested: \"{refined_text}\"")
-
-                text_before_refinement = current_text
-                original_vars = re.findall(r'(\[.*?\])', text_before_refinement) 
-                refined_vars = re.findall(r'(\[.*?\])', refined_text)
-
-                if original_vars != refined_vars:
-                     logger.warning(f"Variable set [...] might have changed! Original: {original_vars}, Refined: {refined_vars}")
-
-                # Stage 6: Apply Glossary Enforcement
-                try:
-                    from core.glossary_manager import GlossaryManager
-                    glossary_manager = GlossaryManager() # Lightweight, loads from dict
-                    refined_text = glossary_manager.apply_to_text(refined_text)
-                    logger.debug("Glossary applied to refined text.")
-                except Exception as gl_err:
-                    logger.error(f"Failed to apply glossary: {gl_err}")
-
-                return (refined_text, None) 
+                raw_text = response.text.strip()
+                return (_finalize_refined_text(raw_text, current_text, source_lang, target_lang), None)
             else:
 
                 error_msg = "Received empty or blocked response from Gemini."
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Command Line Interface (headless, no Qt)
+
+Usage:
+    python -m renforge translate <project> [--engine gemini|google|<plugin id>]
+                                           [--jobs N] [-sl en] [-tl tr]
+
+Progress is written to stdout as JSON lines (see core.headless_pipeline);
+logs go to stderr and the log file. Exit codes: 0 ok, 1 setup failure,
+2 QC errors, 3 failed rows, 130 canceled.
+"""
+
+import argparse
+import signal
+import sys
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import renforge_config as config
+from interfaces.i_plugin import EngineCapabilities
+from renforge_logger import get_logger
+
+logger = get_logger("cli")
+
+
+class CLIError(Exception):
+    """Setup problem reported to the user (exit code 1)."""
+
+
+# Engine factories return (translate_batch, EngineCapabilities); the
+# capabilities size the scheduler's chunks, concurrency and request budget.
+EngineFactoryResult = Tuple[Callable[[List[str]], dict], EngineCapabilities]
+
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+
+def _builtin_capabilities():
+    import renforge_ai as ai
+
+    # Concurrency and request budget are left to --jobs / --rpm
+    return EngineCapabilities(max_items_per_request=ai.BATCH_CHUNK_MAX_ITEMS,
+                              max_chars_per_request=ai.BATCH_CHUNK_MAX_CHARS,
+                              max_concurrency=0)
+
+
+def _gemini_engine(args, cancel_check: Callable[[], bool]) -> EngineFactoryResult:
+    import renforge_ai as ai
+
+    if not ai.load_api_key():
+        # configure_gemini would fall back to an interactive console prompt
+        raise CLIError("Gemini API key not found (set GEMINI_API_KEY or save it in settings)")
+    if not ai.configure_gemini(args.model):
+        raise CLIError(f"Could not configure Gemini model '{args.model}'")
+
+    def translate_batch(texts: List[str]) -> dict:
+        return ai.translate_text_batch_gemini_strict(
+            items=texts,
+            source_lang=args.source_lang,
+            target_lang=args.target_lang,
+            glossary=getattr(config, 'TRANSLATION_GLOSSARY', None),
+            cancel_check=cancel_check,
+        )
+    return translate_batch, _builtin_capabilities()
+
+
+def _google_engine(args, cancel_check: Callable[[], bool]) -> EngineFactoryResult:
+    import renforge_ai as ai
+
+    Translator = ai._lazy_import_translator()
+    if Translator is None:
+        raise CLIError("deep_translator is not installed (pip install deep-translator)")
+
+    def translate_batch(texts: List[str]) -> dict:
+        translator = Translator(source=args.source_lang, target=args.target_lang)
+        result = {"translations": [], "errors": []}
+        for i, text in enumerate(texts):
+            if cancel_check():
+                break
+            try:
+                translated = translator.translate(text)
+            except Exception as e:
+                result["errors"].append({"i": i, "error": str(e)})
+                continue
+            if translated and translated.strip():
+                result["translations"].append({"i": i, "t": translated})
+            else:
+                result["errors"].append({"i": i, "error": "Empty result"})
+        return result
+    return translate_batch, _builtin_capabilities()
+
+
+def _plugin_engine(args, cancel_check: Callable[[], bool]) -> EngineFactoryResult:
+    from core.plugin_manager import PluginManager
+    from core.translation_service import TranslationService
+    from interfaces.i_plugin import CancelToken
+    from models.settings_model import SettingsModel
+
+    plugin_manager = PluginManager()
+    built_in = Path(__file__).resolve().parent / "plugins" / "built_in"
+    # PluginManager also scans the cwd-relative default; only add ours when run elsewhere
+    plugin_manager.initialize(None if Path("plugins/built_in").resolve() == built_in else str(built_in))
+    if plugin_manager.get_engine(args.engine) is None:
+        raise CLIError(f"Unknown engine '{args.engine}'")
+
+    settings = SettingsModel.instance()
+    service = TranslationService({
+        "active_plugin_engine": args.engine,
+        "plugins_config": settings.get("plugins_config", {}),
+    })
+
+    cancel_token = CancelToken(cancel_check)
+
+    def translate_batch(texts: List[str]) -> dict:
+        items = [{"i": i, "original": text} for i, text in enumerate(texts)]
+        result = {"translations": [], "errors": []}
+        for entry in service.stream_translate(items, args.source_lang, args.target_lang, cancel_token):
+            if "error" in entry:
+                result["errors"].append(entry)
+            else:
+                result["translations"].append(entry)
+        return result
+    return translate_batch, service.engine_capabilities()
+
+
+ENGINES = {
+    "gemini": _gemini_engine,
+    "google": _google_engine,
+}
+
+
+def build_engine(args, cancel_check: Callable[[], bool]) -> EngineFactoryResult:
+    """Create the translate_batch callable and capabilities for --engine (built-in name or plugin id)."""
+    factory = ENGINES.get(args.engine, _plugin_engine)
+    return factory(args, cancel_check)
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+
+def _default_checkpoint(project: Path, source_lang: str, target_lang: str) -> Path:
+    root = project if project.is_dir() else project.parent
+    return root / ".renforge" / f"cli_checkpoint_{source_lang}_{target_lang}.json"
+
+
+def cmd_translate(args) -> int:
+    from core.headless_pipeline import (
+        EXIT_FAILURE, Checkpoint, HeadlessPipeline, JsonLinesReporter,
+    )
+
+    project = Path(args.project)
+    if not project.exists():
+        logger.error(f"Project not found: {project}")
+        return EXIT_FAILURE
+
+    reporter = JsonLinesReporter(progress_interval=args.progress_interval)
+    checkpoint = None
+    if not args.no_checkpoint:
+        checkpoint_path = Path(args.checkpoint) if args.checkpoint else \
+            _default_checkpoint(project, args.source_lang, args.target_lang)
+        if args.fresh and checkpoint_path.exists():
+            checkpoint_path.unlink()
+        checkpoint = Checkpoint(checkpoint_path, args.source_lang, args.target_lang)
+
+    pipeline = None
+
+    def is_canceled() -> bool:
+        return pipeline is not None and pipeline.scheduler.is_canceled
+
+    try:
+        translate_batch, capabilities = build_engine(args, is_canceled)
+    except CLIError as e:
+        logger.error(str(e))
+        reporter.emit("error", message=str(e))
+        return EXIT_FAILURE
+
+    jobs = capabilities.limit_jobs(args.jobs)
+    if jobs != args.jobs:
+        logger.info(f"Engine '{args.engine}' allows {jobs} concurrent requests (--jobs {args.jobs})")
+    pipeline = HeadlessPipeline(
+        translate_batch,
+        source_lang=args.source_lang,
+        target_lang=args.target_lang,
+        reporter=reporter,
+        checkpoint=checkpoint,
+        jobs=jobs,
+        requests_per_minute=capabilities.limit_rpm(args.rpm),
+        chunk_items=capabilities.max_items_per_request or sys.maxsize,
+        chunk_chars=capabilities.max_chars_per_request or sys.maxsize,
+        use_tm=not args.no_tm,
+        retranslate=args.retranslate,
+        output_dir=args.output_dir,
+        dry_run=args.dry_run,
+        origin=args.engine,
+    )
+
+    def on_signal(signum, frame):
+        logger.warning("Cancel requested; finishing requests in flight...")
+        pipeline.cancel()
+        # A second Ctrl+C aborts immediately
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, on_signal)
+
+    mode = None if args.mode == "auto" else args.mode
+    summary = pipeline.run(project, mode)
+    return summary['exit_code']
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="renforge",
+        description="RenForge headless tools (no GUI).",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translate = subparsers.add_parser(
+        "translate",
+        help="Translate every .rpy file of a project (or a single file).",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    translate.add_argument("project", help="Project directory (e.g. game/tl/turkish) or .rpy file")
+    translate.add_argument("--engine", default="gemini",
+                           help="'gemini', 'google' or a plugin engine id")
+    translate.add_argument("--model", default=config.DEFAULT_MODEL_NAME, help="Gemini model name")
+    translate.add_argument("-sl", "--source-lang", default=config.DEFAULT_SOURCE_LANG)
+    translate.add_argument("-tl", "--target-lang", default=config.DEFAULT_TARGET_LANG)
+    translate.add_argument("--mode", choices=("auto", "translate", "direct"), default="auto")
+    translate.add_argument("-j", "--jobs", type=int, default=config.PROJECT_BATCH_MAX_WORKERS,
+                           help="Concurrent engine requests")
+    translate.add_argument("--rpm", type=int, default=config.PROJECT_BATCH_REQUESTS_PER_MINUTE,
+                           help="Requests per minute budget (0 = unlimited)")
+    translate.add_argument("--retranslate", action="store_true",
+                           help="Translate rows that already have a translation")
+    translate.add_argument("--no-tm", action="store_true", help="Do not read or write the TM")
+    translate.add_argument("--output-dir", default=None,
+                           help="Write files here (same relative layout) instead of in place")
+    translate.add_argument("--dry-run", action="store_true", help="Do not write any file")
+    translate.add_argument("--checkpoint", default=None,
+                           help="Checkpoint path (default: <project>/.renforge/cli_checkpoint_<sl>_<tl>.json)")
+    translate.add_argument("--fresh", action="store_true", help="Discard an existing checkpoint")
+    translate.add_argument("--no-checkpoint", action="store_true", help="Do not read or write a checkpoint")
+    translate.add_argument("--progress-interval", type=float, default=1.0,
+                           help="Seconds between progress events")
+    translate.set_defaults(func=cmd_translate)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
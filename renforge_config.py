@@ -31,6 +31,28 @@ BREAKPOINT_MARKER = "# renforge-breakpoint"
 DEFAULT_MODE_SELECTION_METHOD = None 
 DEFAULT_USE_DETECTED_TARGET_LANG = True 
 BATCH_TRANSLATE_DELAY = 0.01
+PROJECT_BATCH_MAX_WORKERS = 3          # Concurrent engine calls for project-wide batches
+PROJECT_BATCH_REQUESTS_PER_MINUTE = 30 # Shared request budget (0 = unlimited)
+RESPONSE_CACHE_ENABLED = True          # Replay identical Gemini requests from DB/response_cache.db
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+GEMINI_STREAMING = True                # Stream batch responses and apply rows as they complete
+TM_FUZZY_MIN_SCORE = 0.75              # Similarity for fuzzy TM suggestions / prompt examples
+TM_FUZZY_AUTO_APPLY_SCORE = 1.0        # Fuzzy hits at or above this are applied without the API
+TM_FUZZY_MAX_EXAMPLES = 8              # TM examples added to one Gemini chunk prompt
+GLOSSARY_PROMPT_MAX_TERMS = 100        # Glossary terms (found in the chunk) added to one Gemini prompt
+ENGINE_POOL_ENABLED = True             # Balance Gemini chunks over all configured keys (settings 'gemini_api_keys')
+ENGINE_POOL_GOOGLE_FALLBACK = True     # Fail over to Google Translate when every Gemini key is quarantined
+ENGINE_POOL_QUOTA_COOLDOWN = 60.0      # Seconds a key rests after a quota error (doubles per repeat)
+ENGINE_POOL_MAX_COOLDOWN = 900.0
+ENGINE_POOL_AUTH_COOLDOWN = 3600.0     # Seconds a key rests after an invalid/expired key error
+PLUGIN_PROCESS_ISOLATION = False       # Host engine/tool plugins in worker processes (manifest "isolation" overrides)
+PLUGIN_WORKER_PROCESSES = 2            # Worker processes per isolated plugin (its concurrency)
+PLUGIN_WORKER_START_TIMEOUT = 30.0     # Seconds for a worker to import and load its plugin
+PLUGIN_WORKER_PING_INTERVAL = 30.0     # Idle workers are health-checked before reuse after this many seconds
+QA_RESULT_CACHE_SIZE = 200_000         # (original, translation) pairs whose QA/QC/preflight results are kept
+RPYC_DIRECT_EXTRACT = False            # Project prep writes tl stubs straight from .rpyc ASTs instead of decompiling
+RPYC_STUB_LANGUAGE = "turkish"         # Ren'Py language name of those stubs (game/tl/<name>/)
 ALLOW_EMPTY_STRINGS = True
 
 if getattr(sys, 'frozen', False):
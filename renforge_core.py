@@ -9,8 +9,9 @@ from locales import tr
 
 import parser.core as parser
 from parser.patterns import RenpyPatterns
+from parser.line_classifier import LineKind, classify_line
 from parser.direct_parser import NON_TEXT_KEYWORDS
-from models.parsed_file import ParsedItem
+from models.parsed_file import ParsedItem, ParsedFile
 from renforge_enums import ItemType, ContextType
 from renforge_exceptions import FileOperationError, SaveError, ModeDetectionError
 from dataclasses import replace
@@ -45,21 +46,15 @@ def detect_file_mode(file_path):
     has_translate_blocks = False
     has_screen_definitions = False
 
-    screen_def_regex = RenpyPatterns.SCREEN_START
-    translate_block_regex = RenpyPatterns.TRANSLATE_START
-
     logger.debug(f"[detect_file_mode] Scanning for translate blocks and screen definitions...")
     for line in loaded_file_lines:
-        stripped_line = line.lstrip()
-
-        if stripped_line.startswith('#'):
-            continue
+        kind = classify_line(line).kind
 
-        if translate_block_regex.match(line):
+        if kind == LineKind.TRANSLATE_START:
             has_translate_blocks = True
-
-        if screen_def_regex.match(line):
+        elif kind == LineKind.SCREEN_START:
             has_screen_definitions = True
+            break
 
     logger.debug(f"[detect_file_mode] Analysis results: translate={has_translate_blocks}, screen={has_screen_definitions}")
 
@@ -74,15 +69,39 @@ def detect_file_mode(file_path):
     logger.debug(f"[detect_file_mode] Decision: 'direct' (Default)")
     return "direct"
 
+_BREAKPOINT_LINE = re.compile(r'^(.*?)(\s+' + re.escape(config.BREAKPOINT_MARKER) + r'\s*)$')
+
+def iter_source_lines(input_path, breakpoints):
+    """
+    Stream a .rpy file line by line with breakpoint markers stripped.
+
+    Lines are produced exactly as `read_text(...).splitlines()` would produce
+    them, but the file is never held in memory as a whole. Indices of lines
+    that carried a breakpoint marker are added to `breakpoints` as they are read.
+    """
+    with open(input_path, 'r', encoding='utf-8-sig') as handle:
+        index = 0
+        for raw in handle:
+            for raw_line in raw.splitlines():
+                match = _BREAKPOINT_LINE.search(raw_line)
+                if match:
+                    breakpoints.add(index)
+                    yield match.group(1)
+                else:
+                    yield raw_line
+                index += 1
+
 def load_and_parse_base(input_path):
 
+    loaded_breakpoints = set()
+
     try:
 
         input_path_obj = config.Path(input_path)
         if not input_path_obj.is_file():
              raise FileNotFoundError(tr("core_file_not_found", path=input_path))
 
-        raw_lines = input_path_obj.read_text(encoding='utf-8-sig').splitlines()
+        loaded_file_lines = list(iter_source_lines(input_path_obj, loaded_breakpoints))
     except FileNotFoundError as e:
         logger.error(tr("core_error", error=e))
         return None, None 
@@ -90,20 +109,6 @@ def load_and_parse_base(input_path):
         logger.error(tr("core_read_error", path=input_path, error=e))
         return None, None 
 
-    loaded_file_lines = []
-    loaded_breakpoints = set()
-
-    breakpoint_pattern = re.compile(r'^(.*?)(\s+' + re.escape(config.BREAKPOINT_MARKER) + r'\s*)$')
-
-    for i, raw_line in enumerate(raw_lines):
-        match = breakpoint_pattern.search(raw_line)
-        if match:
-            line_content = match.group(1) 
-            loaded_breakpoints.add(i) 
-            loaded_file_lines.append(line_content) 
-        else:
-            loaded_file_lines.append(raw_line) 
-
     logger.debug(tr("core_file_loaded", path=input_path, lines=len(loaded_file_lines), breakpoints=len(loaded_breakpoints)))
     return loaded_file_lines, loaded_breakpoints
 
@@ -260,6 +265,71 @@ def save_translate_file(output_path, current_file_lines, current_breakpoints):
     except Exception as e:
         raise SaveError(f"Unexpected error saving file: {e}", file_path=output_path) from e 
 
+def load_parsed_file(input_path, mode=None):
+    """
+    Read and parse a .rpy file into a ParsedFile without any GUI objects.
+
+    Args:
+        input_path: Path to the .rpy file
+        mode: 'translate', 'direct', a FileMode, or None to auto-detect
+
+    Returns:
+        Fully loaded ParsedFile (output_path = input_path)
+    """
+    from parser.engine import parse_lines
+
+    breakpoints = set()
+    lines = list(iter_source_lines(input_path, breakpoints))
+    result = parse_lines(lines, mode)
+    return ParsedFile(
+        file_path=str(input_path),
+        mode=result.mode,
+        lines=lines,
+        items=result.items,
+        breakpoints=breakpoints,
+        target_language=result.language,
+    )
+
+def reconstruct_item_line(item):
+    """Rebuild the file line of a ParsedItem from its current text."""
+    pd = item.parsed_data
+    text = item.current_text or ""
+
+    # Use robust parser reconstruction to preserve character tags (Fix P0 Bug #1)
+    try:
+        formatted = parser.format_line_from_components(item, text)
+        if formatted is not None:
+            return formatted
+    except Exception as e:
+        logger.warning(f"Parser reconstruction failed for item {item.line_index}: {e}. Falling back.")
+
+    # Fallback to basic reconstruction if parser fails
+    return f'{pd.get("indent", "")}{pd.get("prefix", "")}"{text}"{pd.get("suffix", "")}'
+
+def save_parsed_file(parsed_file, output_path=None):
+    """
+    Write a ParsedFile to disk: modified items are applied to their lines
+    and breakpoint markers are re-inserted.
+
+    Args:
+        parsed_file: Fully loaded ParsedFile
+        output_path: Target path (defaults to parsed_file.output_path)
+
+    Raises:
+        SaveError: If the file cannot be written
+    """
+    for item in parsed_file.items:
+        if item.is_modified_session:
+            parsed_file.update_line(item.line_index, reconstruct_item_line(item))
+
+    lines_to_save = prepare_lines_for_saving(parsed_file.lines, parsed_file.breakpoints)
+    output_path = output_path or parsed_file.output_path
+    try:
+        config.Path(output_path).write_text('\n'.join(lines_to_save) + '\n', encoding='utf-8')
+    except (IOError, OSError) as e:
+        raise SaveError(tr("core_save_error", path=output_path, error=str(e)), file_path=output_path) from e
+    parsed_file.is_modified = False
+
 def get_context_for_translate_item(item_index, items_list, lines_list):
 
     if not items_list or not (0 <= item_index < len(items_list)):
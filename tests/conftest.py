@@ -125,6 +125,17 @@ def app_controller():
     return AppController()
 
 
+@pytest.fixture(autouse=True)
+def isolated_glossary_store(tmp_path, monkeypatch):
+    """Keep glossary lookups made by translation code out of the real DB directory."""
+    import renforge_config as config
+    from core.glossary_store import GlossaryStore
+    monkeypatch.setattr(config, "DB_DIR", tmp_path / "DB")
+    GlossaryStore.reset_instance()
+    yield
+    GlossaryStore.reset_instance()
+
+
 # =============================================================================
 # DI FIXTURES
 # =============================================================================
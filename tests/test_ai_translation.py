@@ -255,5 +255,108 @@ class TestFirstCharacterPreservation:
         assert not is_valid
 
 
+class TestStrictBatchWithFakeEngine:
+    """Strict batch path against the benchmark fake engine (no network)."""
+    
+    def test_batch_translates_and_restores_tokens(self):
+        """Test every item is translated and tokens survive the round trip."""
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+        
+        items = ["Hello [player]!", "", "{i}Quiet{/i} night."]
+        with installed_fake_model(FakeEngineConfig(latency_ms=0, per_item_ms=0)) as model:
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+        
+        texts = {t["i"]: t["t"] for t in result["translations"]}
+        assert texts == {0: "TR Hello [player]!", 1: "", 2: "TR {i}Quiet{/i} night."}
+        assert result["errors"] == []
+        assert model.stats["requests"] == 1
+    
+    def test_malformed_responses_are_reported(self):
+        """Test truncated JSON never crashes the batch and unresolved rows are errors."""
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+        
+        items = [f"Line number {n}." for n in range(5)]
+        engine_config = FakeEngineConfig(latency_ms=0, per_item_ms=0, malformed_rate=1.0)
+        with installed_fake_model(engine_config) as model:
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+        
+        resolved = {t["i"] for t in result["translations"]} | {e["i"] for e in result["errors"]}
+        assert resolved == set(range(5))
+        assert model.stats["malformed"] >= 1
+
+    
+    def test_lost_tokens_are_repaired_in_one_request(self):
+        """Test every item that lost placeholders is fixed by a single repair request."""
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+        
+        items = ["Hi [player]!", "{i}Run{/i}!", "No tokens here.", "[mc] waves."]
+        engine_config = FakeEngineConfig(latency_ms=0, per_item_ms=0, drop_token_rate=1.0)
+        with installed_fake_model(engine_config) as model:
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+        
+        texts = {t["i"]: t["t"] for t in result["translations"]}
+        assert texts == {0: "TR Hi [player]!", 1: "TR {i}Run{/i}!",
+                         2: "TR No tokens here.", 3: "TR [mc] waves."}
+        assert result["stats"]["retried"] == 3
+        assert (model.stats["requests"], model.stats["repair_requests"]) == (2, 1)
+
+    
+    def test_streamed_rows_are_reported_before_the_chunk_ends(self):
+        """Test streaming hands out every row once, as soon as it completes."""
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+        
+        items = [f"Line number {n} [player]." for n in range(6)]
+        reports = []
+        with installed_fake_model(FakeEngineConfig(latency_ms=0, per_item_ms=0)):
+            result = translate_text_batch_gemini_strict(
+                items, "en", "tr",
+                on_chunk_done=lambda done, total, rows: reports.append((done, [r["i"] for r in rows])))
+        
+        assert len(reports) > 2
+        assert sorted(i for _, rows in reports for i in rows) == list(range(6))
+        assert reports[-1][0] == 6
+        assert {t["t"] for t in result["translations"]} == {f"TR {text}" for text in items}
+    
+    def test_truncated_stream_keeps_completed_rows(self):
+        """Test rows completed before a cut-off are kept and only the rest is retried."""
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+        
+        items = [f"Line number {n}." for n in range(20)]
+        engine_config = FakeEngineConfig(latency_ms=0, per_item_ms=0, malformed_rate=1.0, seed=3)
+        with installed_fake_model(engine_config) as model:
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+        
+        translated = {t["i"] for t in result["translations"] if not t.get("fallback")}
+        assert translated and len(translated) + len(result["errors"]) == 20
+        assert all(t["t"] == f"TR {items[t['i']]}" for t in result["translations"] if t["i"] in translated)
+        assert model.stats["items"] < 60  # Retries only asked for the missing rows
+
+    def test_wrong_schema_stream_is_retried(self):
+        """Test a complete stream without {"i","t"} rows gets the schema retry, not a fallback."""
+        import json
+        from benchmarks.fake_engine import FakeEngineConfig, FakeGeminiModel, installed_fake_model
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        class WrongSchemaFirst(FakeGeminiModel):
+            def _answer(self, items, repair):
+                if self.stats["requests"] == 1:
+                    return json.dumps({"translation": "TR everything"})
+                return super()._answer(items, repair)
+
+        items = ["Hello there.", "Good night."]
+        with installed_fake_model(FakeEngineConfig(latency_ms=0, per_item_ms=0)) as model:
+            model.__class__ = WrongSchemaFirst
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+
+        assert {t["i"]: t["t"] for t in result["translations"]} == {0: "TR Hello there.", 1: "TR Good night."}
+        assert result["errors"] == []
+        assert model.stats["requests"] == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the project-level batch scheduler.
+"""
+
+import threading
+
+from core.batch_scheduler import (
+    FileBatch, ProjectBatchScheduler, RequestBudget, chunk_unique_texts, plan_batches,
+)
+from parser.engine import parse_lines
+from models.parsed_file import ParsedFile
+
+
+def make_file(path, texts):
+    lines = ['label a:'] + [f'    "{t}"' for t in texts]
+    result = parse_lines(lines)
+    return ParsedFile(path, result.mode, lines, result.items)
+
+
+class FakeEngine:
+    """Uppercases text; optionally fails one string."""
+
+    def __init__(self, fail=None):
+        self.calls = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.calls.append(list(texts))
+        translations, errors = [], []
+        for i, text in enumerate(texts):
+            if text == self.fail:
+                errors.append({"i": i, "error": "boom"})
+            else:
+                translations.append({"i": i, "t": text.upper()})
+        return {"translations": translations, "errors": errors}
+
+
+class TestPlan:
+
+    def test_cross_file_dedup(self):
+        a = make_file('a.rpy', ['Yes', 'No', 'Yes'])
+        b = make_file('b.rpy', ['No', 'Maybe', '   '])
+        plan = plan_batches([FileBatch(a, [0, 1, 2]), FileBatch(b, [0, 1, 2])])
+        assert plan.texts == ['Yes', 'No', 'Maybe']
+        assert plan.row_count == 5
+        assert plan.duplicate_count == 2
+        assert plan.consumers[1] == [('a.rpy', 1), ('b.rpy', 0)]
+        assert plan.file_totals == {'a.rpy': 3, 'b.rpy': 2}
+
+    def test_chunking_limits(self):
+        chunks = chunk_unique_texts(['x' * 10] * 7, max_items=3, max_chars=25)
+        assert chunks == [[0, 1], [2, 3], [4, 5], [6]]
+
+
+class TestScheduler:
+
+    def test_routes_results_to_every_file(self):
+        a = make_file('a.rpy', ['Yes', 'No', 'Yes'])
+        b = make_file('b.rpy', ['No', 'Maybe'])
+        engine = FakeEngine()
+        progress = {}
+        scheduler = ProjectBatchScheduler(engine, max_workers=2, chunk_items=2)
+
+        results = scheduler.run(
+            [FileBatch(a, [0, 1, 2]), FileBatch(b, [0, 1])],
+            on_file_progress=lambda path, done, total: progress.__setitem__(path, (done, total)),
+        )
+
+        assert [i.current_text for i in a.items] == ['YES', 'NO', 'YES']
+        assert [i.current_text for i in b.items] == ['NO', 'MAYBE']
+        assert sorted(t for call in engine.calls for t in call) == ['Maybe', 'No', 'Yes']
+        assert results['api_calls'] == 2
+        assert results['deduplicated'] == 2
+        assert results['success_count'] == 5
+        assert progress == {'a.rpy': (3, 3), 'b.rpy': (2, 2)}
+
+    def test_errors_are_reported_per_file(self):
+        a = make_file('a.rpy', ['Yes', 'Bad'])
+        b = make_file('b.rpy', ['Bad'])
+        results = ProjectBatchScheduler(FakeEngine(fail='Bad')).run(
+            [FileBatch(a, [0, 1]), FileBatch(b, [0])]
+        )
+        assert results['files']['a.rpy']['failed_indices'] == [1]
+        assert results['files']['b.rpy']['failed_indices'] == [0]
+        assert results['error_count'] == 2
+        assert {e['file_path'] for e in results['structured_errors']} == {'a.rpy', 'b.rpy'}
+        assert b.items[0].current_text == 'Bad'
+
+    def test_cancel_file_skips_its_rows(self):
+        a = make_file('a.rpy', ['One'])
+        b = make_file('b.rpy', ['Two'])
+        engine = FakeEngine()
+        scheduler = ProjectBatchScheduler(engine, chunk_items=1, max_workers=1)
+        scheduler.cancel_file('b.rpy')
+        results = scheduler.run([FileBatch(a, [0]), FileBatch(b, [0])])
+
+        assert engine.calls == [['One']]
+        assert b.items[0].current_text == 'Two'
+        assert results['files']['b.rpy']['canceled']
+        assert not results['files']['a.rpy']['canceled']
+
+
+class TestRequestBudget:
+
+    def test_waits_for_window(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        budget = RequestBudget(2, clock=lambda: now[0], sleep=sleep)
+        assert budget.acquire() and budget.acquire()
+        assert budget.acquire()
+        assert now[0] >= RequestBudget.WINDOW_SECONDS
+        assert sleeps
+
+    def test_cancel_while_waiting(self):
+        budget = RequestBudget(1, clock=lambda: 0.0, sleep=lambda s: None)
+        assert budget.acquire()
+        assert budget.acquire(cancel_check=lambda: True) is False
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the engine pool (key balancing, quarantine, failover).
+"""
+
+from benchmarks.fake_engine import FakeEngineConfig, installed_fake_pool
+from core.engine_pool import ERROR_AUTH, ERROR_QUOTA, KIND_GOOGLE, Backend, EnginePool, classify_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEnginePool:
+
+    def test_classify_error(self):
+        assert classify_error("429 Resource exhausted") == ERROR_QUOTA
+        assert classify_error("400 API key not valid. Please pass a valid API key.") == ERROR_AUTH
+        assert classify_error("403 Your API key was reported as leaked") == ERROR_AUTH
+        assert classify_error("503 Service unavailable") is None
+
+    def test_weighted_rotation_and_cooldown(self):
+        clock = FakeClock()
+        pool = EnginePool([Backend("a", None), Backend("b", None, weight=2)],
+                          quota_cooldown=10, max_cooldown=15, clock=clock)
+        picks = []
+        for _ in range(6):
+            backend = pool.acquire()
+            picks.append(backend.name)
+            pool.release(backend)
+        assert picks.count("b") == 4
+
+        a = pool.backends[0]
+        busy = pool.acquire()  # Least loaded is "a"
+        assert busy is a and pool.acquire().name == "b"  # "a" is in flight
+        pool.release(a, "429 quota")
+        assert pool.acquire(exclude=["b"]) is None
+        clock.now = 10
+        assert pool.acquire(exclude=["b"]) is a
+        pool.release(a, "429 quota")
+        assert a.cooldown_until == 10 + 15  # Doubled, capped
+
+    def test_secondary_tier_only_when_primaries_are_down(self):
+        pool = EnginePool([Backend("google", None, kind=KIND_GOOGLE, tier=1),
+                           Backend("gemini", None, requests_per_minute=1)])
+        assert pool.acquire().name == "gemini"
+        assert pool.acquire().name == "google"  # Key's rpm budget is used up
+
+
+class TestPoolTranslation:
+
+    def test_exhausted_key_fails_over_without_backoff(self):
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        items = [f"Line {n} [name]." for n in range(120)]  # 3 chunks
+        configs = [FakeEngineConfig(latency_ms=0, per_item_ms=0, quota_after=1),
+                   FakeEngineConfig(latency_ms=0, per_item_ms=0)]
+        with installed_fake_pool(configs) as (pool, models):
+            result = translate_text_batch_gemini_strict(items, "en", "tr")
+
+        assert not result["errors"] and len(result["translations"]) == 120
+        assert models[0].stats["quota_exceeded"] == 1  # Not retried on the same key
+        assert models[1].stats["requests"] == 2
+        assert pool.backends[0].cooldown_until > 0
+
+    def test_google_takes_over_when_no_key_is_left(self):
+        import renforge_ai as ai
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        class FakeGoogle:
+            def __init__(self, source, target):
+                pass
+
+            def translate(self, text):
+                return "G " + text
+
+        configs = [FakeEngineConfig(latency_ms=0, per_item_ms=0, rate_429=1.0)]
+        with installed_fake_pool(configs) as (pool, models):
+            pool.backends.append(Backend("google", FakeGoogle, kind=KIND_GOOGLE, tier=1))
+            result = translate_text_batch_gemini_strict(["Hi [name]!", "Bye."], "en", "tr")
+            assert ai._routing.model is None
+
+        assert [t["t"] for t in result["translations"]] == ["G Hi [name]!", "G Bye."]
+        assert models[0].stats["requests"] == 1
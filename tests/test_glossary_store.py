@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the SQLite glossary store, matcher and CSV/TBX import.
+"""
+
+import json
+
+import pytest
+
+import renforge_config as config
+from core.glossary_csv import export_from_glossary_store, import_to_glossary_store
+from core.glossary_manager import GlossaryManager
+from core.glossary_store import GlossaryStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(json.dumps({"glossary_terms": [
+        {"source": "Hello", "target": "Merhaba", "mode": "exact", "enabled": True},
+        {"source": r"\bMr\.", "target": "Bay", "mode": "regex", "enabled": True},
+    ]}), encoding="utf-8")
+    monkeypatch.setattr(config, "DB_DIR", tmp_path / "db")
+    monkeypatch.setattr(config, "SETTINGS_FILE_PATH", settings_file)
+    GlossaryStore.reset_instance()
+    yield GlossaryStore.instance()
+    GlossaryStore.reset_instance()
+
+
+class TestGlossaryStore:
+
+    def test_settings_terms_are_migrated(self, store, tmp_path):
+        terms = {e.term_src: e for e in store.list_all()}
+        assert terms["Hello"].case_sensitive and terms[r"\bMr\."].is_regex
+        settings = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+        assert "glossary_terms" not in settings
+
+        # Only once
+        store.clear()
+        GlossaryStore.reset_instance()
+        assert GlossaryStore.instance().count() == 0
+
+    def test_upsert_by_normalized_key_and_pair(self, store):
+        store.clear()
+        first = store.insert("Health  Potion", "Can İksiri", source_lang="en", target_lang="tr")
+        again = store.insert("health potion", "Sağlık İksiri", source_lang="en", target_lang="tr")
+        other = store.insert("health potion", "Heiltrank", source_lang="en", target_lang="de")
+        assert first == again != other
+        assert store.get(first).term_dst == "Sağlık İksiri"
+        assert [e.term_dst for e in store.list_all(source_lang="en", target_lang="tr")] == ["Sağlık İksiri"]
+        assert store.language_pairs() == [("en", "de", 1), ("en", "tr", 1)]
+
+    def test_bulk_upsert_strategies(self, store):
+        store.clear()
+        store.insert("sword", "kılıç")
+        rows = [
+            {"term_src": "Sword", "term_dst": "pala", "updated_at": "2000-01-01T00:00:00"},
+            {"term_src": "shield", "term_dst": "kalkan"},
+            {"term_src": "", "term_dst": "boş"},
+        ]
+        result = store.bulk_upsert(rows, "skip")
+        assert (result["added"], result["updated"], result["skipped"], result["conflicts"]) == (1, 0, 2, 1)
+
+        assert store.bulk_upsert(rows[:1], "keep_newest")["updated"] == 0
+        assert store.bulk_upsert(rows[:1], "overwrite")["updated"] == 1
+        assert store.list_all()[1].term_dst == "pala"
+
+    def test_matcher_is_scoped_and_refreshed(self, store):
+        store.clear()
+        store.insert("Elf", "Elf", source_lang="en", target_lang="tr")
+        store.insert("dark elf", "kara elf", source_lang="en", target_lang="tr")
+        store.insert("elf", "Elbe", source_lang="en", target_lang="de")
+        store.insert("cat", "kedi", whole_word=True)
+
+        tr = GlossaryManager("en", "tr")
+        assert tr.apply_to_text("The Dark Elf [name] and a cat, not a catapult.") == \
+            "The kara elf [name] and a kedi, not a catapult."
+        assert tr.apply_to_text("elfish") == "Elfish"
+        assert GlossaryManager("en", "de").apply_to_text("an elf") == "an Elbe"
+
+        store.update(store.list_all()[0].id, enabled=False)  # "cat"
+        assert tr.apply_to_text("cat") == "cat"
+
+    def test_case_sensitive_and_regex_terms(self, store):
+        manager = GlossaryManager()
+        assert manager.apply_to_text("Hello, hello. Mr. Smith") == "Merhaba, hello. Bay Smith"
+
+    def test_legacy_manager_api(self, store):
+        manager = GlossaryManager()
+        manager.merge_glossary([{"source": "Hello", "target": "Selam", "mode": "case"},
+                                {"source": "Bye", "target": "Hoşça kal"}], "MERGE_PREFER_LOCAL")
+        assert {t["source"]: t["target"] for t in manager.get_terms()}["Hello"] == "Merhaba"
+
+        manager.merge_glossary([{"source": "Bye", "target": "Güle güle"}], "OVERWRITE")
+        assert manager.get_terms() == [
+            {"source": "Bye", "target": "Güle güle", "mode": "case", "enabled": True}]
+        manager.update_term(0, {"source": "Bye", "target": "Elveda", "mode": "exact", "enabled": False})
+        assert manager.get_terms()[0]["mode"] == "exact"
+        manager.delete_term("bye")
+        assert manager.get_terms() == []
+
+
+class TestGlossaryImport:
+
+    def test_csv_round_trip(self, store, tmp_path):
+        store.clear()
+        source = tmp_path / "terms.csv"
+        source.write_text(
+            "Source,Target,Category,case_sensitive,target_lang\n"
+            "Mana,Mana,RPG,yes,\n"
+            "Potion,İksir,,0,tr\n"
+            "Potion,Şişe,,0,tr\n",
+            encoding="utf-8",
+        )
+        result = import_to_glossary_store(source, source_lang="en", chunk_size=1)
+        assert (result["total"], result["added"], result["skipped"]) == (3, 2, 1)
+        assert store.language_pairs() == [("en", "*", 1), ("en", "tr", 1)]
+
+        exported = tmp_path / "out.csv"
+        assert export_from_glossary_store(exported) == 2
+        store.clear()
+        assert import_to_glossary_store(exported)["added"] == 2
+        mana = [e for e in store.list_all() if e.term_src == "Mana"][0]
+        assert (mana.category, mana.case_sensitive, mana.source_lang) == ("RPG", True, "en")
+
+    def test_tbx_import(self, store, tmp_path):
+        store.clear()
+        tbx = tmp_path / "terms.tbx"
+        tbx.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<martif type="TBX" xml:lang="en"><text><body>'
+            '<termEntry><descrip type="subjectField">RPG</descrip>'
+            '<langSet xml:lang="en-US"><tig><term>Dragon</term></tig></langSet>'
+            '<langSet xml:lang="de"><tig><term>Drache</term></tig></langSet>'
+            '<langSet xml:lang="tr"><ntig><termGrp><term>Ejderha</term></termGrp></ntig></langSet>'
+            '</termEntry>'
+            '<termEntry><langSet xml:lang="en"><tig><term>Orphan</term></tig></langSet></termEntry>'
+            '</body></text></martif>',
+            encoding="utf-8",
+        )
+        result = import_to_glossary_store(tbx, source_lang="en", target_lang="tr")
+        assert (result["added"], result["skipped"]) == (1, 1)
+        entry = store.list_all()[0]
+        assert (entry.term_dst, entry.category, entry.source_lang, entry.target_lang) == \
+            ("Ejderha", "RPG", "en", "tr")
+
+
+class TestChunkGlossary:
+
+    def test_only_terms_in_chunk_are_injected(self, store):
+        from core.glossary_prompt import clear_cache, select_chunk_terms
+
+        clear_cache()
+        store.insert("mana potion", "mana iksiri", source_lang="en", target_lang="tr")
+        store.insert("dragon", "ejderha", source_lang="en", target_lang="tr")
+        glossary = {"MC": "Ana Karakter", "skill points": "yetenek puanları"}
+
+        texts = ["Give the MC a Mana Potion.", "⟦T0⟧ Hello! Hello again."]
+        chunk = select_chunk_terms(texts, "en", "tr", glossary)
+        assert chunk.terms == (("MC", "Ana Karakter"), ("mana potion", "mana iksiri"),
+                               ("Hello", "Merhaba"))
+        assert chunk.available == 6 and chunk.saved_tokens > 0
+        assert chunk.instruction() == \
+            "\n- Use these term mappings: MC→Ana Karakter, mana potion→mana iksiri, Hello→Merhaba"
+
+        # Cached until the store changes
+        assert select_chunk_terms(texts, "en", "tr", glossary) is chunk
+        store.insert("again", "tekrar", source_lang="en", target_lang="tr")
+        assert ("again", "tekrar") in select_chunk_terms(texts, "en", "tr", glossary).terms
+
+        assert select_chunk_terms(["Nothing here."], "en", "tr", max_terms=1).instruction() == ""
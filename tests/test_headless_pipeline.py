@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the headless (no Qt) translation pipeline and CLI.
+"""
+
+import io
+import json
+
+import pytest
+
+from core.headless_pipeline import (
+    EXIT_OK, EXIT_QC_ERRORS, EXIT_TRANSLATION_ERRORS,
+    Checkpoint, HeadlessPipeline, JsonLinesReporter, discover_files,
+)
+
+TL_FILE = '''translate turkish start_a1b2c3d4:
+
+    # e "Hello there."
+    e ""
+
+translate turkish strings:
+
+    old "Start"
+    new ""
+
+    old "Hello there."
+    new ""
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "tl"
+    (root / "sub").mkdir(parents=True)
+    (root / "script.rpy").write_text(TL_FILE, encoding="utf-8")
+    (root / "sub" / "screens.rpy").write_text(TL_FILE.replace("Start", "Quit"), encoding="utf-8")
+    (root / ".renforge").mkdir()
+    (root / ".renforge" / "ignored.rpy").write_text(TL_FILE, encoding="utf-8")
+    return root
+
+
+def fake_engine(calls, transform=lambda text: f"TR:{text}", fail=()):
+    def translate_batch(texts):
+        calls.append(list(texts))
+        return {
+            "translations": [{"i": i, "t": transform(t)} for i, t in enumerate(texts) if t not in fail],
+            "errors": [{"i": i, "error": "boom"} for i, t in enumerate(texts) if t in fail],
+        }
+    return translate_batch
+
+
+def run_pipeline(project, engine, checkpoint=True):
+    out = io.StringIO()
+    pipeline = HeadlessPipeline(
+        engine, source_lang="en", target_lang="tr",
+        reporter=JsonLinesReporter(out),
+        checkpoint=Checkpoint(project / ".renforge" / "cp.json", "en", "tr") if checkpoint else None,
+        jobs=2, use_tm=False,
+    )
+    summary = pipeline.run(project)
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    return summary, events
+
+
+class TestHeadlessPipeline:
+
+    def test_discover_skips_hidden_dirs(self, project):
+        assert [p.name for p in discover_files(project)] == ["script.rpy", "screens.rpy"]
+
+    def test_translates_dedupes_and_saves(self, project):
+        calls = []
+        summary, events = run_pipeline(project, fake_engine(calls))
+
+        assert summary['exit_code'] == EXIT_OK
+        assert summary['saved_files'] == 2
+        # "Hello there." appears four times but is requested once
+        assert sorted(t for chunk in calls for t in chunk) == ["Hello there.", "Quit", "Start"]
+        saved = (project / "script.rpy").read_text(encoding="utf-8")
+        assert 'new "TR:Start"' in saved and 'e "TR:Hello there."' in saved
+        assert events[0]['event'] == "plan" and events[-1]['event'] == "summary"
+        assert {e['file'] for e in events if e['event'] == "file_done"} == {"script.rpy", "sub/screens.rpy"}
+
+    def test_resume_skips_completed_files(self, project):
+        run_pipeline(project, fake_engine([]))
+        calls = []
+        summary, events = run_pipeline(project, fake_engine(calls))
+        assert calls == []
+        assert summary['skipped_files'] == 2
+
+    def test_failed_rows_are_retried_from_checkpoint(self, project):
+        summary, _ = run_pipeline(project, fake_engine([], fail=("Quit",)))
+        assert summary['exit_code'] == EXIT_TRANSLATION_ERRORS
+
+        calls = []
+        summary, _ = run_pipeline(project, fake_engine(calls))
+        assert summary['exit_code'] == EXIT_OK
+        assert calls == [["Quit"]]
+
+    def test_qc_errors_set_exit_code(self, project):
+        (project / "script.rpy").write_text(
+            'translate turkish strings:\n\n    old "Hi [name]"\n    new ""\n', encoding="utf-8")
+        (project / "sub" / "screens.rpy").unlink()
+        summary, events = run_pipeline(project, fake_engine([], transform=lambda t: "Merhaba"),
+                                       checkpoint=False)
+        assert summary['exit_code'] == EXIT_QC_ERRORS
+        assert any(e['event'] == "qc_error" for e in events)
+
+
+class TestCli:
+
+    def test_translate_with_plugin_engine(self, project, capsys):
+        from renforge_cli import main
+
+        code = main(["translate", str(project), "--engine", "renforge.engine.dummy",
+                     "--no-tm", "--no-checkpoint", "-tl", "tr"])
+        assert code == EXIT_OK
+        events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert events[-1]['translated'] == 6
+        assert 'new "[TEST] Start"' in (project / "script.rpy").read_text(encoding="utf-8")
+
+    def test_unknown_engine_fails(self, project):
+        from renforge_cli import main
+        assert main(["translate", str(project), "--engine", "nope", "--no-checkpoint"]) == 1
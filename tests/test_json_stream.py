@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the incremental batch response parser.
+"""
+
+import json
+
+from core.json_stream import TranslationStreamParser
+
+RESPONSE = json.dumps({"translations": [
+    {"i": 0, "t": "Merhaba {b}dünya{/b}!"},
+    {"i": 1, "t": 'Dedi ki: "}{" \\ ⟦T0⟧'},
+    {"i": 2, "t": "Son."},
+]}, ensure_ascii=False)
+
+
+def feed_all(parser, text, size):
+    found = []
+    for n in range(0, len(text), size):
+        found.extend(parser.feed(text[n:n + size]))
+    return found
+
+
+class TestTranslationStreamParser:
+
+    def test_items_are_emitted_as_they_complete(self):
+        parser = TranslationStreamParser()
+        cut = RESPONSE.index('!"}') + 3  # End of the first item
+        assert parser.feed(RESPONSE[:cut - 1]) == []
+        assert parser.feed(RESPONSE[cut - 1:cut]) == [{"i": 0, "t": "Merhaba {b}dünya{/b}!"}]
+        rest = parser.feed(RESPONSE[cut:])
+        assert [item["i"] for item in rest] == [1, 2]
+        assert rest[0]["t"] == 'Dedi ki: "}{" \\ ⟦T0⟧'
+        assert parser.complete
+
+    def test_any_piece_size_gives_the_same_items(self):
+        expected = json.loads(RESPONSE)["translations"]
+        for size in (1, 3, 7, 64):
+            parser = TranslationStreamParser()
+            assert feed_all(parser, "```json\n" + RESPONSE + "\n```", size) == expected
+            assert parser.complete
+
+    def test_truncated_stream_keeps_completed_items(self):
+        parser = TranslationStreamParser()
+        feed_all(parser, RESPONSE[:RESPONSE.index('"Son.')], 5)
+        assert [item["i"] for item in parser.items] == [0, 1]
+        assert not parser.complete
+
+    def test_bare_list_and_wrong_objects(self):
+        parser = TranslationStreamParser()
+        found = parser.feed('[{"i": 0, "translation": "x"}, {"i": 1, "t": "y"}, {"i": 1, "t": "z"}]')
+        assert found == [{"i": 1, "t": "y"}]
+        assert parser.complete
@@ -37,6 +37,20 @@ class TestParsedItem:
         assert item.current_text == item.initial_text
         assert not item.is_modified_session
 
+    def test_compact_layout(self):
+        """Items are slotted and share parser strings / metadata."""
+        from parser.engine import parse_lines
+
+        items = parse_lines(['label a:', '    e "Hi" with dissolve', '    e "Yo" with dissolve']).items
+        first, second = items
+        assert not hasattr(first, '__dict__')
+        assert first.initial_text is first.current_text
+        assert first.parsed_data['suffix'] is second.parsed_data['suffix']
+
+        copy = first.copy()
+        copy.set_text("Selam")
+        assert first.current_text == "Hi" and copy['text'] == "Selam"
+
 
 class TestParsedFile:
     """Tests for ParsedFile model."""
@@ -116,6 +130,24 @@ class TestParsedFile:
         parsed_file.is_modified = True
         
         assert ('modified', True) in notifications
+    
+    def test_streaming_append(self, parsed_file):
+        """Test appending streamed items and the loading lifecycle."""
+        events = []
+        parsed_file.subscribe('items_appended', lambda start, count: events.append((start, count)))
+        parsed_file.subscribe('loading_finished', lambda: events.append('done'))
+        
+        parsed_file.begin_loading()
+        assert parsed_file.is_loading
+        
+        extra = parsed_file.get_item(0).copy()
+        start = parsed_file.append_items([extra])
+        parsed_file.finish_loading()
+        
+        assert start == 2
+        assert parsed_file.item_count == 3
+        assert not parsed_file.is_loading
+        assert events == [(2, 1), 'done']
 
 
 class TestProjectModel:
@@ -4,6 +4,7 @@ import sys
 import json
 import shutil
 import zipfile
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -13,17 +14,15 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 import renforge_config as config
 from core.packaging import PackManager, PackConstants
 from core.glossary_manager import GlossaryManager
-from core.tm_store import TMManager
+from core.tm_store import TMStore
+from core.glossary_store import GlossaryStore
 import renforge_settings as rf_settings
 
 class TestPackagingCore(unittest.TestCase):
 
     def setUp(self):
         # Setup temp directories
-        self.test_dir = Path("tests/temp_pack_test")
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
-        self.test_dir.mkdir(parents=True)
+        self.test_dir = Path(tempfile.mkdtemp(prefix="rf_pack_test_"))
         
         self.pack_path = self.test_dir / "test_project.rfpack"
         
@@ -67,18 +66,12 @@ class TestPackagingCore(unittest.TestCase):
         with open(self.settings_file, 'w', encoding='utf-8') as f:
             json.dump(self.test_settings, f)
             
-        # Create TM DB
-        self.tm_path = config.DB_DIR / "tm.db"
-        self.tm_mgr = TMManager(str(self.test_dir))
-        self.tm_mgr.init_db(str(self.test_dir)) # Force re-init with new path logic if needed, but we patched config.DB_DIR
-        # Actually init_db uses config.DB_DIR.
-        
-        self.tm_mgr.add_entry("Good Morning", "Gunaydin", "manual", True)
-        self.tm_mgr.conn.close() # Close to allow file copy
-        self.tm_mgr.conn = None
-        del self.tm_mgr
-        import gc
-        gc.collect() 
+        # Create TM DB (TMStore resolves config.DB_DIR on creation)
+        TMStore.reset_instance()
+        GlossaryStore.reset_instance()
+        self.tm = TMStore.instance()
+        self.tm_path = self.tm.db_path
+        self.tm.insert("Good Morning", "Gunaydin", "en", "tr", origin="manual")
         
         # Also create a standalone glossary.json if logic supports it (as per code)
         # Packaging code checks config.APP_DIR / "glossary.json"
@@ -88,6 +81,9 @@ class TestPackagingCore(unittest.TestCase):
 
 
     def tearDown(self):
+        TMStore.reset_instance()
+        GlossaryStore.reset_instance()
+        
         # Restore Config
         config.APP_DIR = self.orig_app_dir
         config.SETTINGS_DIR = self.orig_settings_dir
@@ -118,8 +114,8 @@ class TestPackagingCore(unittest.TestCase):
         self.assertTrue(zipfile.is_zipfile(self.pack_path))
         
         # 2. Modify State (Simulate new/clean workspace)
-        # Delete TM db
-        if self.tm_path.exists(): os.remove(str(self.tm_path))
+        # Empty the TM
+        self.tm.clear()
         
         # Modify Settings
         new_settings = {"ui_language": "en", "glossary_terms": []}
@@ -152,26 +148,37 @@ class TestPackagingCore(unittest.TestCase):
         # But let's check what it does.
         
         # Check TM
-        self.assertTrue(self.tm_path.exists(), "TM DB should be restored")
-        tm_check = TMManager(str(self.test_dir))
-        # Wait, need to reconnect
-        tm_check.init_db(None)
-        res = tm_check.lookup("Good Morning")
-        self.assertTrue(len(res) > 0)
-        self.assertEqual(res[0].target_text, "Gunaydin")
+        self.assertIn("TM Database replaced.", report)
+        entry = self.tm.lookup("Good Morning", "en", "tr")
+        self.assertIsNotNone(entry, "TM should be restored")
+        self.assertEqual(entry.target_text, "Gunaydin")
         
         # Check Glossary (External file merge)
         # Packaging logic merges external glossary.json into GLOSSARY_MANAGER (settings based).
         # My setup created external glossary.json AND settings glossary.
-        # The result should be merged into settings["glossary_terms"] via manager.
-        
-        # Load settings again (internal save triggered)
-        with open(self.settings_file, 'r') as f:
-            final_settings = json.load(f)
-            
-        terms = final_settings.get("glossary_terms", [])
+        # The result should be merged into the glossary store via manager.
+        terms = GlossaryManager().get_terms()
         sources = [t["source"] for t in terms]
         self.assertIn("External", sources)
         
+    def test_tm_snapshot_and_merge(self):
+        pm = PackManager()
+        stages = set()
+        options = {"settings": False, "glossary": False, "plugins": False, "tm": True}
+        pm.export_pack(str(self.pack_path), options,
+                       progress_callback=lambda stage, done, total: stages.add(stage))
+        self.assertEqual({"tm_snapshot", "tm_write"}, stages)
+        self.assertFalse(Path(str(self.pack_path) + ".part").exists())
+        with zipfile.ZipFile(self.pack_path) as zipf:
+            self.assertIn("tm/tm.db", zipf.namelist())
+        
+        # Local TM diverges: one changed entry, one new entry
+        self.tm.insert("Good Night", "Iyi geceler", "en", "tr", origin="manual")
+        
+        report = pm.import_pack(str(self.pack_path), {"tm": "MERGE"})
+        self.assertEqual(report, ["Merged 1 entries into TM."])
+        self.assertEqual(self.tm.get_stats()['total_entries'], 2)
+        self.assertEqual(self.tm.lookup("Good Morning", "en", "tr", touch=False).target_text, "Gunaydin")
+        
 if __name__ == '__main__':
     unittest.main()
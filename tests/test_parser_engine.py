@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the single-pass line classifier and parser engine.
+"""
+
+import pytest
+
+from parser.line_classifier import LineKind, classify_line
+from parser.engine import DETECTION_WINDOW, ParseStream, detect_mode, parse_lines
+from parser.translate_parser import TranslateParser
+from parser.direct_parser import DirectParser
+from renforge_enums import FileMode, ItemType
+
+
+class TestClassifyLine:
+    """Tests for classify_line dispatch."""
+
+    @pytest.mark.parametrize("line,kind", [
+        ('', LineKind.BLANK),
+        ('    ', LineKind.BLANK),
+        ('    # comment', LineKind.COMMENT),
+        ('    "Narration"', LineKind.QUOTED),
+        ('$ x = 1', LineKind.OTHER),
+        ('    e "Hello"', LineKind.WORD),
+        ('translate turkish start_1:', LineKind.TRANSLATE_START),
+        ('Translate turkish strings:', LineKind.TRANSLATE_START),
+        ('    old "Hello"', LineKind.TRANSLATE_OLD),
+        ('    new "Merhaba"', LineKind.TRANSLATE_NEW),
+        ('label start:', LineKind.LABEL_START),
+        ('screen main_menu():', LineKind.SCREEN_START),
+        ('    menu:', LineKind.MENU_START),
+        ('init python:', LineKind.PYTHON_START),
+        ('    oldman "Hi"', LineKind.WORD),
+        ('    old = 3', LineKind.WORD),
+    ])
+    def test_kinds(self, line, kind):
+        assert classify_line(line).kind == kind
+
+    def test_keyword_match_is_reused(self):
+        classified = classify_line('    new "Merhaba" # note')
+        assert classified.match.group(2) == "Merhaba"
+        assert classified.match.group(3) == " # note"
+
+    def test_screen_keywords_recorded(self):
+        assert classify_line('    textbutton _("Start")').keyword == 'textbutton'
+        assert classify_line('    e "Hi"').keyword == ''
+
+
+class TestParseLines:
+    """Tests for the single-pass engine."""
+
+    def test_translate_autodetect(self, sample_lines):
+        result = parse_lines(sample_lines)
+        assert result.mode == FileMode.TRANSLATE
+        assert result.language == "turkish"
+        assert [i.original_text for i in result.items] == ["Hello, world!", "How are you?"]
+
+    def test_direct_autodetect(self, sample_direct_lines):
+        result = parse_lines(sample_direct_lines)
+        assert result.mode == FileMode.DIRECT
+        assert result.language is None
+        types = [i.type for i in result.items]
+        assert types == [ItemType.NARRATION, ItemType.DIALOGUE, ItemType.CHOICE, ItemType.CHOICE]
+
+    def test_matches_individual_parsers(self, sample_lines, sample_direct_lines):
+        items, lang = TranslateParser().parse(sample_lines)
+        result = parse_lines(sample_lines)
+        assert result.items == items and result.language == lang
+
+        items, _ = DirectParser().parse(sample_direct_lines)
+        assert parse_lines(sample_direct_lines).items == items
+
+    def test_translate_block_after_window_is_direct(self):
+        lines = ['e "Hi"'] * DETECTION_WINDOW + ['translate turkish x:', '    new "a"']
+        assert detect_mode(lines) == FileMode.DIRECT
+        result = parse_lines(iter(lines))
+        assert result.mode == FileMode.DIRECT
+        assert result.items[DETECTION_WINDOW - 1].line_index == DETECTION_WINDOW - 1
+
+    def test_explicit_mode(self, sample_lines):
+        result = parse_lines(sample_lines, "direct")
+        assert result.mode == FileMode.DIRECT
+        assert result.language is None
+
+    def test_escaped_quotes(self):
+        result = parse_lines(['label a:', '    e "Say \\"hi\\" now" with dissolve'])
+        item = result.items[0]
+        assert item.original_text == 'Say \\"hi\\" now'
+        assert item.parsed_data['suffix'] == ' with dissolve'
+
+
+class TestParseStream:
+    """Tests for the incremental streaming parse."""
+
+    def test_stream_matches_parse_lines(self, sample_lines, sample_direct_lines):
+        for lines in (sample_lines, sample_direct_lines):
+            expected = parse_lines(lines)
+            stream = ParseStream(iter(lines))
+            assert list(stream) == expected.items
+            assert stream.mode == expected.mode
+            assert stream.language == expected.language
+            assert stream.exhausted
+
+    def test_take_is_incremental(self):
+        lines = ['label a:'] + [f'    e "Line {i}"' for i in range(1000)]
+        consumed = []
+
+        def source():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        stream = ParseStream(source())
+        first = stream.take(10)
+        assert [i.original_text for i in first] == [f"Line {i}" for i in range(10)]
+        assert not stream.exhausted
+        # Only the detection window plus a few lines have been read
+        assert len(consumed) < 150
+
+        rest = stream.take(5000)
+        assert len(rest) == 990
+        assert stream.exhausted
+        assert stream.items_read == 1000
+
+    def test_iter_source_lines(self, tmp_path):
+        import renforge_config as config
+        from renforge_core import iter_source_lines
+
+        path = tmp_path / "bp.rpy"
+        path.write_text(
+            '\ufefflabel a:\r\n    e "Hi"  ' + config.BREAKPOINT_MARKER + '\n\n    "End"',
+            encoding='utf-8'
+        )
+        breakpoints = set()
+        lines = list(iter_source_lines(path, breakpoints))
+        assert lines == ['label a:', '    e "Hi"', '', '    "End"']
+        assert breakpoints == {1}
@@ -11,15 +11,37 @@ from core.plugin_manager import PluginManager
 from core.translation_service import TranslationService
 from models.settings_model import SettingsModel
 
+from interfaces.i_plugin import ITranslationEngine
+
+
+@pytest.fixture
+def plugin_manager():
+    pm = PluginManager()
+    # Ensure we point to the built-in plugins folder
+    built_in_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'plugins', 'built_in'))
+    pm.initialize(built_in_path)
+    return pm
+
+
+class LegacyEngine(ITranslationEngine):
+    """v1 engine that records its requests and drops the first item of each."""
+
+    def __init__(self):
+        super().__init__()
+        self.manifest = {"id": "test.legacy", "capabilities": {"max_items_per_request": 2}}
+        self.requests = []
+
+    def on_load(self, context): pass
+    def on_unload(self): pass
+    def get_supported_languages(self): return ["en", "tr"]
+    def is_available(self, config): return True
+
+    def translate_batch(self, items, source_lang, target_lang, config, cancel_token=None, timeout=30):
+        self.requests.append([x["i"] for x in items])
+        return [{"i": x["i"], "t": x["masked"].upper()} for x in items[1:]]
+
+
 class TestPluginSystem:
-    
-    @pytest.fixture
-    def plugin_manager(self):
-        pm = PluginManager()
-        # Ensure we point to the built-in plugins folder
-        built_in_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'plugins', 'built_in'))
-        pm.initialize(built_in_path)
-        return pm
 
     def test_plugin_discovery(self, plugin_manager):
         """Verify built-in plugins are discovered."""
@@ -120,3 +142,116 @@ class TestPluginSystem:
             r1 = results[0]
             assert "Merhaba" in r1["t"]
             assert "[TEST]" in r1["t"]
+
+
+class TestEngineV2:
+
+    def test_v1_engine_is_adapted(self):
+        from interfaces.i_plugin import EngineV1Adapter, as_engine_v2
+
+        legacy = LegacyEngine()
+        engine = as_engine_v2(legacy)
+        assert isinstance(engine, EngineV1Adapter) and engine.id == "test.legacy"
+        assert engine.capabilities({}).max_items_per_request == 2
+
+        items = [{"i": n, "masked": f"line {n}"} for n in range(5)]
+        results = list(engine.translate_stream(items, "en", "tr", {}))
+        assert legacy.requests == [[0, 1], [2, 3], [4]]
+        assert {r["i"]: r.get("t", r.get("error")) for r in results} == {
+            0: "Missing result", 1: "LINE 1", 2: "Missing result", 3: "LINE 3", 4: "Missing result"}
+
+    def test_cancel_between_requests(self):
+        from interfaces.i_plugin import CancelToken, as_engine_v2
+
+        legacy = LegacyEngine()
+        stream = as_engine_v2(legacy).translate_stream(
+            [{"i": n, "masked": "x"} for n in range(4)], "en", "tr", {},
+            cancel_token=CancelToken(lambda: bool(legacy.requests)))
+        results = list(stream)
+        assert legacy.requests == [[0, 1]]
+        assert [r.get("error") for r in results if r["i"] >= 2] == ["Canceled", "Canceled"]
+
+    def test_builtins_declare_capabilities(self, plugin_manager):
+        from interfaces.i_plugin import ITranslationEngineV2
+
+        google = plugin_manager.get_engine_v2("renforge.engine.google_free")
+        assert isinstance(google, ITranslationEngineV2)
+        caps = google.capabilities({})
+        assert (caps.max_concurrency, caps.supports_dedup) == (2, True)
+        assert caps.limit_jobs(8) == 2 and caps.limit_rpm(0) == caps.limit_rpm(60) == 30
+
+    def test_service_streams_results(self, plugin_manager):
+        service = TranslationService({"active_plugin_engine": "renforge.engine.dummy"})
+        service.plugin_manager = plugin_manager
+
+        items = [{"i": 7, "original": "Hi [name]"}, {"i": 3, "original": "Hi [name]"}]
+        stream = service.stream_translate(items, "en", "tr")
+        assert next(stream) == {"i": 7, "t": "[TEST] Hi [name]"}
+        assert list(stream) == [{"i": 3, "t": "[TEST] Hi [name]"}]
+        assert service.engine_capabilities().max_items_per_request == 500
+
+
+CRASHY_ENGINE = '''
+import os
+import time
+from interfaces.i_plugin import ITranslationEngineV2, is_canceled
+
+class CrashyEngine(ITranslationEngineV2):
+    def on_load(self, context): pass
+    def on_unload(self): pass
+    def get_supported_languages(self): return ["en", "tr"]
+    def is_available(self, config): return True
+    def translate_stream(self, items, source_lang, target_lang, config, cancel_token=None, timeout=30):
+        for item in items:
+            if is_canceled(cancel_token):
+                yield {"i": item["i"], "error": "Canceled"}
+                continue
+            if item["masked"] == "crash":
+                os._exit(3)
+            if item["masked"] == "slow":
+                time.sleep(0.5)
+            yield {"i": item["i"], "t": f"{os.getpid()}:{item['masked']}"}
+'''
+
+
+class TestProcessIsolation:
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        import json
+        from core.plugin_host import create_process_plugin
+
+        plugin_dir = tmp_path / "crashy"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.py").write_text(CRASHY_ENGINE, encoding="utf-8")
+        manifest = {"id": "test.crashy", "type": "engine", "entrypoint": "plugin.py:CrashyEngine",
+                    "isolation": {"mode": "process", "processes": 2},
+                    "capabilities": {"max_concurrency": 4}}
+        (plugin_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        engine = create_process_plugin(manifest, plugin_dir, 2)
+        yield engine
+        engine.on_unload()
+
+    def test_runs_in_worker_and_restarts_after_crash(self, engine):
+        items = [{"i": 0, "masked": "a"}, {"i": 1, "masked": "crash"}, {"i": 2, "masked": "b"}]
+        results = {r["i"]: r for r in engine.translate_stream(items, "en", "tr", {})}
+        worker_pid = int(results[0]["t"].split(":")[0])
+        assert worker_pid != os.getpid()
+        assert "exited" in results[1]["error"] and "exited" in results[2]["error"]
+
+        again = list(engine.translate_stream([{"i": 0, "masked": "ok"}], "en", "tr", {}))
+        assert again[0]["t"].endswith(":ok") and int(again[0]["t"].split(":")[0]) != worker_pid
+        assert engine.pool.restarts == 1
+        assert engine.capabilities({}).max_concurrency == 2  # Capped at the pool size
+
+    def test_cancel_is_forwarded(self, engine):
+        import threading
+
+        cancel = threading.Event()
+        stream = engine.translate_stream(
+            [{"i": n, "masked": "slow"} for n in range(4)], "en", "tr", {}, cancel_token=cancel)
+        first = next(stream)
+        cancel.set()
+        rest = list(stream)
+        assert "t" in first and [r.get("error") for r in rest][-1] == "Canceled"
+        assert engine.pool.health_check() == 0
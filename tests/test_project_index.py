@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the per-file project progress index.
+"""
+
+import os
+
+from core.project_index import ProjectIndex
+
+TRANSLATED = '''translate turkish start_1:
+
+    # e "Hello [player]!"
+    e "Merhaba [player]!"
+
+translate turkish start_2:
+
+    # e "Good night."
+    e ""
+
+translate turkish strings:
+
+    old "Start"
+    new "Start"
+'''
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestProjectIndex:
+
+    def test_counts_and_cache(self, tmp_path):
+        write(tmp_path / "game" / "tl" / "turkish" / "script.rpy", TRANSLATED)
+        write(tmp_path / "game" / "script.rpy", 'label start:\n    e "Hi."\n')
+        write(tmp_path / ".renforge" / "ignored.rpy", TRANSLATED)
+
+        index = ProjectIndex(tmp_path)
+        assert len(index.scan()) == 2
+
+        progress = index.get("game/tl/turkish/script.rpy")
+        assert (progress.mode, progress.language) == ("translate", "turkish")
+        assert (progress.items, progress.untranslated, progress.modified) == (3, 1, 1)
+        assert progress.progress == 2 / 3
+        assert index.get(tmp_path / "game" / "script.rpy").progress is None
+        assert index.totals()["files"] == 2
+
+        # Unchanged files come from the cache
+        reloaded = ProjectIndex(tmp_path)
+        assert reloaded.get("game/tl/turkish/script.rpy") == progress
+        assert reloaded.scan() == []
+
+    def test_incremental_rescan(self, tmp_path):
+        target = tmp_path / "tl.rpy"
+        write(target, TRANSLATED)
+        write(tmp_path / "other.rpy", TRANSLATED)
+        index = ProjectIndex(tmp_path)
+        index.scan()
+
+        write(target, TRANSLATED.replace('e ""', 'e "İyi geceler."'))
+        os.utime(target, ns=(1, 1))
+        changed = index.scan()
+        assert [p.path for p in changed] == ["tl.rpy"]
+        assert index.get("tl.rpy").untranslated == 0
+
+        (tmp_path / "other.rpy").unlink()
+        assert index.scan() == []
+        assert [p.path for p in index.entries()] == ["tl.rpy"]
+
+    def test_parse_errors_are_recorded(self, tmp_path, monkeypatch):
+        import renforge_core
+
+        write(tmp_path / "broken.rpy", "label x:\n")
+
+        def fail(*args, **kwargs):
+            raise ValueError("bad file")
+
+        monkeypatch.setattr(renforge_core, "load_parsed_file", fail)
+        index = ProjectIndex(tmp_path)
+        assert index.scan()[0].error == "bad file"
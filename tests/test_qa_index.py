@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the incremental QA index and the shared rule result cache.
+"""
+
+import threading
+
+from core.qa_engine import QAEngine, QAIndex, QASeverity, get_qa_index, live_counts, mark_dirty
+from core.qc_engine import check_quality
+from core.rule_cache import RuleResultCache, get_rule_cache
+from models.parsed_file import ParsedFile, ParsedItem
+from renforge_enums import FileMode, ItemType
+
+
+def make_file(pairs):
+    items = [ParsedItem(line_index=n, original_text=source, current_text=text, initial_text=text,
+                        type=ItemType.DIALOGUE, parsed_data={}) for n, (source, text) in enumerate(pairs)]
+    return ParsedFile(file_path="/test/qa.rpy", mode=FileMode.TRANSLATE, lines=[], items=items)
+
+
+class CountingEngine(QAEngine):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = 0
+
+    def _evaluate(self, item):
+        self.evaluated += 1
+        return super()._evaluate(item)
+
+
+class TestRuleResultCache:
+
+    def test_lru_eviction(self):
+        cache = RuleResultCache(max_entries=2)
+        calls = []
+        for key in ("a", "b", "a", "c", "b"):
+            cache.get_or_compute((key,), lambda: calls.append(key) or key)
+        assert calls == ["a", "b", "c", "b"]  # "b" was least recently used when "c" came in
+        assert cache.get_stats()["hits"] == 1
+
+    def test_check_quality_is_cached(self):
+        cache = get_rule_cache()
+        first = check_quality("Hello [name], how are you?", "Merhaba, nasılsın?")
+        hits = cache.hits
+        second = check_quality("Hello [name], how are you?", "Merhaba, nasılsın?")
+        assert cache.hits == hits + 1
+        assert second == first and second is not first
+        assert [issue.code for issue in second] == ["PLACEHOLDER_MISSING"]
+
+
+class TestQAIndex:
+
+    def test_scan_matches_full_engine(self):
+        parsed_file = make_file([("Hello [name]", "Merhaba"), ("Long sentence", "Long sentence"),
+                                 ("Fine", "İyi"), ("Empty", "")])
+        index = get_qa_index(parsed_file)
+        expected = QAEngine().scan(parsed_file.items)
+        assert [(i.rule_id, i.raw_index) for i in index.issues()] == \
+               [(i.rule_id, i.raw_index) for i in expected]
+        assert index.counts()["rows"] == 3
+
+    def test_only_dirty_rows_are_rechecked(self):
+        parsed_file = make_file([(f"Line {n} [x]", f"Satır {n} [x]") for n in range(1000)])
+        index = get_qa_index(parsed_file)
+        index.engine = engine = CountingEngine()
+        assert index.issues() == []
+        first_scan = engine.evaluated
+
+        # Nothing changed: no rule runs
+        assert index.issues() == [] and engine.evaluated == first_scan
+
+        parsed_file.update_item_text(10, "Satır 10")
+        assert index.pending() == 1
+        issues = index.issues()
+        assert [(i.rule_id, i.raw_index, i.severity) for i in issues] == \
+               [("token_mismatch", 10, QASeverity.ERROR)]
+        assert engine.evaluated == first_scan + 1
+
+        parsed_file.update_item_text(10, "Satır 10 [x]")
+        assert index.issues() == []
+
+    def test_unnotified_changes(self):
+        parsed_file = make_file([("Hello there", "Merhaba"), ("Bye now", "Hoşça kal")])
+        index = get_qa_index(parsed_file)
+        assert index.issues() == []
+
+        # Batch results set the text directly and mark the rows themselves
+        parsed_file.items[0].set_text("")
+        mark_dirty(parsed_file, [0])
+        assert [i.rule_id for i in index.issues()] == ["empty"]
+
+        # A silent change is only found by a verifying refresh
+        parsed_file.items[1].current_text = "Bye now"
+        assert len(index.issues()) == 1
+        index.refresh(verify=True)
+        assert [i.rule_id for i in index.issues(refresh=False)] == ["empty", "identical"]
+
+    def test_appended_rows_and_cancel(self):
+        parsed_file = make_file([("One", "")] * 1200)
+        index = get_qa_index(parsed_file)
+        assert index.refresh(callback=lambda done, total: done < 500) is False
+        assert index.pending() == 700
+
+        assert index.refresh() is True
+        parsed_file.append_items(make_file([("Two", "")]).items)
+        assert index.pending() == 1
+        assert index.counts()["error"] == 1201
+
+    def test_edits_do_not_wait_for_a_scan(self):
+        parsed_file = make_file([("Hello", "")] * 3)
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingEngine(QAEngine):
+            def check_item(self, item, index):
+                started.set()
+                release.wait(5)
+                return super().check_item(item, index)
+
+        index = QAIndex(parsed_file, BlockingEngine())
+        scan = threading.Thread(target=index.refresh)
+        scan.start()
+        assert started.wait(5)
+
+        # Both return while the scan is still stuck in its first row
+        index.mark_dirty([0])
+        assert index.issues(refresh=False) == [] and index.counts(refresh=False)["rows"] == 0
+        assert scan.is_alive()
+
+        release.set()
+        scan.join(5)
+        assert index.counts(refresh=False)["error"] == 3
+        assert index.pending() == 1  # The edit made during the scan is still queued
+
+    def test_live_counts_only_scanned_files(self):
+        scanned = make_file([("Hello", "")])
+        unscanned = make_file([("Hello", "")])
+        before = live_counts()
+        get_qa_index(scanned).refresh()
+        get_qa_index(unscanned)
+        after = live_counts()
+        assert after["files"] == before["files"] + 1
+        assert after["error"] == before["error"] + 1
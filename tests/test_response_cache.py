@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the persistent Gemini response cache.
+"""
+
+import pytest
+
+from core.response_cache import ResponseCache, compute_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(db_path=tmp_path / "cache.db", max_bytes=1000, ttl_seconds=60)
+
+
+class TestCacheKey:
+
+    def test_normalized_prompt(self):
+        assert compute_cache_key("m", "a  \r\nb\n") == compute_cache_key("m", "a\nb")
+
+    def test_key_parts(self):
+        base = compute_cache_key("m", "p")
+        assert base != compute_cache_key("other", "p")
+        assert base != compute_cache_key("m", "p", json_mode=True)
+        assert base != compute_cache_key("m", "p", template_version=99)
+
+
+class TestResponseCache:
+
+    def test_hit_and_miss_counters(self, cache):
+        assert cache.get("k") is None
+        cache.put("k", "m", "response")
+        assert cache.get("k") == "response"
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+        assert stats['hit_rate'] == 50.0
+
+    def test_ttl_expiry(self, cache, monkeypatch):
+        import core.response_cache as rc
+        cache.put("k", "m", "response")
+        now = rc.time.time()
+        monkeypatch.setattr(rc.time, "time", lambda: now + 120)
+        assert cache.get("k") is None
+        assert cache.get_stats()['expired'] == 1
+        assert cache.get_stats()['entries'] == 0
+
+    def test_lru_eviction(self, cache):
+        cache.put("a", "m", "x" * 400)
+        cache.put("b", "m", "y" * 400)
+        cache.get("a")  # a is now more recent than b
+        cache.put("c", "m", "z" * 400)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.get_stats()['size_bytes'] <= 1000
+
+    def test_persists_across_instances(self, tmp_path):
+        ResponseCache(db_path=tmp_path / "c.db").put("k", "m", "v")
+        assert ResponseCache(db_path=tmp_path / "c.db").get("k") == "v"
+
+
+class TestGeminiReplay:
+
+    @pytest.fixture
+    def fake(self, cache, monkeypatch):
+        import core.response_cache as rc
+        from benchmarks.fake_engine import FakeEngineConfig, installed_fake_model
+
+        with installed_fake_model(FakeEngineConfig(latency_ms=0, per_item_ms=0)) as model:
+            monkeypatch.setattr(rc, "get_response_cache", lambda: cache)
+            yield model
+
+    def test_validated_batch_is_replayed(self, fake):
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        first = translate_text_batch_gemini_strict(["Hello there."], "en", "tr")
+        second = translate_text_batch_gemini_strict(["Hello there."], "en", "tr")
+        assert first["translations"] == second["translations"] == [{"i": 0, "t": "TR Hello there."}]
+        assert fake.stats["requests"] == 1
+
+        translate_text_batch_gemini_strict(["Hello there."], "en", "tr", use_cache=False)
+        assert fake.stats["requests"] == 2
+
+    def test_wrong_schema_response_is_not_stored(self, fake, cache):
+        import json
+        from benchmarks.fake_engine import FakeGeminiModel
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        class WrongSchemaFirst(FakeGeminiModel):
+            def _answer(self, items, repair):
+                if self.stats["requests"] == 1:
+                    return json.dumps({"translation": "TR everything"})
+                return super()._answer(items, repair)
+
+        fake.__class__ = WrongSchemaFirst
+        result = translate_text_batch_gemini_strict(["Hello there."], "en", "tr")
+        assert result["translations"] == [{"i": 0, "t": "TR Hello there."}]
+        # Neither the invalid answer nor the one to the repair prompt is kept
+        assert cache.get_stats()['entries'] == 0
+
+        translate_text_batch_gemini_strict(["Hello there."], "en", "tr")
+        assert fake.stats["requests"] == 3
+
+    def test_response_with_missing_tokens_is_not_stored(self, fake, cache):
+        from renforge_ai import translate_text_batch_gemini_strict
+
+        fake.config.drop_token_rate = 1.0
+        result = translate_text_batch_gemini_strict(["Hi [player]."], "en", "tr")
+        assert result["translations"][0]["t"] == "TR Hi [player]."  # Repaired
+        assert cache.get_stats()['entries'] == 0
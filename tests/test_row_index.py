@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the problem-row index used by TranslationTableModel navigation.
+"""
+
+import random
+from dataclasses import dataclass
+from enum import Enum
+
+import pytest
+
+from core.row_index import (ERROR, FLAGGED, MODIFIED, PROBLEMS, QC, UNTRANSLATED,
+                            ProblemRowIndex, SortedRowSet, row_categories)
+
+
+class Status(Enum):
+    UNTRANSLATED = "untranslated"
+    TRANSLATED = "translated"
+    MODIFIED = "modified"
+    APPROVED = "approved"
+    ERROR = "error"
+
+
+@dataclass
+class Row:
+    status: Status = Status.TRANSLATED
+    is_flagged: bool = False
+    qc_flag: bool = False
+
+
+def brute_force(rows, category):
+    return [n for n, row in enumerate(rows) if category in row_categories(row)]
+
+
+class TestSortedRowSet:
+
+    def test_neighbours_and_wrap(self):
+        rows = SortedRowSet([40, 10, 30, 10])
+        assert list(rows) == [10, 30, 40] and 30 in rows and 20 not in rows
+        assert rows.next_after(10) == 30 and rows.next_after(15) == 30
+        assert rows.next_after(40) == 10 and rows.next_after(40, wrap=False) is None
+        assert rows.prev_before(30) == 10 and rows.prev_before(10) == 40
+        assert rows.prev_before(10, wrap=False) is None
+
+        rows.add(20)
+        rows.discard(30)
+        rows.discard(99)
+        rows.append(50)
+        rows.append(5)  # Out of order: still kept sorted
+        assert list(rows) == [5, 10, 20, 40, 50]
+        assert (rows.first(), rows.last()) == (5, 50)
+
+
+class TestProblemRowIndex:
+
+    def test_categories(self):
+        assert row_categories(Row(Status.UNTRANSLATED)) == [UNTRANSLATED, PROBLEMS]
+        assert row_categories(Row(Status.MODIFIED, qc_flag=True)) == [MODIFIED, QC]
+        assert row_categories(Row(Status.APPROVED, is_flagged=True)) == [FLAGGED, PROBLEMS]
+        assert row_categories(Row(Status.ERROR)) == [ERROR, PROBLEMS]
+
+    def test_incremental_updates_match_full_scan(self):
+        rng = random.Random(3)
+        rows = [Row(rng.choice(list(Status)), rng.random() < 0.1, rng.random() < 0.2) for _ in range(500)]
+        index = ProblemRowIndex()
+        index.rebuild(rows[:300])
+        index.extend(300, rows[300:])
+
+        for _ in range(2000):
+            n = rng.randrange(len(rows))
+            rows[n] = Row(rng.choice(list(Status)), rng.random() < 0.1, rng.random() < 0.2)
+            index.update(n, rows[n])
+
+        for category in (UNTRANSLATED, ERROR, QC, FLAGGED, MODIFIED, PROBLEMS):
+            expected = brute_force(rows, category)
+            assert list(index.sets[category]) == expected
+            assert index.count(category) == len(expected)
+            assert index.first(category) == expected[0] and index.last(category) == expected[-1]
+
+        problems = brute_force(rows, PROBLEMS)
+        assert index.next_row(PROBLEMS, problems[3]) == problems[4]
+        assert index.prev_row(PROBLEMS, problems[3]) == problems[2]
+        assert index.next_row(PROBLEMS, len(rows)) == problems[0]
+        assert index.prev_row(PROBLEMS, -1) == problems[-1]
+
+
+class TestTableModelSync:
+    """Row changes made by the controllers go through the model and keep the index in step."""
+
+    @staticmethod
+    def make_model():
+        pytest.importorskip("PySide6.QtCore")
+        from gui.models.row_data import RowData, RowStatus
+        from gui.models.translation_table_model import TranslationTableModel
+
+        model = TranslationTableModel()
+        model.set_rows([RowData(id=str(n), row_type="say", original_text=f"Line {n}",
+                                editable_text=f"Satır {n}", last_saved_text=f"Satır {n}",
+                                last_engine_text=f"Satır {n}",
+                                status=RowStatus.TRANSLATED) for n in range(5)])
+        return model, RowStatus
+
+    def test_batch_error_sync(self):
+        model, RowStatus = self.make_model()
+        # Same patch BatchController applies to failed rows after a run
+        model.update_single_row(3, {"status": RowStatus.ERROR, "error_message": "Timeout"})
+
+        assert model.count_rows(ERROR) == 1 and model.first_row(PROBLEMS) == 3
+        assert model.next_row(PROBLEMS, 0) == 3
+        assert model.get_global_stats()["problems"] == 1
+
+    def test_revert_to_saved(self):
+        model, RowStatus = self.make_model()
+        model.update_single_row(1, {"status": RowStatus.ERROR, "error_message": "Timeout"})
+        model.revert_row_to_saved(1)
+
+        assert model.get_row_data(1).status == RowStatus.TRANSLATED
+        assert model.count_rows(ERROR) == 0 and model.first_row(PROBLEMS) is None
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for direct dialogue/string extraction from compiled .rpyc ASTs.
+"""
+
+import copyreg
+import hashlib
+import struct
+import zlib
+
+from parser.translate_parser import TranslateParser
+from renforge_enums import ItemType
+from utils.rpyc_extractor import (_load_unrpyc, extract_rpyc, format_translation_stub,
+                                  generate_translation_stubs)
+
+_load_unrpyc()
+from decompiler import magic  # noqa: E402
+from decompiler.renpycompat import CLASS_FACTORY  # noqa: E402
+
+
+def node(kind, module="renpy.ast", **attributes):
+    cls = CLASS_FACTORY(kind, module)
+    made = cls.__new__(cls)
+    made.__dict__.update(attributes)
+    return made
+
+
+def py_code(source):
+    """renpy.ast.PyCode pickles a (version, source, location, mode) state tuple."""
+    cls = CLASS_FACTORY("PyCode", "renpy.ast")
+    code = cls.__new__(cls)
+    state = (1, source, ("game/script.rpy", 8), "exec")
+    code.__reduce_ex__ = lambda protocol: (copyreg.__newobj__, (cls,), state)
+    return code
+
+
+def say(who, what, line, filename="game/script.rpy"):
+    return node("Say", who=who, what=what, with_=None, interact=True, attributes=None,
+                arguments=None, temporary_attributes=None, identifier=None,
+                filename=filename, linenumber=line)
+
+
+def displayable(kind, module, style, text, line):
+    return node("SLDisplayable", "renpy.sl2.slast", displayable=CLASS_FACTORY(kind, module),
+                style=style, positional=[text], children=[], location=("game/screens.rpy", line))
+
+
+def write_rpyc(path, stmts):
+    blob = zlib.compress(magic.safe_dumps(({"version": 1}, stmts), protocol=2))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"RENPY RPC2" + struct.pack("III", 1, 34, len(blob)) +
+                     struct.pack("III", 0, 0, 0) + blob)
+
+
+def script():
+    loc = {"filename": "game/script.rpy"}
+    menu = node("Menu", items=[("Go left", "True", [say("e", "Left it is.", 6)]),
+                               ("Go right", "True", [])],
+                set=None, with_=None, linenumber=5, **loc)
+    python = node("Python", code=py_code('title = _("The End")'), linenumber=8, **loc)
+    start = node("Label", name="start", hide=False, parameters=None, linenumber=1, block=[
+        node("Translate", identifier="start_0badc0de", language=None, linenumber=2,
+             block=[say("e", 'Hi "you"', 2)], **loc),
+        node("EndTranslate", linenumber=2, **loc),
+        say(None, "Same line", 3),
+        say(None, "Same line", 4),
+        menu,
+        python,
+    ], **loc)
+    screen = node("SLScreen", "renpy.sl2.slast", name="main_menu", children=[
+        displayable("Text", "renpy.text.text", "text", '_("New game")', 10),
+        displayable("_textbutton", "renpy.ui", "button", '"Quit"', 11),
+        displayable("Text", "renpy.text.text", "text", "player_name", 12),
+    ])
+    init = node("Init", priority=0, linenumber=9, block=[node("Screen", screen=screen, linenumber=9, **loc)], **loc)
+    return [start, init]
+
+
+class TestExtractRpyc:
+
+    def test_entries_and_identifiers(self, tmp_path):
+        path = tmp_path / "game" / "script.rpyc"
+        write_rpyc(path, script())
+        extraction = extract_rpyc(path)
+
+        digest = hashlib.md5(b'"Same line"\r\n').hexdigest()[:8]
+        in_menu = hashlib.md5(b'e "Left it is."\r\n').hexdigest()[:8]
+        assert [(e.identifier, e.text) for e in extraction.dialogue] == [
+            ("start_0badc0de", 'Hi "you"'),         # Stored by Ren'Py 8
+            (f"start_{digest}", "Same line"),       # Recomputed as Ren'Py does
+            (f"start_{digest}_1", "Same line"),
+            (f"start_{in_menu}", "Left it is."),
+        ]
+        assert extraction.dialogue[1].type == ItemType.NARRATION
+        assert extraction.dialogue[0].code == 'e "Hi \\"you\\""'
+
+        assert [(e.type, e.text, e.label) for e in extraction.strings] == [
+            (ItemType.CHOICE, "Go left", "start"),
+            (ItemType.CHOICE, "Go right", "start"),
+            (ItemType.VARIABLE, "The End", "start"),
+            (ItemType.SCREEN_TEXT_STATEMENT, "New game", "main_menu"),
+            (ItemType.SCREEN_BUTTON, "Quit", "main_menu"),
+        ]
+
+    def test_stub_parses_back(self, tmp_path):
+        path = tmp_path / "game" / "script.rpyc"
+        write_rpyc(path, script())
+        extraction = extract_rpyc(path)
+        stub = format_translation_stub(extraction, "turkish")
+
+        assert stub.startswith("# game/script.rpy:2\ntranslate turkish start_0badc0de:\n")
+        items, language = TranslateParser().parse(stub.split("\n"))
+        assert language == "turkish"
+        assert len(items) == len(extraction.entries)
+
+
+class TestGenerateTranslationStubs:
+
+    def test_skips_translated_and_existing(self, tmp_path):
+        write_rpyc(tmp_path / "game" / "script.rpyc", script())
+        write_rpyc(tmp_path / "game" / "tl" / "turkish" / "old.rpyc", [
+            node("Translate", identifier="start_0badc0de", language="turkish", linenumber=1,
+                 block=[say("e", "Merhaba", 2)], filename="game/tl/turkish/old.rpy"),
+            node("TranslateString", language="turkish", old="Quit", new="Çık",
+                 linenumber=4, filename="game/tl/turkish/old.rpy"),
+        ])
+
+        results = generate_translation_stubs(tmp_path, "turkish")
+        assert (results["files_written"], results["dialogue"], results["strings"]) == (1, 3, 4)
+
+        stub = (tmp_path / "game" / "tl" / "turkish" / "script.rpy").read_text(encoding="utf-8")
+        assert "start_0badc0de" not in stub and 'old "Quit"' not in stub
+        assert not (tmp_path / "game" / "tl" / "turkish" / "tl").exists()
+
+        again = generate_translation_stubs(tmp_path, "turkish")
+        assert (again["files_written"], again["files_skipped"]) == (0, 1)
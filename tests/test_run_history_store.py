@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the append-only run history store.
+"""
+
+import json
+
+import pytest
+
+import renforge_config as config
+from core.run_history_store import RunHistoryStore, RunRecord
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_DIR", tmp_path / "db")
+    (tmp_path / "db").mkdir()
+    RunHistoryStore.reset_instance()
+    yield RunHistoryStore.instance()
+    RunHistoryStore.reset_instance()
+
+
+def make_run(ts, errors=0, **kwargs):
+    return RunRecord(
+        timestamp=ts, processed=10, errors_count=errors, tm_hits=2,
+        error_items=[{"row_id": i, "message": "boom"} for i in range(errors)],
+        error_row_ids=list(range(errors)),
+        **kwargs,
+    )
+
+
+class TestRunHistoryStore:
+
+    def test_summaries_are_unbounded_and_details_lazy(self, store):
+        for day in range(1, 61):
+            store.add_run(make_run(f"2026-01-01 00:00:{day:02d}" if day < 60 else "2026-03-01 00:00:00",
+                                   errors=day % 3))
+
+        runs = store.get_runs(100)
+        assert len(runs) == 60
+        latest = store.get_last_run()
+        assert latest.timestamp == "2026-03-01 00:00:00"
+        assert latest.tm_hits == 2
+        assert latest.error_items == [] and not latest.details_loaded
+
+        run = store.load_details(runs[1])
+        assert run.details_loaded
+        assert len(run.error_items) == run.errors_count == 2
+        assert run.error_row_ids == [0, 1]
+
+    def test_project_first_and_clear(self, store, tmp_path):
+        project = tmp_path / "game"
+        project.mkdir()
+        store.add_run(make_run("2026-01-01 10:00:00"))
+        store.set_project_path(str(project))
+        assert len(store.get_runs()) == 1  # project empty -> global fallback
+
+        store.add_run(make_run("2026-01-02 10:00:00", errors=1))
+        assert [r.timestamp for r in store.get_runs()] == ["2026-01-02 10:00:00"]
+        assert store.load_details(store.get_last_run()).error_row_ids == [0]
+
+        store.clear()
+        assert store.get_runs() == []
+
+    def test_compact_drops_old_details_only(self, store):
+        store.add_run(make_run("2000-01-01 00:00:00", errors=2))
+        store.add_run(make_run("2999-01-01 00:00:00", errors=2))
+
+        assert store.compact() == 1
+        old, new = sorted(store.get_runs(), key=lambda r: r.timestamp)
+        assert old.errors_count == 2 and store.load_details(old).error_items == []
+        assert len(store.load_details(new).error_items) == 2
+
+    def test_legacy_json_is_migrated(self, store, tmp_path):
+        legacy = [
+            {"timestamp": "2025-05-02 00:00:00", "processed": 3, "qc_items": [{"row_id": 1}]},
+            {"timestamp": "2025-05-01 00:00:00", "processed": 1, "unknown_field": True},
+        ]
+        (tmp_path / "db" / "run_history.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        runs = store.get_runs()
+        assert [r.processed for r in runs] == [3, 1]
+        assert store.load_details(runs[0]).qc_items == [{"row_id": 1}]
+        assert (tmp_path / "db" / "run_history.json.migrated").exists()
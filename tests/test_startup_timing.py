@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the startup timing report.
+"""
+
+import sys
+
+from utils.startup_timing import StartupTimer
+
+
+class TestStartupTimer:
+
+    def test_nested_phases_keep_parent_first(self):
+        timer = StartupTimer(profile_imports=False)
+        with timer.phase("bootstrap"):
+            with timer.phase("view"):
+                pass
+        timer.mark("first_window")
+
+        lines = timer.report().splitlines()
+        assert lines[0] == "Startup timing:"
+        assert lines[1].strip().startswith("bootstrap")
+        assert lines[2].startswith("    view")
+        assert "@ first_window" in lines[3]
+
+    def test_import_profile_lists_imports_and_unhooks(self):
+        sys.modules.pop("json.tool", None)
+        timer = StartupTimer(profile_imports=True)
+        try:
+            with timer.phase("imports"):
+                import json.tool  # noqa: F401
+            report = timer.report()
+        finally:
+            timer.stop_import_profile()
+
+        assert "import json.tool" in report
+        assert not any(type(f).__name__ == "_ImportTimingFinder" for f in sys.meta_path)
+
+    def test_log_report_only_once(self):
+        messages = []
+
+        class Logger:
+            def info(self, msg):
+                messages.append(msg)
+
+        timer = StartupTimer(profile_imports=False)
+        timer.log_report(Logger())
+        timer.log_report(Logger())
+        assert len(messages) == 1
+
+
+def test_pages_package_is_lazy():
+    import gui.pages as pages
+    assert "TMPage" in pages.__all__
+    assert "TMPage" not in vars(pages)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for per-stage batch telemetry.
+"""
+
+import pytest
+
+import renforge_config as config
+from core import telemetry
+from core.run_history_store import RunHistoryStore, RunRecord
+
+
+@pytest.fixture(autouse=True)
+def no_active_run():
+    telemetry.finish_run()
+    yield
+    telemetry.finish_run()
+
+
+class TestHistogram:
+
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = telemetry.StageHistogram()
+        for ms in [0.5] * 50 + [15] * 45 + [700] * 5:
+            histogram.add(ms)
+
+        assert histogram.count == 100
+        assert histogram.percentile(0.5) == 1.0
+        assert histogram.percentile(0.95) == 20.0
+        assert histogram.percentile(1.0) == 700.0  # capped at max
+        assert histogram.to_dict()["min_ms"] == 0.5
+
+
+class TestRun:
+
+    def test_inactive_calls_are_noops(self):
+        with telemetry.stage(telemetry.NETWORK):
+            pass
+        telemetry.count("items")
+        assert telemetry.current() is None
+        assert telemetry.finish_run() == {}
+
+    def test_snapshot_and_breakdown(self):
+        telemetry.start_run()
+        with telemetry.stage("custom"):
+            pass
+        with telemetry.stage(telemetry.QC):
+            pass
+        telemetry.record(telemetry.NETWORK, 0.25)
+        telemetry.record(telemetry.NETWORK, 0.05)
+        telemetry.count("items", 3)
+        telemetry.count("items")
+
+        snapshot = telemetry.finish_run()
+        assert list(snapshot["stages"]) == [telemetry.NETWORK, telemetry.QC, "custom"]
+        assert snapshot["counters"] == {"items": 4}
+        assert snapshot["stages"][telemetry.NETWORK]["total_ms"] == 300.0
+
+        rows = telemetry.breakdown(snapshot)
+        assert rows[0]["stage"] == telemetry.NETWORK and rows[0]["count"] == 2
+        assert rows[0]["p95_ms"] == 250.0
+        assert telemetry.breakdown({}) == []
+
+    def test_stage_records_on_exception(self):
+        telemetry.start_run()
+        with pytest.raises(ValueError):
+            with telemetry.stage(telemetry.REPAIR):
+                raise ValueError
+        assert telemetry.finish_run()["stages"][telemetry.REPAIR]["count"] == 1
+
+    def test_owner_finishes_only_its_own_run(self):
+        first = telemetry.start_run()
+        telemetry.count("items")
+        second = telemetry.start_run()  # e.g. a headless run started meanwhile
+
+        assert telemetry.finish_run(first)["counters"] == {"items": 1}
+        assert telemetry.current() is second
+        assert telemetry.finish_run(second)["counters"] == {}
+        assert telemetry.current() is None
+
+
+def test_snapshot_is_stored_with_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_DIR", tmp_path)
+    RunHistoryStore.reset_instance()
+    try:
+        telemetry.start_run()
+        telemetry.record(telemetry.BACKOFF, 2.0)
+        store = RunHistoryStore.instance()
+        store.add_run(RunRecord(timestamp="2026-01-01 00:00:00", telemetry=telemetry.finish_run()))
+
+        RunHistoryStore.reset_instance()
+        run = RunHistoryStore.instance().get_last_run()
+        assert run.telemetry["stages"][telemetry.BACKOFF]["total_ms"] == 2000.0
+    finally:
+        RunHistoryStore.reset_instance()
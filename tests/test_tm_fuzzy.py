@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for fuzzy TM matching and the TM pre-check.
+"""
+
+import random
+
+import pytest
+
+import renforge_config as config
+from core.tm_fuzzy import adapt_target, fuzzy_key, levenshtein
+from core.tm_precheck import tm_precheck, tm_precheck_batch
+from core.tm_store import TMStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_DIR", tmp_path)
+    TMStore.reset_instance()
+    yield TMStore.instance()
+    TMStore.reset_instance()
+
+
+class Settings:
+    tm_enabled = True
+    tm_auto_apply_exact = True
+    tm_fuzzy_enabled = True
+    tm_fuzzy_threshold = 0.75
+    tm_fuzzy_auto_apply_score = 1.0
+
+
+def _reference_levenshtein(a, b):
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+class TestScoring:
+
+    def test_levenshtein_matches_reference(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            a = "".join(rng.choice("ab cç") for _ in range(rng.randint(0, 80)))
+            b = "".join(rng.choice("ab cç") for _ in range(rng.randint(0, 80)))
+            assert levenshtein(a, b) == _reference_levenshtein(a, b)
+
+    def test_key_masks_tokens_and_case(self):
+        assert fuzzy_key("Hello,  [name]{w}!") == fuzzy_key("hello, [player]{p=1.0}!")
+
+    def test_adapt_target_remaps_tokens(self):
+        assert adapt_target("Hi [player]!", "Hi [name]!", "Selam [name]!") == "Selam [player]!"
+        assert adapt_target("Hi [a] [b]!", "Hi [name]!", "Selam [name]!") is None
+
+
+class TestFuzzyLookup:
+
+    def test_one_word_difference(self, store):
+        store.insert("You can't go back to the old mansion tonight.", "Bu gece eski malikaneye dönemezsin.",
+                     "en", "tr")
+        store.insert("Something completely different.", "Bambaşka bir şey.", "en", "tr")
+
+        matches = store.lookup_fuzzy("You can't go back to the old house tonight.", "en", "tr")
+        assert [m.entry.target_text for m in matches] == ["Bu gece eski malikaneye dönemezsin."]
+        assert 0.75 <= matches[0].score < 1.0
+
+    def test_language_pair_and_new_entries(self, store):
+        store.insert("Where is the key to the cellar?", "Mahzenin anahtarı nerede?", "en", "tr")
+        assert store.lookup_fuzzy("Where is the key to the cellar!", "en", "de") == []
+        assert len(store.lookup_fuzzy("Where is the key to the cellar!", "en", "tr")) == 1
+
+        # Indexed lazily on the next lookup
+        store.insert("The cellar door is locked.", "Mahzen kapısı kilitli.", "en", "tr")
+        assert store.lookup_fuzzy("The cellar door is locked!", "en", "tr")[0].entry.target_text == \
+            "Mahzen kapısı kilitli."
+
+    def test_deleted_and_cleared_entries_disappear(self, store):
+        store.insert("I will wait for you at the station.", "Seni istasyonda bekleyeceğim.", "en", "tr")
+        entry = store.lookup_fuzzy("I will wait for you at the station!", "en", "tr")[0].entry
+        store.delete(entry.id)
+        assert store.lookup_fuzzy("I will wait for you at the station!", "en", "tr") == []
+
+        store.insert("I will wait for you at the station.", "Seni istasyonda bekleyeceğim.", "en", "tr")
+        store.clear()
+        assert store.fuzzy_index.indexed_upto() == 0
+        assert store.lookup_fuzzy("I will wait for you at the station!", "en", "tr") == []
+
+
+class TestPrecheck:
+
+    def test_tiers(self, store):
+        store.insert("Good morning, [name]!", "Günaydın, [name]!", "en", "tr")
+        store.insert("Please close the window before you leave.", "Çıkmadan önce pencereyi kapat lütfen.",
+                     "en", "tr")
+        texts = [
+            "Good morning, [name]!",                         # exact
+            "Good morning, [player]!",                       # same key, tokens remapped
+            "Please close the door before you leave.",       # similar -> example only
+            "Unrelated line.",
+        ]
+        context = {'tm_hits': 0, 'tm_applied': 0}
+        results, remaining = tm_precheck_batch(texts, "en", "tr", context, settings=Settings())
+
+        assert results[0].match_type == "exact" and results[0].should_skip_provider
+        assert results[1].translation == "Günaydın, [player]!"
+        assert not results[2].should_skip_provider
+        assert results[2].examples[0][1] == "Çıkmadan önce pencereyi kapat lütfen."
+        assert remaining == [2, 3]
+        assert context == {'tm_hits': 3, 'tm_applied': 2}
+
+    def test_disabled(self, store):
+        store.insert("Good morning!", "Günaydın!", "en", "tr")
+        settings = Settings()
+        settings.tm_enabled = False
+        assert not tm_precheck("Good morning!", "en", "tr", settings=settings).should_skip_provider
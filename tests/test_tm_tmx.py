@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming TMX import/export engine.
+"""
+
+import pytest
+
+import renforge_config as config
+from core.tm_store import TMStore
+from core.tm_tmx import export_from_tm_store, import_to_tm_store, iter_tmx_units
+
+TMX = '''<?xml version="1.0" encoding="UTF-8"?>
+<tmx version="1.4">
+  <header srclang="en-US" datatype="plaintext" segtype="sentence"/>
+  <body>
+    <tu changedate="20300101T000000Z" usagecount="7">
+      <tuv xml:lang="en-US"><seg>Hello &amp; welcome</seg></tuv>
+      <tuv xml:lang="tr-TR"><seg>Merhaba ve hoş geldin</seg></tuv>
+    </tu>
+    <tu changedate="20000101T000000Z">
+      <tuv xml:lang="en-US"><seg>Start <ph>{b}</ph>now</seg></tuv>
+      <tuv xml:lang="tr-TR"><seg>Şimdi <ph>{b}</ph>başla</seg></tuv>
+    </tu>
+    <tu>
+      <tuv xml:lang="en-US"><seg>No target</seg></tuv>
+    </tu>
+  </body>
+</tmx>
+'''
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_DIR", tmp_path)
+    TMStore.reset_instance()
+    yield TMStore.instance()
+    TMStore.reset_instance()
+
+
+@pytest.fixture
+def tmx_file(tmp_path):
+    path = tmp_path / "vendor.tmx"
+    path.write_text(TMX, encoding="utf-8")
+    return path
+
+
+class TestTmxImport:
+
+    def test_iter_units_reads_inline_codes(self, tmx_file):
+        units = list(iter_tmx_units(tmx_file, "en", "tr"))
+        assert units[1][:2] == ("Start {b}now", "Şimdi {b}başla")
+        assert units[0][4] == 7
+        assert units[2][1] == ""
+
+    def test_import_counts(self, store, tmx_file):
+        result = import_to_tm_store(tmx_file, "tr", "en")
+        assert result == {'total': 3, 'added': 2, 'updated': 0, 'skipped': 0,
+                          'conflicts': 0, 'invalid': 1}
+        assert store.lookup("Hello & welcome", "en", "tr").target_text == "Merhaba ve hoş geldin"
+
+    def test_header_srclang_is_default(self, store, tmx_file):
+        assert import_to_tm_store(tmx_file, "tr")['added'] == 2
+        assert store.lookup("Start {b}now", "en-US", "tr") is not None
+
+    @pytest.mark.parametrize("strategy, expected_hello, expected_start", [
+        ("skip", "old", "old"),
+        ("overwrite", "Merhaba ve hoş geldin", "Şimdi {b}başla"),
+        ("keep_newest", "Merhaba ve hoş geldin", "old"),
+    ])
+    def test_conflict_strategies(self, store, tmx_file, strategy, expected_hello, expected_start):
+        store.insert("Hello & welcome", "old", "en", "tr")
+        store.insert("Start {b}now", "old", "en", "tr")
+        result = import_to_tm_store(tmx_file, "tr", "en", strategy=strategy, batch_size=1)
+        assert result['conflicts'] == 2
+        assert store.lookup("Hello & welcome", "en", "tr", touch=False).target_text == expected_hello
+        assert store.lookup("Start {b}now", "en", "tr", touch=False).target_text == expected_start
+
+    def test_unknown_strategy(self, store, tmx_file):
+        with pytest.raises(ValueError):
+            import_to_tm_store(tmx_file, "tr", "en", strategy="bogus")
+
+
+class TestTmxExport:
+
+    def test_round_trip(self, store, tmx_file, tmp_path):
+        import_to_tm_store(tmx_file, "tr", "en")
+        out = tmp_path / "out.tmx"
+        assert export_from_tm_store(out, "en", "tr") == 2
+
+        units = list(iter_tmx_units(out, None, "tr"))
+        assert ("Hello & welcome", "Merhaba ve hoş geldin") in [u[:2] for u in units]
+        assert units[0][3].startswith("2030-01-01")
+        assert not (tmp_path / "out.tmx.part").exists()
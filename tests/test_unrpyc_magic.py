@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the C unpickler fast path of the vendored unrpyc decompiler.
+"""
+
+import copyreg
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+UNRPYC_DIR = Path(__file__).resolve().parent.parent / "utils" / "unrpyc_lib"
+if str(UNRPYC_DIR) not in sys.path:
+    sys.path.insert(0, str(UNRPYC_DIR))
+
+from decompiler import magic  # noqa: E402
+from decompiler.renpycompat import CLASS_FACTORY, pickle_detect_python2  # noqa: E402
+
+
+def make_pickle():
+    say = CLASS_FACTORY("Say", "renpy.ast")
+    node = say.__new__(say)
+    node.__dict__.update(who="e", what="Merhaba [player]", linenumber=3)
+    return magic.safe_dumps(({"version": 1}, [node, node]), protocol=2)
+
+
+def load(data, fast):
+    old = magic.FAST_UNPICKLING
+    magic.FAST_UNPICKLING = fast
+    try:
+        return magic.safe_loads(data, CLASS_FACTORY, {"_ast", "collections"})
+    finally:
+        magic.FAST_UNPICKLING = old
+
+
+class TestFastUnpickling:
+
+    def test_fast_and_slow_paths_agree(self):
+        data = make_pickle()
+        fast_meta, fast_stmts = load(data, fast=True)
+        slow_meta, slow_stmts = load(data, fast=False)
+        assert fast_meta == slow_meta == {"version": 1}
+        assert type(fast_stmts[0]) is type(slow_stmts[0])
+        assert fast_stmts[0].__dict__ == slow_stmts[0].__dict__
+        assert fast_stmts[0] is fast_stmts[1]  # Memo shared like the Python path
+
+    def test_falls_back_on_failure(self):
+        # Truncated stream: the fast path fails and the Python path reports the error
+        data = make_pickle()[:-10]
+        errors = []
+        for fast in (True, False):
+            with pytest.raises(Exception) as info:
+                load(data, fast)
+            errors.append(type(info.value))
+        assert errors[0] is errors[1]
+
+    def test_extension_registry_disables_fast_safe_path(self):
+        assert magic._safe_fast_unpickler(False) is not None
+        copyreg.add_extension("renforge_test_module", "Thing", 0x7ffffff0)
+        try:
+            assert magic._safe_fast_unpickler(False) is None
+            assert magic._safe_fast_unpickler(True) is not None
+        finally:
+            copyreg.remove_extension("renforge_test_module", "Thing", 0x7ffffff0)
+
+    def test_python2_detection_is_bounded(self):
+        data = pickle.dumps(list(range(50_000)), protocol=2)
+        assert pickle_detect_python2(data) is False
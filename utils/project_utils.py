@@ -281,8 +281,23 @@ def prepare_project_files(project_path_str: str, settings: dict) -> dict:
     # Process RPYC files
     rpyc_files = [p for p in project_path.rglob("*.rpyc") if "__pycache__" not in p.parts]
 
+    direct_extract = settings.get("rpyc_direct_extract", config.RPYC_DIRECT_EXTRACT)
+
     if rpyc_files:
-        if UNRPYC_AVAILABLE:
+        if UNRPYC_AVAILABLE and direct_extract:
+            # Dekompile yerine AST'den doğrudan tl/<dil> taslakları (tek geçiş)
+            from utils.rpyc_extractor import generate_translation_stubs
+            language = settings.get("rpyc_stub_language", config.RPYC_STUB_LANGUAGE)
+            logger.info(f"{len(rpyc_files)} *.rpyc dosyası bulundu. '{language}' çeviri taslakları doğrudan çıkarılıyor...")
+            stub_results = generate_translation_stubs(project_path, language)
+            results["rpyc_processed"] = stub_results["files_written"]
+            results["rpyc_skipped"] = stub_results["files_skipped"]
+            results["rpyc_errors"] = stub_results["errors"]
+            results["rpyc_error_details"].extend(stub_results["error_details"])
+            results["rpyc_stub_language"] = language
+            results["rpyc_stub_dialogue"] = stub_results["dialogue"]
+            results["rpyc_stub_strings"] = stub_results["strings"]
+        elif UNRPYC_AVAILABLE:
             logger.info(f"{len(rpyc_files)} *.rpyc dosyası (__pycache__ dışında) bulundu. İşleniyor...")
             for rpyc_file in rpyc_files:
                 success, message = _decompile_single_rpyc(rpyc_file)
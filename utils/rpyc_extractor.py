@@ -0,0 +1,478 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge RPYC String Extractor
+
+Reads translatable text straight from compiled .rpyc files: the unpickled
+Ren'Py AST is walked once for dialogue (Say), menu choices, screen-language
+text/textbutton/label literals and `_("...")` strings in python code, with no
+decompile to .rpy, text write, re-read or regex parse in between.
+
+Dialogue comes with the identifier Ren'Py uses for `translate <lang> <id>:`
+blocks. Ren'Py 8 stores it in the `Translate` node that wraps each
+statement; for trees without those nodes it is recomputed the way the
+decompiler's Translator (and Ren'Py's restructurer) does.
+
+    extraction = extract_rpyc(Path("game/script.rpyc"))
+    text = format_translation_stub(extraction, "turkish")
+    results = generate_translation_stubs(project_path, "turkish")
+"""
+
+import ast as pyast
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from renforge_enums import ItemType
+from renforge_logger import get_logger
+
+logger = get_logger("utils.rpyc_extractor")
+
+UNRPYC_LIB_DIR = Path(__file__).parent / "unrpyc_lib"
+
+# `_("...")` / `__("...")` with a single string literal argument
+_MARKED_STRING_RE = re.compile(
+    r'(?<![\w.])__?\(\s*((?:[rRuU]?)(?:"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'))\s*\)')
+
+_unrpyc = None
+
+
+def _load_unrpyc():
+    """Import the vendored unrpyc (its `decompiler` package lives next to the script)."""
+    global _unrpyc
+    if _unrpyc is None:
+        lib_dir = str(UNRPYC_LIB_DIR.resolve())
+        if lib_dir not in sys.path:
+            sys.path.insert(0, lib_dir)
+        import unrpyc
+        _unrpyc = unrpyc
+    return _unrpyc
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class RpycEntry:
+    """
+    One translatable text found in a compiled script.
+
+    Attributes:
+        type: Item type, as the text parsers would report it
+        text: Source text (unescaped)
+        filename: Script path recorded by Ren'Py (e.g. "game/script.rpy")
+        linenumber: 1-based line in that script
+        identifier: Dialogue translation identifier; None for strings
+        code: Say statement as Ren'Py writes it in translation files
+        label: Enclosing label or screen name
+    """
+    type: ItemType
+    text: str
+    filename: str
+    linenumber: int
+    identifier: Optional[str] = None
+    code: Optional[str] = None
+    label: Optional[str] = None
+
+    @property
+    def is_dialogue(self) -> bool:
+        return self.identifier is not None
+
+
+@dataclass
+class RpycExtraction:
+    """
+    Everything extracted from one .rpyc file.
+
+    Attributes:
+        path: The .rpyc file
+        entries: Dialogue and strings in script order
+        translated_dialogue: Language -> identifiers translated in this file
+        translated_strings: Language -> `old` strings translated in this file
+        warnings: Loader messages (e.g. pre-Ren'Py 8 files)
+    """
+    path: Path
+    entries: List[RpycEntry] = field(default_factory=list)
+    translated_dialogue: Dict[str, Set[str]] = field(default_factory=dict)
+    translated_strings: Dict[str, Set[str]] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def dialogue(self) -> List[RpycEntry]:
+        return [e for e in self.entries if e.is_dialogue]
+
+    @property
+    def strings(self) -> List[RpycEntry]:
+        return [e for e in self.entries if not e.is_dialogue]
+
+
+# =============================================================================
+# AST WALK
+# =============================================================================
+
+def _literal(source: str) -> Optional[str]:
+    """String value of a literal or `_()`-wrapped literal expression, else None."""
+    source = source.strip()
+    marked = re.fullmatch(r'__?\((.*)\)', source, re.S)
+    if marked:
+        source = marked.group(1).strip()
+    if not source or source[-1] not in "\"'":
+        return None
+    try:
+        value = pyast.literal_eval(source)
+    except (ValueError, SyntaxError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+_AST = "renpy.ast."
+
+# SL2 displayables whose first positional argument is display text (see SL2Decompiler.displayable_names)
+_SL_TEXT = {
+    ("renpy.text.text.Text", "text"): ItemType.SCREEN_TEXT_STATEMENT,
+    ("renpy.ui._textbutton", "button"): ItemType.SCREEN_BUTTON,
+    ("renpy.ui._textbutton", 0): ItemType.SCREEN_BUTTON,
+    ("renpy.ui._label", "label"): ItemType.SCREEN_LABEL,
+}
+
+# Statements whose `block` holds child statements (as Translator.walk)
+_BLOCK_KINDS = frozenset({"Init", "Label", "While", "TranslateBlock"})
+
+
+def _dotted(cls) -> str:
+    return f"{getattr(cls, '__module__', '')}.{getattr(cls, '__name__', '')}"
+
+
+class _Extractor:
+    """
+    Single pass over a statement list.
+
+    Nodes are told apart by class name: isinstance() against the decompiler's
+    fake renpy classes compares names up the whole hierarchy and would cost
+    more than the unpickling. Dialogue grouping and identifiers follow
+    Translator.translate_dialogue and create_translate.
+    """
+
+    def __init__(self, filename_hint: str):
+        _load_unrpyc()
+        from decompiler import translate, util
+
+        # Holds the label/alternate state and the identifiers already used
+        self.ids = translate.Translator(None)
+        self.ids.label = None
+        self.say_get_code = util.say_get_code
+        self.filename_hint = filename_hint
+        self.found = []  # (linenumber, order, entry)
+        self.translated_dialogue: Dict[str, Set[str]] = {}
+        self.translated_strings: Dict[str, Set[str]] = {}
+        self.context = None  # Label or screen name for strings
+        self._kinds: Dict[type, str] = {}
+
+    def kind(self, node) -> str:
+        """Class name for renpy.ast nodes, dotted path for anything else."""
+        cls = type(node)
+        kind = self._kinds.get(cls)
+        if kind is None:
+            kind = _dotted(cls)
+            if kind.startswith(_AST):
+                kind = kind[len(_AST):]
+            self._kinds[cls] = kind
+        return kind
+
+    # -- entries ---------------------------------------------------------------
+
+    def _add(self, linenumber: int, entry: RpycEntry):
+        self.found.append((linenumber, len(self.found), entry))
+
+    def _location(self, node):
+        return getattr(node, "filename", None) or self.filename_hint, getattr(node, "linenumber", 0) or 0
+
+    def _add_say(self, node, identifier: str, code: Optional[str] = None):
+        filename, linenumber = self._location(node)
+        self._add(linenumber, RpycEntry(
+            type=ItemType.DIALOGUE if node.who else ItemType.NARRATION,
+            text=node.what, filename=filename, linenumber=linenumber,
+            identifier=identifier, code=code or self.say_get_code(node), label=self.ids.label))
+
+    def _add_string(self, item_type: ItemType, text: str, filename: str, linenumber: int):
+        if isinstance(text, str) and text.strip():
+            self._add(linenumber, RpycEntry(type=item_type, text=text, filename=filename,
+                                            linenumber=linenumber, label=self.context))
+
+    def _add_code_strings(self, source: Optional[str], filename: str, linenumber: int):
+        if not source or "_(" not in source:
+            return
+        for match in _MARKED_STRING_RE.finditer(source):
+            try:
+                text = pyast.literal_eval(match.group(1))
+            except (ValueError, SyntaxError):
+                continue
+            line = linenumber + source.count("\n", 0, match.start())
+            self._add_string(ItemType.VARIABLE, text, filename, line)
+
+    def _flush(self, group: list):
+        """Identifier for a translatable group ending in a Say (Translator.create_translate)."""
+        md5 = hashlib.md5()
+        codes = []
+        for node in group:
+            code = self.say_get_code(node) if self.kind(node) == "Say" else node.line
+            codes.append(code)
+            md5.update(code.encode("utf-8") + b"\r\n")
+        digest = md5.hexdigest()[:8]
+
+        ids = self.ids
+        identifier = ids.unique_identifier(ids.label, digest)
+        ids.identifiers.add(identifier)
+        if ids.alternate is not None:
+            ids.identifiers.add(ids.unique_identifier(ids.alternate, digest))
+
+        for node, code in zip(group, codes):
+            if self.kind(node) == "Say":
+                self._add_say(node, identifier, code)
+
+    # -- script statements -----------------------------------------------------
+
+    def run(self, stmts: list) -> List[RpycEntry]:
+        self.visit(stmts)
+        self.found.sort(key=lambda found: (found[0], found[1]))
+        return [entry for _, _, entry in self.found]
+
+    def visit(self, block: Iterable):
+        group = []
+        for node in block:
+            kind = self.kind(node)
+
+            if kind == "Label" and not getattr(node, "hide", False):
+                if node.name.startswith("_"):
+                    self.ids.alternate = node.name
+                else:
+                    self.ids.label = self.context = node.name
+                    self.ids.alternate = None
+
+            if kind == "Translate":
+                if node.language is None:
+                    # Ren'Py 8: the identifier is stored with the statement
+                    for child in node.block:
+                        if self.kind(child) == "Say":
+                            self._add_say(child, node.identifier)
+                    self.ids.identifiers.add(node.identifier)
+                else:
+                    done = self.translated_dialogue.setdefault(node.language, set())
+                    done.add(node.identifier)
+                    if getattr(node, "alternate", None):
+                        done.add(node.alternate)
+            elif kind == "TranslateString":
+                self.translated_strings.setdefault(node.language, set()).add(node.old)
+            elif kind in _BLOCK_KINDS:
+                self.visit(node.block)
+            elif kind == "If":
+                for entry in node.entries:
+                    self.visit(entry[1])
+            elif kind == "Menu":
+                filename, linenumber = self._location(node)
+                for label, condition, items in node.items:
+                    line = getattr(condition, "linenumber", None) or linenumber
+                    self._add_string(ItemType.CHOICE, label, filename, line)
+                    if items is not None:
+                        self.visit(items)
+            elif kind in ("Python", "EarlyPython", "Define", "Default"):
+                filename, linenumber = self._location(node)
+                self._add_code_strings(getattr(getattr(node, "code", None), "source", None),
+                                       filename, linenumber)
+            elif kind == "Screen":
+                self.visit_screen(node.screen)
+
+            # Dialogue grouping, as Translator.translate_dialogue
+            if kind == "Say":
+                group.append(node)
+                self._flush(group)
+                group = []
+            elif getattr(node, "translatable", False):
+                group.append(node)
+            elif group:
+                self._flush(group)
+                group = []
+
+        if group:
+            self._flush(group)
+
+    # -- screen language -------------------------------------------------------
+
+    def visit_screen(self, screen):
+        name = getattr(screen, "name", None)
+        previous = self.context
+        if isinstance(name, str):
+            self.context = name
+        try:
+            self.visit_sl(screen)
+        finally:
+            self.context = previous
+
+    def visit_sl(self, node):
+        if self.kind(node) == "renpy.sl2.slast.SLDisplayable" and node.positional:
+            item_type = _SL_TEXT.get((_dotted(node.displayable), node.style))
+            if item_type is not None:
+                text = _literal(str(node.positional[0]))
+                if text is not None:
+                    location = getattr(node, "location", None) or (self.filename_hint, 0)
+                    self._add_string(item_type, text, location[0], location[1])
+
+        for child in getattr(node, "children", None) or ():
+            self.visit_sl(child)
+        for entry in getattr(node, "entries", None) or ():  # SLIf / SLShowIf: (condition, SLBlock)
+            self.visit_sl(entry[1])
+        block = getattr(node, "block", None)  # SLUse with a transclusion block
+        if block is not None and not isinstance(block, (list, str)):
+            self.visit_sl(block)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def extract_rpyc(rpyc_path: Path) -> RpycExtraction:
+    """
+    Extract translatable text from one compiled script.
+
+    Args:
+        rpyc_path: .rpyc (or .rpymc) file
+
+    Returns:
+        RpycExtraction with entries in script order
+
+    Raises:
+        Exception: If the file is not a readable rpyc archive
+    """
+    unrpyc = _load_unrpyc()
+    context = unrpyc.Context()
+    with Path(rpyc_path).open("rb") as f:
+        stmts = unrpyc.read_ast_from_file(f, context)
+
+    extractor = _Extractor(Path(rpyc_path).with_suffix(".rpy").name)
+    entries = extractor.run(stmts)
+    return RpycExtraction(path=Path(rpyc_path), entries=entries,
+                          translated_dialogue=extractor.translated_dialogue,
+                          translated_strings=extractor.translated_strings,
+                          warnings=[line.strip() for line in context.log_contents])
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+def format_translation_stub(extraction: RpycExtraction, language: str,
+                            done_dialogue: Optional[Set[str]] = None,
+                            done_strings: Optional[Set[str]] = None) -> str:
+    """
+    Ren'Py style `translate <language>` file for one script, source text as placeholder.
+
+    Args:
+        extraction: Result of extract_rpyc
+        language: Ren'Py language name (e.g. "turkish")
+        done_dialogue: Identifiers to leave out (already translated)
+        done_strings: Strings to leave out (already translated or in an earlier file);
+            strings written here are added to it
+
+    Returns:
+        File content, or "" when nothing is left to translate
+    """
+    done_dialogue = set() if done_dialogue is None else done_dialogue
+    done_strings = set() if done_strings is None else done_strings
+    out = []
+
+    # A Translate block can hold several Say statements (rare); keep them together
+    blocks: Dict[str, List[RpycEntry]] = {}
+    for entry in extraction.dialogue:
+        if entry.identifier not in done_dialogue:
+            blocks.setdefault(entry.identifier, []).append(entry)
+
+    for identifier, block in blocks.items():
+        first = block[0]
+        out.append(f"# {first.filename}:{first.linenumber}")
+        out.append(f"translate {language} {identifier}:")
+        out.append("")
+        for entry in block:
+            out.append(f"    # {entry.code}")
+            out.append(f"    {entry.code}")
+        out.append("")
+
+    strings = []
+    for entry in extraction.strings:
+        if entry.text not in done_strings:
+            done_strings.add(entry.text)
+            strings.append(entry)
+    if strings:
+        out.append(f"translate {language} strings:")
+        out.append("")
+        for entry in strings:
+            out.append(f"    # {entry.filename}:{entry.linenumber}")
+            out.append(f"    old {_quote(entry.text)}")
+            out.append(f"    new {_quote(entry.text)}")
+            out.append("")
+
+    return "\n".join(out)
+
+
+def generate_translation_stubs(project_path: Path, language: str, overwrite: bool = False) -> dict:
+    """
+    Write `game/tl/<language>/<script>.rpy` stubs for every compiled script in one pass.
+
+    Existing tl files are kept (unless `overwrite`), and dialogue or strings
+    already translated to `language` in compiled tl files are left out.
+
+    Args:
+        project_path: Ren'Py project folder (or its game folder)
+        language: Ren'Py language name
+        overwrite: Replace existing stub files
+
+    Returns:
+        Dict with files_written, files_skipped, errors, error_details,
+        dialogue and strings (counts written)
+    """
+    project_path = Path(project_path)
+    game_dir = project_path / "game" if (project_path / "game").is_dir() else project_path
+    tl_dir = game_dir / "tl" / language
+
+    results = {"files_written": 0, "files_skipped": 0, "errors": 0, "error_details": [],
+               "dialogue": 0, "strings": 0}
+
+    scripts = []
+    done_dialogue: Set[str] = set()
+    done_strings: Set[str] = set()
+    for path in sorted(game_dir.rglob("*.rpyc")):
+        if "__pycache__" in path.parts:
+            continue
+        try:
+            extraction = extract_rpyc(path)
+        except Exception as e:
+            results["errors"] += 1
+            results["error_details"].append(f"{path.name}: {e}")
+            logger.warning(f"[RpycExtractor] Could not read {path}: {e}")
+            continue
+        done_dialogue |= extraction.translated_dialogue.get(language, set())
+        done_strings |= extraction.translated_strings.get(language, set())
+        if path.relative_to(game_dir).parts[0] != "tl":
+            scripts.append(extraction)
+
+    for extraction in scripts:
+        relative = extraction.path.relative_to(game_dir).with_suffix(".rpy")
+        target = tl_dir / relative
+        if target.exists() and not overwrite:
+            results["files_skipped"] += 1
+            continue
+        dialogue = {e.identifier for e in extraction.dialogue} - done_dialogue
+        strings_before = len(done_strings)
+        content = format_translation_stub(extraction, language, done_dialogue, done_strings)
+        if not content:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+        results["files_written"] += 1
+        results["dialogue"] += len(dialogue)
+        results["strings"] += len(done_strings) - strings_before
+
+    logger.info(f"[RpycExtractor] {results['files_written']} stub files written to {tl_dir}")
+    return results
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+RenForge Startup Timing
+
+Measures cold-start phases (imports, settings, bootstrap, window creation,
+first event loop turn) and writes a per-phase report to the log once the
+first window is on screen.
+
+Setting RENFORGE_IMPORT_PROFILE=1 additionally times every module import
+during startup (cumulative, like `python -X importtime`) and lists the
+slowest ones under the phase that triggered them.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+class _TimedLoader:
+    """Loader proxy that records how long exec_module takes."""
+
+    def __init__(self, loader, name: str, records: Dict[str, float]):
+        self._loader = loader
+        self._name = name
+        self._records = records
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._records[self._name] = time.perf_counter() - start
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _ImportTimingFinder:
+    """Meta path finder that wraps loaders of newly imported modules."""
+
+    def __init__(self, records: Dict[str, float]):
+        self._records = records
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, name, self._records)
+            return spec
+        return None
+
+
+class StartupTimer:
+    """
+    Collects startup phase durations.
+
+    Usage:
+        timer = get_startup_timer()
+        with timer.phase("bootstrap"):
+            ...
+        timer.mark("first_window")
+        timer.log_report()
+    """
+
+    def __init__(self, profile_imports: Optional[bool] = None):
+        self._start = time.perf_counter()
+        self._phases: List[Tuple[str, float, int, Dict[str, float]]] = []
+        self._marks: List[Tuple[str, float]] = []
+        self._depth = 0
+        self._reported = False
+        self._import_records: Dict[str, float] = {}
+        self._finder: Optional[_ImportTimingFinder] = None
+
+        if profile_imports is None:
+            profile_imports = os.environ.get("RENFORGE_IMPORT_PROFILE", "0") == "1"
+        if profile_imports:
+            self._finder = _ImportTimingFinder(self._import_records)
+            sys.meta_path.insert(0, self._finder)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._start
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase; nested phases are indented in the report."""
+        start = time.perf_counter()
+        modules_before = len(sys.modules)
+        imports_before = dict(self._import_records)
+        label = "  " * self._depth + name
+        # Reserve the slot so parents are listed before their nested phases
+        slot = len(self._phases)
+        self._phases.append((label, 0.0, 0, {}))
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            new_imports = {
+                module: secs for module, secs in self._import_records.items()
+                if module not in imports_before
+            }
+            self._phases[slot] = (
+                label,
+                time.perf_counter() - start,
+                len(sys.modules) - modules_before,
+                new_imports,
+            )
+
+    def mark(self, name: str):
+        """Record a milestone (time since startup)."""
+        self._marks.append((name, self.elapsed))
+
+    def stop_import_profile(self):
+        """Remove the import hook (called automatically by report)."""
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def report(self, top_imports: int = 5) -> str:
+        """Format the collected phases and milestones."""
+        self.stop_import_profile()
+        lines = ["Startup timing:"]
+        for name, secs, modules, imports in self._phases:
+            lines.append(f"  {name:<32} {secs * 1000:8.1f} ms  (+{modules} modules)")
+            slowest = sorted(imports.items(), key=lambda kv: kv[1], reverse=True)[:top_imports]
+            for module, module_secs in slowest:
+                lines.append(f"      import {module:<30} {module_secs * 1000:8.1f} ms")
+        for name, at in self._marks:
+            lines.append(f"  @ {name:<30} {at * 1000:8.1f} ms since start")
+        return "\n".join(lines)
+
+    def log_report(self, logger=None):
+        """Write the report once to the RenForge log."""
+        if self._reported:
+            return
+        self._reported = True
+        if logger is None:
+            from renforge_logger import get_logger
+            logger = get_logger("startup")
+        logger.info(self.report())
+
+
+_timer: Optional[StartupTimer] = None
+
+
+def get_startup_timer() -> StartupTimer:
+    """Process-wide startup timer (created on first use)."""
+    global _timer
+    if _timer is None:
+        _timer = StartupTimer()
+    return _timer
@@ -37,9 +37,14 @@ except:
 
 if PY3:
     from io import BytesIO as StringIO
+    import copyreg
 else:
     from cStringIO import StringIO
 
+# Use the C unpickler (pickle.Unpickler) for load/loads/safe_load/safe_loads where possible.
+# Set to False to force the pure-Python pickle._Unpickler path.
+FAST_UNPICKLING = PY3
+
 __all__ = [
     "load", "loads", "safe_load", "safe_loads", "safe_dump", "safe_dumps",
     "fake_package", "remove_fake_package",
@@ -47,7 +52,7 @@ __all__ = [
     "FakeClassType", "FakeClassFactory",
     "FakeClass", "FakeStrict", "FakeWarning", "FakeIgnore",
     "FakeUnpicklingError", "FakeUnpickler", "SafeUnpickler",
-    "SafePickler"
+    "FastFakeUnpickler", "FastSafeUnpickler", "SafePickler"
 ]
 
 # Fake class implementation
@@ -552,6 +557,74 @@ class SafeUnpickler(FakeUnpickler):
         else:
             return self.class_factory("extension_code_{0}".format(code), "copyreg")
 
+if PY3:
+    class FastFakeUnpickler(pickle.Unpickler):
+        """
+        :class:`FakeUnpickler` on top of the C implementation of :class:`pickle.Unpickler`.
+        The C unpickler calls the overridden :meth:`find_class`, so class resolution is the same,
+        while the opcode loop runs in C. Only available in Python 3.
+        """
+        def __init__(self, file, class_factory=None, encoding="bytes", errors="strict"):
+            super().__init__(file, fix_imports=False, encoding=encoding, errors=errors)
+            self.class_factory = class_factory or FakeClassFactory()
+
+        find_class = FakeUnpickler.find_class
+
+    class FastSafeUnpickler(FastFakeUnpickler):
+        """
+        :class:`SafeUnpickler` on top of the C implementation of :class:`pickle.Unpickler`.
+
+        The C unpickler resolves EXT opcodes from the copyreg registry itself instead of calling
+        :meth:`get_extension`. It is therefore only safe while that registry is empty (then any
+        extension code fails to load) or when *use_copyreg* is set; see :func:`safe_load`.
+        Resolved classes are cached per unpickler.
+        """
+        def __init__(self, file, class_factory=None, safe_modules=(),
+                     use_copyreg=False, encoding="bytes", errors="strict"):
+            FastFakeUnpickler.__init__(self, file, class_factory, encoding=encoding, errors=errors)
+            self.safe_modules = set(safe_modules)
+            self.use_copyreg = use_copyreg
+            self._class_cache = {}
+
+        def find_class(self, module, name):
+            key = (module, name)
+            klass = self._class_cache.get(key, None)
+            if klass is None:
+                klass = self._class_cache[key] = SafeUnpickler.find_class(self, module, name)
+            return klass
+
+else:
+    FastFakeUnpickler = FastSafeUnpickler = None
+
+def _load(file, fast_unpickler, unpickler):
+    """
+    Load with *fast_unpickler* when possible, falling back to *unpickler* (the pure-Python
+    implementation) from the same position if the fast path fails, so that the few cases the C
+    unpickler handles differently (extension codes) still load, and errors are reported by the
+    reference implementation.
+    """
+    start = None
+    if fast_unpickler is not None and FAST_UNPICKLING:
+        try:
+            if file.seekable():
+                start = file.tell()
+        except (AttributeError, OSError):
+            start = None
+    if start is None:
+        return unpickler(file).load()
+
+    try:
+        return fast_unpickler(file).load()
+    except Exception:
+        file.seek(start)
+        return unpickler(file).load()
+
+def _safe_fast_unpickler(use_copyreg):
+    # with registered extension codes the C unpickler would load the real objects behind them
+    if FastSafeUnpickler is None or (not use_copyreg and copyreg._inverted_registry):
+        return None
+    return FastSafeUnpickler
+
 class SafePickler(pickle.Pickler if PY2 else pickle._Pickler):
     """
     A pickler which can repickle object hierarchies containing objects created by SafeUnpickler.
@@ -572,7 +645,7 @@ class SafePickler(pickle.Pickler if PY2 else pickle._Pickler):
                 self.write(pickle.STACK_GLOBAL)
             else:
                 self.write(pickle.GLOBAL
-                           + (obj.__module__ + '\n' + obj.__name__ + '\n').decode("utf-8"))
+                           + (obj.__module__ + '\n' + obj.__name__ + '\n').encode("utf-8"))
             self.memoize(obj)
             return
 
@@ -585,7 +658,8 @@ def load(file, class_factory=None, encoding="bytes", errors="errors"):
     Read a pickled object representation from the open binary :term:`file object` *file*
     and return the reconstitutded object hierarchy specified therein, generating
     any missing class definitions at runtime. This is equivalent to
-    ``FakeUnpickler(file).load()``.
+    ``FakeUnpickler(file).load()``. In Python 3, seekable files are loaded with
+    :class:`FastFakeUnpickler` first.
 
     The optional keyword arguments are *class_factory*, *encoding* and *errors*.
     *class_factory* can be used to control how the missing class definitions are
@@ -599,15 +673,16 @@ def load(file, class_factory=None, encoding="bytes", errors="errors"):
 
     This function should only be used to unpickle trusted data.
     """
-    return FakeUnpickler(file, class_factory, encoding=encoding, errors=errors).load()
+    return _load(file,
+                 FastFakeUnpickler and (lambda f: FastFakeUnpickler(f, class_factory, encoding=encoding, errors=errors)),
+                 lambda f: FakeUnpickler(f, class_factory, encoding=encoding, errors=errors))
 
 def loads(string, class_factory=None, encoding="bytes", errors="errors"):
     """
     Simjilar to :func:`load`, but takes an 8-bit string (bytes in Python 3, str in Python 2)
     as its first argument instead of a binary :term:`file object`.
     """
-    return FakeUnpickler(StringIO(string), class_factory,
-                         encoding=encoding, errors=errors).load()
+    return load(StringIO(string), class_factory, encoding=encoding, errors=errors)
 
 def safe_load(file, class_factory=None, safe_modules=(), use_copyreg=False,
               encoding="bytes", errors="errors"):
@@ -615,7 +690,8 @@ def safe_load(file, class_factory=None, safe_modules=(), use_copyreg=False,
     Read a pickled object representation from the open binary :term:`file object` *file*
     and return the reconstitutded object hierarchy specified therein, substituting any
     class definitions by fake classes, ensuring safety in the unpickling process.
-    This is equivalent to ``SafeUnpickler(file).load()``.
+    This is equivalent to ``SafeUnpickler(file).load()``. In Python 3, seekable files
+    are loaded with :class:`FastSafeUnpickler` first when that is equally safe.
 
     The optional keyword arguments are *class_factory*, *safe_modules*, *use_copyreg*,
     *encoding* and *errors*. *class_factory* can be used to control how the missing class
@@ -636,8 +712,12 @@ def safe_load(file, class_factory=None, safe_modules=(), use_copyreg=False,
     This function can be used to unpickle untrusted data safely with the default
     class_factory when *safe_modules* is empty and *use_copyreg* is False.
     """
-    return SafeUnpickler(file, class_factory, safe_modules, use_copyreg,
-                         encoding=encoding, errors=errors).load()
+    fast = _safe_fast_unpickler(use_copyreg)
+    return _load(file,
+                 fast and (lambda f: fast(f, class_factory, safe_modules, use_copyreg,
+                                          encoding=encoding, errors=errors)),
+                 lambda f: SafeUnpickler(f, class_factory, safe_modules, use_copyreg,
+                                         encoding=encoding, errors=errors))
 
 def safe_loads(string, class_factory=None, safe_modules=(), use_copyreg=False,
                encoding="bytes", errors="errors"):
@@ -645,8 +725,8 @@ def safe_loads(string, class_factory=None, safe_modules=(), use_copyreg=False,
     Similar to :func:`safe_load`, but takes an 8-bit string (bytes in Python 3, str in Python 2)
     as its first argument instead of a binary :term:`file object`.
     """
-    return SafeUnpickler(StringIO(string), class_factory, safe_modules, use_copyreg,
-                         encoding=encoding, errors=errors).load()
+    return safe_load(StringIO(string), class_factory, safe_modules, use_copyreg,
+                     encoding=encoding, errors=errors)
 
 def safe_dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL):
     """
@@ -186,6 +186,12 @@ def pickle_loads(buffer: bytes):
     return magic.loads(buffer, CLASS_FACTORY)
 
 
+# python 2 pickles give themselves away on the first attribute name, so the scan for
+# pickle_detect_python2 stops after this many opcodes instead of walking the whole
+# (pure-python) opcode stream of large files, which took as long as unpickling them
+PY2_DETECT_MAX_OPCODES = 10000
+
+
 def pickle_detect_python2(buffer: bytes):
     # When objects get pickled in protocol 2, python 2 will
     # normally emit BINSTRING/SHORT_BINSTRING opcodes for any attribute
@@ -201,7 +207,10 @@ def pickle_detect_python2(buffer: bytes):
     # then attributes will use BINUNICODE instead (like py3)
     # Most ren'py AST classes do use __slots__ so that's a bit annoying
 
-    for opcode, arg, pos in pickletools.genops(buffer):
+    for count, (opcode, arg, pos) in enumerate(pickletools.genops(buffer)):
+        if count >= PY2_DETECT_MAX_OPCODES:
+            break
+
         if opcode.code == "\x80":
             # from what I know ren'py for now always uses protocol 2,
             # but it might've been different in the past, and change in the future